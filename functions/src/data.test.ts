@@ -13,7 +13,7 @@ import {
   createModelLogEntry,
   ModelResponseStatus,
 } from '@deliberation-lab/utils';
-import {getExperimentLogs} from './data';
+import {getExperimentDownload, getExperimentLogs} from './data';
 
 const RULES = `
 rules_version = '2';
@@ -153,3 +153,232 @@ describe('getExperimentLogs', () => {
     expect(result!.length).toBe(0);
   });
 });
+
+describe('getExperimentDownload', () => {
+  let testEnv: RulesTestEnvironment;
+
+  const experimentId = 'download-experiment';
+  // Shares a prefix with experimentId; none of its data may leak in
+  const otherExperimentId = 'download-experiment-2';
+
+  const NUM_PARTICIPANTS = 60;
+  // Seeded once for the round-trip comparison below
+  const LARGE_NUM_PARTICIPANTS = 3000;
+  const NUM_COHORTS = 6;
+  const NUM_MESSAGES = 8;
+  const STAGE_IDS = ['survey', 'chat-1', 'chat-2'];
+
+  beforeAll(async () => {
+    testEnv = await initializeTestEnvironment({
+      projectId: 'deliberate-lab-download-test',
+      firestore: {
+        rules: RULES,
+        ...(!process.env.FIRESTORE_EMULATOR_HOST && {
+          host: 'localhost',
+          port: 8081,
+        }),
+      },
+    });
+    mockFirestore = testEnv.unauthenticatedContext().firestore();
+    mockFirestore.settings({ignoreUndefinedProperties: true, merge: true});
+  });
+
+  afterAll(async () => {
+    await testEnv.cleanup();
+  });
+
+  /** Helper: seed a study with participants, cohorts, chats and agents. */
+  async function seedStudy(id: string, numParticipants = NUM_PARTICIPANTS) {
+    const experiment = mockFirestore.collection('experiments').doc(id);
+    let batch = mockFirestore.batch();
+    let writes = 0;
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const set = async (ref: any, data: object) => {
+      batch.set(ref, data);
+      if (++writes % 400 === 0) {
+        await batch.commit();
+        batch = mockFirestore.batch();
+      }
+    };
+
+    await set(experiment, {id, name: id});
+    for (const stageId of STAGE_IDS) {
+      await set(experiment.collection('stages').doc(stageId), {
+        id: stageId,
+        kind: stageId === 'survey' ? 'survey' : 'chat',
+      });
+    }
+    for (let p = 0; p < numParticipants; p++) {
+      const privateId = `private-${p}`;
+      const participant = experiment.collection('participants').doc(privateId);
+      await set(participant, {
+        privateId,
+        publicId: `public-${p}`,
+        currentCohortId: `cohort-${p % NUM_COHORTS}`,
+      });
+      for (const stageId of STAGE_IDS) {
+        await set(participant.collection('stageData').doc(stageId), {
+          id: stageId,
+          experimentId: id,
+          participant: p,
+        });
+      }
+    }
+    for (let c = 0; c < NUM_COHORTS; c++) {
+      const cohort = experiment.collection('cohorts').doc(`cohort-${c}`);
+      await set(cohort, {id: `cohort-${c}`});
+      for (const stageId of STAGE_IDS) {
+        const isChat = stageId !== 'survey';
+        const data = cohort.collection('publicStageData').doc(stageId);
+        await set(data, {id: stageId, kind: isChat ? 'chat' : 'survey'});
+        if (!isChat) {
+          continue;
+        }
+        // Write messages in reverse so document order differs from time order
+        for (let m = NUM_MESSAGES - 1; m >= 0; m--) {
+          await set(data.collection('chats').doc(`a-${NUM_MESSAGES - m}`), {
+            id: `message-${m}`,
+            experimentId: id,
+            timestamp: new Date(Date.UTC(2025, 0, 1, 0, m)),
+          });
+        }
+      }
+    }
+    for (const collection of ['agentMediators', 'agentParticipants']) {
+      const agent = experiment.collection(collection).doc('agent-1');
+      await set(agent, {id: 'agent-1'});
+      await set(agent.collection('prompts').doc('chat-1'), {
+        id: 'chat-1',
+        experimentId: id,
+      });
+    }
+    await set(experiment.collection('alerts').doc('alert-1'), {
+      id: 'alert-1',
+      participantId: 'private-0',
+      timestamp: new Date(Date.UTC(2025, 0, 1)),
+    });
+    await batch.commit();
+  }
+
+  beforeEach(async () => {
+    await testEnv.clearFirestore();
+    await seedStudy(experimentId);
+    await seedStudy(otherExperimentId);
+  });
+
+  it('should return null for a nonexistent experiment', async () => {
+    const result = await getExperimentDownload(
+      mockFirestore,
+      'nonexistent-experiment',
+    );
+    expect(result).toBeNull();
+  });
+
+  it('should assemble every section from only this experiment', async () => {
+    const result = await getExperimentDownload(mockFirestore, experimentId);
+    expect(result).not.toBeNull();
+    const download = result!;
+
+    expect(Object.keys(download.stageMap).sort()).toEqual(
+      [...STAGE_IDS].sort(),
+    );
+    expect(Object.keys(download.participantMap).length).toBe(NUM_PARTICIPANTS);
+    for (const participant of Object.values(download.participantMap)) {
+      expect(Object.keys(participant.answerMap).sort()).toEqual(
+        [...STAGE_IDS].sort(),
+      );
+      for (const answer of Object.values(participant.answerMap)) {
+        expect(answer).toMatchObject({experimentId});
+      }
+    }
+
+    expect(Object.keys(download.cohortMap).length).toBe(NUM_COHORTS);
+    for (const cohort of Object.values(download.cohortMap)) {
+      expect(Object.keys(cohort.dataMap).length).toBe(STAGE_IDS.length);
+      expect(Object.keys(cohort.chatMap).sort()).toEqual(['chat-1', 'chat-2']);
+      for (const messages of Object.values(cohort.chatMap)) {
+        // Ordered by timestamp, not by document ID
+        expect(messages.map((message) => message.id)).toEqual(
+          Array.from({length: NUM_MESSAGES}, (_, m) => `message-${m}`),
+        );
+        expect(
+          messages.every(
+            (message) =>
+              (message as unknown as {experimentId: string}).experimentId ===
+              experimentId,
+          ),
+        ).toBe(true);
+      }
+    }
+
+    for (const agents of [
+      download.agentMediatorMap,
+      download.agentParticipantMap,
+    ]) {
+      expect(Object.keys(agents)).toEqual(['agent-1']);
+      expect(agents['agent-1'].promptMap['chat-1']).toMatchObject({
+        experimentId,
+      });
+    }
+    expect(download.alerts['private-0'].map((alert) => alert.id)).toEqual([
+      'alert-1',
+    ]);
+  });
+
+  it('should read a large study without one query per participant', async () => {
+    await testEnv.clearFirestore();
+    await seedStudy(experimentId, LARGE_NUM_PARTICIPANTS);
+    await seedStudy(otherExperimentId);
+    const experiment = mockFirestore
+      .collection('experiments')
+      .doc(experimentId);
+
+    // Previous approach: list participants, then one stageData query each
+    let start = performance.now();
+    const participants = (await experiment.collection('participants').get())
+      .docs;
+    const perParticipantAnswers: Record<string, number> = {};
+    for (const participant of participants) {
+      const stageData = await participant.ref.collection('stageData').get();
+      perParticipantAnswers[participant.data().publicId] = stageData.size;
+    }
+    const perParticipantMs = performance.now() - start;
+
+    start = performance.now();
+    const result = await getExperimentDownload(mockFirestore, experimentId, {
+      sections: ['participantMap'],
+    });
+    const collectionGroupMs = performance.now() - start;
+    console.log(
+      `participantMap for ${LARGE_NUM_PARTICIPANTS} participants: ` +
+        `${perParticipantMs.toFixed(0)} ms with per-participant queries, ` +
+        `${collectionGroupMs.toFixed(0)} ms with getExperimentDownload`,
+    );
+
+    expect(result).not.toBeNull();
+    const participantMap = result!.participantMap;
+    expect(Object.keys(participantMap).length).toBe(LARGE_NUM_PARTICIPANTS);
+    for (const [publicId, participant] of Object.entries(participantMap)) {
+      expect(Object.keys(participant.answerMap).length).toBe(
+        perParticipantAnswers[publicId],
+      );
+      for (const answer of Object.values(participant.answerMap)) {
+        expect(answer).toMatchObject({experimentId});
+      }
+    }
+    expect(collectionGroupMs).toBeLessThan(perParticipantMs);
+  }, 300_000);
+
+  it('should skip reads for sections that are not requested', async () => {
+    const result = await getExperimentDownload(mockFirestore, experimentId, {
+      sections: ['cohortMap.chatMap'],
+    });
+    expect(result).not.toBeNull();
+    expect(result!.participantMap).toEqual({});
+    expect(result!.agentMediatorMap).toEqual({});
+    for (const cohort of Object.values(result!.cohortMap)) {
+      expect(cohort.dataMap).toEqual({});
+      expect(Object.keys(cohort.chatMap).sort()).toEqual(['chat-1', 'chat-2']);
+    }
+  });
+});
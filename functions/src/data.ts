@@ -2,7 +2,11 @@
  * Data download utilities for Firebase Admin SDK
  */
 
-import {Firestore, Query} from 'firebase-admin/firestore';
+import {
+  Firestore,
+  Query,
+  QueryDocumentSnapshot,
+} from 'firebase-admin/firestore';
 import {
   AgentMediatorPersonaConfig,
   AgentMediatorTemplate,
@@ -11,14 +15,18 @@ import {
   AlertMessage,
   ChatMessage,
   CohortConfig,
+  CohortDownload,
   createCohortDownload,
   createExperimentDownload,
   createParticipantDownload,
   DEFAULT_LOGS_PAGE_SIZE,
   Experiment,
   ExperimentDownload,
+  ExperimentDownloadSection,
+  getExperimentDownloadSelection,
   LogEntry,
   MediatorPromptConfig,
+  ParticipantDownload,
   ParticipantProfileExtended,
   ParticipantPromptConfig,
   StageConfig,
@@ -27,7 +35,7 @@ import {
   StagePublicData,
   UnifiedTimestamp,
 } from '@deliberation-lab/utils';
-import {convertTimestamps} from './data.utils';
+import {convertTimestamps, mapWithConcurrency} from './data.utils';
 
 /**
  * Options for getExperimentDownload
@@ -35,11 +43,152 @@ import {convertTimestamps} from './data.utils';
 export interface GetExperimentDownloadOptions {
   /** Whether to include participant, cohort, and alert data. Defaults to true. */
   includeParticipantData?: boolean;
+  /**
+   * Sections to build (see EXPERIMENT_DOWNLOAD_SECTIONS). Sections that are
+   * not selected are left empty and their Firestore reads are skipped.
+   * Takes precedence over includeParticipantData. Defaults to all sections.
+   */
+  sections?: ExperimentDownloadSection[];
+}
+
+/** Max concurrent Firestore reads while building a single download. */
+export const DOWNLOAD_READ_CONCURRENCY = 16;
+
+/**
+ * Fetch every document of a collection group that lives under one
+ * experiment (at any depth), ordered by document path.
+ *
+ * A single collection-group query replaces one query per parent document
+ * (e.g., one per participant for stageData), so the number of round trips
+ * does not grow with the number of participants, cohorts or agents.
+ * The range on the document path (compared segment by segment) restricts
+ * results to experiments/{experimentId}/...; callers check the exact
+ * parent collections with getDocumentPathSegments().
+ */
+async function getExperimentCollectionGroup(
+  firestore: Firestore,
+  experimentId: string,
+  collectionId: string,
+): Promise<QueryDocumentSnapshot[]> {
+  const experimentPath = `experiments/${experimentId}`;
+  return getCollectionGroupUnder(
+    firestore,
+    collectionId,
+    experimentPath,
+    experimentPath,
+  );
+}
+
+/**
+ * Fetch every document of a collection group that lives under a run of
+ * sibling documents, from firstParentPath to lastParentPath inclusive
+ * (e.g., the stageData of one page of participants), ordered by path.
+ */
+async function getCollectionGroupUnder(
+  firestore: Firestore,
+  collectionId: string,
+  firstParentPath: string,
+  lastParentPath: string,
+): Promise<QueryDocumentSnapshot[]> {
+  return (
+    await firestore
+      .collectionGroup(collectionId)
+      .where('__name__', '>', firstParentPath)
+      .where('__name__', '<', `${lastParentPath}/\uf8ff/\uf8ff`)
+      .get()
+  ).docs;
+}
+
+/** Split a document path into its segments. */
+function getDocumentPathSegments(doc: QueryDocumentSnapshot): string[] {
+  return doc.ref.path.split('/');
+}
+
+/**
+ * Group documents of a collection group by the ID of their grandparent
+ * document (e.g., stageData docs by participant), keeping only documents
+ * under experiments/{id}/{parentCollection}/{parentId}/{collectionId}.
+ */
+function groupByParentDocument<T>(
+  docs: QueryDocumentSnapshot[],
+  parentCollection: string,
+): Map<string, T[]> {
+  const groups = new Map<string, T[]>();
+  for (const doc of docs) {
+    const segments = getDocumentPathSegments(doc);
+    if (segments.length !== 6 || segments[2] !== parentCollection) {
+      continue;
+    }
+    const group = groups.get(segments[3]) ?? [];
+    group.push(doc.data() as T);
+    groups.set(segments[3], group);
+  }
+  return groups;
+}
+
+/**
+ * Group chat message docs by cohort ID and then chat stage ID (chats live
+ * at experiments/{id}/cohorts/{cohortId}/publicStageData/{stageId}/chats).
+ */
+function groupChatsByCohort(
+  docs: QueryDocumentSnapshot[],
+): Map<string, Map<string, QueryDocumentSnapshot[]>> {
+  const chatMaps = new Map<string, Map<string, QueryDocumentSnapshot[]>>();
+  for (const doc of docs) {
+    const segments = getDocumentPathSegments(doc);
+    if (
+      segments.length !== 8 ||
+      segments[2] !== 'cohorts' ||
+      segments[4] !== 'publicStageData'
+    ) {
+      continue;
+    }
+    const chatMap =
+      chatMaps.get(segments[3]) ?? new Map<string, QueryDocumentSnapshot[]>();
+    const messages = chatMap.get(segments[5]) ?? [];
+    messages.push(doc);
+    chatMap.set(segments[5], messages);
+    chatMaps.set(segments[3], chatMap);
+  }
+  return chatMaps;
+}
+
+/** Order chat messages as orderBy('timestamp', 'asc') would. */
+function sortChatMessages(
+  docs: QueryDocumentSnapshot[],
+): QueryDocumentSnapshot[] {
+  return docs
+    .filter((doc) => doc.get('timestamp') != null)
+    .sort((a, b) => {
+      const timeA = a.get('timestamp') as UnifiedTimestamp;
+      const timeB = b.get('timestamp') as UnifiedTimestamp;
+      return (
+        timeA.seconds - timeB.seconds ||
+        timeA.nanoseconds - timeB.nanoseconds ||
+        (a.id < b.id ? -1 : a.id > b.id ? 1 : 0)
+      );
+    });
+}
+
+/** Resolve download options to the sections to build. */
+function getDownloadOptionsSelection(options: GetExperimentDownloadOptions) {
+  const {includeParticipantData = true} = options;
+  return getExperimentDownloadSelection(
+    options.sections ??
+      (includeParticipantData
+        ? undefined
+        : ['stageMap', 'agentMediatorMap', 'agentParticipantMap']),
+  );
 }
 
 /**
  * Build a complete ExperimentDownload structure using Firebase Admin SDK.
  *
+ * Independent sections are read concurrently, and per-participant,
+ * per-cohort and per-agent subcollections are each read with one
+ * collection-group query, so the number of round trips is constant
+ * rather than proportional to participants, cohorts and agents.
+ *
  * @param firestore - Firestore instance from firebase-admin/firestore
  * @param experimentId - ID of the experiment to download
  * @param options - Options for what data to include
@@ -50,13 +199,61 @@ export async function getExperimentDownload(
   experimentId: string,
   options: GetExperimentDownloadOptions = {},
 ): Promise<ExperimentDownload | null> {
-  const {includeParticipantData = true} = options;
+  const selection = getDownloadOptionsSelection(options);
+  const experimentRef = firestore.collection('experiments').doc(experimentId);
+  const getDocs = async <T>(enabled: boolean, query: () => Query) =>
+    enabled ? (await query().get()).docs.map((doc) => doc.data() as T) : [];
+  const getGroup = async (enabled: boolean, collectionId: string) =>
+    enabled
+      ? getExperimentCollectionGroup(firestore, experimentId, collectionId)
+      : [];
 
-  // Get experiment config from experimentId
-  const experimentConfig = (
-    await firestore.collection('experiments').doc(experimentId).get()
-  ).data() as Experiment | undefined;
+  const includeAgents =
+    selection.agentMediatorMap || selection.agentParticipantMap;
+  const includePublicData = selection.cohortData || selection.cohortChats;
+  const [
+    experimentDoc,
+    stageConfigs,
+    mediatorAgents,
+    participantAgents,
+    agentPromptDocs,
+    profiles,
+    stageAnswerDocs,
+    cohorts,
+    publicStageDataDocs,
+    chatDocs,
+    alertList,
+  ] = await Promise.all([
+    experimentRef.get(),
+    getDocs<StageConfig>(selection.stageMap, () =>
+      experimentRef.collection('stages'),
+    ),
+    getDocs<AgentMediatorPersonaConfig>(selection.agentMediatorMap, () =>
+      experimentRef.collection('agentMediators'),
+    ),
+    getDocs<AgentParticipantPersonaConfig>(selection.agentParticipantMap, () =>
+      experimentRef.collection('agentParticipants'),
+    ),
+    getGroup(includeAgents, 'prompts'),
+    getDocs<ParticipantProfileExtended>(selection.participantProfiles, () =>
+      experimentRef.collection('participants'),
+    ),
+    getGroup(
+      selection.participantProfiles && selection.participantAnswers,
+      'stageData',
+    ),
+    getDocs<CohortConfig>(selection.cohorts, () =>
+      experimentRef.collection('cohorts'),
+    ),
+    getGroup(selection.cohorts && includePublicData, 'publicStageData'),
+    getGroup(selection.cohorts && selection.cohortChats, 'chats'),
+    getDocs<AlertMessage>(selection.alerts, () =>
+      experimentRef.collection('alerts').orderBy('timestamp', 'asc'),
+    ),
+  ]);
 
+  // Get experiment config from experimentId
+  const experimentConfig = experimentDoc.data() as Experiment | undefined;
   if (!experimentConfig) {
     return null;
   }
@@ -65,90 +262,380 @@ export async function getExperimentDownload(
   const experimentDownload = createExperimentDownload(experimentConfig);
 
   // For each experiment stage config, add to ExperimentDownload
-  const stageConfigs = (
-    await firestore
-      .collection('experiments')
-      .doc(experimentId)
-      .collection('stages')
-      .get()
-  ).docs.map((doc) => doc.data() as StageConfig);
   for (const stage of stageConfigs) {
     experimentDownload.stageMap[stage.id] = stage;
   }
 
-  // For each agent mediator, add template
-  const mediatorAgents = (
-    await firestore
-      .collection('experiments')
-      .doc(experimentId)
-      .collection('agentMediators')
-      .get()
-  ).docs.map((agent) => agent.data() as AgentMediatorPersonaConfig);
+  // For each agent, add template with its prompts
+  const agentTemplates = assembleAgentTemplates(
+    mediatorAgents,
+    participantAgents,
+    agentPromptDocs,
+  );
+  experimentDownload.agentMediatorMap = agentTemplates.agentMediatorMap;
+  experimentDownload.agentParticipantMap = agentTemplates.agentParticipantMap;
+
+  // For each participant, add ParticipantDownload
+  // (stageData is keyed by participant private ID)
+  const stageAnswers = groupByParentDocument<StageParticipantAnswer>(
+    stageAnswerDocs,
+    'participants',
+  );
+  for (const profile of profiles) {
+    experimentDownload.participantMap[profile.publicId] =
+      assembleParticipantDownload(
+        profile,
+        stageAnswers.get(profile.privateId) ?? [],
+      );
+  }
+
+  // For each cohort, add CohortDownload
+  const publicStageData = groupByParentDocument<StagePublicData>(
+    publicStageDataDocs,
+    'cohorts',
+  );
+  const chatMaps = groupChatsByCohort(chatDocs);
+  for (const cohort of cohorts) {
+    const chatMap = chatMaps.get(cohort.id);
+    experimentDownload.cohortMap[cohort.id] = assembleCohortDownload(
+      cohort,
+      publicStageData.get(cohort.id) ?? [],
+      (stageId) => sortChatMessages(chatMap?.get(stageId) ?? []),
+      {
+        includeData: selection.cohortData,
+        includeChats: selection.cohortChats,
+      },
+    );
+  }
+
+  // Group alerts by participant private ID
+  for (const alert of alertList) {
+    const participantId = alert.participantId;
+    if (!experimentDownload.alerts[participantId]) {
+      experimentDownload.alerts[participantId] = [];
+    }
+    experimentDownload.alerts[participantId].push(alert);
+  }
+
+  // Convert all Timestamp objects to UnifiedTimestamp format
+  const normalized = convertTimestamps(
+    experimentDownload,
+  ) as ExperimentDownload;
+  return normalized;
+}
+
+/** Documents read per page while streaming a download. */
+export const DOWNLOAD_STREAM_PAGE_SIZE = 200;
+
+/**
+ * One record of a streamed ExperimentDownload (one NDJSON line).
+ *
+ * Records mirror the sections of ExperimentDownload: cohort records carry
+ * CohortDownload without chatMap, and each chat message follows its cohort
+ * as a separate record. The data key comes last, so readers can parse the
+ * keys of a line without decoding its data.
+ */
+export type ExperimentDownloadRecord =
+  | {type: 'experiment'; data: Experiment}
+  | {type: 'stage'; id: string; data: StageConfig}
+  | {type: 'participant'; id: string; data: ParticipantDownload}
+  | {type: 'cohort'; id: string; data: Omit<CohortDownload, 'chatMap'>}
+  | {type: 'chatMessage'; cohortId: string; stageId: string; data: ChatMessage}
+  | {type: 'agentMediator'; id: string; data: AgentMediatorTemplate}
+  | {type: 'agentParticipant'; id: string; data: AgentParticipantTemplate}
+  | {type: 'alert'; participantId: string; data: AlertMessage};
+
+/** Yield the documents of a query in pages, ordered by document ID. */
+async function* getDocumentPages(
+  query: Query,
+  pageSize: number,
+): AsyncGenerator<QueryDocumentSnapshot[]> {
+  let last: QueryDocumentSnapshot | undefined;
+  while (true) {
+    const page = (
+      await (last ? query.startAfter(last) : query).limit(pageSize).get()
+    ).docs;
+    if (page.length > 0) {
+      yield page;
+    }
+    if (page.length < pageSize) {
+      return;
+    }
+    last = page[page.length - 1];
+  }
+}
+
+/**
+ * Stream an ExperimentDownload as records, reading Firestore page by page.
+ *
+ * Records are yielded in section order (experiment, stages, participants,
+ * cohorts with their chats, agents, alerts) as soon as each page is read,
+ * so memory use is bounded by the page size rather than the experiment
+ * size. Each page of participants or cohorts reads its subcollections
+ * with one collection-group query over the page's path range.
+ * Alerts are yielded grouped by participant, each group in time order.
+ *
+ * @param options - Same options as getExperimentDownload
+ * @returns Async iterator of records (timestamps converted to
+ *   UnifiedTimestamp); yields nothing if the experiment is not found
+ */
+export async function* streamExperimentDownload(
+  firestore: Firestore,
+  experimentId: string,
+  options: GetExperimentDownloadOptions = {},
+): AsyncGenerator<ExperimentDownloadRecord> {
+  const selection = getDownloadOptionsSelection(options);
+  const experimentRef = firestore.collection('experiments').doc(experimentId);
+  const toRecord = (record: ExperimentDownloadRecord) =>
+    convertTimestamps(record) as ExperimentDownloadRecord;
+
+  const experimentConfig = (await experimentRef.get()).data() as
+    | Experiment
+    | undefined;
+  if (!experimentConfig) {
+    return;
+  }
+  yield toRecord({type: 'experiment', data: experimentConfig});
+
+  if (selection.stageMap) {
+    const stages = await experimentRef.collection('stages').get();
+    for (const doc of stages.docs) {
+      const stage = doc.data() as StageConfig;
+      yield toRecord({type: 'stage', id: stage.id, data: stage});
+    }
+  }
+
+  if (selection.participantProfiles) {
+    for await (const page of getDocumentPages(
+      experimentRef.collection('participants'),
+      DOWNLOAD_STREAM_PAGE_SIZE,
+    )) {
+      // stageData is keyed by participant private ID (the doc ID)
+      const stageAnswers = selection.participantAnswers
+        ? groupByParentDocument<StageParticipantAnswer>(
+            await getCollectionGroupUnder(
+              firestore,
+              'stageData',
+              page[0].ref.path,
+              page[page.length - 1].ref.path,
+            ),
+            'participants',
+          )
+        : new Map<string, StageParticipantAnswer[]>();
+      for (const doc of page) {
+        const profile = doc.data() as ParticipantProfileExtended;
+        yield toRecord({
+          type: 'participant',
+          id: profile.publicId,
+          data: assembleParticipantDownload(
+            profile,
+            stageAnswers.get(profile.privateId) ?? [],
+          ),
+        });
+      }
+    }
+  }
+
+  if (selection.cohorts) {
+    const includePublicData = selection.cohortData || selection.cohortChats;
+    for await (const page of getDocumentPages(
+      experimentRef.collection('cohorts'),
+      DOWNLOAD_STREAM_PAGE_SIZE,
+    )) {
+      const getPageGroup = async (enabled: boolean, collectionId: string) =>
+        enabled
+          ? getCollectionGroupUnder(
+              firestore,
+              collectionId,
+              page[0].ref.path,
+              page[page.length - 1].ref.path,
+            )
+          : [];
+      const [publicStageDataDocs, chatDocs] = await Promise.all([
+        getPageGroup(includePublicData, 'publicStageData'),
+        getPageGroup(selection.cohortChats, 'chats'),
+      ]);
+      const publicStageData = groupByParentDocument<StagePublicData>(
+        publicStageDataDocs,
+        'cohorts',
+      );
+      const chatMaps = groupChatsByCohort(chatDocs);
+      for (const doc of page) {
+        const cohort = doc.data() as CohortConfig;
+        const chatMap = chatMaps.get(cohort.id);
+        const {chatMap: chats, ...cohortDownload} = assembleCohortDownload(
+          cohort,
+          publicStageData.get(cohort.id) ?? [],
+          (stageId) => sortChatMessages(chatMap?.get(stageId) ?? []),
+          {
+            includeData: selection.cohortData,
+            includeChats: selection.cohortChats,
+          },
+        );
+        yield toRecord({type: 'cohort', id: cohort.id, data: cohortDownload});
+        for (const [stageId, messages] of Object.entries(chats)) {
+          for (const message of messages) {
+            yield toRecord({
+              type: 'chatMessage',
+              cohortId: cohort.id,
+              stageId,
+              data: message,
+            });
+          }
+        }
+      }
+    }
+  }
+
+  if (selection.agentMediatorMap || selection.agentParticipantMap) {
+    const getDocs = async <T>(enabled: boolean, collectionId: string) =>
+      enabled
+        ? (await experimentRef.collection(collectionId).get()).docs.map(
+            (doc) => doc.data() as T,
+          )
+        : [];
+    const [mediatorAgents, participantAgents, agentPromptDocs] =
+      await Promise.all([
+        getDocs<AgentMediatorPersonaConfig>(
+          selection.agentMediatorMap,
+          'agentMediators',
+        ),
+        getDocs<AgentParticipantPersonaConfig>(
+          selection.agentParticipantMap,
+          'agentParticipants',
+        ),
+        getExperimentCollectionGroup(firestore, experimentId, 'prompts'),
+      ]);
+    const {agentMediatorMap, agentParticipantMap} = assembleAgentTemplates(
+      mediatorAgents,
+      participantAgents,
+      agentPromptDocs,
+    );
+    for (const [id, template] of Object.entries(agentMediatorMap)) {
+      yield toRecord({type: 'agentMediator', id, data: template});
+    }
+    for (const [id, template] of Object.entries(agentParticipantMap)) {
+      yield toRecord({type: 'agentParticipant', id, data: template});
+    }
+  }
+
+  if (selection.alerts) {
+    // Group alerts by participant private ID, as in ExperimentDownload
+    const alerts = new Map<string, AlertMessage[]>();
+    const alertDocs = await experimentRef
+      .collection('alerts')
+      .orderBy('timestamp', 'asc')
+      .get();
+    for (const doc of alertDocs.docs) {
+      const alert = doc.data() as AlertMessage;
+      const group = alerts.get(alert.participantId) ?? [];
+      group.push(alert);
+      alerts.set(alert.participantId, group);
+    }
+    for (const [participantId, group] of alerts) {
+      for (const alert of group) {
+        yield toRecord({type: 'alert', participantId, data: alert});
+      }
+    }
+  }
+}
+
+/**
+ * Build agent mediator and participant templates from persona configs and
+ * the experiment's 'prompts' collection-group docs.
+ */
+function assembleAgentTemplates(
+  mediatorAgents: AgentMediatorPersonaConfig[],
+  participantAgents: AgentParticipantPersonaConfig[],
+  agentPromptDocs: QueryDocumentSnapshot[],
+): Pick<ExperimentDownload, 'agentMediatorMap' | 'agentParticipantMap'> {
+  const agentMediatorMap: Record<string, AgentMediatorTemplate> = {};
+  const mediatorPrompts = groupByParentDocument<MediatorPromptConfig>(
+    agentPromptDocs,
+    'agentMediators',
+  );
   for (const persona of mediatorAgents) {
-    const mediatorPrompts = (
-      await firestore
-        .collection('experiments')
-        .doc(experimentId)
-        .collection('agentMediators')
-        .doc(persona.id)
-        .collection('prompts')
-        .get()
-    ).docs.map((doc) => doc.data() as MediatorPromptConfig);
-    const mediatorTemplate: AgentMediatorTemplate = {
-      persona,
-      promptMap: {},
-    };
-    mediatorPrompts.forEach((prompt) => {
+    const mediatorTemplate: AgentMediatorTemplate = {persona, promptMap: {}};
+    for (const prompt of mediatorPrompts.get(persona.id) ?? []) {
       mediatorTemplate.promptMap[prompt.id] = prompt;
-    });
-    // Add to ExperimentDownload
-    experimentDownload.agentMediatorMap[persona.id] = mediatorTemplate;
+    }
+    agentMediatorMap[persona.id] = mediatorTemplate;
   }
 
-  // For each agent participant, add template
-  const participantAgents = (
-    await firestore
-      .collection('experiments')
-      .doc(experimentId)
-      .collection('agentParticipants')
-      .get()
-  ).docs.map((agent) => agent.data() as AgentParticipantPersonaConfig);
+  const agentParticipantMap: Record<string, AgentParticipantTemplate> = {};
+  const participantPrompts = groupByParentDocument<ParticipantPromptConfig>(
+    agentPromptDocs,
+    'agentParticipants',
+  );
   for (const persona of participantAgents) {
-    const participantPrompts = (
-      await firestore
-        .collection('experiments')
-        .doc(experimentId)
-        .collection('agentParticipants')
-        .doc(persona.id)
-        .collection('prompts')
-        .get()
-    ).docs.map((doc) => doc.data() as ParticipantPromptConfig);
     const participantTemplate: AgentParticipantTemplate = {
       persona,
       promptMap: {},
     };
-    participantPrompts.forEach((prompt) => {
+    for (const prompt of participantPrompts.get(persona.id) ?? []) {
       participantTemplate.promptMap[prompt.id] = prompt;
-    });
-    // Add to ExperimentDownload
-    experimentDownload.agentParticipantMap[persona.id] = participantTemplate;
+    }
+    agentParticipantMap[persona.id] = participantTemplate;
   }
+  return {agentMediatorMap, agentParticipantMap};
+}
 
-  if (includeParticipantData) {
-    // For each participant, add ParticipantDownload
-    const profiles = (
-      await firestore
-        .collection('experiments')
-        .doc(experimentId)
-        .collection('participants')
-        .get()
-    ).docs.map((doc) => doc.data() as ParticipantProfileExtended);
-    for (const profile of profiles) {
-      // Create new ParticipantDownload
-      const participantDownload = createParticipantDownload(profile);
-
-      // For each stage answer, add to ParticipantDownload map
-      const stageAnswers = (
+/** Build a ParticipantDownload from a profile and its stage answers. */
+function assembleParticipantDownload(
+  profile: ParticipantProfileExtended,
+  stageAnswers: StageParticipantAnswer[],
+): ParticipantDownload {
+  // Create new ParticipantDownload
+  const participantDownload = createParticipantDownload(profile);
+  // For each stage answer, add to ParticipantDownload map
+  for (const stage of stageAnswers) {
+    participantDownload.answerMap[stage.id] = stage;
+  }
+  return participantDownload;
+}
+
+/**
+ * Build a CohortDownload from a cohort config, its public stage data and
+ * a getter for the (ordered) chat messages of each chat stage.
+ */
+function assembleCohortDownload(
+  cohort: CohortConfig,
+  publicStageData: StagePublicData[],
+  getChats: (stageId: string) => QueryDocumentSnapshot[],
+  options: {includeData?: boolean; includeChats?: boolean} = {},
+): CohortDownload {
+  const {includeData = true, includeChats = true} = options;
+
+  // Create new CohortDownload
+  const cohortDownload = createCohortDownload(cohort);
+
+  for (const data of publicStageData) {
+    if (includeData) {
+      cohortDownload.dataMap[data.id] = data;
+    }
+    // If chat stage, add list of chat messages to CohortDownload
+    if (includeChats && data.kind === StageKind.CHAT) {
+      cohortDownload.chatMap[data.id] = getChats(data.id).map(
+        (doc) => doc.data() as ChatMessage,
+      );
+    }
+  }
+  return cohortDownload;
+}
+
+/**
+ * Build a ParticipantDownload for a single participant profile.
+ *
+ * @param includeAnswers - Whether to read the participant's stage answers
+ */
+async function buildParticipantDownload(
+  firestore: Firestore,
+  experimentId: string,
+  profile: ParticipantProfileExtended,
+  includeAnswers = true,
+): Promise<ParticipantDownload> {
+  const stageAnswers = includeAnswers
+    ? (
         await firestore
           .collection('experiments')
           .doc(experimentId)
@@ -156,85 +643,133 @@ export async function getExperimentDownload(
           .doc(profile.privateId)
           .collection('stageData')
           .get()
-      ).docs.map((doc) => doc.data() as StageParticipantAnswer);
-      for (const stage of stageAnswers) {
-        participantDownload.answerMap[stage.id] = stage;
-      }
-      // Add ParticipantDownload to ExperimentDownload
-      experimentDownload.participantMap[profile.publicId] = participantDownload;
-    }
+      ).docs.map((doc) => doc.data() as StageParticipantAnswer)
+    : [];
+  return assembleParticipantDownload(profile, stageAnswers);
+}
 
-    // For each cohort, add CohortDownload
-    const cohorts = (
-      await firestore
-        .collection('experiments')
-        .doc(experimentId)
-        .collection('cohorts')
-        .get()
-    ).docs.map((cohort) => cohort.data() as CohortConfig);
-    for (const cohort of cohorts) {
-      // Create new CohortDownload
-      const cohortDownload = createCohortDownload(cohort);
-
-      // For each public stage data, add to CohortDownload
-      const publicStageData = (
-        await firestore
-          .collection('experiments')
-          .doc(experimentId)
-          .collection('cohorts')
-          .doc(cohort.id)
-          .collection('publicStageData')
+/**
+ * Build a CohortDownload for a single cohort config.
+ *
+ * Chat transcripts of the cohort's chat stages are read concurrently
+ * (at most DOWNLOAD_READ_CONCURRENCY at a time).
+ *
+ * @param options.includeData - Whether to fill dataMap (public stage data)
+ * @param options.includeChats - Whether to fill chatMap (chat transcripts)
+ */
+async function buildCohortDownload(
+  firestore: Firestore,
+  experimentId: string,
+  cohort: CohortConfig,
+  options: {includeData?: boolean; includeChats?: boolean} = {},
+): Promise<CohortDownload> {
+  const {includeData = true, includeChats = true} = options;
+  const publicStageDataRef = firestore
+    .collection('experiments')
+    .doc(experimentId)
+    .collection('cohorts')
+    .doc(cohort.id)
+    .collection('publicStageData');
+
+  // Public stage data is also needed to find chat stages when only chats
+  // are requested
+  const publicStageData =
+    includeData || includeChats
+      ? (await publicStageDataRef.get()).docs.map(
+          (doc) => doc.data() as StagePublicData,
+        )
+      : [];
+  const chatStageIds = includeChats
+    ? publicStageData
+        .filter((data) => data.kind === StageKind.CHAT)
+        .map((data) => data.id)
+    : [];
+  const chatLists = await mapWithConcurrency(
+    chatStageIds,
+    DOWNLOAD_READ_CONCURRENCY,
+    async (stageId) =>
+      (
+        await publicStageDataRef
+          .doc(stageId)
+          .collection('chats')
+          .orderBy('timestamp', 'asc')
           .get()
-      ).docs.map((doc) => doc.data() as StagePublicData);
-      for (const data of publicStageData) {
-        cohortDownload.dataMap[data.id] = data;
-        // If chat stage, add list of chat messages to CohortDownload
-        if (data.kind === StageKind.CHAT) {
-          const chatList = (
-            await firestore
-              .collection('experiments')
-              .doc(experimentId)
-              .collection('cohorts')
-              .doc(cohort.id)
-              .collection('publicStageData')
-              .doc(data.id)
-              .collection('chats')
-              .orderBy('timestamp', 'asc')
-              .get()
-          ).docs.map((doc) => doc.data() as ChatMessage);
-          cohortDownload.chatMap[data.id] = chatList;
-        }
-      }
+      ).docs,
+  );
+  const chats = new Map(
+    chatStageIds.map((stageId, index) => [stageId, chatLists[index]]),
+  );
+  return assembleCohortDownload(
+    cohort,
+    publicStageData,
+    (stageId) => chats.get(stageId) ?? [],
+    options,
+  );
+}
 
-      // Add CohortDownload to ExperimentDownload
-      experimentDownload.cohortMap[cohort.id] = cohortDownload;
-    }
+/**
+ * Build the CohortDownload (cohort config, public stage data and chat
+ * transcripts) for one cohort, i.e., the matching slice of
+ * ExperimentDownload.cohortMap.
+ *
+ * @returns Cohort download data, or null if cohort not found
+ */
+export async function getCohortDownload(
+  firestore: Firestore,
+  experimentId: string,
+  cohortId: string,
+): Promise<CohortDownload | null> {
+  const cohort = (
+    await firestore
+      .collection('experiments')
+      .doc(experimentId)
+      .collection('cohorts')
+      .doc(cohortId)
+      .get()
+  ).data() as CohortConfig | undefined;
 
-    // Add alerts to ExperimentDownload
-    const alertList = (
-      await firestore
-        .collection('experiments')
-        .doc(experimentId)
-        .collection('alerts')
-        .orderBy('timestamp', 'asc')
-        .get()
-    ).docs.map((doc) => doc.data() as AlertMessage);
-
-    // Group alerts by participant private ID
-    for (const alert of alertList) {
-      const participantId = alert.participantId;
-      if (!experimentDownload.alerts[participantId]) {
-        experimentDownload.alerts[participantId] = [];
-      }
-      experimentDownload.alerts[participantId].push(alert);
-    }
+  if (!cohort) {
+    return null;
   }
 
-  // Convert all Timestamp objects to UnifiedTimestamp format
-  const normalized = convertTimestamps(
-    experimentDownload,
-  ) as ExperimentDownload;
-  return normalized;
+  const cohortDownload = await buildCohortDownload(
+    firestore,
+    experimentId,
+    cohort,
+  );
+  return convertTimestamps(cohortDownload) as CohortDownload;
+}
+
+/**
+ * Build the ParticipantDownload (profile and stage answers) for one
+ * participant, i.e., the matching slice of ExperimentDownload.participantMap.
+ *
+ * @param publicId - Participant public ID (the participantMap key)
+ * @returns Participant download data, or null if participant not found
+ */
+export async function getParticipantDownload(
+  firestore: Firestore,
+  experimentId: string,
+  publicId: string,
+): Promise<ParticipantDownload | null> {
+  const snapshot = await firestore
+    .collection('experiments')
+    .doc(experimentId)
+    .collection('participants')
+    .where('publicId', '==', publicId)
+    .limit(1)
+    .get();
+
+  if (snapshot.empty) {
+    return null;
+  }
+
+  const participantDownload = await buildParticipantDownload(
+    firestore,
+    experimentId,
+    snapshot.docs[0].data() as ParticipantProfileExtended,
+  );
+  return convertTimestamps(participantDownload) as ParticipantDownload;
 }
 
 /**
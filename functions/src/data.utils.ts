@@ -52,3 +52,29 @@ export function convertTimestamps(obj: any): any {
   // Return primitives as-is
   return obj;
 }
+
+/**
+ * Map over items with at most `limit` calls of fn in flight at once.
+ * Results are returned in input order; the first rejection rejects the
+ * whole call (calls already started are left to settle).
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+  const workers = Array.from(
+    {length: Math.max(1, Math.min(limit, items.length))},
+    worker,
+  );
+  await Promise.all(workers);
+  return results;
+}
@@ -123,6 +123,37 @@ describe('Cohort API Integration Tests', () => {
       expect(names).toContain('Cohort B');
     });
 
+    it('should paginate and filter cohorts', async () => {
+      const experimentId = await createTestExperiment('Paged Cohorts Test');
+
+      await createCohortViaApi(apiRequest, experimentId, 'Arm 1');
+      await createCohortViaApi(apiRequest, experimentId, 'Arm 2');
+      await createCohortViaApi(apiRequest, experimentId, 'Control');
+
+      const firstResponse = await apiRequest(
+        'GET',
+        `/v1/experiments/${experimentId}/cohorts?namePrefix=Arm&limit=1`,
+      );
+      expect(firstResponse.status).toBe(200);
+      const firstPage = await firstResponse.json();
+      expect(firstPage.cohorts).toHaveLength(1);
+      expect(firstPage.nextCursor).toBeTruthy();
+
+      const secondResponse = await apiRequest(
+        'GET',
+        `/v1/experiments/${experimentId}/cohorts?namePrefix=Arm&limit=1&cursor=${firstPage.nextCursor}`,
+      );
+      expect(secondResponse.status).toBe(200);
+      const secondPage = await secondResponse.json();
+      expect(secondPage.cohorts).toHaveLength(1);
+      expect(secondPage.nextCursor).toBeNull();
+
+      const names = [...firstPage.cohorts, ...secondPage.cohorts].map(
+        (c: CohortConfig) => c.metadata.name,
+      );
+      expect(names.sort()).toEqual(['Arm 1', 'Arm 2']);
+    });
+
     it('should return 404 for non-existent experiment', async () => {
       const response = await apiRequest(
         'GET',
@@ -310,6 +341,43 @@ describe('Cohort API Integration Tests', () => {
     });
   });
 
+  describe('GET /v1/experiments/:id/export/cohorts/:cohortId (export cohort)', () => {
+    it('should export a single cohort download', async () => {
+      const template = getFlipCardExperimentTemplate();
+      const experimentId = await createTestExperiment(
+        'Export Cohort Test',
+        template.stageConfigs,
+      );
+      const cohortId = await createCohortViaApi(
+        apiRequest,
+        experimentId,
+        'Export Me',
+      );
+
+      const response = await apiRequest(
+        'GET',
+        `/v1/experiments/${experimentId}/export/cohorts/${cohortId}`,
+      );
+      expect(response.status).toBe(200);
+
+      const data = await response.json();
+      expect(data.cohort.id).toBe(cohortId);
+      expect(data.cohort.metadata.name).toBe('Export Me');
+      expect(data.dataMap).toBeDefined();
+      expect(data.chatMap).toBeDefined();
+    });
+
+    it('should return 404 for non-existent cohort', async () => {
+      const experimentId = await createTestExperiment('Export Missing Cohort');
+
+      const response = await apiRequest(
+        'GET',
+        `/v1/experiments/${experimentId}/export/cohorts/non-existent-cohort`,
+      );
+      expect(response.status).toBe(404);
+    });
+  });
+
   describe('PUT /v1/experiments/:experimentId/cohorts/:cohortId (update)', () => {
     it('should update cohort name', async () => {
       const experimentId = await createTestExperiment('Update Name Test');
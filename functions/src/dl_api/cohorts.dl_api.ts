@@ -7,7 +7,10 @@ import {Response} from 'express';
 import createHttpError from 'http-errors';
 import {
   DeliberateLabAPIRequest,
+  applyMetadataFilters,
+  getListPage,
   hasDeliberateLabAPIPermission,
+  parseListQueryOptions,
   verifyExperimentAccess,
   verifyExperimentOwnership,
 } from './dl_api.utils';
@@ -51,6 +54,9 @@ interface UpdateCohortRequest {
 
 /**
  * List cohorts for an experiment
+ *
+ * Supports the same pagination (limit, cursor) and metadata filters
+ * (tag, namePrefix, modifiedAfter, modifiedBefore) as listExperiments.
  */
 export async function listCohorts(
   req: DeliberateLabAPIRequest,
@@ -67,17 +73,24 @@ export async function listCohorts(
     throw createHttpError(400, 'Experiment ID required');
   }
 
+  const options = parseListQueryOptions(req);
+
   // Verify access to experiment
   await verifyExperimentAccess(experimentId, experimenterId);
 
-  const snapshot = await app
+  const collection = app
     .firestore()
     .collection('experiments')
     .doc(experimentId)
-    .collection('cohorts')
-    .get();
+    .collection('cohorts');
+
+  const {docs, nextCursor} = await getListPage(
+    applyMetadataFilters(collection, options),
+    collection,
+    options,
+  );
 
-  const cohorts = snapshot.docs.map((doc) => ({
+  const cohorts = docs.map((doc) => ({
     id: doc.id,
     ...doc.data(),
   }));
@@ -85,6 +98,7 @@ export async function listCohorts(
   res.status(200).json({
     cohorts,
     total: cohorts.length,
+    nextCursor,
   });
 }
 
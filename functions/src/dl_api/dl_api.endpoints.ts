@@ -22,6 +22,8 @@ import {
   deleteExperiment,
   exportExperimentData,
   exportExperimentLogs,
+  exportCohortData,
+  exportParticipantData,
   forkExperiment,
 } from './experiments.dl_api';
 import {
@@ -74,6 +76,11 @@ app.put('/v1/experiments/:id', updateExperiment);
 app.delete('/v1/experiments/:id', deleteExperiment);
 app.get('/v1/experiments/:id/export', exportExperimentData);
 app.get('/v1/experiments/:id/export/logs', exportExperimentLogs);
+app.get('/v1/experiments/:id/export/cohorts/:cohortId', exportCohortData);
+app.get(
+  '/v1/experiments/:id/export/participants/:publicId',
+  exportParticipantData,
+);
 app.post('/v1/experiments/:id/fork', forkExperiment);
 
 // API Routes - Cohorts (nested under experiments)
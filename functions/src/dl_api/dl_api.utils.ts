@@ -5,7 +5,19 @@
 
 import {Request, Response, NextFunction} from 'express';
 import createHttpError from 'http-errors';
-import {Experiment} from '@deliberation-lab/utils';
+import {
+  CollectionReference,
+  Query,
+  QueryDocumentSnapshot,
+  Timestamp,
+} from 'firebase-admin/firestore';
+import {
+  EXPERIMENT_DOWNLOAD_SECTIONS,
+  Experiment,
+  ExperimentDownload,
+  ExperimentDownloadSection,
+  isExperimentDownloadSection,
+} from '@deliberation-lab/utils';
 import {
   verifyDeliberateLabAPIKey,
   extractDeliberateLabBearerToken,
@@ -190,3 +202,209 @@ export async function verifyExperimentOwnership(
 
   return experiment;
 }
+
+// ************************************************************************* //
+// LIST PAGINATION AND FILTER HELPERS                                        //
+// ************************************************************************* //
+
+/** Maximum number of documents returned by a single list request. */
+export const MAX_LIST_PAGE_SIZE = 500;
+
+/**
+ * Pagination and metadata filters shared by the list endpoints.
+ * All filters apply to the document's `metadata` field.
+ */
+export interface ListQueryOptions {
+  /** Page size. When omitted, all matching documents are returned. */
+  limit?: number;
+  /** ID of the last document of the previous page. */
+  cursor?: string;
+  /** Only include documents whose metadata.tags contain this tag. */
+  tag?: string;
+  /** Only include documents whose metadata.name starts with this prefix. */
+  namePrefix?: string;
+  /** Only include documents modified at or after this time. */
+  modifiedAfter?: Timestamp;
+  /** Only include documents modified strictly before this time. */
+  modifiedBefore?: Timestamp;
+}
+
+/**
+ * Read a single string query parameter.
+ * Throws HttpError if the parameter is repeated or not a string.
+ */
+export function getQueryParam(req: Request, name: string): string | undefined {
+  const value = req.query[name];
+  if (value === undefined || value === '') {
+    return undefined;
+  }
+  if (typeof value !== 'string') {
+    throw createHttpError(400, `Invalid query parameter: ${name}`);
+  }
+  return value;
+}
+
+/** Parse an ISO 8601 date query parameter into a Firestore Timestamp. */
+function getTimestampQueryParam(
+  req: Request,
+  name: string,
+): Timestamp | undefined {
+  const value = getQueryParam(req, name);
+  if (value === undefined) {
+    return undefined;
+  }
+  const date = new Date(value);
+  if (isNaN(date.getTime())) {
+    throw createHttpError(
+      400,
+      `Invalid query parameter: ${name} must be an ISO 8601 date`,
+    );
+  }
+  return Timestamp.fromDate(date);
+}
+
+/**
+ * Parse pagination and filter query parameters for list endpoints:
+ * limit, cursor, tag, namePrefix, modifiedAfter, modifiedBefore.
+ * Throws HttpError if any parameter is malformed.
+ */
+export function parseListQueryOptions(req: Request): ListQueryOptions {
+  const options: ListQueryOptions = {
+    cursor: getQueryParam(req, 'cursor'),
+    tag: getQueryParam(req, 'tag'),
+    namePrefix: getQueryParam(req, 'namePrefix'),
+    modifiedAfter: getTimestampQueryParam(req, 'modifiedAfter'),
+    modifiedBefore: getTimestampQueryParam(req, 'modifiedBefore'),
+  };
+
+  const limit = getQueryParam(req, 'limit');
+  if (limit !== undefined) {
+    const parsed = Number(limit);
+    if (!Number.isInteger(parsed) || parsed < 1) {
+      throw createHttpError(
+        400,
+        'Invalid query parameter: limit must be a positive integer',
+      );
+    }
+    options.limit = Math.min(parsed, MAX_LIST_PAGE_SIZE);
+  }
+
+  return options;
+}
+
+/**
+ * Apply metadata filters from ListQueryOptions to a Firestore query.
+ *
+ * Every combination of these filters (with the experiment list's creator
+ * and visibility equalities) needs a composite index; keep
+ * firestore/indexes.json in sync when adding a filter.
+ */
+export function applyMetadataFilters(
+  query: Query,
+  options: ListQueryOptions,
+): Query {
+  if (options.tag !== undefined) {
+    query = query.where('metadata.tags', 'array-contains', options.tag);
+  }
+  if (options.namePrefix !== undefined) {
+    query = query
+      .where('metadata.name', '>=', options.namePrefix)
+      .where('metadata.name', '<', `${options.namePrefix}\uf8ff`);
+  }
+  if (options.modifiedAfter !== undefined) {
+    query = query.where('metadata.dateModified', '>=', options.modifiedAfter);
+  }
+  if (options.modifiedBefore !== undefined) {
+    query = query.where('metadata.dateModified', '<', options.modifiedBefore);
+  }
+  return query;
+}
+
+/**
+ * Fetch one page of a (filtered) list query.
+ *
+ * The cursor is the ID of the last document returned by the previous page;
+ * paging resumes after that document's snapshot so it works with whatever
+ * ordering Firestore derives from the applied filters.
+ * Returns nextCursor = null when there are no more results.
+ */
+export async function getListPage(
+  query: Query,
+  collection: CollectionReference,
+  options: ListQueryOptions,
+): Promise<{docs: QueryDocumentSnapshot[]; nextCursor: string | null}> {
+  if (options.cursor !== undefined) {
+    const cursorDoc = await collection.doc(options.cursor).get();
+    if (!cursorDoc.exists) {
+      throw createHttpError(400, 'Invalid query parameter: cursor');
+    }
+    query = query.startAfter(cursorDoc);
+  }
+
+  if (options.limit === undefined) {
+    return {docs: (await query.get()).docs, nextCursor: null};
+  }
+
+  // Fetch one extra document to detect whether another page exists
+  const docs = (await query.limit(options.limit + 1).get()).docs;
+  if (docs.length <= options.limit) {
+    return {docs, nextCursor: null};
+  }
+  const page = docs.slice(0, options.limit);
+  return {docs: page, nextCursor: page[page.length - 1].id};
+}
+
+// ************************************************************************* //
+// EXPORT SECTION HELPERS                                                    //
+// ************************************************************************* //
+
+/**
+ * Parse the comma-separated `sections` query parameter.
+ * Returns undefined if not provided (i.e., all allowed sections).
+ * Throws HttpError if any section is unknown or not in allowedSections.
+ */
+export function parseSectionsQueryParam(
+  req: Request,
+  allowedSections?: ExperimentDownloadSection[],
+): ExperimentDownloadSection[] | undefined {
+  const value = getQueryParam(req, 'sections');
+  if (value === undefined) {
+    return undefined;
+  }
+
+  const sections = value
+    .split(',')
+    .map((section) => section.trim())
+    .filter((section) => section.length > 0);
+  const allowed: readonly string[] =
+    allowedSections ?? EXPERIMENT_DOWNLOAD_SECTIONS;
+  const invalid = sections.filter(
+    (section) =>
+      !isExperimentDownloadSection(section) || !allowed.includes(section),
+  );
+  if (invalid.length > 0) {
+    throw createHttpError(
+      400,
+      `Invalid sections: ${invalid.join(', ')}. Allowed: ${allowed.join(', ')}`,
+    );
+  }
+  return sections as ExperimentDownloadSection[];
+}
+
+/**
+ * Keep only `experiment` and the top-level ExperimentDownload keys
+ * covered by the requested sections (e.g., `cohortMap.chatMap` keeps
+ * `cohortMap`).
+ */
+export function pickExperimentDownloadSections(
+  data: ExperimentDownload,
+  sections: ExperimentDownloadSection[],
+): Partial<ExperimentDownload> {
+  const result: Partial<ExperimentDownload> = {experiment: data.experiment};
+  for (const section of sections) {
+    const key = section.split('.')[0] as keyof ExperimentDownload;
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    (result as any)[key] = data[key];
+  }
+  return result;
+}
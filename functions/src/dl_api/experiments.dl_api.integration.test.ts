@@ -15,8 +15,10 @@ import {
   ProlificConfig,
   Visibility,
   createExperimentConfig,
+  createParticipantProfileExtended,
   createPrivateChatStage,
   createSurveyStage,
+  createSurveyStageParticipantAnswer,
   SurveyQuestionKind,
 } from '@deliberation-lab/utils';
 import {
@@ -415,6 +417,57 @@ describe('API Experiment Creation Integration Tests', () => {
         expect(ids).toContain(exp1Id);
         expect(ids).toContain(exp2Id);
       });
+
+      it('should paginate experiments with limit and cursor', async () => {
+        const expIds = [
+          await createTestExperiment('Paged 1', 'First', []),
+          await createTestExperiment('Paged 2', 'Second', []),
+          await createTestExperiment('Paged 3', 'Third', []),
+        ];
+
+        const firstResponse = await apiRequest(
+          'GET',
+          '/v1/experiments?limit=2',
+        );
+        expect(firstResponse.status).toBe(200);
+        const firstPage = await firstResponse.json();
+        expect(firstPage.experiments).toHaveLength(2);
+        expect(firstPage.nextCursor).toBeTruthy();
+
+        const secondResponse = await apiRequest(
+          'GET',
+          `/v1/experiments?limit=2&cursor=${firstPage.nextCursor}`,
+        );
+        expect(secondResponse.status).toBe(200);
+        const secondPage = await secondResponse.json();
+        expect(secondPage.experiments).toHaveLength(1);
+        expect(secondPage.nextCursor).toBeNull();
+
+        const ids = [...firstPage.experiments, ...secondPage.experiments].map(
+          (e: {id: string}) => e.id,
+        );
+        expect(ids.sort()).toEqual([...expIds].sort());
+      });
+
+      it('should filter experiments by name prefix', async () => {
+        const matchId = await createTestExperiment('Pilot A', 'Match', []);
+        await createTestExperiment('Main Study', 'No match', []);
+
+        const response = await apiRequest(
+          'GET',
+          '/v1/experiments?namePrefix=Pilot',
+        );
+        expect(response.status).toBe(200);
+
+        const data = await response.json();
+        expect(data.total).toBe(1);
+        expect(data.experiments[0].id).toBe(matchId);
+      });
+
+      it('should reject invalid pagination parameters', async () => {
+        const response = await apiRequest('GET', '/v1/experiments?limit=0');
+        expect(response.status).toBe(400);
+      });
     });
 
     describe('GET /v1/experiments/:id (get)', () => {
@@ -706,6 +759,154 @@ describe('API Experiment Creation Integration Tests', () => {
         expect(data.cohortMap).toBeDefined();
         expect(data.alerts).toBeDefined();
       });
+
+      it('should export only requested sections', async () => {
+        const template = getFlipCardExperimentTemplate();
+        const experimentId = await createTestExperiment(
+          'Export Sections Test',
+          'Testing export sections',
+          template.stageConfigs,
+        );
+
+        const response = await apiRequest(
+          'GET',
+          `/v1/experiments/${experimentId}/export?sections=stageMap,alerts`,
+        );
+        expect(response.status).toBe(200);
+
+        const data = await response.json();
+        expect(data.experiment.id).toBe(experimentId);
+        expect(Object.keys(data.stageMap).length).toBe(
+          template.stageConfigs.length,
+        );
+        expect(data.alerts).toBeDefined();
+        expect(data.participantMap).toBeUndefined();
+        expect(data.cohortMap).toBeUndefined();
+        expect(data.agentMediatorMap).toBeUndefined();
+      });
+
+      it('should stream export records with format=ndjson', async () => {
+        const template = getFlipCardExperimentTemplate();
+        const experimentId = await createTestExperiment(
+          'Export NDJSON Test',
+          'Testing streamed export',
+          template.stageConfigs,
+        );
+
+        const response = await apiRequest(
+          'GET',
+          `/v1/experiments/${experimentId}/export?format=ndjson`,
+        );
+        expect(response.status).toBe(200);
+        expect(response.headers.get('content-type')).toContain(
+          'application/x-ndjson',
+        );
+
+        const records = (await response.text())
+          .split('\n')
+          .filter((line) => line)
+          .map((line) => JSON.parse(line));
+        expect(records[0].type).toBe('experiment');
+        expect(records[0].data.id).toBe(experimentId);
+        const stageRecords = records.filter(
+          (record) => record.type === 'stage',
+        );
+        expect(stageRecords.map((record) => record.id)).toEqual(
+          expect.arrayContaining(
+            template.stageConfigs.map((stage) => stage.id),
+          ),
+        );
+        expect(stageRecords.length).toBe(template.stageConfigs.length);
+        expect(records.some((record) => record.type === 'error')).toBe(false);
+      });
+
+      it('should reject unsupported export formats', async () => {
+        const experimentId = await createTestExperiment(
+          'Export Bad Format Test',
+          'Testing invalid export format',
+          [],
+        );
+
+        const response = await apiRequest(
+          'GET',
+          `/v1/experiments/${experimentId}/export?format=csv`,
+        );
+        expect(response.status).toBe(400);
+      });
+
+      it('should export a single participant download', async () => {
+        const experimentId = await createTestExperiment(
+          'Export Participant Test',
+          'Testing participant export',
+          [],
+        );
+        const profile = createParticipantProfileExtended({
+          publicId: 'export-me',
+          currentStageId: 'survey',
+        });
+        const answer = createSurveyStageParticipantAnswer({
+          id: 'survey',
+          answerMap: {
+            q1: {id: 'q1', kind: SurveyQuestionKind.TEXT, answer: 'hello'},
+          },
+        });
+
+        // Participants are written by the app, not the API
+        await ctx.testEnv.withSecurityRulesDisabled(async (context) => {
+          const participantDoc = context
+            .firestore()
+            .collection(EXPERIMENTS_COLLECTION)
+            .doc(experimentId)
+            .collection('participants')
+            .doc(profile.privateId);
+          await participantDoc.set(serializeForFirestore(profile));
+          await participantDoc
+            .collection('stageData')
+            .doc(answer.id)
+            .set(serializeForFirestore(answer));
+        });
+
+        const response = await apiRequest(
+          'GET',
+          `/v1/experiments/${experimentId}/export/participants/export-me`,
+        );
+        expect(response.status).toBe(200);
+
+        const data = await response.json();
+        expect(data.profile.publicId).toBe('export-me');
+        expect(data.profile.privateId).toBe(profile.privateId);
+        expect(data.profile.currentStageId).toBe('survey');
+        expect(Object.keys(data.answerMap)).toEqual(['survey']);
+        expect(data.answerMap.survey.answerMap.q1.answer).toBe('hello');
+      });
+
+      it('should return 404 when exporting a non-existent participant', async () => {
+        const experimentId = await createTestExperiment(
+          'Export Missing Participant Test',
+          'Testing participant export',
+          [],
+        );
+
+        const response = await apiRequest(
+          'GET',
+          `/v1/experiments/${experimentId}/export/participants/non-existent`,
+        );
+        expect(response.status).toBe(404);
+      });
+
+      it('should reject unknown export sections', async () => {
+        const experimentId = await createTestExperiment(
+          'Export Bad Sections Test',
+          'Testing invalid export sections',
+          [],
+        );
+
+        const response = await apiRequest(
+          'GET',
+          `/v1/experiments/${experimentId}/export?sections=participants`,
+        );
+        expect(response.status).toBe(400);
+      });
     });
   });
 
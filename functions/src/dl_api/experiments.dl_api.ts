@@ -8,7 +8,13 @@ import {Value} from '@sinclair/typebox/value';
 import {app} from '../app';
 import {
   DeliberateLabAPIRequest,
+  applyMetadataFilters,
+  getListPage,
+  getQueryParam,
   hasDeliberateLabAPIPermission,
+  parseListQueryOptions,
+  parseSectionsQueryParam,
+  pickExperimentDownloadSections,
   verifyExperimentAccess,
 } from './dl_api.utils';
 import {Timestamp} from 'firebase-admin/firestore';
@@ -20,15 +26,23 @@ import {
   CreateExperimentRequestData,
   DEFAULT_LOGS_PAGE_SIZE,
   Experiment,
+  ExperimentDownloadSection,
   ExperimentTemplate,
   LogEntry,
   MetadataConfig,
   StageConfig,
   ProlificConfig,
   UnifiedTimestamp,
+  Visibility,
 } from '@deliberation-lab/utils';
 import {getFirestoreExperimentRef} from '../utils/firestore';
-import {getExperimentDownload, getExperimentLogs} from '../data';
+import {
+  getCohortDownload,
+  getExperimentDownload,
+  getExperimentLogs,
+  getParticipantDownload,
+  streamExperimentDownload,
+} from '../data';
 import {JsonStreamStringify} from 'json-stream-stringify';
 import {
   deleteExperimentById,
@@ -81,8 +95,21 @@ interface UpdateExperimentRequest {
   template?: ExperimentTemplate;
 }
 
+/** Sections that GET /experiments/:id can return. */
+const GET_EXPERIMENT_SECTIONS: ExperimentDownloadSection[] = [
+  'stageMap',
+  'agentMediatorMap',
+  'agentParticipantMap',
+];
+
 /**
  * List experiments for the authenticated user
+ *
+ * Supports optional query parameters:
+ * - limit / cursor: cursor-based pagination (cursor is the nextCursor
+ *   returned by the previous page)
+ * - tag, namePrefix, modifiedAfter, modifiedBefore: metadata filters
+ * - visibility: 'public' or 'private'
  */
 export async function listExperiments(
   req: DeliberateLabAPIRequest,
@@ -93,15 +120,32 @@ export async function listExperiments(
   }
 
   const experimenterId = req.deliberateLabAPIKeyData!.experimenterId;
+  const options = parseListQueryOptions(req);
+
+  const visibility = getQueryParam(req, 'visibility');
+  if (
+    visibility !== undefined &&
+    !Object.values(Visibility).includes(visibility as Visibility)
+  ) {
+    throw createHttpError(
+      400,
+      'Invalid query parameter: visibility must be public or private',
+    );
+  }
 
   // Get experiments where user is creator or has read access
-  const snapshot = await app
-    .firestore()
-    .collection('experiments')
-    .where('metadata.creator', '==', experimenterId)
-    .get();
+  const collection = app.firestore().collection('experiments');
+  let query = applyMetadataFilters(
+    collection.where('metadata.creator', '==', experimenterId),
+    options,
+  );
+  if (visibility !== undefined) {
+    query = query.where('permissions.visibility', '==', visibility);
+  }
 
-  const experiments = snapshot.docs.map((doc) => ({
+  const {docs, nextCursor} = await getListPage(query, collection, options);
+
+  const experiments = docs.map((doc) => ({
     id: doc.id,
     ...doc.data(),
   }));
@@ -109,6 +153,7 @@ export async function listExperiments(
   res.status(200).json({
     experiments,
     total: experiments.length,
+    nextCursor,
   });
 }
 
@@ -241,6 +286,9 @@ export async function createExperiment(
 
 /**
  * Get a specific experiment
+ *
+ * Optional `sections` query parameter (comma-separated) restricts the
+ * response to a subset of stageMap, agentMediatorMap, agentParticipantMap.
  */
 export async function getExperiment(
   req: DeliberateLabAPIRequest,
@@ -257,12 +305,16 @@ export async function getExperiment(
     throw createHttpError(400, 'Experiment ID required');
   }
 
+  const sections =
+    parseSectionsQueryParam(req, GET_EXPERIMENT_SECTIONS) ??
+    GET_EXPERIMENT_SECTIONS;
+
   // Verify access permissions before fetching full data
   await verifyExperimentAccess(experimentId, experimenterId);
 
-  // Now fetch full experiment data (stages, agents, etc.)
+  // Now fetch requested experiment data (stages, agents, etc.)
   const data = await getExperimentDownload(app.firestore(), experimentId, {
-    includeParticipantData: false,
+    sections,
   });
 
   if (!data) {
@@ -270,10 +322,8 @@ export async function getExperiment(
   }
 
   res.status(200).json({
+    ...pickExperimentDownloadSections(data, sections),
     experiment: {...data.experiment, id: experimentId},
-    stageMap: data.stageMap,
-    agentMediatorMap: data.agentMediatorMap,
-    agentParticipantMap: data.agentParticipantMap,
   });
 }
 
@@ -471,6 +521,9 @@ export async function deleteExperiment(
 /**
  * Export experiment data
  * Returns comprehensive ExperimentDownload structure with all related data
+ *
+ * Optional `sections` query parameter (comma-separated, see
+ * EXPERIMENT_DOWNLOAD_SECTIONS) builds and returns only those sections.
  */
 export async function exportExperimentData(
   req: DeliberateLabAPIRequest,
@@ -487,28 +540,182 @@ export async function exportExperimentData(
     throw createHttpError(400, 'Experiment ID required');
   }
 
+  // Format response based on query parameter
+  const format = req.query.format || 'json';
+
+  if (format !== 'json' && format !== 'ndjson') {
+    throw createHttpError(
+      400,
+      'Unsupported format. Use format=json or format=ndjson',
+    );
+  }
+
+  const sections = parseSectionsQueryParam(req);
+
   // Verify access permissions
   await verifyExperimentAccess(experimentId, experimenterId);
 
-  // Use the shared function to get full experiment data
+  if (format === 'ndjson') {
+    await streamExperimentRecords(res, experimentId, sections);
+    return;
+  }
+
+  // Use the shared function to get (requested) experiment data
   const experimentDownload = await getExperimentDownload(
     app.firestore(),
     experimentId,
+    {sections},
   );
 
   if (!experimentDownload) {
     throw createHttpError(500, 'Failed to load experiment data');
   }
 
-  // Format response based on query parameter
-  const format = req.query.format || 'json';
+  res.status(200).setHeader('Content-Type', 'application/json');
+  new JsonStreamStringify(
+    sections
+      ? pickExperimentDownloadSections(experimentDownload, sections)
+      : experimentDownload,
+  ).pipe(res);
+}
+
+/**
+ * Wait for the client to catch up (or disconnect). Both listeners are
+ * removed once either fires, so repeated waits do not accumulate
+ * 'close' listeners on the response.
+ */
+function waitForDrain(res: Response): Promise<void> {
+  return new Promise((resolve) => {
+    const done = () => {
+      res.off('drain', done);
+      res.off('close', done);
+      resolve();
+    };
+    res.on('drain', done);
+    res.on('close', done);
+  });
+}
+
+/**
+ * Write an experiment export as NDJSON records (see
+ * streamExperimentDownload), one line per record, as Firestore pages are
+ * read. Errors after the response has started cannot change its status,
+ * so they end the stream with an {"type": "error"} record.
+ */
+async function streamExperimentRecords(
+  res: Response,
+  experimentId: string,
+  sections?: ExperimentDownloadSection[],
+): Promise<void> {
+  const records = streamExperimentDownload(app.firestore(), experimentId, {
+    sections,
+  });
 
-  if (format !== 'json') {
-    throw createHttpError(400, 'Unsupported format. Use format=json');
+  // The experiment record comes first; without it there is nothing to send
+  const first = await records.next();
+  if (first.done) {
+    throw createHttpError(500, 'Failed to load experiment data');
+  }
+
+  res.status(200).setHeader('Content-Type', 'application/x-ndjson');
+  try {
+    let result = first;
+    while (!result.done && !res.destroyed) {
+      if (!res.write(JSON.stringify(result.value) + '\n')) {
+        await waitForDrain(res);
+      }
+      result = await records.next();
+    }
+  } catch (error) {
+    console.error('Error streaming experiment export:', error);
+    res.write(
+      JSON.stringify({type: 'error', error: 'Export interrupted'}) + '\n',
+    );
+  } finally {
+    await records.return(undefined);
+  }
+  res.end();
+}
+
+/**
+ * Export data for a single cohort
+ * Returns the CohortDownload (cohort config, dataMap and chatMap) that
+ * export would include under cohortMap[cohortId]
+ */
+export async function exportCohortData(
+  req: DeliberateLabAPIRequest,
+  res: Response,
+): Promise<void> {
+  if (!hasDeliberateLabAPIPermission(req, 'read')) {
+    throw createHttpError(403, 'Insufficient permissions');
+  }
+
+  const experimentId = req.params.id;
+  const cohortId = req.params.cohortId;
+  const experimenterId = req.deliberateLabAPIKeyData!.experimenterId;
+
+  if (!experimentId) {
+    throw createHttpError(400, 'Experiment ID required');
+  }
+  if (!cohortId) {
+    throw createHttpError(400, 'Cohort ID required');
+  }
+
+  // Verify access permissions
+  await verifyExperimentAccess(experimentId, experimenterId);
+
+  const cohortDownload = await getCohortDownload(
+    app.firestore(),
+    experimentId,
+    cohortId,
+  );
+
+  if (!cohortDownload) {
+    throw createHttpError(404, 'Cohort not found');
   }
 
   res.status(200).setHeader('Content-Type', 'application/json');
-  new JsonStreamStringify(experimentDownload).pipe(res);
+  new JsonStreamStringify(cohortDownload).pipe(res);
+}
+
+/**
+ * Export data for a single participant
+ * Returns the ParticipantDownload (profile and answerMap) that export
+ * would include under participantMap[publicId]
+ */
+export async function exportParticipantData(
+  req: DeliberateLabAPIRequest,
+  res: Response,
+): Promise<void> {
+  if (!hasDeliberateLabAPIPermission(req, 'read')) {
+    throw createHttpError(403, 'Insufficient permissions');
+  }
+
+  const experimentId = req.params.id;
+  const publicId = req.params.publicId;
+  const experimenterId = req.deliberateLabAPIKeyData!.experimenterId;
+
+  if (!experimentId) {
+    throw createHttpError(400, 'Experiment ID required');
+  }
+  if (!publicId) {
+    throw createHttpError(400, 'Participant public ID required');
+  }
+
+  // Verify access permissions
+  await verifyExperimentAccess(experimentId, experimenterId);
+
+  const participantDownload = await getParticipantDownload(
+    app.firestore(),
+    experimentId,
+    publicId,
+  );
+
+  if (!participantDownload) {
+    throw createHttpError(404, 'Participant not found');
+  }
+
+  res.status(200).json(participantDownload);
 }
 
 /**
@@ -12,6 +12,8 @@ Usage:
 """
 
 from deliberate_lab.client import Client, APIError
+from deliberate_lab.conditions import AnswerTable, compile_condition
+from deliberate_lab.store import ExportStore
 from deliberate_lab.types import *  # noqa: F401, F403
 
-__all__ = ["Client", "APIError"]
+__all__ = ["Client", "APIError", "ExportStore", "AnswerTable", "compile_condition"]
@@ -0,0 +1,358 @@
+"""
+Compact, randomly accessible archive for Deliberate Lab model logs.
+
+Agent prompts repeat the same system instructions and stage context in
+call after call. The archive splits each prompt into line-aligned,
+content-defined chunks and stores every distinct chunk once; a log entry
+keeps the rest of its fields plus the list of chunk IDs of its prompt.
+Chunks and entries are packed into separately zlib-compressed blocks, and
+a footer maps entry and chunk IDs to their block, so any entry can be read
+back (with its exact prompt) by decompressing one entry block and the
+chunk blocks its prompt uses.
+
+Chunk boundaries depend only on line content (a line ends a chunk when
+its hash hits a fixed pattern, or when the chunk grows too long), so the
+same instructions produce the same chunks wherever they appear in a prompt.
+
+Usage:
+    from deliberate_lab.archive import LogArchive, write_log_archive
+
+    manifest = write_log_archive(client.iter_experiment_logs("exp123"), "exp123.dla")
+    print(manifest["promptBytes"] / manifest["bytes"])
+
+    with LogArchive("exp123.dla") as archive:
+        entry = archive[1234]              # full log entry, prompt included
+        for entry in archive:              # sequential scan
+            ...
+"""
+
+from __future__ import annotations
+from array import array
+from collections import OrderedDict
+from typing import Any, Iterable, Iterator, Optional
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+
+ARCHIVE_VERSION = 1
+
+_MAGIC = b"DLLOGAR1"
+_FOOTER = struct.Struct(">Q8s")  # footer length, magic
+
+# Target uncompressed size of a block
+_BLOCK_SIZE = 1 << 18
+
+# A line ends a chunk when its hash has these low bits clear (about one
+# line in 8), or when the chunk reaches _MAX_CHUNK bytes
+_BOUNDARY_MASK = 0x7
+_MAX_CHUNK = 1 << 12
+
+
+def split_chunks(text: str) -> list[bytes]:
+    """Split text into line-aligned, content-defined UTF-8 chunks."""
+    chunks = []
+    current: list[bytes] = []
+    size = 0
+    for line in text.encode("utf-8").splitlines(keepends=True):
+        current.append(line)
+        size += len(line)
+        if size >= _MAX_CHUNK or zlib.crc32(line) & _BOUNDARY_MASK == 0:
+            chunks.append(b"".join(current))
+            current = []
+            size = 0
+    if current:
+        chunks.append(b"".join(current))
+    return chunks
+
+
+class _BlockWriter:
+    """Packs byte strings into zlib-compressed blocks of one file."""
+
+    def __init__(self, fp, level: int):
+        self._fp = fp
+        # [file offset, compressed length] per block
+        self.blocks: list[list[int]] = []
+        self._level = level
+        self._buffer = bytearray()
+
+    def add(self, data: bytes) -> tuple[int, int]:
+        """Queue data; returns (block number, offset within the block)."""
+        if self._buffer and len(self._buffer) + len(data) > _BLOCK_SIZE:
+            self.flush()
+        location = (len(self.blocks), len(self._buffer))
+        self._buffer += data
+        return location
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        compressed = zlib.compress(bytes(self._buffer), self._level)
+        self.blocks.append([self._fp.tell(), len(compressed)])
+        self._fp.write(compressed)
+        self._buffer = bytearray()
+
+
+class LogArchiveWriter:
+    """
+    Writes a log archive entry by entry.
+
+    Use as a context manager, or call close() to write the footer; an
+    archive without a footer cannot be opened.
+    """
+
+    def __init__(self, path: str, level: int = 6):
+        """
+        Args:
+            path: Destination file path
+            level: zlib compression level (1-9)
+        """
+        self.path = path
+        self._fp = open(path, "wb")  # pylint: disable=consider-using-with
+        self._fp.write(_MAGIC)
+        self._chunks = _BlockWriter(self._fp, level)
+        self._entries = _BlockWriter(self._fp, level)
+        self._chunk_ids: dict[bytes, int] = {}
+        # Per chunk / entry: block number, offset in block, length
+        self._chunk_locations = array("q")
+        self._entry_locations = array("q")
+        self._ids: list[str] = []
+        self.prompt_bytes = 0
+        self.chunk_bytes = 0
+
+    def __enter__(self) -> LogArchiveWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _chunk_id(self, chunk: bytes) -> int:
+        digest = hashlib.blake2b(chunk, digest_size=16).digest()
+        chunk_id = self._chunk_ids.get(digest)
+        if chunk_id is None:
+            chunk_id = self._chunk_ids[digest] = len(self._chunk_ids)
+            block, offset = self._chunks.add(chunk)
+            self._chunk_locations.extend((block, offset, len(chunk)))
+            self.chunk_bytes += len(chunk)
+        return chunk_id
+
+    def add(self, entry: dict) -> int:
+        """Append a log entry. Returns its position in the archive."""
+        prompt = entry.get("prompt")
+        if isinstance(prompt, str):
+            keys = list(entry)
+            rest = {key: value for key, value in entry.items() if key != "prompt"}
+            chunks = split_chunks(prompt)
+            self.prompt_bytes += sum(len(chunk) for chunk in chunks)
+            record = {
+                "e": rest,
+                "p": [self._chunk_id(chunk) for chunk in chunks],
+                "i": keys.index("prompt"),
+            }
+        else:
+            record = {"e": entry}
+        data = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+        block, offset = self._entries.add(data)
+        self._entry_locations.extend((block, offset, len(data)))
+        self._ids.append(entry.get("id", ""))
+        return len(self._ids) - 1
+
+    def close(self) -> dict:
+        """
+        Flush blocks and write the footer.
+
+        Returns:
+            Manifest dict with 'path', 'entries', 'chunks', 'promptBytes'
+            (raw prompt size), 'chunkBytes' (distinct chunk size) and
+            'bytes' (archive size)
+        """
+        if self._fp.closed:
+            return self.manifest()
+        self._chunks.flush()
+        self._entries.flush()
+        footer = zlib.compress(
+            json.dumps(
+                {
+                    "version": ARCHIVE_VERSION,
+                    "chunkBlocks": self._chunks.blocks,
+                    "entryBlocks": self._entries.blocks,
+                    "chunks": self._chunk_locations.tolist(),
+                    "entries": self._entry_locations.tolist(),
+                    "ids": self._ids,
+                },
+                separators=(",", ":"),
+            ).encode("utf-8")
+        )
+        self._fp.write(footer)
+        self._fp.write(_FOOTER.pack(len(footer), _MAGIC))
+        self._fp.close()
+        return self.manifest()
+
+    def manifest(self) -> dict:
+        return {
+            "path": self.path,
+            "entries": len(self._ids),
+            "chunks": len(self._chunk_ids),
+            "promptBytes": self.prompt_bytes,
+            "chunkBytes": self.chunk_bytes,
+            "bytes": os.path.getsize(self.path) if self._fp.closed else None,
+        }
+
+
+def write_log_archive(logs: Iterable[dict], path: str, level: int = 6) -> dict:
+    """
+    Write model log entries to an archive.
+
+    Args:
+        logs: Log entries, e.g. from Client.iter_experiment_logs() or
+              ndjson.iter_logs_ndjson()
+        path: Destination file path
+        level: zlib compression level (1-9)
+
+    Returns:
+        Manifest dict, as returned by LogArchiveWriter.close()
+    """
+    with LogArchiveWriter(path, level) as writer:
+        for entry in logs:
+            writer.add(entry)
+    return writer.manifest()
+
+
+class LogArchive:
+    """
+    Read-only random access to a log archive.
+
+    Decompressed blocks are kept in a small LRU cache, so scans and reads
+    of nearby entries decompress each block once.
+    """
+
+    def __init__(self, path: str, cache_blocks: int = 64):
+        """
+        Args:
+            path: Path of an archive written by LogArchiveWriter
+            cache_blocks: Number of decompressed blocks to cache
+        """
+        self.path = path
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(_MAGIC) + _FOOTER.size:
+            self._file.close()
+            raise ValueError(f"Not a complete log archive: {path}")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        footer_length, magic = _FOOTER.unpack(self._data[-_FOOTER.size :])
+        end = size - _FOOTER.size
+        footer = None
+        if (
+            self._data[: len(_MAGIC)] == _MAGIC
+            and magic == _MAGIC
+            and footer_length <= end - len(_MAGIC)
+        ):
+            try:
+                footer = json.loads(
+                    zlib.decompress(self._data[end - footer_length : end])
+                )
+            except (ValueError, zlib.error):
+                # Corrupted where the footer should be
+                pass
+        if not isinstance(footer, dict):
+            self.close()
+            raise ValueError(f"Not a complete log archive: {path}")
+        if footer.get("version") != ARCHIVE_VERSION:
+            self.close()
+            raise ValueError(
+                f"Unsupported log archive version: {footer.get('version')}"
+            )
+        self._chunk_blocks = footer["chunkBlocks"]
+        self._entry_blocks = footer["entryBlocks"]
+        self._chunks = array("q", footer["chunks"])
+        self._entries = array("q", footer["entries"])
+        self.ids: list[str] = footer["ids"]
+        self._positions: Optional[dict[str, int]] = None
+        self._cache: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+        self._cache_blocks = cache_blocks
+
+    def close(self) -> None:
+        if not self._data.closed:
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> LogArchive:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _block(self, blocks: list[list[int]], block: int) -> bytes:
+        key = (id(blocks), block)
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+            return data
+        offset, length = blocks[block]
+        data = zlib.decompress(self._data[offset : offset + length])
+        self._cache[key] = data
+        if len(self._cache) > self._cache_blocks:
+            self._cache.popitem(last=False)
+        return data
+
+    def _chunk(self, chunk_id: int) -> bytes:
+        block, offset, length = self._chunks[3 * chunk_id : 3 * chunk_id + 3]
+        return self._block(self._chunk_blocks, block)[offset : offset + length]
+
+    def _record(self, index: int) -> dict:
+        if not 0 <= index < len(self.ids):
+            raise IndexError(index)
+        block, offset, length = self._entries[3 * index : 3 * index + 3]
+        data = self._block(self._entry_blocks, block)[offset : offset + length]
+        return json.loads(data)
+
+    def prompt(self, index: int) -> Optional[str]:
+        """The prompt of an entry (None if the entry had no text prompt)."""
+        record = self._record(index)
+        if "p" not in record:
+            prompt = record["e"].get("prompt")
+            return prompt if isinstance(prompt, str) else None
+        return b"".join(self._chunk(c) for c in record["p"]).decode("utf-8")
+
+    def __getitem__(self, index: int) -> dict:
+        """The full log entry at a position."""
+        record = self._record(index)
+        entry = record["e"]
+        if "p" not in record:
+            return entry
+        prompt = b"".join(self._chunk(c) for c in record["p"])
+        items = list(entry.items())
+        items.insert(record["i"], ("prompt", prompt.decode("utf-8")))
+        return dict(items)
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(len(self.ids)):
+            yield self[index]
+
+    def get(self, log_id: str) -> dict:
+        """The log entry with a given log ID (KeyError if missing)."""
+        if self._positions is None:
+            self._positions = {log_id: i for i, log_id in enumerate(self.ids)}
+        return self[self._positions[log_id]]
+
+    def entries_without_prompts(self) -> Iterator[dict]:
+        """Scan entries without reassembling prompts (fastest scan)."""
+        for index in range(len(self.ids)):
+            yield self._record(index)["e"]
+
+    def stats(self) -> dict[str, Any]:
+        """Entry and chunk counts and sizes."""
+        return {
+            "entries": len(self.ids),
+            "chunks": len(self._chunks) // 3,
+            "chunkBytes": sum(self._chunks[2::3]),
+            "blocks": len(self._chunk_blocks) + len(self._entry_blocks),
+            "bytes": len(self._data),
+        }
@@ -0,0 +1,501 @@
+"""
+Fast ExperimentTemplate builder that validates once, at build() time.
+
+Building a large template from validated Pydantic models (and copying and
+re-validating them for every variant) validates the same stages over and
+over. TemplateBuilder instead collects parts as given - plain dicts,
+deliberate_lab.structs structs, or models made with Model.model_construct()
+- and validates each distinct part once, when build() is called. Copies of
+a builder share their parts and validation results, so building variants
+only validates the parts that changed.
+
+Validation errors are collected for the whole template and reported with
+the exact part and field, e.g.
+`stageConfigs[12] (survey 'demographics').questions[0].questionTitle:
+Field required`.
+
+Parts are treated as immutable once added: to change a stage, add or
+replace it with a new object rather than mutating the one already added.
+
+Usage:
+    from deliberate_lab.builder import TemplateBuilder
+
+    builder = TemplateBuilder(name="My Study")
+    builder.add_stage(dl.TOSStageConfig.model_construct(...))
+    builder.add_stages(survey_stage_dicts)
+    builder.add_agent_mediator(mediator)
+    template = builder.build()          # validated ExperimentTemplate
+    client.create_experiment(template=template)
+
+    # Variants share unchanged stages, which are not validated again
+    variant = builder.copy().replace_stage("chat", faster_chat_stage)
+    variant_template = variant.build()
+
+    # Validate stages in worker processes for very large templates
+    template = builder.build(workers=4)
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Optional, get_args
+import uuid
+
+from pydantic import BaseModel, ValidationError
+
+from deliberate_lab import types
+
+# Experiment config version (EXPERIMENT_VERSION_ID in utils/src/experiment.ts);
+# the server sets the current version when it writes the experiment
+EXPERIMENT_VERSION_ID = 19
+
+# Parts validated per worker task by build(workers=...)
+_CHUNK_SIZE = 64
+
+# Stage model classes by 'kind' (ranking stages share a kind and are
+# told apart by their other literal fields, e.g. 'rankingType')
+_STAGE_MODELS: dict[str, list[type[BaseModel]]] = {}
+
+
+def _stage_models(kind: Any) -> list[type[BaseModel]]:
+    if not _STAGE_MODELS:
+        annotation = types.ExperimentTemplate.model_fields["stageConfigs"].annotation
+        for model in get_args(get_args(annotation)[0]):
+            default = model.model_fields["kind"].default
+            _STAGE_MODELS.setdefault(default, []).append(model)
+    return _STAGE_MODELS.get(kind, [])
+
+
+def stage_model(stage: dict) -> Optional[type[BaseModel]]:
+    """The Pydantic model class for a stage config dict (None if unknown)."""
+    candidates = _stage_models(stage.get("kind"))
+    if len(candidates) < 2:
+        return candidates[0] if candidates else None
+    for model in candidates:
+        if all(
+            stage.get(name, field.default) == field.default
+            for name, field in model.model_fields.items()
+            if name != "kind" and isinstance(field.default, str)
+            # Literal fields only (their single value is their default)
+            and get_args(field.annotation) == (field.default,)
+        ):
+            return model
+    # Validation reports the mismatching literal field
+    return candidates[0]
+
+
+def _part_dict(part: Any) -> dict:
+    """JSON-ready dict of a dict, struct or (possibly unvalidated) model."""
+    if isinstance(part, dict):
+        return part
+    if hasattr(part, "model_dump"):
+        return part.model_dump(
+            mode="json", by_alias=True, exclude_none=True, warnings=False
+        )
+    return part.to_dict()
+
+
+def _part_id(part: Any) -> Optional[str]:
+    return part.get("id") if isinstance(part, dict) else getattr(part, "id", None)
+
+
+def _stage_id(stage: Any) -> str:
+    """ID of a stage config, which every stage must have."""
+    stage_id = _part_id(stage)
+    if not stage_id:
+        raise ValueError("Stage config has no 'id'")
+    return stage_id
+
+
+def _format_loc(loc: Iterable[Any]) -> str:
+    """Pydantic error location as a field path, e.g. questions[0].title."""
+    path = ""
+    for item in loc:
+        path += f"[{item}]" if isinstance(item, int) else f".{item}"
+    return path
+
+
+def _validate(model_name: str, data: dict) -> tuple[Optional[BaseModel], list]:
+    """Validate one part; returns (model, []) or (None, pydantic errors)."""
+    try:
+        return getattr(types, model_name).model_validate(data), []
+    except ValidationError as error:
+        return None, [
+            {"loc": _format_loc(e["loc"]), "msg": e["msg"], "type": e["type"]}
+            for e in error.errors(include_url=False, include_input=False)
+        ]
+
+
+def _validate_chunk(items: list[tuple[str, dict]]) -> list[tuple[Any, list]]:
+    return [_validate(model_name, data) for model_name, data in items]
+
+
+class TemplateValidationError(ValueError):
+    """
+    A template failed validation.
+
+    `errors` lists every error as a dict with 'location' (part and field
+    path), 'part' (e.g. "stageConfigs[3]"), 'id' (the part's ID), 'model',
+    'field', 'msg' and 'type'.
+    """
+
+    def __init__(self, errors: list[dict], max_lines: int = 20):
+        self.errors = errors
+        lines = [f"  {e['location']}: {e['msg']}" for e in errors[:max_lines]]
+        if len(errors) > max_lines:
+            lines.append(f"  ... and {len(errors) - max_lines} more")
+        super().__init__(
+            f"{len(errors)} validation error(s) in template:\n" + "\n".join(lines)
+        )
+
+
+class TemplateBuilder:
+    """Assembles an ExperimentTemplate without per-part validation."""
+
+    def __init__(
+        self,
+        name: str = "",
+        description: str = "",
+        public_name: str = "",
+        template_id: Optional[str] = None,
+        **experiment_fields: Any,
+    ):
+        """
+        Args:
+            name: Experiment name (metadata.name)
+            description: Experiment description (metadata.description)
+            public_name: Name shown to participants (metadata.publicName)
+            template_id: Template ID (a new UUID if omitted)
+            **experiment_fields: Other Experiment fields (e.g. prolificConfig,
+                                 defaultCohortConfig, variableMap), as dicts,
+                                 structs or models
+        """
+        self.template_id = template_id or str(uuid.uuid4())
+        self._experiment: dict[str, Any] = {
+            "id": str(uuid.uuid4()),
+            "versionId": EXPERIMENT_VERSION_ID,
+            "metadata": {
+                "name": name,
+                "publicName": public_name,
+                "description": description,
+                "tags": [],
+            },
+            "permissions": {"visibility": "private", "readers": []},
+            "defaultCohortConfig": {
+                "includeAllParticipantsInCohortCount": False,
+                "botProtection": False,
+            },
+            "prolificConfig": {
+                "enableProlificIntegration": False,
+                "defaultRedirectCode": "",
+                "attentionFailRedirectCode": "",
+                "bootedRedirectCode": "",
+            },
+            "cohortLockMap": {},
+            "variableConfigs": [],
+            "variableMap": {},
+        }
+        self.set_experiment(**experiment_fields)
+        self._stages: list[Any] = []
+        self._stage_index: dict[str, int] = {}
+        self._agent_mediators: list[Any] = []
+        self._agent_participants: list[Any] = []
+        # id(part) -> (part, validated model); shared with copies. The part
+        # is kept so its id() cannot be reused by another object.
+        self._validated: dict[int, tuple[Any, BaseModel]] = {}
+
+    @classmethod
+    def from_template(cls, template: Any) -> TemplateBuilder:
+        """
+        A builder holding the parts of an existing ExperimentTemplate
+        (model, struct or dict). Parts of a validated model are not
+        validated again by build().
+        """
+        data = _part_dict(template)
+        experiment = dict(data["experiment"])
+        experiment.pop("stageIds", None)
+        builder = cls(template_id=data.get("id"))
+        builder._experiment = experiment
+        stages = data["stageConfigs"]
+        mediators = data["agentMediators"]
+        participants = data["agentParticipants"]
+        if isinstance(template, types.ExperimentTemplate):
+            stages = template.stageConfigs
+            mediators = template.agentMediators
+            participants = template.agentParticipants
+            for part in (*stages, *mediators, *participants):
+                builder._validated[id(part)] = (part, part)
+        builder.add_stages(stages)
+        builder._agent_mediators = list(mediators)
+        builder._agent_participants = list(participants)
+        return builder
+
+    # =========================================================================
+    # Assembly
+    # =========================================================================
+
+    def set_experiment(self, **fields: Any) -> TemplateBuilder:
+        """Set top-level Experiment fields (stageIds is derived from stages)."""
+        for key, value in fields.items():
+            if key == "stageIds":
+                raise ValueError("stageIds is derived from the builder's stages")
+            if isinstance(value, list):
+                value = [_part_dict(item) for item in value]
+            elif not isinstance(value, (str, int, float, bool, type(None))):
+                value = _part_dict(value)
+            self._experiment[key] = value
+        return self
+
+    def add_stage(self, stage: Any) -> TemplateBuilder:
+        """Append a stage config (dict, struct or model)."""
+        stage_id = _stage_id(stage)
+        if stage_id in self._stage_index:
+            raise ValueError(f"Duplicate stage ID: {stage_id}")
+        self._stage_index[stage_id] = len(self._stages)
+        self._stages.append(stage)
+        return self
+
+    def add_stages(self, stages: Iterable[Any]) -> TemplateBuilder:
+        for stage in stages:
+            self.add_stage(stage)
+        return self
+
+    def replace_stage(self, stage_id: str, stage: Any) -> TemplateBuilder:
+        """Replace the stage with a given ID, keeping its position."""
+        index = self._stage_index[stage_id]
+        new_id = _stage_id(stage)
+        if new_id != stage_id and new_id in self._stage_index:
+            raise ValueError(f"Duplicate stage ID: {new_id}")
+        self._stages[index] = stage
+        self._reindex_stages()
+        return self
+
+    def remove_stage(self, stage_id: str) -> TemplateBuilder:
+        del self._stages[self._stage_index[stage_id]]
+        self._reindex_stages()
+        return self
+
+    def _reindex_stages(self) -> None:
+        # Rebuilt in list order, which stage_ids and stageIds follow
+        self._stage_index = {
+            _stage_id(stage): index for index, stage in enumerate(self._stages)
+        }
+
+    def stage(self, stage_id: str) -> Any:
+        """The stage with a given ID, as it was added."""
+        return self._stages[self._stage_index[stage_id]]
+
+    @property
+    def stage_ids(self) -> list[str]:
+        return list(self._stage_index)
+
+    def reorder_stages(self, stage_ids: list[str]) -> TemplateBuilder:
+        """Put the stages in a new order, given every stage ID once."""
+        if sorted(stage_ids) != sorted(self._stage_index):
+            raise ValueError("stage_ids must list every stage ID exactly once")
+        self._stages = [self.stage(stage_id) for stage_id in stage_ids]
+        self._stage_index = {stage_id: i for i, stage_id in enumerate(stage_ids)}
+        return self
+
+    def add_agent_mediator(self, agent: Any) -> TemplateBuilder:
+        """Append an AgentMediatorTemplate (dict, struct or model)."""
+        self._agent_mediators.append(agent)
+        return self
+
+    def add_agent_participant(self, agent: Any) -> TemplateBuilder:
+        """Append an AgentParticipantTemplate (dict, struct or model)."""
+        self._agent_participants.append(agent)
+        return self
+
+    def agent_mediator(self, persona_id: str) -> Any:
+        """The agent mediator with a given persona ID, as it was added."""
+        return self._agent_mediators[self._mediator_index(persona_id)]
+
+    def replace_agent_mediator(self, persona_id: str, agent: Any) -> TemplateBuilder:
+        """Replace the agent mediator with a given persona ID."""
+        self._agent_mediators[self._mediator_index(persona_id)] = agent
+        return self
+
+    def _mediator_index(self, persona_id: str) -> int:
+        for index, agent in enumerate(self._agent_mediators):
+            if (_part_dict(agent).get("persona") or {}).get("id") == persona_id:
+                return index
+        raise KeyError(f"No agent mediator with persona ID: {persona_id}")
+
+    def add_variable_config(self, config: Any) -> TemplateBuilder:
+        """Append a variable config (static, random permutation, ...)."""
+        self._experiment["variableConfigs"] = [
+            *(self._experiment.get("variableConfigs") or []),
+            _part_dict(config),
+        ]
+        return self
+
+    def replace_variable_config(self, config_id: str, config: Any) -> TemplateBuilder:
+        """Replace the variable config with a given ID."""
+        configs = list(self._experiment.get("variableConfigs") or [])
+        for index, existing in enumerate(configs):
+            if existing.get("id") == config_id:
+                configs[index] = _part_dict(config)
+                self._experiment["variableConfigs"] = configs
+                return self
+        raise KeyError(f"No variable config with ID: {config_id}")
+
+    def copy(self) -> TemplateBuilder:
+        """
+        A builder for a variant: parts and validation results are shared,
+        lists are not, so adding or replacing parts leaves this one as is.
+        """
+        other = object.__new__(TemplateBuilder)
+        other.template_id = str(uuid.uuid4())
+        other._experiment = {
+            **self._experiment,
+            "id": str(uuid.uuid4()),
+            "metadata": dict(self._experiment["metadata"]),
+        }
+        other._stages = list(self._stages)
+        other._stage_index = dict(self._stage_index)
+        other._agent_mediators = list(self._agent_mediators)
+        other._agent_participants = list(self._agent_participants)
+        other._validated = self._validated
+        return other
+
+    # =========================================================================
+    # Output
+    # =========================================================================
+
+    def _experiment_dict(self) -> dict:
+        return {**self._experiment, "stageIds": list(self._stage_index)}
+
+    @property
+    def experiment(self) -> dict:
+        """The Experiment fields, as JSON-ready values (do not mutate)."""
+        return self._experiment_dict()
+
+    def to_dict(self) -> dict:
+        """The template as an (unvalidated) JSON-ready dict."""
+        return {
+            "id": self.template_id,
+            "experiment": self._experiment_dict(),
+            "stageConfigs": [_part_dict(stage) for stage in self._stages],
+            "agentMediators": [_part_dict(agent) for agent in self._agent_mediators],
+            "agentParticipants": [
+                _part_dict(agent) for agent in self._agent_participants
+            ],
+        }
+
+    def build(self, workers: int = 0) -> types.ExperimentTemplate:
+        """
+        Validate every part not validated before and assemble the template.
+
+        Args:
+            workers: Validate stages in this many worker processes (0 or 1
+                     validates in this process, which is faster unless the
+                     template has thousands of new stages)
+
+        Returns:
+            The validated ExperimentTemplate
+
+        Raises:
+            TemplateValidationError: With every error, located by part and
+                                     field
+        """
+        # (location, part ID, part, model class name, data) per part to validate
+        parts: list[tuple[str, Optional[str], Any, str, Any]] = [
+            ("experiment", None, None, "Experiment", self._experiment_dict())
+        ]
+        errors: list[dict] = []
+        for index, stage in enumerate(self._stages):
+            location = f"stageConfigs[{index}]"
+            data = _part_dict(stage)
+            model = stage_model(data)
+            if model is None:
+                errors.append(
+                    {
+                        "location": location,
+                        "part": location,
+                        "id": _part_id(stage),
+                        "model": None,
+                        "field": "kind",
+                        "msg": f"Unknown stage kind {data.get('kind')!r}",
+                        "type": "union_tag_invalid",
+                    }
+                )
+                continue
+            parts.append((location, _part_id(stage), stage, model.__name__, data))
+        for section, agents in (
+            ("agentMediators", self._agent_mediators),
+            ("agentParticipants", self._agent_participants),
+        ):
+            for index, agent in enumerate(agents):
+                data = _part_dict(agent)
+                persona_id = (data.get("persona") or {}).get("id")
+                parts.append(
+                    (
+                        f"{section}[{index}]",
+                        persona_id,
+                        agent,
+                        "AgentMediatorTemplate",
+                        data,
+                    )
+                )
+
+        # Validate parts without a cached result
+        pending = [
+            i
+            for i, (_, _, part, _, _) in enumerate(parts)
+            if part is None or id(part) not in self._validated
+        ]
+        items = [(parts[i][3], parts[i][4]) for i in pending]
+        if workers > 1 and len(items) > _CHUNK_SIZE:
+            chunks = [
+                items[start : start + _CHUNK_SIZE]
+                for start in range(0, len(items), _CHUNK_SIZE)
+            ]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = [
+                    r for chunk in executor.map(_validate_chunk, chunks) for r in chunk
+                ]
+        else:
+            results = _validate_chunk(items)
+
+        validated: dict[int, BaseModel] = {}
+        for i, (model, part_errors) in zip(pending, results):
+            location, part_id, part, model_name, data = parts[i]
+            if model is not None:
+                validated[i] = model
+                if part is not None:
+                    self._validated[id(part)] = (part, model)
+                continue
+            label = location
+            if location.startswith("stageConfigs"):
+                label += f" ({data.get('kind')} {part_id!r})"
+            elif part_id:
+                label += f" ({part_id!r})"
+            for error in part_errors:
+                errors.append(
+                    {
+                        "location": f"{label}{error['loc']}",
+                        "part": location,
+                        "id": part_id,
+                        "model": model_name,
+                        "field": error["loc"].lstrip("."),
+                        "msg": error["msg"],
+                        "type": error["type"],
+                    }
+                )
+        if errors:
+            raise TemplateValidationError(errors)
+
+        models = [
+            validated[i] if i in validated else self._validated[id(part)][1]
+            for i, (_, _, part, _, _) in enumerate(parts)
+        ]
+        num_stages = len(self._stages)
+        num_mediators = len(self._agent_mediators)
+        # Parts are validated, so assemble without validating them again
+        return types.ExperimentTemplate.model_construct(
+            id=self.template_id,
+            experiment=models[0],
+            stageConfigs=models[1 : 1 + num_stages],
+            agentMediators=models[1 + num_stages : 1 + num_stages + num_mediators],
+            agentParticipants=models[1 + num_stages + num_mediators :],
+        )
@@ -0,0 +1,382 @@
+"""
+Chat transcript index for Deliberate Lab experiment exports.
+
+Indexes the messages in `cohortMap[*].chatMap` once, as column arrays
+(timestamp, cohort, stage, sender, user type) plus time-sorted postings per
+sender, stage, cohort, chat thread (cohort + stage) and user type. Counts,
+time-window queries, response latencies and mediator turns then touch only
+the postings involved instead of rescanning every transcript.
+
+Usage:
+    from deliberate_lab.chats import ChatIndex
+
+    index = ChatIndex.from_export(store)   # ExperimentDownload dict or ExportStore
+    index.count_by_sender(stage_id="chat-stage")
+    rows = index.window(start_ms, end_ms, cohort_id="cohort-1")
+    latencies = index.response_latencies(stage_id="chat-stage")
+
+    # New messages (e.g., from a later export) can be appended in place
+    index.add_messages("cohort-1", "chat-stage", new_messages)
+"""
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+
+def to_millis(timestamp: Any) -> float:
+    """
+    Milliseconds since the epoch for an exported timestamp.
+
+    Accepts {seconds, nanoseconds} objects (as written by the export
+    endpoints), Firestore-style {_seconds, _nanoseconds}, ISO 8601 strings
+    and numbers (already in milliseconds).
+    """
+    if isinstance(timestamp, dict):
+        seconds = timestamp.get("seconds", timestamp.get("_seconds", 0))
+        nanoseconds = timestamp.get("nanoseconds", timestamp.get("_nanoseconds", 0))
+        return seconds * 1000 + nanoseconds / 1e6
+    if isinstance(timestamp, str):
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return parsed.timestamp() * 1000
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    raise ValueError(f"Unsupported timestamp: {timestamp!r}")
+
+
+class _Interner:
+    """Maps strings to dense integer codes and back."""
+
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def code(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class _Posting:
+    """Row IDs of one key, kept sorted by (timestamp, row) lazily."""
+
+    __slots__ = ("rows", "times", "dirty")
+
+    def __init__(self):
+        self.rows = array("q")
+        self.times = array("d")
+        self.dirty = False
+
+    def add(self, row: int, time: float) -> None:
+        if self.times and time < self.times[-1]:
+            self.dirty = True
+        self.rows.append(row)
+        self.times.append(time)
+
+    def ensure_sorted(self) -> None:
+        if not self.dirty:
+            return
+        pairs = sorted(zip(self.times, self.rows))
+        self.times = array("d", (time for time, _ in pairs))
+        self.rows = array("q", (row for _, row in pairs))
+        self.dirty = False
+
+    def window(self, start: Optional[float], end: Optional[float]) -> array:
+        """Rows with start <= timestamp < end, in time order."""
+        self.ensure_sorted()
+        low = 0 if start is None else bisect_left(self.times, start)
+        high = len(self.times) if end is None else bisect_left(self.times, end)
+        return self.rows[low:high]
+
+
+class ChatIndex:
+    """
+    Index over chat messages of one or more exports.
+
+    Rows are numbered in insertion order; row-level data is available
+    through the column arrays (`times`, `cohorts`, `stages`, `senders`,
+    `types`) and, if messages are kept, `message(row)`.
+    """
+
+    def __init__(self, keep_messages: bool = True):
+        """
+        Args:
+            keep_messages: Whether to keep message dicts for message(row);
+                           disable to index very large exports in less memory
+        """
+        self.keep_messages = keep_messages
+        self.times = array("d")
+        self.cohorts = array("l")
+        self.stages = array("l")
+        self.senders = array("l")
+        self.types = array("l")
+        self.message_ids: list[str] = []
+        self._messages: list[dict] = []
+        self._cohort_names = _Interner()
+        self._stage_names = _Interner()
+        self._sender_names = _Interner()
+        self._type_names = _Interner()
+        self._seen: set[tuple[int, int, str]] = set()
+        self._all = _Posting()
+        # (dimension, code) -> posting; dimension is one of cohort, stage,
+        # sender, type or thread (cohort and stage codes combined)
+        self._postings: dict[tuple, _Posting] = {}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    # =========================================================================
+    # Building
+    # =========================================================================
+
+    @classmethod
+    def from_export(cls, export: Any, keep_messages: bool = True) -> ChatIndex:
+        """
+        Index all chat messages of an export.
+
+        Args:
+            export: ExperimentDownload dict or an ExportStore
+            keep_messages: See __init__
+        """
+        index = cls(keep_messages=keep_messages)
+        index.add_export(export)
+        return index
+
+    def add_export(self, export: Any) -> int:
+        """Add the chat messages of an export. Returns the number added."""
+        added = 0
+        if hasattr(export, "chat_map"):
+            for cohort_id in export.cohort_ids():
+                for stage_id, messages in export.chat_map(cohort_id).items():
+                    added += self.add_messages(cohort_id, stage_id, messages)
+            return added
+        for cohort_id, cohort in (export.get("cohortMap") or {}).items():
+            for stage_id, messages in (cohort.get("chatMap") or {}).items():
+                added += self.add_messages(cohort_id, stage_id, messages)
+        return added
+
+    def add_messages(
+        self, cohort_id: str, stage_id: str, messages: Iterable[dict]
+    ) -> int:
+        """
+        Append messages of one chat thread, skipping messages already indexed.
+
+        Messages may arrive in any order; postings are re-sorted lazily.
+
+        Returns:
+            Number of messages added
+        """
+        cohort = self._cohort_names.code(cohort_id)
+        stage = self._stage_names.code(stage_id)
+        thread = self._posting(("thread", cohort, stage))
+        cohort_posting = self._posting(("cohort", cohort))
+        stage_posting = self._posting(("stage", stage))
+        added = 0
+        for message in messages:
+            key = (cohort, stage, message.get("id", ""))
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            row = len(self.times)
+            time = to_millis(message.get("timestamp", 0))
+            sender = self._sender_names.code(message.get("senderId", ""))
+            user_type = self._type_names.code(message.get("type", "unknown"))
+            self.times.append(time)
+            self.cohorts.append(cohort)
+            self.stages.append(stage)
+            self.senders.append(sender)
+            self.types.append(user_type)
+            self.message_ids.append(message.get("id", ""))
+            if self.keep_messages:
+                self._messages.append(message)
+            self._all.add(row, time)
+            thread.add(row, time)
+            cohort_posting.add(row, time)
+            stage_posting.add(row, time)
+            self._posting(("sender", sender)).add(row, time)
+            self._posting(("type", user_type)).add(row, time)
+            added += 1
+        return added
+
+    def _posting(self, key: tuple) -> _Posting:
+        posting = self._postings.get(key)
+        if posting is None:
+            posting = self._postings[key] = _Posting()
+        return posting
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def message(self, row: int) -> dict:
+        """The original message dict for a row (requires keep_messages)."""
+        if not self.keep_messages:
+            raise ValueError("Index was built with keep_messages=False")
+        return self._messages[row]
+
+    def cohort_id(self, row: int) -> str:
+        return self._cohort_names.names[self.cohorts[row]]
+
+    def stage_id(self, row: int) -> str:
+        return self._stage_names.names[self.stages[row]]
+
+    def sender_id(self, row: int) -> str:
+        return self._sender_names.names[self.senders[row]]
+
+    def user_type(self, row: int) -> str:
+        return self._type_names.names[self.types[row]]
+
+    def _select(
+        self,
+        cohort_id: Optional[str],
+        stage_id: Optional[str],
+        sender_id: Optional[str],
+        user_type: Optional[str],
+    ) -> tuple[Optional[_Posting], list[tuple[array, int]]]:
+        """
+        Pick the smallest posting matching the filters, plus the remaining
+        (column, code) checks. Returns (None, []) if nothing can match.
+        """
+        filters = []
+        for dimension, names, column, value in (
+            ("cohort", self._cohort_names, self.cohorts, cohort_id),
+            ("stage", self._stage_names, self.stages, stage_id),
+            ("sender", self._sender_names, self.senders, sender_id),
+            ("type", self._type_names, self.types, user_type),
+        ):
+            if value is None:
+                continue
+            code = names.codes.get(value)
+            if code is None:
+                return None, []
+            filters.append(((dimension, code), column, code))
+
+        # (posting, posting keys of the filters it already satisfies)
+        candidates: list[tuple[_Posting, tuple[tuple, ...]]] = [(self._all, ())]
+        candidates += [(self._postings[key], (key,)) for key, _, _ in filters]
+        if cohort_id is not None and stage_id is not None:
+            thread = ("thread", filters[0][2], filters[1][2])
+            if thread not in self._postings:
+                return None, []
+            covered = (filters[0][0], filters[1][0])
+            candidates.append((self._postings[thread], covered))
+        posting, covered = min(candidates, key=lambda item: len(item[0].rows))
+        checks = [(column, code) for key, column, code in filters if key not in covered]
+        return posting, checks
+
+    def window(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        cohort_id: Optional[str] = None,
+        stage_id: Optional[str] = None,
+        sender_id: Optional[str] = None,
+        user_type: Optional[str] = None,
+    ) -> list[int]:
+        """
+        Rows with start <= timestamp < end (milliseconds) matching the
+        filters, in time order. Omitted bounds and filters match everything.
+        """
+        posting, checks = self._select(cohort_id, stage_id, sender_id, user_type)
+        if posting is None:
+            return []
+        rows = posting.window(start, end)
+        if not checks:
+            return rows.tolist()
+        return [
+            row for row in rows if all(column[row] == code for column, code in checks)
+        ]
+
+    def count(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        cohort_id: Optional[str] = None,
+        stage_id: Optional[str] = None,
+        sender_id: Optional[str] = None,
+        user_type: Optional[str] = None,
+    ) -> int:
+        """Number of messages matching window() arguments."""
+        posting, checks = self._select(cohort_id, stage_id, sender_id, user_type)
+        if posting is None:
+            return 0
+        if not checks:
+            return len(posting.window(start, end))
+        return len(self.window(start, end, cohort_id, stage_id, sender_id, user_type))
+
+    def count_by_sender(
+        self,
+        cohort_id: Optional[str] = None,
+        stage_id: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> dict[str, int]:
+        """Message counts per sender ID."""
+        counts: dict[int, int] = {}
+        for row in self.window(start, end, cohort_id=cohort_id, stage_id=stage_id):
+            sender = self.senders[row]
+            counts[sender] = counts.get(sender, 0) + 1
+        names = self._sender_names.names
+        return {names[sender]: count for sender, count in counts.items()}
+
+    def thread(self, cohort_id: str, stage_id: str) -> list[int]:
+        """Rows of one chat thread in time order."""
+        return self.window(cohort_id=cohort_id, stage_id=stage_id)
+
+    def threads(self) -> list[tuple[str, str]]:
+        """All (cohort ID, stage ID) threads in the index."""
+        return [
+            (self._cohort_names.names[key[1]], self._stage_names.names[key[2]])
+            for key in self._postings
+            if key[0] == "thread"
+        ]
+
+    def response_latencies(
+        self,
+        cohort_id: Optional[str] = None,
+        stage_id: Optional[str] = None,
+    ) -> dict[str, list[float]]:
+        """
+        Seconds each sender took to reply, per sender ID.
+
+        A reply is a message whose previous message in the same thread was
+        sent by someone else; the latency is the time between the two.
+        """
+        cohort = stage = -1
+        if cohort_id is not None:
+            cohort = self._cohort_names.codes.get(cohort_id, -1)
+        if stage_id is not None:
+            stage = self._stage_names.codes.get(stage_id, -1)
+        latencies: dict[int, list[float]] = {}
+        for key, posting in self._postings.items():
+            if key[0] != "thread":
+                continue
+            if cohort_id is not None and key[1] != cohort:
+                continue
+            if stage_id is not None and key[2] != stage:
+                continue
+            posting.ensure_sorted()
+            previous_sender = None
+            previous_time = 0.0
+            for row, time in zip(posting.rows, posting.times):
+                sender = self.senders[row]
+                if previous_sender is not None and sender != previous_sender:
+                    latencies.setdefault(sender, []).append(
+                        (time - previous_time) / 1000
+                    )
+                previous_sender = sender
+                previous_time = time
+        names = self._sender_names.names
+        return {names[sender]: values for sender, values in latencies.items()}
+
+    def mediator_turns(
+        self,
+        cohort_id: Optional[str] = None,
+        stage_id: Optional[str] = None,
+    ) -> list[int]:
+        """Rows of messages sent by mediators (agents), in time order."""
+        return self.window(cohort_id=cohort_id, stage_id=stage_id, user_type="mediator")
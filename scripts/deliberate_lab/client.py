@@ -16,6 +16,16 @@ Usage:
     # List experiments
     experiments = client.list_experiments()
 
+    # Lazily page through experiments matching a filter
+    for experiment in client.iter_experiments(tag="pilot"):
+        print(experiment["id"])
+
+    # One client can be shared by worker threads; requests draw on one
+    # connection pool and one rate-limit budget
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        exports = list(pool.map(client.export_experiment, experiment_ids))
+    print(client.request_metrics())
+
     # Create experiment with typed stage configs
     stage = dl.SurveyStageConfig(
         id="survey1",
@@ -31,15 +41,46 @@ Usage:
 """
 
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import (
+    BinaryIO,
+    Callable,
+    Generator,
+    Iterator,
+    Optional,
+    TextIO,
+    TYPE_CHECKING,
+)
+import functools
+import hashlib
+import io
+import json
+import logging
 import os
+import tempfile
+import threading
+import time
+from pydantic import BaseModel
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError
+
+from deliberate_lab.ndjson import (
+    JsonStreamReader,
+    write_experiment_ndjson,
+    write_logs_ndjson,
+)
 
 # Re-export all types so users can do: dl.SurveyStageConfig, dl.TextSurveyQuestion, etc.
 from deliberate_lab.types import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
 if TYPE_CHECKING:
-    from pydantic import BaseModel
+    from deliberate_lab.structs import Struct
+
+logger = logging.getLogger(__name__)
 
 
 class APIError(requests.HTTPError):
@@ -52,8 +93,144 @@ class APIError(requests.HTTPError):
         )
 
 
+# API rate limit per key (functions/src/dl_api/dl_api.endpoints.ts)
+RATE_LIMIT_REQUESTS = 100
+RATE_LIMIT_WINDOW_SECONDS = 15 * 60
+
+
+class _RequestBudget:
+    """Sliding-window request budget shared by threads."""
+
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._max_requests = max_requests
+        self._window = window_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._times: deque[float] = deque()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def acquire(self) -> float:
+        """Take one request from the budget; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                while self._times and self._times[0] <= now - self._window:
+                    self._times.popleft()
+                if len(self._times) < self._max_requests:
+                    self._times.append(now)
+                    return waited
+                delay = self._times[0] + self._window - now
+                self.waited += delay
+            if not waited:
+                logger.warning(
+                    "Request budget of %d per %gs used up; waiting %.0fs",
+                    self._max_requests,
+                    self._window,
+                    delay,
+                )
+            waited += delay
+            self._sleep(delay)
+
+
+class _HTTPConnectionPool(HTTPConnectionPool):
+    def __init__(self, *args, pool_timeout: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_timeout = pool_timeout
+
+    def urlopen(self, method, url, *args, **kwargs):
+        kwargs.setdefault("pool_timeout", self.pool_timeout)
+        return super().urlopen(method, url, *args, **kwargs)
+
+
+class _HTTPSConnectionPool(HTTPSConnectionPool):
+    def __init__(self, *args, pool_timeout: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_timeout = pool_timeout
+
+    def urlopen(self, method, url, *args, **kwargs):
+        kwargs.setdefault("pool_timeout", self.pool_timeout)
+        return super().urlopen(method, url, *args, **kwargs)
+
+
+class _BlockingPoolAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with one pool of `pool_size` connections per host.
+
+    Requests beyond that wait for a free connection, for at most
+    `pool_timeout` seconds if given, then raise requests.ConnectionError.
+    """
+
+    def __init__(self, pool_size: int, pool_timeout: Optional[float] = None):
+        self._pool_timeout = pool_timeout
+        super().__init__(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        # requests never passes urllib3's pool_timeout, so the pools apply
+        # the adapter's own
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": functools.partial(
+                _HTTPConnectionPool, pool_timeout=self._pool_timeout
+            ),
+            "https": functools.partial(
+                _HTTPSConnectionPool, pool_timeout=self._pool_timeout
+            ),
+        }
+
+    def send(self, request, *args, **kwargs) -> requests.Response:
+        try:
+            return super().send(request, *args, **kwargs)
+        except EmptyPoolError as error:
+            raise requests.ConnectionError(error, request=request) from error
+
+
+@dataclass
+class RequestMetrics:
+    """Requests one thread made through a Client."""
+
+    requests: int = 0
+    # Responses with status >= 400, and requests that raised
+    errors: int = 0
+    rate_limited: int = 0
+    # Time until the response headers arrived (bodies of streamed
+    # responses are read afterwards)
+    seconds: float = 0.0
+    # Time spent waiting for the client's rate-limit budget
+    budget_wait: float = 0.0
+
+    def summary(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rateLimited": self.rate_limited,
+            "seconds": self.seconds,
+            "budgetWait": self.budget_wait,
+        }
+
+
 class Client:
-    """Client for the Deliberate Lab REST API."""
+    """
+    Client for the Deliberate Lab REST API.
+
+    A Client may be shared by any number of threads. Requests go through
+    one connection pool of `pool_size` connections (threads beyond that
+    wait for a free connection) and draw on one sliding-window budget of
+    `max_requests` per `window_seconds`, so threads sharing a client stay
+    within the API's per-key rate limit instead of hitting 429s.
+
+    iter_experiment_logs() and iter_experiment_records() hold a connection
+    while their response streams; exhaust them or close() them (e.g., with
+    contextlib.closing) when stopping early, since other threads wait for
+    a free connection (for at most `pool_timeout` seconds, if given).
+    """
 
     PROD_URL = "https://us-central1-deliberate-lab.cloudfunctions.net/api/v1"
     DEV_URL = "http://127.0.0.1:5001/demo-deliberate-lab/us-central1/api/v1"
@@ -64,6 +241,10 @@ class Client:
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: float = 60.0,
+        pool_size: int = 10,
+        pool_timeout: Optional[float] = None,
+        max_requests: Optional[int] = RATE_LIMIT_REQUESTS,
+        window_seconds: float = RATE_LIMIT_WINDOW_SECONDS,
     ):
         """
         Initialize the client.
@@ -75,6 +256,18 @@ class Client:
             api_key: API key for authentication. If not provided, reads from
                      DL_API_KEY environment variable.
             timeout: Request timeout in seconds. Defaults to 60, longer for exports.
+            pool_size: Connections kept open to the API, i.e., requests in
+                       flight at once across threads.
+            pool_timeout: Seconds a request waits for a free connection before
+                          raising requests.ConnectionError. None waits without
+                          a limit.
+            max_requests: Requests allowed per window across all threads using
+                          this client (the API allows 100 per 15 minutes per
+                          key; lower it if the key is used elsewhere at the
+                          same time). Requests beyond it wait, with a warning
+                          logged, until the window has room. None disables
+                          the budget.
+            window_seconds: Rate limit window in seconds.
         """
         if base_url is not None:
             self.base_url = base_url
@@ -92,6 +285,8 @@ class Client:
             raise ValueError(
                 "API key required. Pass api_key parameter or set DL_API_KEY env var."
             )
+        # The session is only configured here; afterwards threads share it
+        # read-only, and the pool hands each request its own connection
         self._session = requests.Session()
         self._session.headers.update(
             {
@@ -99,6 +294,64 @@ class Client:
                 "Content-Type": "application/json",
             }
         )
+        adapter = _BlockingPoolAdapter(pool_size, pool_timeout)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self.budget = (
+            _RequestBudget(max_requests, window_seconds)
+            if max_requests is not None
+            else None
+        )
+        self._metrics: dict[str, RequestMetrics] = {}
+        self._metrics_lock = threading.Lock()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request within the rate-limit budget, recording metrics."""
+        waited = self.budget.acquire() if self.budget is not None else 0.0
+        start = time.perf_counter()
+        try:
+            response = self._session.request(method, url, **kwargs)
+        except requests.RequestException:
+            self._record(waited, time.perf_counter() - start, None)
+            raise
+        self._record(waited, time.perf_counter() - start, response.status_code)
+        return response
+
+    def _record(self, waited: float, seconds: float, status: Optional[int]) -> None:
+        name = threading.current_thread().name
+        with self._metrics_lock:
+            metrics = self._metrics.setdefault(name, RequestMetrics())
+            metrics.requests += 1
+            metrics.seconds += seconds
+            metrics.budget_wait += waited
+            if status is None or status >= 400:
+                metrics.errors += 1
+            if status == 429:
+                metrics.rate_limited += 1
+
+    def request_metrics(self) -> dict[str, RequestMetrics]:
+        """Snapshot of the requests made so far, per thread name."""
+        with self._metrics_lock:
+            return {
+                name: RequestMetrics(**asdict(metrics))
+                for name, metrics in self._metrics.items()
+            }
+
+    def total_request_metrics(self) -> RequestMetrics:
+        """Requests made so far by all threads together."""
+        total = RequestMetrics()
+        for metrics in self.request_metrics().values():
+            total.requests += metrics.requests
+            total.errors += metrics.errors
+            total.rate_limited += metrics.rate_limited
+            total.seconds += metrics.seconds
+            total.budget_wait += metrics.budget_wait
+        return total
+
+    def reset_request_metrics(self) -> None:
+        """Forget the requests recorded so far."""
+        with self._metrics_lock:
+            self._metrics.clear()
 
     def _handle_response(self, response: requests.Response):
         """Handle API response and raise errors if needed."""
@@ -110,39 +363,238 @@ class Client:
             raise APIError(response, error_msg)
         return response.json()
 
+    def _download_to(
+        self,
+        url: str,
+        dest: BinaryIO,
+        params: Optional[dict] = None,
+        timeout: float = 0,
+    ) -> dict:
+        """
+        Stream a GET response body into a binary file object.
+
+        Returns:
+            dict with 'sourceBytes' and 'sourceSha256' of the response body
+        """
+        with self._request(
+            "GET", url, params=params, timeout=timeout or self.timeout, stream=True
+        ) as response:
+            if response.status_code >= 400:
+                self._handle_response(response)
+            sha256 = hashlib.sha256()
+            size = 0
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                dest.write(chunk)
+                sha256.update(chunk)
+                size += len(chunk)
+        return {"sourceBytes": size, "sourceSha256": sha256.hexdigest()}
+
+    def _export_to(
+        self,
+        url: str,
+        path: str,
+        format: str,  # pylint: disable=redefined-builtin
+        writer: Callable[[TextIO, BinaryIO], dict],
+        params: Optional[dict] = None,
+    ) -> dict:
+        """
+        Download an export to `path`, optionally converting it to NDJSON.
+
+        The response body is streamed to a temporary file next to `path`
+        and, for NDJSON, laid out record by record by `writer`, so the
+        full payload is never held in memory.
+        """
+        if format not in ("ndjson", "json"):
+            raise ValueError(f"Unknown format '{format}'. Use 'ndjson' or 'json'.")
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".download")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                source = self._download_to(
+                    url, tmp, params=params, timeout=self.timeout * 3
+                )
+            if format == "json":
+                os.replace(tmp_path, path)
+                manifest = {
+                    "bytes": source["sourceBytes"],
+                    "sha256": source["sourceSha256"],
+                }
+            else:
+                with open(tmp_path, "r", encoding="utf-8") as src, open(
+                    path, "wb"
+                ) as dest:
+                    manifest = writer(src, dest)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return {"path": path, "format": format, **manifest, **source}
+
+    @staticmethod
+    def _list_params(
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        tag: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        modified_after: Optional[datetime | str] = None,
+        modified_before: Optional[datetime | str] = None,
+    ) -> dict:
+        """Build query parameters shared by the paginated list endpoints."""
+        params: dict = {}
+        if limit is not None:
+            params["limit"] = limit
+        if cursor is not None:
+            params["cursor"] = cursor
+        if tag is not None:
+            params["tag"] = tag
+        if name_prefix is not None:
+            params["namePrefix"] = name_prefix
+        if modified_after is not None:
+            params["modifiedAfter"] = (
+                modified_after.isoformat()
+                if isinstance(modified_after, datetime)
+                else modified_after
+            )
+        if modified_before is not None:
+            params["modifiedBefore"] = (
+                modified_before.isoformat()
+                if isinstance(modified_before, datetime)
+                else modified_before
+            )
+        return params
+
+    @staticmethod
+    def _model_dict(model: BaseModel | Struct | dict) -> dict:
+        """
+        JSON-ready dict of a Pydantic model, a deliberate_lab.structs struct
+        or an already serialized dict (the same output for all three).
+        """
+        if isinstance(model, dict):
+            return model
+        if isinstance(model, BaseModel):
+            return model.model_dump(mode="json", by_alias=True, exclude_none=True)
+        return model.to_dict()
+
+    @staticmethod
+    def _sections_params(sections: Optional[list[str]]) -> dict:
+        """Build the 'sections' query parameter for get/export endpoints."""
+        if sections is None:
+            return {}
+        return {"sections": ",".join(sections)}
+
     def health_check(self) -> dict:
         """Check API health status."""
-        response = self._session.get(f"{self.base_url}/health", timeout=self.timeout)
+        response = self._request("GET", f"{self.base_url}/health", timeout=self.timeout)
         return self._handle_response(response)
 
     # =========================================================================
     # Experiment Methods
     # =========================================================================
 
-    def list_experiments(self) -> dict:
+    def list_experiments(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        tag: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        modified_after: Optional[datetime | str] = None,
+        modified_before: Optional[datetime | str] = None,
+        visibility: Optional[str] = None,
+    ) -> dict:
         """
-        List all experiments for the authenticated user.
+        List experiments for the authenticated user.
+
+        Filters are applied server-side. Without `limit`, all matching
+        experiments are returned in one response; use iter_experiments()
+        to page through large accounts lazily.
+
+        Args:
+            limit: Optional page size (max 500)
+            cursor: Optional 'nextCursor' from a previous page
+            tag: Only include experiments with this tag
+            name_prefix: Only include experiments whose name starts with this prefix
+            modified_after: Only include experiments modified at or after this time
+                            (datetime or ISO 8601 string)
+            modified_before: Only include experiments modified before this time
+                             (datetime or ISO 8601 string)
+            visibility: Only include experiments with this visibility ("public" or "private")
 
         Returns:
-            dict with 'experiments' list and 'total' count
+            dict with 'experiments' list, 'total' count for this page and
+            'nextCursor' (None when there are no more pages)
         """
-        response = self._session.get(
-            f"{self.base_url}/experiments", timeout=self.timeout
+        params = self._list_params(
+            limit, cursor, tag, name_prefix, modified_after, modified_before
+        )
+        if visibility is not None:
+            params["visibility"] = visibility
+        response = self._request(
+            "GET", f"{self.base_url}/experiments", params=params, timeout=self.timeout
         )
         return self._handle_response(response)
 
-    def get_experiment(self, experiment_id: str) -> dict:
+    def iter_experiments(
+        self,
+        page_size: int = 100,
+        tag: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        modified_after: Optional[datetime | str] = None,
+        modified_before: Optional[datetime | str] = None,
+        visibility: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Iterate over experiments for the authenticated user, one page at a time.
+
+        Pages are fetched lazily as the iterator is consumed, so stopping
+        early avoids downloading the rest of the list.
+
+        Args:
+            page_size: Number of experiments to fetch per request (max 500)
+            tag, name_prefix, modified_after, modified_before, visibility:
+                Filters, as in list_experiments()
+
+        Yields:
+            Experiment dicts (each including 'id')
+
+        Example:
+            for experiment in client.iter_experiments(name_prefix="Pilot"):
+                print(experiment["id"], experiment["metadata"]["name"])
+        """
+        cursor: Optional[str] = None
+        while True:
+            page = self.list_experiments(
+                limit=page_size,
+                cursor=cursor,
+                tag=tag,
+                name_prefix=name_prefix,
+                modified_after=modified_after,
+                modified_before=modified_before,
+                visibility=visibility,
+            )
+            yield from page["experiments"]
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return
+
+    def get_experiment(
+        self, experiment_id: str, sections: Optional[list[str]] = None
+    ) -> dict:
         """
         Get a specific experiment by ID.
 
         Args:
             experiment_id: The experiment ID
+            sections: Optional subset of 'stageMap', 'agentMediatorMap' and
+                      'agentParticipantMap' to fetch. Defaults to all three.
 
         Returns:
-            dict with 'experiment', 'stageMap', 'agentMediatorMap', 'agentParticipantMap'
+            dict with 'experiment' plus the requested sections
+            ('stageMap', 'agentMediatorMap', 'agentParticipantMap')
         """
-        response = self._session.get(
-            f"{self.base_url}/experiments/{experiment_id}", timeout=self.timeout
+        response = self._request(
+            "GET",
+            f"{self.base_url}/experiments/{experiment_id}",
+            params=self._sections_params(sections),
+            timeout=self.timeout,
         )
         return self._handle_response(response)
 
@@ -150,11 +602,11 @@ class Client:
         self,
         name: Optional[str] = None,
         description: Optional[str] = None,
-        stages: Optional[list[BaseModel]] = None,
-        prolific_config: Optional[ProlificConfig] = None,
-        agent_mediators: Optional[list[BaseModel]] = None,
-        agent_participants: Optional[list[BaseModel]] = None,
-        template: Optional[BaseModel] = None,
+        stages: Optional[list[BaseModel | Struct]] = None,
+        prolific_config: Optional[ProlificConfig | Struct] = None,
+        agent_mediators: Optional[list[BaseModel | Struct]] = None,
+        agent_participants: Optional[list[BaseModel | Struct]] = None,
+        template: Optional[BaseModel | Struct | dict] = None,
     ) -> dict:
         """
         Create a new experiment.
@@ -174,7 +626,8 @@ class Client:
             prolific_config: Optional Prolific integration config (simple creation)
             agent_mediators: Optional list of AgentMediatorTemplate (simple creation)
             agent_participants: Optional list of AgentParticipantTemplate (simple creation)
-            template: Optional full ExperimentTemplate for complete creation.
+            template: Optional full ExperimentTemplate (model, struct or
+                      JSON-ready dict) for complete creation.
                       When provided, all other fields are ignored.
 
         Returns:
@@ -199,9 +652,7 @@ class Client:
 
         # Full template creation takes precedence
         if template is not None:
-            data["template"] = template.model_dump(
-                mode="json", by_alias=True, exclude_none=True
-            )
+            data["template"] = self._model_dict(template)
         else:
             # Simple creation mode
             if name is None:
@@ -212,28 +663,19 @@ class Client:
             if description is not None:
                 data["description"] = description
             if stages is not None:
-                # Convert Pydantic models to dicts for JSON serialization
-                data["stages"] = [
-                    s.model_dump(mode="json", by_alias=True, exclude_none=True)
-                    for s in stages
-                ]
+                # Convert models (Pydantic or structs) to dicts for JSON serialization
+                data["stages"] = [self._model_dict(s) for s in stages]
             if prolific_config is not None:
-                data["prolificConfig"] = prolific_config.model_dump(
-                    mode="json", by_alias=True, exclude_none=True
-                )
+                data["prolificConfig"] = self._model_dict(prolific_config)
             if agent_mediators is not None:
-                data["agentMediators"] = [
-                    a.model_dump(mode="json", by_alias=True, exclude_none=True)
-                    for a in agent_mediators
-                ]
+                data["agentMediators"] = [self._model_dict(a) for a in agent_mediators]
             if agent_participants is not None:
                 data["agentParticipants"] = [
-                    a.model_dump(mode="json", by_alias=True, exclude_none=True)
-                    for a in agent_participants
+                    self._model_dict(a) for a in agent_participants
                 ]
 
-        response = self._session.post(
-            f"{self.base_url}/experiments", json=data, timeout=self.timeout
+        response = self._request(
+            "POST", f"{self.base_url}/experiments", json=data, timeout=self.timeout
         )
         return self._handle_response(response)
 
@@ -242,11 +684,11 @@ class Client:
         experiment_id: str,
         name: Optional[str] = None,
         description: Optional[str] = None,
-        stages: Optional[list[BaseModel]] = None,
-        prolific_config: Optional[ProlificConfig] = None,
-        agent_mediators: Optional[list[BaseModel]] = None,
-        agent_participants: Optional[list[BaseModel]] = None,
-        template: Optional[BaseModel] = None,
+        stages: Optional[list[BaseModel | Struct]] = None,
+        prolific_config: Optional[ProlificConfig | Struct] = None,
+        agent_mediators: Optional[list[BaseModel | Struct]] = None,
+        agent_participants: Optional[list[BaseModel | Struct]] = None,
+        template: Optional[BaseModel | Struct | dict] = None,
     ) -> dict:
         """
         Update an existing experiment.
@@ -268,7 +710,8 @@ class Client:
             prolific_config: Optional new Prolific integration config (partial update)
             agent_mediators: Optional list of AgentMediatorTemplate (partial update, replaces all mediators)
             agent_participants: Optional list of AgentParticipantTemplate (partial update, replaces all participants)
-            template: Optional full ExperimentTemplate for complete replacement.
+            template: Optional full ExperimentTemplate (model, struct or
+                      JSON-ready dict) for complete replacement.
                       When provided, replaces entire experiment. Other fields are ignored.
 
         Returns:
@@ -289,9 +732,7 @@ class Client:
 
         # Full template update takes precedence
         if template is not None:
-            data["template"] = template.model_dump(
-                mode="json", by_alias=True, exclude_none=True
-            )
+            data["template"] = self._model_dict(template)
         else:
             # Partial update mode
             if name is not None:
@@ -299,26 +740,18 @@ class Client:
             if description is not None:
                 data["description"] = description
             if stages is not None:
-                data["stages"] = [
-                    s.model_dump(mode="json", by_alias=True, exclude_none=True)
-                    for s in stages
-                ]
+                data["stages"] = [self._model_dict(s) for s in stages]
             if prolific_config is not None:
-                data["prolificConfig"] = prolific_config.model_dump(
-                    mode="json", by_alias=True, exclude_none=True
-                )
+                data["prolificConfig"] = self._model_dict(prolific_config)
             if agent_mediators is not None:
-                data["agentMediators"] = [
-                    a.model_dump(mode="json", by_alias=True, exclude_none=True)
-                    for a in agent_mediators
-                ]
+                data["agentMediators"] = [self._model_dict(a) for a in agent_mediators]
             if agent_participants is not None:
                 data["agentParticipants"] = [
-                    a.model_dump(mode="json", by_alias=True, exclude_none=True)
-                    for a in agent_participants
+                    self._model_dict(a) for a in agent_participants
                 ]
 
-        response = self._session.put(
+        response = self._request(
+            "PUT",
             f"{self.base_url}/experiments/{experiment_id}",
             json=data,
             timeout=self.timeout,
@@ -335,28 +768,97 @@ class Client:
         Returns:
             dict with 'deleted' bool and 'id'
         """
-        response = self._session.delete(
-            f"{self.base_url}/experiments/{experiment_id}", timeout=self.timeout
+        response = self._request(
+            "DELETE",
+            f"{self.base_url}/experiments/{experiment_id}",
+            timeout=self.timeout,
         )
         return self._handle_response(response)
 
-    def export_experiment(self, experiment_id: str) -> dict:
+    def export_experiment(
+        self, experiment_id: str, sections: Optional[list[str]] = None
+    ) -> dict:
         """
         Export full experiment data including participants.
 
         Args:
             experiment_id: The experiment ID to export
+            sections: Optional list of sections to build and return. One or more of
+                      'stageMap', 'participantMap', 'participantMap.profile',
+                      'participantMap.answerMap', 'cohortMap', 'cohortMap.cohort',
+                      'cohortMap.dataMap', 'cohortMap.chatMap', 'agentMediatorMap',
+                      'agentParticipantMap', 'alerts'. 'experiment' is always
+                      included. Defaults to everything.
 
         Returns:
             Full ExperimentDownload structure with experiment, stages,
-            cohorts, participants, agents, and chat data
+            cohorts, participants, agents, and chat data (or only the
+            requested sections)
+
+        Example:
+            # Participant profiles only, without answers
+            data = client.export_experiment("exp123", sections=["participantMap.profile"])
+
+            # Chat transcripts only
+            data = client.export_experiment("exp123", sections=["cohortMap.chatMap"])
         """
-        response = self._session.get(
+        response = self._request(
+            "GET",
             f"{self.base_url}/experiments/{experiment_id}/export",
+            params=self._sections_params(sections),
             timeout=(self.timeout * 3),  # Allow more time for exports
         )
         return self._handle_response(response)
 
+    def export_cohort(self, experiment_id: str, cohort_id: str) -> dict:
+        """
+        Export data for a single cohort.
+
+        Returns the same slice a full export contains under
+        cohortMap[cohort_id], so large exports can be split per cohort
+        and retried independently.
+
+        Args:
+            experiment_id: The experiment ID
+            cohort_id: The cohort ID to export
+
+        Returns:
+            CohortDownload dict with 'cohort', 'dataMap' and 'chatMap'
+        """
+        response = self._request(
+            "GET",
+            f"{self.base_url}/experiments/{experiment_id}/export/cohorts/{cohort_id}",
+            timeout=(self.timeout * 3),  # Allow more time for exports
+        )
+        return self._handle_response(response)
+
+    def export_participant(self, experiment_id: str, public_id: str) -> dict:
+        """
+        Export data for a single participant.
+
+        Returns the same slice a full export contains under
+        participantMap[public_id].
+
+        Args:
+            experiment_id: The experiment ID
+            public_id: The participant's public ID
+
+        Returns:
+            ParticipantDownload dict with 'profile' and 'answerMap'
+
+        Example:
+            # Shard an export by participant
+            profiles = client.export_experiment(exp_id, sections=["participantMap.profile"])
+            for public_id in profiles["participantMap"]:
+                participant = client.export_participant(exp_id, public_id)
+        """
+        response = self._request(
+            "GET",
+            f"{self.base_url}/experiments/{experiment_id}/export/participants/{public_id}",
+            timeout=self.timeout,
+        )
+        return self._handle_response(response)
+
     def export_experiment_logs(self, experiment_id: str) -> list:
         """
         Export all model logs from an experiment.
@@ -367,12 +869,157 @@ class Client:
         Returns:
             List of model log entries
         """
-        response = self._session.get(
+        response = self._request(
+            "GET",
             f"{self.base_url}/experiments/{experiment_id}/export/logs",
             timeout=(self.timeout * 3),  # Allow more time for exports
         )
         return self._handle_response(response)
 
+    def iter_experiment_logs(self, experiment_id: str) -> Generator[dict, None, None]:
+        """
+        Iterate over an experiment's model logs without loading them all.
+
+        The response body is streamed and decoded one log entry at a time,
+        so memory use is bounded by the largest single entry.
+
+        Args:
+            experiment_id: The experiment ID to export logs for
+
+        Yields:
+            Model log entries, ordered by creation timestamp
+
+        Example:
+            for log in client.iter_experiment_logs("exp123"):
+                print(log["stageId"], log["response"].get("usage"))
+        """
+        with self._request(
+            "GET",
+            f"{self.base_url}/experiments/{experiment_id}/export/logs",
+            timeout=(self.timeout * 3),
+            stream=True,
+        ) as response:
+            if response.status_code >= 400:
+                self._handle_response(response)
+            response.raw.decode_content = True
+            reader = JsonStreamReader(io.TextIOWrapper(response.raw, encoding="utf-8"))
+            for _ in reader.iter_array():
+                yield reader.read_value()
+
+    def iter_experiment_records(
+        self, experiment_id: str, sections: Optional[list[str]] = None
+    ) -> Generator[dict, None, None]:
+        """
+        Iterate over experiment export records as the server streams them.
+
+        Uses the export endpoint's NDJSON mode, where the server writes
+        records while it reads the experiment, so neither side holds the
+        whole export in memory. Records are the ones deliberate_lab.ndjson
+        writes: 'experiment', 'stage', 'participant', 'cohort' (without
+        'chatMap'), 'chatMessage', 'agentMediator', 'agentParticipant' and
+        'alert', each with 'type', its keys and 'data'.
+
+        Args:
+            experiment_id: The experiment ID to export
+            sections: Optional export sections, as in export_experiment()
+
+        Yields:
+            Export records in section order
+
+        Raises:
+            APIError: If the request fails, or the server reports an error
+                      after the stream has started
+
+        Example:
+            for record in client.iter_experiment_records("exp123"):
+                if record["type"] == "participant":
+                    print(record["id"], len(record["data"]["answerMap"]))
+        """
+        params = {**self._sections_params(sections), "format": "ndjson"}
+        with self._request(
+            "GET",
+            f"{self.base_url}/experiments/{experiment_id}/export",
+            params=params,
+            timeout=(self.timeout * 3),
+            stream=True,
+        ) as response:
+            if response.status_code >= 400:
+                self._handle_response(response)
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                record = json.loads(line)
+                if record.get("type") == "error":
+                    raise APIError(response, record.get("error", "Export failed"))
+                yield record
+
+    def export_experiment_to(
+        self,
+        experiment_id: str,
+        path: str,
+        format: str = "ndjson",  # pylint: disable=redefined-builtin
+        sections: Optional[list[str]] = None,
+    ) -> dict:
+        """
+        Export experiment data straight to a file on disk.
+
+        The HTTP body is streamed to disk rather than parsed in memory.
+        With format="ndjson" it is then rewritten one record per line
+        (experiment, stage, participant, cohort, chatMessage, agent and
+        alert records; see deliberate_lab.ndjson), decoding one record at
+        a time, so memory use is bounded by the largest single record.
+
+        Args:
+            experiment_id: The experiment ID to export
+            path: Destination file path
+            format: "ndjson" (one record per line) or "json" (raw export body)
+            sections: Optional export sections, as in export_experiment()
+
+        Returns:
+            Manifest dict with 'path', 'format', 'bytes' and 'sha256' of the
+            written file, 'sourceBytes' and 'sourceSha256' of the downloaded
+            body and, for NDJSON, 'counts' per record type and 'sections'
+            mapping each export section to its [start, end) byte range
+
+        Example:
+            manifest = client.export_experiment_to("exp123", "exp123.ndjson")
+            print(manifest["counts"]["participant"])
+        """
+        return self._export_to(
+            f"{self.base_url}/experiments/{experiment_id}/export",
+            path,
+            format,
+            write_experiment_ndjson,
+            params=self._sections_params(sections),
+        )
+
+    def export_experiment_logs_to(
+        self,
+        experiment_id: str,
+        path: str,
+        format: str = "ndjson",  # pylint: disable=redefined-builtin
+    ) -> dict:
+        """
+        Export all model logs from an experiment straight to a file on disk.
+
+        With format="ndjson" each log entry is written on its own line.
+
+        Args:
+            experiment_id: The experiment ID to export logs for
+            path: Destination file path
+            format: "ndjson" (one log entry per line) or "json" (raw export body)
+
+        Returns:
+            Manifest dict with 'path', 'format', 'bytes', 'sha256',
+            'sourceBytes', 'sourceSha256' and, for NDJSON, 'counts'
+        """
+        return self._export_to(
+            f"{self.base_url}/experiments/{experiment_id}/export/logs",
+            path,
+            format,
+            write_logs_ndjson,
+        )
+
     def fork_experiment(self, experiment_id: str, name: Optional[str] = None) -> dict:
         """
         Fork an experiment, creating a copy with all stages and agents.
@@ -397,7 +1044,8 @@ class Client:
         if name is not None:
             data["name"] = name
 
-        response = self._session.post(
+        response = self._request(
+            "POST",
             f"{self.base_url}/experiments/{experiment_id}/fork",
             json=data if data else None,
             timeout=self.timeout,
@@ -408,22 +1056,79 @@ class Client:
     # Cohort Methods
     # =========================================================================
 
-    def list_cohorts(self, experiment_id: str) -> dict:
+    def list_cohorts(
+        self,
+        experiment_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        tag: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        modified_after: Optional[datetime | str] = None,
+        modified_before: Optional[datetime | str] = None,
+    ) -> dict:
         """
-        List all cohorts for an experiment.
+        List cohorts for an experiment.
 
         Args:
             experiment_id: The experiment ID
+            limit: Optional page size (max 500)
+            cursor: Optional 'nextCursor' from a previous page
+            tag: Only include cohorts with this tag
+            name_prefix: Only include cohorts whose name starts with this prefix
+            modified_after: Only include cohorts modified at or after this time
+            modified_before: Only include cohorts modified before this time
 
         Returns:
-            dict with 'cohorts' list and 'total' count
+            dict with 'cohorts' list, 'total' count for this page and
+            'nextCursor' (None when there are no more pages)
         """
-        response = self._session.get(
+        response = self._request(
+            "GET",
             f"{self.base_url}/experiments/{experiment_id}/cohorts",
+            params=self._list_params(
+                limit, cursor, tag, name_prefix, modified_after, modified_before
+            ),
             timeout=self.timeout,
         )
         return self._handle_response(response)
 
+    def iter_cohorts(
+        self,
+        experiment_id: str,
+        page_size: int = 100,
+        tag: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        modified_after: Optional[datetime | str] = None,
+        modified_before: Optional[datetime | str] = None,
+    ) -> Iterator[dict]:
+        """
+        Iterate over the cohorts of an experiment, one page at a time.
+
+        Args:
+            experiment_id: The experiment ID
+            page_size: Number of cohorts to fetch per request (max 500)
+            tag, name_prefix, modified_after, modified_before:
+                Filters, as in list_cohorts()
+
+        Yields:
+            Cohort dicts (each including 'id')
+        """
+        cursor: Optional[str] = None
+        while True:
+            page = self.list_cohorts(
+                experiment_id,
+                limit=page_size,
+                cursor=cursor,
+                tag=tag,
+                name_prefix=name_prefix,
+                modified_after=modified_after,
+                modified_before=modified_before,
+            )
+            yield from page["cohorts"]
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return
+
     def get_cohort(self, experiment_id: str, cohort_id: str) -> dict:
         """
         Get a specific cohort by ID.
@@ -435,7 +1140,8 @@ class Client:
         Returns:
             dict with 'cohort' and 'participantCount'
         """
-        response = self._session.get(
+        response = self._request(
+            "GET",
             f"{self.base_url}/experiments/{experiment_id}/cohorts/{cohort_id}",
             timeout=self.timeout,
         )
@@ -446,7 +1152,7 @@ class Client:
         experiment_id: str,
         name: str,
         description: Optional[str] = None,
-        participant_config: Optional[BaseModel] = None,
+        participant_config: Optional[BaseModel | Struct] = None,
     ) -> dict:
         """
         Create a new cohort in an experiment.
@@ -471,11 +1177,10 @@ class Client:
         if description is not None:
             data["description"] = description
         if participant_config is not None:
-            data["participantConfig"] = participant_config.model_dump(
-                mode="json", by_alias=True, exclude_none=True
-            )
+            data["participantConfig"] = self._model_dict(participant_config)
 
-        response = self._session.post(
+        response = self._request(
+            "POST",
             f"{self.base_url}/experiments/{experiment_id}/cohorts",
             json=data,
             timeout=self.timeout,
@@ -488,7 +1193,7 @@ class Client:
         cohort_id: str,
         name: Optional[str] = None,
         description: Optional[str] = None,
-        participant_config: Optional[BaseModel] = None,
+        participant_config: Optional[BaseModel | Struct] = None,
     ) -> dict:
         """
         Update an existing cohort.
@@ -509,11 +1214,10 @@ class Client:
         if description is not None:
             data["description"] = description
         if participant_config is not None:
-            data["participantConfig"] = participant_config.model_dump(
-                mode="json", by_alias=True, exclude_none=True
-            )
+            data["participantConfig"] = self._model_dict(participant_config)
 
-        response = self._session.put(
+        response = self._request(
+            "PUT",
             f"{self.base_url}/experiments/{experiment_id}/cohorts/{cohort_id}",
             json=data,
             timeout=self.timeout,
@@ -534,7 +1238,8 @@ class Client:
         Returns:
             dict with 'deleted' bool and 'id'
         """
-        response = self._session.delete(
+        response = self._request(
+            "DELETE",
             f"{self.base_url}/experiments/{experiment_id}/cohorts/{cohort_id}",
             timeout=self.timeout,
         )
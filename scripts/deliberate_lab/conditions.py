@@ -0,0 +1,437 @@
+"""
+Offline evaluation of ConditionGroup / ComparisonCondition trees.
+
+Mirrors the server's condition logic (utils/src/utils/condition.ts and
+condition.utils.ts) over many participants at once. Survey answers are
+held column-wise in an AnswerTable, one column per condition target
+("stageId::questionId"), and a condition tree is compiled once into a
+function that evaluates each comparison over a whole column and combines
+the resulting masks with bitwise and/or.
+
+Usage:
+    import deliberate_lab as dl
+
+    export = client.export_experiment("exp123")
+    condition = dl.compile_condition(transfer_group.conditions)
+    table = dl.AnswerTable.from_export(export, keys=condition.dependencies)
+    mask = condition.evaluate(table)            # list[bool], one per participant
+    matched = condition.matching_ids(table)      # participant public IDs
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Optional
+import json
+import math
+
+# Stage ID under which participant variables are exposed to conditions
+SYSTEM_VARIABLE_NAMESPACE = "__system_variables__"
+
+# A mask holds one byte (0 or 1) per participant, so masks can be combined
+# with a single big-integer and/or.
+Mask = bytes
+
+
+def condition_target_key(stage_id: str, question_id: str) -> str:
+    """Build the key string for a condition target reference."""
+    return f"{stage_id}::{question_id}"
+
+
+def _as_dict(condition: Any) -> dict:
+    """Accept either a generated model or a plain dict."""
+    if hasattr(condition, "model_dump"):
+        return condition.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return condition
+
+
+def extract_condition_dependencies(condition: Any) -> list[str]:
+    """Return the (deduplicated) target keys a condition depends on."""
+    keys: dict[str, None] = {}
+
+    def visit(node: dict) -> None:
+        if node["type"] == "comparison":
+            target = node["target"]
+            keys[condition_target_key(target["stageId"], target["questionId"])] = None
+        else:
+            for child in node["conditions"]:
+                visit(child)
+
+    if condition is not None:
+        visit(_as_dict(condition))
+    return list(keys)
+
+
+# ============================================================================
+# JavaScript value semantics
+# ============================================================================
+
+
+# Integer literal prefixes Number() accepts (without a sign)
+_JS_RADIX_PREFIXES = {"0x": 16, "0o": 8, "0b": 2}
+
+
+def _js_number(value: Any) -> float:
+    """Equivalent of JavaScript Number(value) for answer values."""
+    if value is None:
+        return math.nan
+    if isinstance(value, (bool, int, float)):
+        return float(value)
+    text = str(value).strip()
+    if not text:
+        return 0.0
+    if not text.isascii():
+        return math.nan
+    radix = _JS_RADIX_PREFIXES.get(text[:2].lower())
+    if radix is not None:
+        digits = text[2:]
+        try:
+            return float(int(digits, radix)) if digits.isalnum() else math.nan
+        except ValueError:
+            return math.nan
+    if text in ("Infinity", "+Infinity", "-Infinity"):
+        return -math.inf if text.startswith("-") else math.inf
+    try:
+        number = float(text)
+    except ValueError:
+        return math.nan
+    # Python accepts spellings JavaScript does not (e.g., "inf", "1_000")
+    if "_" in text or text.lower().lstrip("+-") in ("inf", "infinity", "nan"):
+        return math.nan
+    return number
+
+
+def _js_number_string(number: float) -> str:
+    """Equivalent of JavaScript String(number) (Number::toString)."""
+    if math.isnan(number):
+        return "NaN"
+    if math.isinf(number):
+        return "Infinity" if number > 0 else "-Infinity"
+    if number == 0:
+        return "0"
+    sign = "-" if number < 0 else ""
+    # Shortest round-trip digits, as both languages use
+    mantissa, _, exponent = f"{abs(number)!r}".partition("e")
+    whole, _, fraction = mantissa.partition(".")
+    digits = (whole + fraction).lstrip("0")
+    point = len(whole) + int(exponent or 0) - (len(whole + fraction) - len(digits))
+    digits = digits.rstrip("0")
+    if len(digits) <= point <= 21:
+        return sign + digits + "0" * (point - len(digits))
+    if 0 < point <= 21:
+        return f"{sign}{digits[:point]}.{digits[point:]}"
+    if -6 < point <= 0:
+        return f"{sign}0.{'0' * -point}{digits}"
+    rest = f".{digits[1:]}" if len(digits) > 1 else ""
+    return f"{sign}{digits[0]}{rest}e{'+' if point > 0 else '-'}{abs(point - 1)}"
+
+
+def _js_string(value: Any) -> str:
+    """Equivalent of JavaScript String(value) for answer values."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return _js_number_string(float(value))
+    return str(value)
+
+
+def _js_strict_equals(a: Any, b: Any) -> bool:
+    """Equivalent of JavaScript a === b for answer values."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, str) or isinstance(b, str):
+        return isinstance(a, str) and isinstance(b, str) and a == b
+    return a == b
+
+
+# ============================================================================
+# Answer table
+# ============================================================================
+
+
+def _extract_answer_value(answer: dict) -> Any:
+    """Extract the comparable value from a survey answer (by question kind)."""
+    kind = answer.get("kind")
+    if kind == "check":
+        return answer.get("isChecked")
+    if kind == "mc":
+        return answer.get("choiceId")
+    if kind == "scale":
+        return answer.get("value")
+    if kind == "text":
+        return answer.get("answer")
+    return None
+
+
+def _participant_target_values(
+    participant: dict,
+    target_participant_id: Optional[str],
+    include_variables: bool,
+) -> dict[str, Any]:
+    """Resolve all condition target values for one ParticipantDownload."""
+    values: dict[str, Any] = {}
+    for stage_id, stage_answer in (participant.get("answerMap") or {}).items():
+        answer_map = stage_answer.get("answerMap")
+        if not isinstance(answer_map, dict):
+            continue
+        kind = stage_answer.get("kind")
+        for question_id, answer in answer_map.items():
+            if kind == "surveyPerParticipant":
+                if target_participant_id is None:
+                    continue
+                answer = (answer or {}).get(target_participant_id)
+            if answer:
+                value = _extract_answer_value(answer)
+                if value is not None:
+                    values[condition_target_key(stage_id, question_id)] = value
+
+    if include_variables:
+        profile = participant.get("profile") or {}
+        for name, raw in (profile.get("variableMap") or {}).items():
+            try:
+                parsed = json.loads(raw)
+            except (TypeError, ValueError):
+                values[condition_target_key(SYSTEM_VARIABLE_NAMESPACE, name)] = raw
+                continue
+            # Objects and arrays are flattened one level, as on the server
+            if isinstance(parsed, (dict, list)):
+                entries = (
+                    parsed.items() if isinstance(parsed, dict) else enumerate(parsed)
+                )
+                for key, value in entries:
+                    target = condition_target_key(
+                        SYSTEM_VARIABLE_NAMESPACE, f"{name}.{key}"
+                    )
+                    values[target] = value
+    return values
+
+
+class AnswerTable:
+    """
+    Column-oriented view of condition target values for many participants.
+
+    Each column is a list aligned with `participant_ids`, holding the
+    answer value or None where the participant has no answer.
+    """
+
+    def __init__(self, participant_ids: list[str], columns: dict[str, list[Any]]):
+        self.participant_ids = participant_ids
+        self.columns = columns
+        self._numeric: dict[str, list[Optional[float]]] = {}
+        self._strings: dict[str, list[Optional[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.participant_ids)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[str, dict[str, Any]]],
+        keys: Optional[Iterable[str]] = None,
+    ) -> AnswerTable:
+        """
+        Build a table from (participant ID, {target key: value}) rows.
+
+        Args:
+            rows: Per-participant target values, e.g., synthetic answers
+            keys: Optional target keys to keep (all keys if omitted)
+        """
+        wanted = set(keys) if keys is not None else None
+        participant_ids: list[str] = []
+        columns: dict[str, list[Any]] = {}
+        for index, (participant_id, values) in enumerate(rows):
+            participant_ids.append(participant_id)
+            for key, value in values.items():
+                if wanted is not None and key not in wanted:
+                    continue
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * index
+                column.append(value)
+            for column in columns.values():
+                if len(column) <= index:
+                    column.append(None)
+        return cls(participant_ids, columns)
+
+    @classmethod
+    def from_export(
+        cls,
+        export: Any,
+        keys: Optional[Iterable[str]] = None,
+        target_participant_id: Optional[str] = None,
+        include_variables: bool = True,
+    ) -> AnswerTable:
+        """
+        Build a table from an experiment export.
+
+        Args:
+            export: ExperimentDownload dict or an ExportStore
+            keys: Optional target keys to keep, e.g., compiled.dependencies;
+                  limits memory to the columns actually needed
+            target_participant_id: For SurveyPerParticipant stages, whose
+                                   answers to use (as on the server)
+            include_variables: Whether to expose participant variables under
+                               SYSTEM_VARIABLE_NAMESPACE
+
+        Returns:
+            AnswerTable with one row per participant, keyed by public ID
+        """
+        if hasattr(export, "iter_participants"):
+            participants = export.iter_participants()
+        else:
+            participants = (export.get("participantMap") or {}).items()
+        return cls.from_rows(
+            (
+                (
+                    public_id,
+                    _participant_target_values(
+                        participant, target_participant_id, include_variables
+                    ),
+                )
+                for public_id, participant in participants
+            ),
+            keys=keys,
+        )
+
+    def column(self, key: str) -> list[Any]:
+        """Values for a target key (all None if no participant answered it)."""
+        column = self.columns.get(key)
+        if column is None:
+            column = self.columns[key] = [None] * len(self.participant_ids)
+        return column
+
+    def numeric(self, key: str) -> list[Optional[float]]:
+        """Column converted with JavaScript Number() semantics (cached)."""
+        if key not in self._numeric:
+            self._numeric[key] = [
+                None if value is None else _js_number(value)
+                for value in self.column(key)
+            ]
+        return self._numeric[key]
+
+    def strings(self, key: str) -> list[Optional[str]]:
+        """Column converted with JavaScript String() semantics (cached)."""
+        if key not in self._strings:
+            self._strings[key] = [
+                None if value is None else _js_string(value)
+                for value in self.column(key)
+            ]
+        return self._strings[key]
+
+
+# ============================================================================
+# Compilation
+# ============================================================================
+
+_NUMERIC_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    "greater_than": lambda a, b: a > b,
+    "greater_than_or_equal": lambda a, b: a >= b,
+    "less_than": lambda a, b: a < b,
+    "less_than_or_equal": lambda a, b: a <= b,
+}
+
+
+def _compile_comparison(node: dict) -> Callable[[AnswerTable], Mask]:
+    target = node["target"]
+    key = condition_target_key(target["stageId"], target["questionId"])
+    operator = node["operator"]
+    expected = node["value"]
+
+    if operator in ("equals", "not_equals"):
+        negate = operator == "not_equals"
+
+        def compare_equality(table: AnswerTable) -> Mask:
+            return bytes(
+                value is not None and (_js_strict_equals(value, expected) != negate)
+                for value in table.column(key)
+            )
+
+        return compare_equality
+
+    if operator in _NUMERIC_OPERATORS:
+        op = _NUMERIC_OPERATORS[operator]
+        number = _js_number(expected)
+
+        def compare_numeric(table: AnswerTable) -> Mask:
+            return bytes(
+                value is not None and op(value, number) for value in table.numeric(key)
+            )
+
+        return compare_numeric
+
+    if operator in ("contains", "not_contains"):
+        negate = operator == "not_contains"
+        needle = _js_string(expected)
+
+        def compare_contains(table: AnswerTable) -> Mask:
+            return bytes(
+                value is not None and ((needle in value) != negate)
+                for value in table.strings(key)
+            )
+
+        return compare_contains
+
+    # Unknown operators never match, as on the server
+    return lambda table: bytes(len(table))
+
+
+def _compile_node(node: dict) -> Callable[[AnswerTable], Mask]:
+    if node["type"] == "comparison":
+        return _compile_comparison(node)
+
+    children = [_compile_node(child) for child in node["conditions"]]
+    is_and = node["operator"] == "and"
+
+    def evaluate_group(table: AnswerTable) -> Mask:
+        size = len(table)
+        if not children:
+            return b"\x01" * size
+        result = int.from_bytes(children[0](table), "little")
+        for child in children[1:]:
+            mask = int.from_bytes(child(table), "little")
+            result = (result & mask) if is_and else (result | mask)
+        return result.to_bytes(size, "little")
+
+    return evaluate_group
+
+
+class CompiledCondition:
+    """A condition tree compiled for evaluation over an AnswerTable."""
+
+    def __init__(self, condition: Any):
+        """
+        Args:
+            condition: ConditionGroup / ComparisonCondition (model or dict),
+                       or None for an always-true condition
+        """
+        node = _as_dict(condition) if condition is not None else None
+        self.dependencies = extract_condition_dependencies(node)
+        self._evaluate = (
+            _compile_node(node)
+            if node is not None
+            else (lambda table: b"\x01" * len(table))
+        )
+
+    def mask(self, table: AnswerTable) -> Mask:
+        """Evaluate over all participants; one 0/1 byte per participant."""
+        return self._evaluate(table)
+
+    def evaluate(self, table: AnswerTable) -> list[bool]:
+        """Evaluate over all participants; one bool per participant."""
+        return [bool(flag) for flag in self._evaluate(table)]
+
+    def count(self, table: AnswerTable) -> int:
+        """Number of participants for whom the condition passes."""
+        return self._evaluate(table).count(1)
+
+    def matching_ids(self, table: AnswerTable) -> list[str]:
+        """Public IDs of participants for whom the condition passes."""
+        mask = self._evaluate(table)
+        return [
+            participant_id
+            for participant_id, flag in zip(table.participant_ids, mask)
+            if flag
+        ]
+
+
+def compile_condition(condition: Any) -> CompiledCondition:
+    """Compile a ConditionGroup / ComparisonCondition (model or dict) once."""
+    return CompiledCondition(condition)
@@ -0,0 +1,274 @@
+"""
+Latency and token analytics for Deliberate Lab model logs.
+
+ModelLogTable reads model log entries one at a time (from
+Client.iter_experiment_logs(), an NDJSON file written by
+Client.export_experiment_logs_to(), or any list of entries) and keeps only
+column arrays: timestamps, latency, token counts and interned group codes.
+Prompts and responses are dropped once counted, so a table costs a few
+dozen bytes per call however large the logs are.
+
+Latency is responseTimestamp - queryTimestamp. Token counts come from the
+response's usage when the provider reported it; otherwise they are
+approximated from the prompt and response text (about four characters
+per token) and flagged as estimated.
+
+Usage:
+    from deliberate_lab.logs import ModelLogTable
+
+    table = ModelLogTable.from_logs(client.iter_experiment_logs("exp123"))
+    # or: ModelLogTable.from_logs(iter_logs_ndjson("exp123.logs.ndjson"))
+
+    table.latency_percentiles(by="model")
+    table.token_totals(by=("agent", "stage"))
+    table.throughput(bucket_seconds=60)
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Any, Iterable, Optional
+import math
+
+from deliberate_lab.chats import to_millis
+
+# Dimensions logs can be grouped by
+DIMENSIONS = ("model", "agent", "stage", "cohort", "participant", "status")
+
+# Characters per token used to estimate tokens when usage is missing
+APPROX_CHARS_PER_TOKEN = 4
+
+
+def approximate_tokens(text: Optional[str]) -> int:
+    """Rough token count of a text (about four characters per token)."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / APPROX_CHARS_PER_TOKEN)
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile (0-100) of sorted values (NaN if empty)."""
+    if not ordered:
+        return math.nan
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _log_dimensions(entry: dict) -> tuple[str, ...]:
+    """Group values of a log entry, in DIMENSIONS order."""
+    profile = entry.get("userProfile") or {}
+    agent_config = profile.get("agentConfig") or {}
+    model_settings = agent_config.get("modelSettings") or {}
+    return (
+        model_settings.get("modelName", ""),
+        agent_config.get("agentId", ""),
+        entry.get("stageId", ""),
+        entry.get("cohortId", ""),
+        entry.get("publicId", ""),
+        (entry.get("response") or {}).get("status", ""),
+    )
+
+
+class ModelLogTable:
+    """
+    Columnar table of model calls.
+
+    Rows follow input order. Times are milliseconds since the epoch;
+    missing query / response timestamps (e.g., failed calls) are NaN, and
+    so is the latency of those rows.
+    """
+
+    def __init__(self):
+        self.created = array("d")
+        self.latency = array("d")
+        self.prompt_tokens = array("q")
+        self.completion_tokens = array("q")
+        # 1 where token counts were approximated rather than reported
+        self.estimated = bytearray()
+        self._codes: dict[str, dict[str, int]] = {d: {} for d in DIMENSIONS}
+        self._names: dict[str, list[str]] = {d: [] for d in DIMENSIONS}
+        self._columns: dict[str, array] = {d: array("l") for d in DIMENSIONS}
+
+    def __len__(self) -> int:
+        return len(self.created)
+
+    @classmethod
+    def from_logs(cls, logs: Iterable[dict]) -> ModelLogTable:
+        """Build a table from log entries, consuming them one at a time."""
+        table = cls()
+        for entry in logs:
+            table.append(entry)
+        return table
+
+    def append(self, entry: dict) -> None:
+        """Add one model log entry."""
+        query = entry.get("queryTimestamp")
+        response_time = entry.get("responseTimestamp")
+        created = entry.get("createdTimestamp")
+        self.created.append(to_millis(created) if created else math.nan)
+        self.latency.append(
+            to_millis(response_time) - to_millis(query)
+            if query and response_time
+            else math.nan
+        )
+
+        response = entry.get("response") or {}
+        usage = response.get("usage")
+        if usage:
+            self.prompt_tokens.append(int(usage.get("promptTokens") or 0))
+            self.completion_tokens.append(int(usage.get("completionTokens") or 0))
+            self.estimated.append(0)
+        else:
+            prompt = entry.get("prompt")
+            self.prompt_tokens.append(
+                approximate_tokens(prompt if isinstance(prompt, str) else str(prompt))
+            )
+            self.completion_tokens.append(
+                approximate_tokens(response.get("text"))
+                + approximate_tokens(response.get("reasoning"))
+            )
+            self.estimated.append(1)
+
+        for dimension, value in zip(DIMENSIONS, _log_dimensions(entry)):
+            codes = self._codes[dimension]
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(self._names[dimension])
+                self._names[dimension].append(value)
+            self._columns[dimension].append(code)
+
+    # =========================================================================
+    # Grouping
+    # =========================================================================
+
+    def values(self, dimension: str) -> list[str]:
+        """Distinct values of a dimension, e.g. all model names."""
+        return list(self._names[dimension])
+
+    def _groups(self, by: Optional[str | tuple[str, ...]]) -> dict[Any, list[int]]:
+        """Row numbers per group key (a value, or a tuple for several dims)."""
+        if by is None:
+            return {None: list(range(len(self)))}
+        dimensions = (by,) if isinstance(by, str) else tuple(by)
+        for dimension in dimensions:
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Unknown log dimension: {dimension}")
+        columns = [self._columns[d] for d in dimensions]
+        groups: dict[tuple[int, ...], list[int]] = {}
+        for row, codes in enumerate(zip(*columns)):
+            groups.setdefault(codes, []).append(row)
+
+        names = [self._names[d] for d in dimensions]
+        result: dict[Any, list[int]] = {}
+        for codes, rows in groups.items():
+            key = tuple(n[c] for n, c in zip(names, codes))
+            result[key[0] if isinstance(by, str) else key] = rows
+        return result
+
+    # =========================================================================
+    # Analytics
+    # =========================================================================
+
+    def latency_percentiles(
+        self,
+        by: Optional[str | tuple[str, ...]] = None,
+        percentiles: Iterable[float] = (50, 90, 99),
+    ) -> dict[Any, dict[str, float]]:
+        """
+        Latency statistics (milliseconds) per group.
+
+        Args:
+            by: Dimension or tuple of dimensions to group by (one group,
+                keyed None, if omitted)
+            percentiles: Percentiles to compute (nearest rank)
+
+        Returns:
+            Map from group key to {"calls", "timed", "mean", "p50", ...};
+            "timed" counts calls with both query and response timestamps
+        """
+        qs = list(percentiles)
+        stats = {}
+        for key, rows in self._groups(by).items():
+            latencies = sorted(
+                value for value in (self.latency[row] for row in rows) if value == value
+            )
+            group: dict[str, float] = {
+                "calls": len(rows),
+                "timed": len(latencies),
+                "mean": sum(latencies) / len(latencies) if latencies else math.nan,
+            }
+            for q in qs:
+                group[f"p{q:g}"] = percentile(latencies, q)
+            stats[key] = group
+        return stats
+
+    def token_totals(
+        self, by: Optional[str | tuple[str, ...]] = None
+    ) -> dict[Any, dict[str, int]]:
+        """
+        Token totals per group.
+
+        Returns:
+            Map from group key to {"calls", "promptTokens", "completionTokens",
+            "totalTokens", "estimatedCalls"}
+        """
+        totals = {}
+        for key, rows in self._groups(by).items():
+            prompt = sum(self.prompt_tokens[row] for row in rows)
+            completion = sum(self.completion_tokens[row] for row in rows)
+            totals[key] = {
+                "calls": len(rows),
+                "promptTokens": prompt,
+                "completionTokens": completion,
+                "totalTokens": prompt + completion,
+                "estimatedCalls": sum(self.estimated[row] for row in rows),
+            }
+        return totals
+
+    def throughput(
+        self,
+        bucket_seconds: float = 60,
+        by: Optional[str | tuple[str, ...]] = None,
+    ) -> dict[Any, list[tuple[float, int, int]]]:
+        """
+        Calls and tokens per time bucket (by creation timestamp).
+
+        Args:
+            bucket_seconds: Bucket width in seconds
+            by: Dimension(s) to group by, as in latency_percentiles()
+
+        Returns:
+            Map from group key to (bucket start in ms, calls, total tokens)
+            tuples in time order; rows without a timestamp are skipped
+        """
+        width = bucket_seconds * 1000
+        series = {}
+        for key, rows in self._groups(by).items():
+            buckets: dict[int, list[int]] = {}
+            for row in rows:
+                created = self.created[row]
+                if created != created:
+                    continue
+                bucket = buckets.setdefault(int(created // width), [0, 0])
+                bucket[0] += 1
+                bucket[1] += self.prompt_tokens[row] + self.completion_tokens[row]
+            series[key] = [
+                (index * width, calls, tokens)
+                for index, (calls, tokens) in sorted(buckets.items())
+            ]
+        return series
+
+    def summary(self) -> dict[str, Any]:
+        """Overall latency and token statistics."""
+        latency = self.latency_percentiles()[None]
+        tokens = self.token_totals()[None]
+        created = [value for value in self.created if value == value]
+        return {
+            **tokens,
+            "timedCalls": latency["timed"],
+            "meanLatencyMs": latency["mean"],
+            "p50LatencyMs": latency["p50"],
+            "p90LatencyMs": latency["p90"],
+            "p99LatencyMs": latency["p99"],
+            "firstCall": min(created) if created else None,
+            "lastCall": max(created) if created else None,
+        }
@@ -0,0 +1,348 @@
+"""
+Streaming NDJSON layout for Deliberate Lab exports.
+
+Converts the JSON bodies returned by the export endpoints into
+newline-delimited JSON without loading the whole payload into memory.
+Values are decoded one record at a time (one participant, one cohort,
+one chat message, one log entry) by JsonStreamReader.
+
+Experiment exports are written as typed records, one per line:
+
+    {"type": "experiment", "data": {...}}
+    {"type": "stage", "id": "<stageId>", "data": {...}}
+    {"type": "participant", "id": "<publicId>", "data": {"profile": ..., "answerMap": ...}}
+    {"type": "cohort", "id": "<cohortId>", "data": {"cohort": ..., "dataMap": ...}}
+    {"type": "chatMessage", "cohortId": "...", "stageId": "...", "data": {...}}
+    {"type": "agentMediator", "id": "<personaId>", "data": {...}}
+    {"type": "agentParticipant", "id": "<personaId>", "data": {...}}
+    {"type": "alert", "participantId": "<privateId>", "data": {...}}
+
+Chat messages are written directly after the cohort they belong to.
+Log exports are written as one log entry per line.
+"""
+
+from __future__ import annotations
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Optional, TextIO
+import hashlib
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that may continue a number (fraction, exponent, sign)
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+
+# ExperimentDownload map key -> NDJSON record type for per-entry sections
+_MAP_RECORD_TYPES = {
+    "stageMap": "stage",
+    "participantMap": "participant",
+    "agentMediatorMap": "agentMediator",
+    "agentParticipantMap": "agentParticipant",
+}
+
+
+class JsonStreamReader:
+    """
+    Incremental reader over a JSON text stream.
+
+    Navigates objects and arrays key by key / element by element, and
+    decodes individual values with the standard json decoder. Only the
+    value currently being decoded has to fit in memory.
+
+    Example:
+        reader = JsonStreamReader(fp)
+        for key in reader.iter_object():
+            value = reader.read_value()  # each value must be consumed
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = 1 << 20):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        """Append at least `size` characters to the buffer. Returns False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(max(self._chunk_size, size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"{message} (near: {self._buf[self._pos:self._pos + 40]!r})")
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of input)."""
+        while True:
+            match = _WHITESPACE.match(self._buf, self._pos)
+            assert match is not None  # the pattern matches the empty string
+            self._pos = match.end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(0):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be `char`."""
+        if self.peek() != char:
+            raise self._error(f"Expected {char!r}")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """Decode and return the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Value is incomplete: grow the buffer geometrically and retry
+                if not self._fill(len(self._buf)):
+                    raise
+                continue
+            # A number near the end of the buffer may continue in the next
+            # chunk, including after a trailing '.', 'e' or '-' the decoder
+            # stopped before (e.g. "1." of "1.5")
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                tail = _NUMBER_TAIL.match(self._buf, end)
+                assert tail is not None
+                if tail.end() == len(self._buf) and self._fill(0):
+                    continue
+            self._pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next JSON object.
+
+        After each key is yielded the reader is positioned at its value,
+        which the caller must consume (read_value, iter_object or
+        iter_array) before advancing the iterator.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise self._error("Expected object key")
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self._error("Expected ',' or '}'")
+
+    def iter_array(self) -> Iterator[int]:
+        """
+        Iterate over the elements of the next JSON array.
+
+        Yields element indices; as with iter_object, the caller must
+        consume each element before advancing the iterator.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self._error("Expected ',' or ']'")
+
+
+class NdjsonWriter:
+    """Writes NDJSON lines while tracking byte offsets, counts and a checksum."""
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self._sha256 = hashlib.sha256()
+        self.offset = 0
+        self.counts: dict[str, int] = {}
+
+    def write_line(self, obj: Any) -> int:
+        """Write one JSON value as a line. Returns the line's byte offset."""
+        line = (
+            json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            + b"\n"
+        )
+        offset = self.offset
+        self._fp.write(line)
+        self._sha256.update(line)
+        self.offset += len(line)
+        return offset
+
+    def write_record(self, record_type: str, data: Any, **keys: Any) -> int:
+        """Write a typed record line. Returns the line's byte offset."""
+        self.counts[record_type] = self.counts.get(record_type, 0) + 1
+        return self.write_line({"type": record_type, **keys, "data": data})
+
+    def manifest(self) -> dict:
+        """Summary of what has been written so far."""
+        return {
+            "bytes": self.offset,
+            "sha256": self._sha256.hexdigest(),
+            "counts": dict(self.counts),
+        }
+
+
+# A record to write: (export section key, record type, data, key fields)
+Record = tuple[str, str, Any, dict[str, Any]]
+
+
+def _iter_cohort_records(cohort_id: str, cohort: dict) -> Iterator[Record]:
+    """Split a CohortDownload into a cohort record and chatMessage records."""
+    chat_map = cohort.pop("chatMap", {}) or {}
+    yield "cohortMap", "cohort", cohort, {"id": cohort_id}
+    for stage_id, messages in chat_map.items():
+        for message in messages:
+            yield "cohortMap", "chatMessage", message, {
+                "cohortId": cohort_id,
+                "stageId": stage_id,
+            }
+
+
+def iter_experiment_records_from_stream(source: TextIO) -> Iterator[Record]:
+    """Yield NDJSON records from an ExperimentDownload JSON text stream."""
+    reader = JsonStreamReader(source)
+    for key in reader.iter_object():
+        if key == "experiment":
+            yield key, "experiment", reader.read_value(), {}
+        elif key in _MAP_RECORD_TYPES:
+            for entry_id in reader.iter_object():
+                yield key, _MAP_RECORD_TYPES[key], reader.read_value(), {"id": entry_id}
+        elif key == "cohortMap":
+            for cohort_id in reader.iter_object():
+                yield from _iter_cohort_records(cohort_id, reader.read_value())
+        elif key == "alerts":
+            for participant_id in reader.iter_object():
+                for _ in reader.iter_array():
+                    yield key, "alert", reader.read_value(), {
+                        "participantId": participant_id
+                    }
+        else:
+            # Unknown section: keep it as a single record
+            yield key, key, reader.read_value(), {}
+
+
+def iter_experiment_records(export: dict) -> Iterator[Record]:
+    """Yield NDJSON records from an in-memory ExperimentDownload dict."""
+    for key, value in export.items():
+        if key == "experiment":
+            yield key, "experiment", value, {}
+        elif key in _MAP_RECORD_TYPES:
+            for entry_id, entry in value.items():
+                yield key, _MAP_RECORD_TYPES[key], entry, {"id": entry_id}
+        elif key == "cohortMap":
+            for cohort_id, cohort in value.items():
+                yield from _iter_cohort_records(cohort_id, dict(cohort))
+        elif key == "alerts":
+            for participant_id, alerts in value.items():
+                for alert in alerts:
+                    yield key, "alert", alert, {"participantId": participant_id}
+        else:
+            yield key, key, value, {}
+
+
+def write_experiment_records(
+    records: Iterable[Record],
+    dest: BinaryIO,
+    on_record: Optional[Callable[[str, dict[str, Any], int, int], None]] = None,
+) -> dict:
+    """
+    Write experiment records as NDJSON lines.
+
+    Args:
+        records: Records from iter_experiment_records(_from_stream)
+        dest: Binary stream to write NDJSON to
+        on_record: Optional callback(record_type, keys, offset, length)
+                   invoked after each line is written (e.g., to build an index)
+
+    Returns:
+        dict with 'bytes', 'sha256' (of the NDJSON output), 'counts' per
+        record type and 'sections', mapping each top-level export key to
+        the [start, end) byte range of its records
+    """
+    writer = NdjsonWriter(dest)
+    sections: dict[str, list[int]] = {}
+    for section, record_type, data, keys in records:
+        if section not in sections:
+            sections[section] = [writer.offset, writer.offset]
+        offset = writer.write_record(record_type, data, **keys)
+        sections[section][1] = writer.offset
+        if on_record is not None:
+            on_record(record_type, keys, offset, writer.offset - offset)
+
+    manifest = writer.manifest()
+    manifest["sections"] = sections
+    return manifest
+
+
+def write_experiment_ndjson(source: TextIO, dest: BinaryIO) -> dict:
+    """
+    Lay out an ExperimentDownload JSON stream as typed NDJSON records.
+
+    Args:
+        source: Text stream containing the export JSON (full or sectioned)
+        dest: Binary stream to write NDJSON to
+
+    Returns:
+        Manifest dict, as returned by write_experiment_records()
+    """
+    return write_experiment_records(iter_experiment_records_from_stream(source), dest)
+
+
+def read_record_header(line: bytes) -> dict:
+    """
+    Decode only the type and key fields of an NDJSON record line.
+
+    Records are written with "data" as their last key, so the header can
+    be parsed without decoding the (possibly large) data payload.
+    """
+    end = line.find(b',"data":')
+    return json.loads(line[:end] + b"}" if end >= 0 else line)
+
+
+def write_logs_ndjson(source: TextIO, dest: BinaryIO) -> dict:
+    """
+    Lay out a model log export (JSON array) as one log entry per line.
+
+    Args:
+        source: Text stream containing the log export JSON array
+        dest: Binary stream to write NDJSON to
+
+    Returns:
+        dict with 'bytes', 'sha256' (of the NDJSON output) and 'counts'
+    """
+    reader = JsonStreamReader(source)
+    writer = NdjsonWriter(dest)
+    for _ in reader.iter_array():
+        writer.counts["log"] = writer.counts.get("log", 0) + 1
+        writer.write_line(reader.read_value())
+    return writer.manifest()
+
+
+def iter_logs_ndjson(path: str) -> Iterator[dict]:
+    """
+    Iterate over the log entries of a file written by write_logs_ndjson(),
+    decoding one line at a time.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,314 @@
+"""
+Offline payout computation for Deliberate Lab experiment exports.
+
+Mirrors calculatePayoutResult / calculatePayoutTotal
+(utils/src/stages/payout_stage.ts), as used for the dashboard's payout
+CSV columns, over every participant of an export, and writes Prolific
+bulk bonus files.
+
+Usage:
+    from deliberate_lab.payouts import compute_payouts, write_prolific_bonus_csv
+
+    export = client.export_experiment("exp123")
+    payouts = compute_payouts(export)
+    with open("bonuses.csv", "w", newline="") as f:
+        write_prolific_bonus_csv(payouts, f)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, TextIO
+import csv
+import math
+
+
+@dataclass
+class PayoutItemBreakdown:
+    """Amounts earned for one payout item."""
+
+    item_id: str
+    type: str
+    name: str
+    stage_id: str
+    completed_stage: bool
+    base_amount_earned: float
+    # SURVEY items: question ID -> amount earned for a correct answer
+    question_amounts: dict[str, float] = field(default_factory=dict)
+    # SURVEY items: public ID of the ranking winner whose answers were used
+    ranking_winner: Optional[str] = None
+    # CHIP items: chip value gained over the starting chips (floored at 0)
+    chip_amount: float = 0.0
+
+    @property
+    def amount(self) -> float:
+        """Total (unrounded) amount contributed by this item."""
+        return (
+            self.base_amount_earned
+            + sum(self.question_amounts.values())
+            + self.chip_amount
+        )
+
+
+@dataclass
+class ParticipantPayout:
+    """One participant's payout for one payout stage."""
+
+    public_id: str
+    prolific_id: Optional[str]
+    cohort_id: Optional[str]
+    stage_id: str
+    currency: str
+    items: list[PayoutItemBreakdown]
+    total: float
+
+
+def _export_parts(export: Any) -> tuple[dict, Iterable, Any]:
+    """Stage map, participants and a cohort dataMap getter for any export."""
+    if hasattr(export, "iter_participants"):
+        stage_map = {
+            stage_id: export.stage(stage_id) for stage_id in export.stage_ids()
+        }
+        cohort_ids = set(export.cohort_ids())
+
+        def data_map(cohort_id: str) -> dict:
+            if cohort_id not in cohort_ids:
+                return {}
+            return export.cohort(cohort_id, include_chats=False).get("dataMap") or {}
+
+        return stage_map, export.iter_participants(), data_map
+
+    cohort_map = export.get("cohortMap") or {}
+
+    def data_map(cohort_id: str) -> dict:
+        return (cohort_map.get(cohort_id) or {}).get("dataMap") or {}
+
+    return (
+        export.get("stageMap") or {},
+        (export.get("participantMap") or {}).items(),
+        data_map,
+    )
+
+
+def _item_plans(payout_stage: dict, stage_map: dict) -> list[dict]:
+    """
+    Resolve the stage-level parts of each active payout item once
+    (referenced stage, chips, and the scored multiple choice questions).
+    """
+    plans = []
+    for item in payout_stage.get("payoutItems") or []:
+        if not item.get("isActive"):
+            continue
+        stage = stage_map.get(item.get("stageId"))
+        kind = item.get("type")
+        if not stage:
+            continue
+        plan = {"item": item, "stage": stage}
+        if kind == "CHIP":
+            if stage.get("kind") != "chip":
+                continue
+            plan["chips"] = stage.get("chips") or []
+        elif kind == "SURVEY":
+            if stage.get("kind") != "survey":
+                continue
+            question_map = item.get("questionMap") or {}
+            plan["questions"] = [
+                (
+                    question["id"],
+                    question["correctAnswerId"],
+                    question_map[question["id"]],
+                )
+                for question in stage.get("questions") or []
+                if question.get("kind") == "mc"
+                and question_map.get(question["id"])
+                and question.get("correctAnswerId")
+            ]
+        elif kind != "DEFAULT":
+            continue
+        plans.append(plan)
+    return plans
+
+
+def _chip_amount(chips: list[dict], public_data: dict, public_id: str) -> float:
+    """Chip value gained over the starting chips, as in calculatePayoutTotal."""
+    quantities = (public_data.get("participantChipMap") or {}).get(public_id)
+    if not quantities:
+        return 0.0
+    values = (public_data.get("participantChipValueMap") or {}).get(public_id) or {}
+    chip_total = 0.0
+    initial_total = 0.0
+    for chip in chips:
+        value = float(values.get(chip["id"], 0) or 0)
+        quantity = float(quantities.get(chip["id"], 0) or 0)
+        chip_total += math.floor(quantity * value * 100) / 100
+        initial_total += math.floor(chip.get("startingQuantity", 0) * value * 100) / 100
+    return max(0.0, chip_total - initial_total)
+
+
+def _item_breakdown(
+    plan: dict, profile: dict, data_map: dict
+) -> Optional[PayoutItemBreakdown]:
+    """Payout breakdown for one item (None where the server returns null)."""
+    item = plan["item"]
+    stage_id = item["stageId"]
+    completed = (profile.get("timestamps") or {}).get("completedStages", {}).get(
+        stage_id
+    ) is not None
+    public_id = profile.get("publicId") or ""
+    breakdown = PayoutItemBreakdown(
+        item_id=item["id"],
+        type=item["type"],
+        name=item.get("name", ""),
+        stage_id=stage_id,
+        completed_stage=completed,
+        base_amount_earned=item.get("baseCurrencyAmount", 0) if completed else 0,
+    )
+
+    if item["type"] == "CHIP":
+        public_data = data_map.get(stage_id)
+        if not public_data or public_data.get("kind") != "chip":
+            return None
+        breakdown.chip_amount = _chip_amount(plan["chips"], public_data, public_id)
+
+    elif item["type"] == "SURVEY":
+        answer_owner = public_id
+        ranking_stage_id = item.get("rankingStageId")
+        if ranking_stage_id:
+            ranking_data = data_map.get(ranking_stage_id)
+            if not ranking_data or ranking_data.get("kind") != "ranking":
+                return None
+            breakdown.ranking_winner = ranking_data.get("winnerId")
+            answer_owner = breakdown.ranking_winner or ""
+        survey_data = data_map.get(stage_id) or {}
+        answer_map = {}
+        if survey_data.get("kind") == "survey":
+            answer_map = (survey_data.get("participantAnswerMap") or {}).get(
+                answer_owner
+            ) or {}
+        for question_id, correct_id, amount in plan["questions"]:
+            answer = answer_map.get(question_id) or {}
+            answer_id = answer.get("choiceId", "") if answer.get("kind") == "mc" else ""
+            breakdown.question_amounts[question_id] = (
+                amount if answer_id == correct_id else 0
+            )
+
+    return breakdown
+
+
+def _total(items: list[PayoutItemBreakdown], average: bool) -> float:
+    """Rounded total, as in calculatePayoutTotal (rounded up to cents)."""
+    total = 0.0
+    for item in items:
+        total += item.base_amount_earned
+        for amount in item.question_amounts.values():
+            total += amount
+        total += item.chip_amount
+    if average:
+        return math.ceil(total / len(items) * 100) / 100 if items else 0.0
+    return math.ceil(total * 100) / 100
+
+
+def compute_payouts(
+    export: Any, stage_ids: Optional[list[str]] = None
+) -> list[ParticipantPayout]:
+    """
+    Compute every participant's payout breakdown.
+
+    Stage configs and payout items are resolved once per payout stage and
+    cohort public data once per cohort, so the per-participant work is a
+    lookup over precomputed plans.
+
+    Args:
+        export: ExperimentDownload dict (with stageMap, participantMap and
+                cohortMap) or an ExportStore
+        stage_ids: Payout stage IDs to compute (all payout stages if omitted)
+
+    Returns:
+        One ParticipantPayout per participant and payout stage, for
+        participants with an answer (random selection) for that stage
+    """
+    stage_map, participants, data_map_for = _export_parts(export)
+    payout_stages = [
+        stage
+        for stage_id, stage in stage_map.items()
+        if stage.get("kind") == "payout"
+        and (stage_ids is None or stage_id in stage_ids)
+    ]
+    plans = {stage["id"]: _item_plans(stage, stage_map) for stage in payout_stages}
+    data_maps: dict[str, dict] = {}
+
+    payouts = []
+    for public_id, participant in participants:
+        profile = participant.get("profile") or {}
+        answer_map = participant.get("answerMap") or {}
+        # Participants not (yet) in a cohort have no cohort data
+        cohort_id = profile.get("currentCohortId") or ""
+        if cohort_id not in data_maps:
+            data_maps[cohort_id] = data_map_for(cohort_id) if cohort_id else {}
+        data_map = data_maps[cohort_id]
+
+        for stage in payout_stages:
+            answer = answer_map.get(stage["id"])
+            if not answer:
+                continue
+            selection = answer.get("randomSelectionMap") or {}
+            items = []
+            for plan in plans[stage["id"]]:
+                item = plan["item"]
+                group = item.get("randomSelectionId")
+                if group and selection.get(group) != item["id"]:
+                    continue
+                breakdown = _item_breakdown(plan, profile, data_map)
+                if breakdown is not None:
+                    items.append(breakdown)
+            payouts.append(
+                ParticipantPayout(
+                    public_id=public_id,
+                    prolific_id=profile.get("prolificId"),
+                    cohort_id=cohort_id,
+                    stage_id=stage["id"],
+                    currency=stage.get("currency", "USD"),
+                    items=items,
+                    total=_total(items, bool(stage.get("averageAllPayoutItems"))),
+                )
+            )
+    return payouts
+
+
+def write_prolific_bonus_csv(
+    payouts: Iterable[ParticipantPayout], dest: TextIO, include_zero: bool = False
+) -> int:
+    """
+    Write a Prolific bulk bonus file ("<prolific ID>,<amount>" per line).
+
+    Totals of the same Prolific participant across payout stages are
+    summed. Participants without a Prolific ID are skipped.
+
+    Args:
+        payouts: Results of compute_payouts()
+        dest: Text stream to write to (open with newline="")
+        include_zero: Whether to write participants with a zero bonus
+
+    Returns:
+        Number of lines written
+
+    Raises:
+        ValueError: If the payouts use more than one currency
+    """
+    totals: dict[str, float] = {}
+    currencies = set()
+    for payout in payouts:
+        if not payout.prolific_id:
+            continue
+        currencies.add(payout.currency)
+        totals[payout.prolific_id] = totals.get(payout.prolific_id, 0.0) + payout.total
+    if len(currencies) > 1:
+        raise ValueError(f"Payouts use multiple currencies: {sorted(currencies)}")
+
+    writer = csv.writer(dest, lineterminator="\n")
+    written = 0
+    for prolific_id, total in totals.items():
+        if total <= 0 and not include_zero:
+            continue
+        writer.writerow([prolific_id, f"{total:.2f}"])
+        written += 1
+    return written
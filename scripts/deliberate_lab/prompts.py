@@ -0,0 +1,1387 @@
+"""
+Offline rendering of agent prompt configs against experiment exports.
+
+Ports the server's structured prompt assembly (processPromptItems in
+functions/src/structured_prompt.utils.ts) so the prompt an agent saw at a
+given point of an experiment can be reconstructed from an export. A prompt
+config (ChatPromptConfig / GenericPromptConfig, model or dict) is compiled
+once: Mustache text is parsed, item conditions are compiled and the
+structured output suffix is built. A PromptRenderer bound to one export then
+renders compiled prompts for any number of (agent, cohort, turn) contexts,
+caching rendered stage context so that contexts sharing a stage, cohort and
+transcript length only format it once.
+
+Stage displays are ported for info, tos, chat, privateChat, survey, ranking
+and role stages. Other stage kinds render their scaffolding and descriptions
+with an empty display, and are listed in `renderer.unsupported_stage_kinds`.
+Exports do not contain private chat transcripts, so those are passed per
+context. Participant statuses and answers are read as of the export.
+
+Usage:
+    from deliberate_lab.prompts import (
+        PromptContext,
+        PromptRenderer,
+        compile_prompt,
+        mediator_profile,
+    )
+
+    renderer = PromptRenderer(store)  # ExperimentDownload dict or ExportStore
+    template = store.agent_mediator("persona-id")
+    prompt = compile_prompt(template["promptMap"]["chat-stage"])
+    mediator = mediator_profile(template["persona"], "cohort-1")
+
+    # The mediator's prompt before each message of the cohort's chat
+    messages = store.chat("cohort-1", "chat-stage")
+    contexts = [
+        PromptContext("cohort-1", "chat-stage", mediator, turn=turn)
+        for turn in range(len(messages))
+    ]
+    prompts = renderer.render_many(prompt, contexts)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+import json
+import math
+import re
+
+from deliberate_lab.chats import to_millis
+from deliberate_lab.conditions import (
+    AnswerTable,
+    _as_dict,
+    _js_number,
+    _js_number_string,
+    _participant_target_values,
+    compile_condition,
+    extract_condition_dependencies,
+)
+from deliberate_lab.simulation import _choices
+
+# ============================================================================
+# Server prompt constants (utils/src/structured_prompt.ts,
+# utils/src/stages/chat_stage.prompts.ts)
+# ============================================================================
+
+PROMPT_ITEM_PROFILE_CONTEXT_PARTICIPANT_SCAFFOLDING = (
+    "This information is private to you. Use it to guide your behavior in "
+    "this task. Other participants do not know these attributes unless you "
+    "choose to share it."
+)
+
+PROMPT_ITEM_PROFILE_INFO_PARTICIPANT_SCAFFOLDING = (
+    "This is the display name that others will use to refer to you. It may "
+    "be a label such as an animal or object, but you are still a human using "
+    "this alias."
+)
+
+DEFAULT_MEDIATOR_CHAT_STYLE_INSTRUCTIONS = (
+    "Follow any persona context or instructions carefully. If none are "
+    "given, respond in short, natural sentences (1–2 per turn)."
+)
+
+DEFAULT_MEDIATOR_CHAT_FREQUENCY_INSTRUCTIONS = (
+    "Adjust your response frequency based on group size: respond less often "
+    "in groups with multiple participants so that all have a chance to speak."
+)
+
+DEFAULT_MEDIATOR_GROUP_CHAT_PROMPT_INSTRUCTIONS = (
+    f"{DEFAULT_MEDIATOR_CHAT_STYLE_INSTRUCTIONS} "
+    f"{DEFAULT_MEDIATOR_CHAT_FREQUENCY_INSTRUCTIONS}"
+)
+
+DEFAULT_MEDIATOR_GROUP_CHAT_TURN_TAKING_PROMPT_INSTRUCTIONS = (
+    DEFAULT_MEDIATOR_CHAT_STYLE_INSTRUCTIONS
+)
+
+DEFAULT_AGENT_PARTICIPANT_CHAT_STYLE_INSTRUCTIONS = """\
+Rules for how to write your message:
+- Let your persona determine how you open. Some people jump straight to their \
+opinion; others react to what was just said first ("yeah but—", "wait, \
+really?", "I mean, kind of"). Don't default to a thesis-statement opener just \
+because it's the easiest thing to write — ask what *this person* would \
+actually do.
+- Keep it short: 1-3 sentences as a default. Never write a paragraph. Real \
+people in group chats don't write essays.
+- Verbosity is a tendency, not a rule. A terse persona is usually brief — but \
+if something genuinely provokes them, they say more. A verbose persona \
+usually elaborates — but sometimes a short reaction is all they have. Let the \
+moment determine it.
+- Express your personality through word choice and content, not through \
+formal sentence structure. Even a highly educated or pedantic persona types \
+in chat voice, not essay voice. A pedant in a group chat writes "honestly not \
+that hard to keep your inbox organized" — not "it is a profound failure of \
+personal discipline."
+- Sound like your persona, not like an AI assistant. Use your persona's \
+speech patterns, vocabulary level, and tone. Fragments and low-substance \
+replies are valid when they fit the persona.
+- Match your persona's conversational style: some people always have \
+something substantive to add, others often just signal agreement or \
+confusion. Not every response needs to make a new point — but only write a \
+low-substance reply if that genuinely fits how your persona communicates.
+- Stay in character throughout. Do not summarize, explain your reasoning, or \
+step outside the persona."""
+
+DEFAULT_AGENT_PARTICIPANT_CHAT_PROMPT = f"""\
+You are participating in a live group chat as your persona.
+
+First, react: read the last 1-2 messages and ask yourself how this specific \
+person would feel in this moment. Are they amused? Annoyed? Curious? \
+Uncertain? Let that reaction drive your response.
+
+Then decide whether to actually send a message. Not every message in a group \
+chat deserves a reply — sometimes you'd scroll past. If yes, write it. If no, \
+stay silent.
+
+{DEFAULT_AGENT_PARTICIPANT_CHAT_STYLE_INSTRUCTIONS}"""
+
+DEFAULT_AGENT_PARTICIPANT_CHAT_TURN_TAKING_PROMPT = f"""\
+You are participating in a live group chat as your persona. It is your turn \
+to write a message.
+
+First, react: read the last 1-2 messages and ask yourself how this specific \
+person would feel in this moment. Are they amused? Annoyed? Curious? \
+Uncertain? Let that reaction drive your response. Write a message.
+
+{DEFAULT_AGENT_PARTICIPANT_CHAT_STYLE_INSTRUCTIONS}"""
+
+CHAT_PROMPT_TRANSCRIPT_EXPLANATION = (
+    "Below is the transcript of your discussion. Messages are shown in "
+    "chronological order; new messages appear at the bottom. Each message / "
+    "turn follows the format: (HH:MM) Name: message."
+)
+
+# Participant statuses counted as active (getFirestoreActiveParticipants)
+ACTIVE_PARTICIPANT_STATUSES = frozenset({"IN_PROGRESS", "SUCCESS", "ATTENTION_CHECK"})
+
+# Stage ID markers that switch to an anonymous profile set (profile_sets.ts)
+_PROFILE_SET_MARKERS = (
+    ("secondary_profile", "animals-2"),
+    ("tertiary_profile", "nature"),
+)
+
+
+def _active_profile_set_id(stage_id: str = "", stage_name: str = "") -> str:
+    """Port of getActiveProfileSetId()."""
+    combined = f"{stage_id} {stage_name}".lower()
+    for marker, profile_set_id in _PROFILE_SET_MARKERS:
+        if marker in combined:
+            return profile_set_id
+    return ""
+
+
+# ============================================================================
+# Mustache templates (resolveTemplateVariables)
+# ============================================================================
+
+
+class _TemplateSyntaxError(ValueError):
+    pass
+
+
+# {{name}}, {{{name}}}, {{&name}}, {{#section}}, {{^inverted}}, {{/close}},
+# {{! comment}}, {{> partial}} and {{=<% %>=}} (delimiter changes)
+_TAG = re.compile(r"\{\{(\{)?\s*([#^/!&>=]?)\s*(.*?)\s*\}?\}\}", re.S)
+_STANDALONE_TYPES = frozenset("#^/!>=")
+
+
+@lru_cache(maxsize=4096)
+def _parse_template(text: str) -> tuple:
+    """
+    Parse a Mustache template into a tree of nodes, as mustache.js does.
+
+    Nodes are strings (literal text), ("name", key) and ("#" | "^", key,
+    children). Lines holding only a section, comment or partial tag are
+    removed ("standalone" tags).
+    """
+    root: list = []
+    stack: list[tuple[str, list]] = [("", root)]
+    position = 0
+    for match in _TAG.finditer(text):
+        kind = match.group(2) or ("&" if match.group(1) else "name")
+        key = match.group(3)
+        start, end = match.span()
+        if kind in _STANDALONE_TYPES:
+            line_start = text.rfind("\n", 0, start) + 1
+            line_end = text.find("\n", end)
+            line_end = len(text) if line_end < 0 else line_end + 1
+            if (
+                line_start >= position
+                and not text[line_start:start].strip(" \t")
+                and not text[end:line_end].strip(" \t\r\n")
+            ):
+                start, end = line_start, line_end
+        if text[position:start]:
+            stack[-1][1].append(text[position:start])
+        position = end
+        if kind in ("name", "&"):
+            stack[-1][1].append(("name", key))
+        elif kind in ("#", "^"):
+            children: list = []
+            stack[-1][1].append((kind, key, children))
+            stack.append((key, children))
+        elif kind == "/":
+            if len(stack) == 1 or stack[-1][0] != key:
+                raise _TemplateSyntaxError(f"Unopened section {key!r}")
+            stack.pop()
+        elif kind == "=":
+            raise _TemplateSyntaxError("Custom delimiters are not supported")
+    if len(stack) > 1:
+        raise _TemplateSyntaxError(f"Unclosed section {stack[-1][0]!r}")
+    if text[position:]:
+        root.append(text[position:])
+    return _freeze(root)
+
+
+def _freeze(nodes: list) -> tuple:
+    return tuple(
+        (
+            (node[0], node[1], _freeze(node[2]))
+            if isinstance(node, tuple) and len(node) == 3
+            else node
+        )
+        for node in nodes
+    )
+
+
+def _lookup(stack: list, key: str) -> Any:
+    """Resolve a (dotted) key against the context stack, innermost first."""
+    if key == ".":
+        return stack[-1]
+    parts = key.split(".")
+    for view in reversed(stack):
+        value = view
+        for part in parts:
+            if isinstance(value, dict) and part in value:
+                value = value[part]
+            elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+                value = value[int(part)]
+            elif isinstance(value, list) and part == "length":
+                value = len(value)
+            else:
+                break
+        else:
+            return value
+    return None
+
+
+def _js_display(value: Any) -> str:
+    """Equivalent of JavaScript String(value) as used by Mustache output."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return _js_number_string(float(value))
+    if isinstance(value, list):
+        return ",".join(_js_display(item) for item in value)
+    if isinstance(value, dict):
+        return "[object Object]"
+    return str(value)
+
+
+def _js_truthy(value: Any) -> bool:
+    if isinstance(value, float) and math.isnan(value):
+        return False
+    return bool(value) or value == {}
+
+
+def _render_nodes(nodes: tuple, stack: list, out: list[str]) -> None:
+    for node in nodes:
+        if isinstance(node, str):
+            out.append(node)
+            continue
+        value = _lookup(stack, node[1])
+        if node[0] == "name":
+            out.append(_js_display(value))
+        elif node[0] == "#":
+            if isinstance(value, list):
+                for item in value:
+                    stack.append(item)
+                    _render_nodes(node[2], stack, out)
+                    stack.pop()
+            elif _js_truthy(value):
+                stack.append(value)
+                _render_nodes(node[2], stack, out)
+                stack.pop()
+        elif not _js_truthy(value) or value == []:
+            _render_nodes(node[2], stack, out)
+
+
+def _typed_values(
+    definitions: dict[str, dict], value_map: dict[str, str]
+) -> dict[str, Any]:
+    """Convert stored variable strings by schema type, as on the server."""
+    typed: dict[str, Any] = {}
+    for name, raw in value_map.items():
+        schema_type = ((definitions.get(name) or {}).get("schema") or {}).get("type")
+        if schema_type == "string":
+            typed[name] = raw if raw is not None else ""
+        elif schema_type == "boolean":
+            typed[name] = raw == "true"
+        elif schema_type in ("number", "integer"):
+            typed[name] = _js_number(raw)
+        elif schema_type in ("object", "array"):
+            typed[name] = json.loads(raw)
+    return typed
+
+
+def render_template(text: str, values: dict[str, Any]) -> str:
+    """
+    Render a Mustache template with typed variable values.
+
+    Like the server, HTML escaping is disabled and the template is returned
+    unchanged if it cannot be parsed.
+    """
+    if "{{" not in text:
+        return text
+    try:
+        nodes = _parse_template(text)
+    except _TemplateSyntaxError:
+        return text
+    out: list[str] = []
+    _render_nodes(nodes, [values], out)
+    return "".join(out)
+
+
+def variable_definitions(experiment: dict) -> dict[str, dict]:
+    """Port of extractVariablesFromVariableConfigs() for an experiment."""
+
+    def item_schema(schema: dict) -> dict:
+        if schema.get("type") == "array" and schema.get("items"):
+            return schema["items"]
+        return schema
+
+    definitions: dict[str, dict] = {}
+    for config in experiment.get("variableConfigs") or []:
+        definition = config.get("definition") or {}
+        name = definition.get("name")
+        if not name:
+            continue
+        config_type = config.get("type")
+        if config_type == "static":
+            definitions[name] = definition
+        elif config_type == "random_permutation":
+            if config.get("expandListToSeparateVariables"):
+                count = config.get("numToSelect")
+                if count is None:
+                    count = len(config.get("values") or [])
+                for index in range(1, count + 1):
+                    definitions[f"{name}_{index}"] = {
+                        "name": f"{name}_{index}",
+                        "description": definition.get("description"),
+                        "schema": item_schema(definition.get("schema") or {}),
+                    }
+            else:
+                definitions[name] = definition
+        elif config_type == "balanced_assignment":
+            definitions[name] = {
+                "name": name,
+                "description": definition.get("description"),
+                "schema": item_schema(definition.get("schema") or {}),
+            }
+    return definitions
+
+
+# ============================================================================
+# Profiles
+# ============================================================================
+
+
+def participant_display_name(
+    profile: dict,
+    profile_set_id: str = "",
+    include_avatar: bool = True,
+    include_pronouns: bool = False,
+) -> str:
+    """Port of getParticipantDisplayName()."""
+    if profile_set_id:
+        anonymous = (profile.get("anonymousProfiles") or {}).get(profile_set_id) or {}
+        name, avatar = anonymous.get("name"), anonymous.get("avatar")
+    else:
+        name, avatar = profile.get("name"), profile.get("avatar")
+    if name:
+        prefix = f"{avatar} " if include_avatar and avatar else ""
+        pronouns = profile.get("pronouns")
+        suffix = f" ({pronouns})" if include_pronouns and pronouns else ""
+        return f"{prefix}{name}{suffix}"
+    return profile.get("publicId", "")
+
+
+def mediator_profile(persona: Any, cohort_id: str, public_id: str = "") -> dict:
+    """
+    MediatorProfileExtended for an agent persona, as the server creates it.
+
+    Mediator profiles are not exported; the prompt only uses the persona's
+    default name and avatar, so the public ID is informational.
+
+    Args:
+        persona: AgentMediatorPersonaConfig (model or dict)
+        cohort_id: Cohort the mediator was added to
+        public_id: Optional public ID (defaults to the persona ID)
+    """
+    persona = _as_dict(persona)
+    default_profile = persona.get("defaultProfile") or {}
+    return {
+        "type": "mediator",
+        "publicId": public_id or persona.get("id", ""),
+        "privateId": public_id or persona.get("id", ""),
+        "name": default_profile.get("name"),
+        "avatar": default_profile.get("avatar"),
+        "pronouns": default_profile.get("pronouns"),
+        "currentCohortId": cohort_id,
+        "agentConfig": {
+            "agentId": persona.get("id", ""),
+            "promptContext": "",
+            "modelSettings": persona.get("defaultModelSettings"),
+        },
+    }
+
+
+# ============================================================================
+# Stage displays (getStageDisplayForPrompt per stage manager)
+# ============================================================================
+
+
+def _format_time(timestamp: Any, tz: tzinfo) -> str:
+    """Port of convertUnifiedTimestampToTime(): "(HH:MM)"."""
+    seconds = math.floor(to_millis(timestamp) / 1000)
+    return datetime.fromtimestamp(seconds, tz).strftime("(%H:%M)")
+
+
+def _format_message(message: dict, tz: tzinfo) -> str:
+    time = _format_time(message.get("timestamp") or 0, tz)
+    if message.get("type") == "system":
+        return f"{time} [SYSTEM]: {message.get('message', '')}"
+    name = (message.get("profile") or {}).get("name")
+    if name is None:
+        name = message.get("senderId", "")
+    return f"{time} {name}: {message.get('message', '')}"
+
+
+def _discussion_details(discussion: dict) -> str:
+    if discussion.get("type") == "DEFAULT":
+        return f"Discussion thread: {discussion.get('description', '')}"
+    items = ", ".join(item.get("name", "") for item in discussion.get("items") or [])
+    return (
+        "Discussion thread comparing the following items: "
+        f"{items}. {discussion.get('description', '')}"
+    )
+
+
+def _chat_history(messages: list[dict], stage: dict, tz: tzinfo) -> str:
+    """Port of getChatPromptMessageHistory()."""
+    if not messages:
+        return "No messages yet."
+    discussions = stage.get("discussions") or []
+    if stage.get("kind") != "chat" or not discussions:
+        history = "\n".join(_format_message(message, tz) for message in messages)
+    else:
+        threads: list[str] = []
+        for discussion in discussions:
+            thread = [m for m in messages if m.get("discussionId") == discussion["id"]]
+            if thread:
+                threads.append(_discussion_details(discussion))
+                threads.append("\n".join(_format_message(m, tz) for m in thread))
+        history = "\n".join(threads)
+    return f"{CHAT_PROMPT_TRANSCRIPT_EXPLANATION}\n\n{history}"
+
+
+def _scale_text(question: dict) -> str:
+    lower, upper = question.get("lowerValue", 0), question.get("upperValue", 0)
+    text = f"Scale: {_js_display(lower)} = {question.get('lowerText', '')}"
+    if question.get("middleText"):
+        middle = math.floor((lower + upper) / 2)
+        text += f", {middle} = {question['middleText']}"
+    return text + f", {_js_display(upper)} = {question.get('upperText', '')}"
+
+
+def _survey_question_text(question: dict) -> str:
+    text = f"* {question.get('questionTitle', '')}"
+    kind = question.get("kind")
+    if kind == "text":
+        constraints = []
+        if question.get("minCharCount"):
+            constraints.append(f"min {question['minCharCount']} chars")
+        if question.get("maxCharCount"):
+            constraints.append(f"max {question['maxCharCount']} chars")
+        if constraints:
+            text += f" (Text response: {', '.join(constraints)})"
+        else:
+            text += " (Text response)"
+    elif kind == "check":
+        text += f" (Checkbox{', required' if question.get('isRequired') else ''})"
+    elif kind == "mc":
+        options = ", ".join(
+            f"{option.get('text', '')} ({option.get('id', '')})"
+            for option in question.get("options") or []
+        )
+        text += f" (Multiple choice: {options})"
+    elif kind == "scale":
+        text += f" ({_scale_text(question)})"
+    return text
+
+
+def _survey_answer_text(answer: dict, question: dict) -> str:
+    kind = answer.get("kind")
+    if kind == "text":
+        return answer.get("answer") or "(no response)"
+    if kind == "check":
+        return "Checked" if answer.get("isChecked") else "Not checked"
+    if kind == "mc":
+        for option in question.get("options") or []:
+            if option.get("id") == answer.get("choiceId"):
+                return option.get("text", "")
+        return "(no selection)"
+    if kind == "scale":
+        return f"{_js_display(answer.get('value'))} ({_scale_text(question)})"
+    return "(unknown answer type)"
+
+
+def _survey_display(
+    answers: list[tuple[str, str, dict]], questions: list[dict], scaffolding: bool
+) -> str:
+    """Port of getSurveyStageDisplayPromptString()."""
+    if not answers:
+        return "\n".join(_survey_question_text(question) for question in questions)
+    summaries = []
+    for _, display_name, stage_answer in answers:
+        answer_map = stage_answer.get("answerMap") or {}
+        responses = []
+        for question in questions:
+            answer = answer_map.get(question.get("id"))
+            formatted = (
+                _survey_answer_text(answer, question)
+                if answer
+                else "(not answered yet)"
+            )
+            responses.append(f"  * {question.get('questionTitle', '')}: {formatted}")
+        if not responses:
+            summaries.append("")
+        elif scaffolding or len(answers) > 1:
+            prefix = f"* Participant {display_name}'s answers:"
+            summaries.append(prefix + "\n" + "\n".join(responses))
+        else:
+            summaries.append("\n".join(responses))
+    return "\n".join(summaries)
+
+
+def _ranking_display(
+    stage: dict,
+    participants: list[dict],
+    answers: list[tuple[str, str, dict]],
+    active: list[dict],
+) -> str:
+    by_id = {public_id: (name, answer) for public_id, name, answer in answers}
+    responses = ""
+    if participants:
+        lines = []
+        for participant in participants:
+            entry = by_id.get(participant.get("publicId", ""))
+            if entry is None:
+                lines.append("")
+                continue
+            ranking = _js_display(entry[1].get("rankingList") or [])
+            lines.append(
+                f"{entry[0]} ({participant.get('publicId')})'s ranking: {ranking}"
+            )
+        responses = "\n" + "\n".join(lines)
+    compact = {"separators": (",", ":"), "ensure_ascii": False}
+    if stage.get("rankingType") == "items":
+        items = [
+            {"id": item.get("id"), "text": item.get("text")}
+            for item in stage.get("rankingItems") or []
+        ]
+        return (
+            "Items available in ranking stage: "
+            f"{json.dumps(items, **compact)}{responses}"
+        )
+    if stage.get("rankingType") == "participants":
+        people = [
+            {"id": participant.get("publicId", ""), "name": participant.get("name")}
+            for participant in active
+        ]
+        return (
+            "Participants available in ranking stage: "
+            f"{json.dumps(people, **compact)}{responses}"
+        )
+    return ""
+
+
+def _role_display(
+    stage: dict, participants: list[dict], public_data: Optional[dict]
+) -> str:
+    if not public_data:
+        return ""
+    lines_by_role = {
+        role.get("id"): role.get("displayLines") or []
+        for role in stage.get("roles") or []
+    }
+    role_map = public_data.get("participantMap") or {}
+    info = []
+    for participant in participants:
+        role = role_map.get(participant.get("publicId", ""))
+        if role:
+            lines = "\n\n".join(lines_by_role.get(role, []))
+            info.append(f"{participant.get('publicId')}: {lines}")
+    return "\n".join(info)
+
+
+# ============================================================================
+# Structured output (makeStructuredOutputPrompt)
+# ============================================================================
+
+
+def _schema_object(schema: dict) -> dict:
+    """Port of schemaToObject(); None fields are dropped like undefined."""
+    result: dict[str, Any] = {}
+    if schema.get("description") is not None:
+        result["description"] = schema["description"]
+    result["type"] = str(schema.get("type", "")).lower()
+    properties = schema.get("properties")
+    if properties is not None:
+        result["properties"] = {
+            prop["name"]: _schema_object(prop.get("schema") or {})
+            for prop in properties
+        }
+    if schema.get("arrayItems"):
+        result["items"] = _schema_object(schema["arrayItems"])
+    if schema.get("enumItems") is not None:
+        result["enum"] = schema["enumItems"]
+    if properties is not None:
+        result["required"] = [prop["name"] for prop in properties]
+    return result
+
+
+def structured_output_prompt(config: Any, include_scaffolding: bool = True) -> str:
+    """Port of makeStructuredOutputPrompt() for a StructuredOutputConfig."""
+    if not config:
+        return ""
+    config = _as_dict(config)
+    schema = config.get("schema")
+    if config.get("type") == "NONE" and not config.get("appendToPrompt"):
+        return ""
+    if not schema or schema.get("properties") == [] or not config.get("enabled"):
+        return ""
+    if not config.get("appendToPrompt"):
+        return ""
+    scaffolding = "\n--- Response format ---\n" if include_scaffolding else ""
+    printed = json.dumps(_schema_object(schema), indent=2, ensure_ascii=False)
+    return (
+        f"{scaffolding}Return only valid JSON, according to the following "
+        f"schema:\n{printed}\n"
+    )
+
+
+def _without_should_respond(config: Any) -> Any:
+    """Turn-based chats drop the shouldRespond property from the schema."""
+    if not config:
+        return config
+    config = _as_dict(config)
+    schema = config.get("schema") or {}
+    if not schema.get("properties"):
+        return config
+    properties = [
+        prop for prop in schema["properties"] if prop.get("name") != "shouldRespond"
+    ]
+    return {**config, "schema": {**schema, "properties": properties}}
+
+
+# ============================================================================
+# Compilation
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class _CompiledItem:
+    type: str
+    text: str = ""
+    stage_id: str = ""
+    # (includePrimaryText, includeInfoText, includeParticipantAnswers)
+    flags: tuple = (False, False, False)
+    condition: Any = None
+    condition_stage_ids: tuple = ()
+    items: tuple = ()
+    # (seed strategy, custom seed) for shuffled groups
+    shuffle: Optional[tuple] = None
+
+
+def _compile_items(items: Iterable[Any]) -> tuple[_CompiledItem, ...]:
+    compiled = []
+    for item in items:
+        item = _as_dict(item)
+        condition = item.get("condition")
+        condition_stage_ids: tuple = ()
+        if condition is not None:
+            condition_stage_ids = tuple(
+                dict.fromkeys(
+                    key.split("::", 1)[0]
+                    for key in extract_condition_dependencies(condition)
+                )
+            )
+            condition = compile_condition(condition)
+        shuffle_config = item.get("shuffleConfig") or {}
+        text = item.get("text") or ""
+        if "{{" in text:
+            try:
+                _parse_template(text)
+            except _TemplateSyntaxError:
+                pass
+        compiled.append(
+            _CompiledItem(
+                type=item.get("type", ""),
+                text=text,
+                stage_id=item.get("stageId") or "",
+                flags=(
+                    bool(item.get("includePrimaryText")),
+                    bool(item.get("includeInfoText")),
+                    bool(item.get("includeParticipantAnswers")),
+                ),
+                condition=condition,
+                condition_stage_ids=condition_stage_ids,
+                items=_compile_items(item.get("items") or []),
+                shuffle=(
+                    (shuffle_config.get("seed"), shuffle_config.get("customSeed", ""))
+                    if shuffle_config.get("shuffle")
+                    else None
+                ),
+            )
+        )
+    return tuple(compiled)
+
+
+class CompiledPrompt:
+    """A prompt config prepared for repeated rendering."""
+
+    def __init__(self, config: Any):
+        """
+        Args:
+            config: ChatPromptConfig / GenericPromptConfig (model or dict)
+        """
+        config = _as_dict(config)
+        self.stage_id: str = config.get("id", "")
+        # Stage kind the prompt is for (conditions only apply to privateChat)
+        self.kind: str = config.get("type", "")
+        self.include_scaffolding = bool(config.get("includeScaffoldingInPrompt"))
+        self.items = _compile_items(config.get("prompt") or [])
+        # The first shuffled top-level group keeps the bare seed
+        self.first_shuffled_index = next(
+            (
+                index
+                for index, item in enumerate(self.items)
+                if item.type == "GROUP" and item.shuffle is not None
+            ),
+            -1,
+        )
+        structured_output = config.get("structuredOutputConfig")
+        self.structured_output = structured_output_prompt(structured_output)
+        self.turn_based_structured_output = structured_output_prompt(
+            _without_should_respond(structured_output)
+        )
+
+
+def compile_prompt(config: Any) -> CompiledPrompt:
+    """Compile a ChatPromptConfig / GenericPromptConfig (model or dict) once."""
+    return CompiledPrompt(config)
+
+
+@lru_cache(maxsize=4096)
+def _shuffle_order(seed: str, length: int) -> tuple[int, ...]:
+    """Positions of shuffleWithSeed(items, seed) for `length` items."""
+    return tuple(_choices(list(range(length)), length, seed))
+
+
+# ============================================================================
+# Rendering
+# ============================================================================
+
+
+@dataclass
+class PromptContext:
+    """
+    One point at which an agent's prompt is rendered.
+
+    Attributes:
+        cohort_id: The agent's cohort
+        stage_id: The current stage
+        user: The agent's profile: a participant profile from the export
+              (ParticipantProfileExtended) or a mediator profile (see
+              mediator_profile())
+        turn: Number of messages of the current stage's chat transcript
+              visible to the agent (all messages if None)
+        participant_ids: Public IDs of the participants whose answers are in
+                         context (e.g., the participant of a private chat);
+                         defaults to the agent itself for participants and all
+                         active participants for mediators
+        private_chats: Private chat transcripts by participant public ID
+                       (not part of exports)
+        active_participant_ids: Public IDs of the cohort's active participants
+                                at this point; defaults to those active in
+                                the export
+    """
+
+    cohort_id: str
+    stage_id: str
+    user: Any
+    turn: Optional[int] = None
+    participant_ids: Optional[list[str]] = None
+    private_chats: Optional[dict[str, list[dict]]] = None
+    active_participant_ids: Optional[list[str]] = None
+
+
+class _Scope:
+    """Per-context state resolved once before rendering items."""
+
+    def __init__(
+        self, renderer: PromptRenderer, prompt: CompiledPrompt, context: PromptContext
+    ):
+        self.context = context
+        self.prompt = prompt
+        self.user = _as_dict(context.user)
+        self.is_participant = self.user.get("type") == "participant"
+        self.scaffolding = prompt.include_scaffolding
+
+        if context.active_participant_ids is not None:
+            self.active = [
+                renderer._profile(public_id)
+                for public_id in context.active_participant_ids
+            ]
+            self.active_key: Optional[tuple] = tuple(context.active_participant_ids)
+        else:
+            self.active = renderer._active_participants(context.cohort_id)
+            self.active_key = None
+
+        if context.participant_ids:
+            self.participants = [
+                renderer._profile(public_id) for public_id in context.participant_ids
+            ]
+        elif self.is_participant:
+            self.participants = [self.user]
+        else:
+            self.participants = self.active
+        self.participant_ids = tuple(p.get("publicId", "") for p in self.participants)
+
+        # Whose variables resolve templates (and seed per-participant shuffles)
+        self.variable_participant: Optional[dict] = None
+        if self.is_participant:
+            self.variable_participant = self.user
+        elif prompt.kind == "privateChat" and len(self.participants) == 1:
+            self.variable_participant = self.participants[0]
+        self.variable_key = (
+            context.cohort_id,
+            (self.variable_participant or {}).get("publicId"),
+        )
+        self.values = renderer._variable_values(
+            context.cohort_id, self.variable_participant
+        )
+
+        # Conditions are only evaluated for private chats with one participant
+        self.condition_table: Optional[AnswerTable] = None
+        if prompt.kind == "privateChat" and len(self.participants) == 1:
+            public_id = self.participants[0].get("publicId", "")
+            self.condition_table = AnswerTable.from_rows(
+                [
+                    (
+                        public_id,
+                        _participant_target_values(
+                            renderer._download(public_id), None, False
+                        ),
+                    )
+                ]
+            )
+
+        # Chat instructions and the response schema follow the current stage's
+        # turn taking, but only when a prompt item loaded that stage's data
+        stage_id = context.stage_id
+        self.turn_based = False
+        if stage_id in renderer._loaded_stage_ids(prompt.items, self):
+            stage = renderer._stage(stage_id)
+            self.turn_based = stage.get("kind") == "chat" and bool(
+                stage.get("isTurnBased")
+            )
+
+    def include(self, item: _CompiledItem) -> bool:
+        if item.condition is None or self.condition_table is None:
+            return True
+        return bool(item.condition.mask(self.condition_table)[0])
+
+
+class PromptRenderer:
+    """
+    Renders compiled prompts against one experiment export.
+
+    Stage configs, cohort data, transcripts, variable values and rendered
+    stage context are cached across render calls; create one renderer per
+    export and reuse it for a batch.
+    """
+
+    def __init__(self, export: Any, tz: tzinfo = timezone.utc):
+        """
+        Args:
+            export: ExperimentDownload dict or an ExportStore
+            tz: Time zone of chat timestamps in transcripts (the server
+                formats them in its local time, UTC on Cloud Functions)
+        """
+        self._export = export
+        self._is_store = hasattr(export, "iter_participants")
+        self.experiment: dict = (
+            export.experiment() if self._is_store else export.get("experiment") or {}
+        )
+        self._tz = tz
+        self._definitions = variable_definitions(self.experiment)
+        self._stages: dict[str, dict] = {}
+        self._downloads: dict[str, dict] = {}
+        self._cohorts: dict[str, dict] = {}
+        self._chats: dict[tuple[str, str], list[dict]] = {}
+        self._members: Optional[dict[str, list[dict]]] = None
+        self._variables: dict[tuple, dict[str, Any]] = {}
+        self._resolved_stages: dict[tuple, dict] = {}
+        self._fragments: dict[tuple, str] = {}
+        self._hits = 0
+        self._misses = 0
+        # Stage kinds rendered without a stage display
+        self.unsupported_stage_kinds: set[str] = set()
+
+    # =========================================================================
+    # Export access
+    # =========================================================================
+
+    def _stage(self, stage_id: str) -> dict:
+        stage = self._stages.get(stage_id)
+        if stage is None:
+            if self._is_store:
+                stage = self._export.stage(stage_id)
+            else:
+                stage = self._export["stageMap"][stage_id]
+            self._stages[stage_id] = stage
+        return stage
+
+    def _download(self, public_id: str) -> dict:
+        """ParticipantDownload by public ID (empty if not in the export)."""
+        download = self._downloads.get(public_id)
+        if download is None:
+            try:
+                if self._is_store:
+                    download = self._export.participant(public_id)
+                else:
+                    download = self._export["participantMap"][public_id]
+            except KeyError:
+                download = {"profile": {"publicId": public_id}, "answerMap": {}}
+            self._downloads[public_id] = download
+        return download
+
+    def _profile(self, public_id: str) -> dict:
+        return self._download(public_id).get("profile") or {}
+
+    def _cohort(self, cohort_id: str) -> dict:
+        cohort = self._cohorts.get(cohort_id)
+        if cohort is None:
+            if self._is_store:
+                cohort = self._export.cohort(cohort_id, include_chats=False)
+            else:
+                cohort = (self._export.get("cohortMap") or {}).get(cohort_id) or {}
+            self._cohorts[cohort_id] = cohort
+        return cohort
+
+    def _chat(self, cohort_id: str, stage_id: str) -> list[dict]:
+        key = (cohort_id, stage_id)
+        messages = self._chats.get(key)
+        if messages is None:
+            if self._is_store:
+                messages = self._export.chat(cohort_id, stage_id)
+            else:
+                chat_map = self._cohort(cohort_id).get("chatMap") or {}
+                messages = chat_map.get(stage_id) or []
+            self._chats[key] = messages
+        return messages
+
+    def _active_participants(self, cohort_id: str) -> list[dict]:
+        if self._members is None:
+            if self._is_store:
+                downloads = self._export.iter_participants()
+            else:
+                downloads = (self._export.get("participantMap") or {}).items()
+            self._members = {}
+            for public_id, download in downloads:
+                self._downloads.setdefault(public_id, download)
+                profile = download.get("profile") or {}
+                if profile.get("currentStatus") in ACTIVE_PARTICIPANT_STATUSES:
+                    members = self._members.setdefault(
+                        profile.get("currentCohortId", ""), []
+                    )
+                    members.append(profile)
+        return self._members.get(cohort_id, [])
+
+    def _variable_values(
+        self, cohort_id: str, participant: Optional[dict]
+    ) -> dict[str, Any]:
+        """Typed variable values (experiment < cohort < participant)."""
+        key = (cohort_id, (participant or {}).get("publicId"))
+        values = self._variables.get(key)
+        if values is None:
+            cohort = self._cohort(cohort_id).get("cohort") or {}
+            value_map = {
+                **(self.experiment.get("variableMap") or {}),
+                **(cohort.get("variableMap") or {}),
+                **((participant or {}).get("variableMap") or {}),
+            }
+            values = _typed_values(self._definitions, value_map)
+            self._variables[key] = values
+        return values
+
+    def _preceding_stage_ids(self, stage_id: str) -> list[str]:
+        """Port of getAllPrecedingStageIds() (includes the stage itself)."""
+        stage_ids = self.experiment.get("stageIds") or []
+        if stage_id not in stage_ids:
+            return []
+        return stage_ids[: stage_ids.index(stage_id) + 1]
+
+    def _loaded_stage_ids(self, items: tuple, scope: _Scope) -> set[str]:
+        """Stage IDs the server would have loaded for the prompt's items."""
+        loaded: set[str] = set()
+        for item in items:
+            if item.condition is not None and scope.condition_table is not None:
+                loaded.update(item.condition_stage_ids)
+                if not scope.include(item):
+                    continue
+            if item.type == "STAGE_CONTEXT":
+                if item.stage_id:
+                    loaded.add(item.stage_id)
+                else:
+                    loaded.update(self._preceding_stage_ids(scope.context.stage_id))
+            elif item.type == "GROUP":
+                loaded |= self._loaded_stage_ids(item.items, scope)
+        return loaded
+
+    # =========================================================================
+    # Stage context
+    # =========================================================================
+
+    def _resolved_stage(self, stage_id: str, scope: _Scope) -> dict:
+        """Stage config with template variables resolved (cached)."""
+        key = (stage_id, scope.variable_key)
+        stage = self._resolved_stages.get(key)
+        if stage is not None:
+            return stage
+        stage = dict(self._stage(stage_id))
+        values = scope.values
+        descriptions = dict(stage.get("descriptions") or {})
+        for field in ("primaryText", "infoText"):
+            descriptions[field] = render_template(descriptions.get(field) or "", values)
+        stage["descriptions"] = descriptions
+        if stage.get("kind") == "info":
+            stage["infoLines"] = [
+                render_template(line, values) for line in stage.get("infoLines") or []
+            ]
+        elif stage.get("kind") == "survey":
+            stage["questions"] = [
+                _resolve_question(question, values)
+                for question in stage.get("questions") or []
+            ]
+        self._resolved_stages[key] = stage
+        return stage
+
+    def _stage_answers(
+        self, stage_id: str, participants: list[dict]
+    ) -> list[tuple[str, str, dict]]:
+        """(public ID, display name, stage answer) of participants who answered."""
+        profile_set_id = _active_profile_set_id(stage_id)
+        answers = []
+        for participant in participants:
+            public_id = participant.get("publicId", "")
+            answer = (self._download(public_id).get("answerMap") or {}).get(stage_id)
+            if answer:
+                name = participant_display_name(participant, profile_set_id, True, True)
+                answers.append((public_id, name, answer))
+        return answers
+
+    def _visible_messages(self, stage_id: str, scope: _Scope) -> list[dict]:
+        messages = self._chat(scope.context.cohort_id, stage_id)
+        if stage_id == scope.context.stage_id and scope.context.turn is not None:
+            return messages[: scope.context.turn]
+        return messages
+
+    def _stage_display(
+        self, stage: dict, participants: list[dict], scope: _Scope
+    ) -> str:
+        kind = stage.get("kind")
+        stage_id = stage.get("id", "")
+        if kind == "info":
+            return "\n".join(stage.get("infoLines") or [])
+        if kind == "tos":
+            return "\n".join(stage.get("tosLines") or [])
+        if kind == "chat":
+            profile_set_id = next(
+                (ps for marker, ps in _PROFILE_SET_MARKERS if marker in stage_id), ""
+            )
+            names = ", ".join(
+                participant_display_name(participant, profile_set_id, True, True)
+                for participant in scope.active
+            )
+            history = _chat_history(
+                self._visible_messages(stage_id, scope), stage, self._tz
+            )
+            if scope.scaffolding:
+                history = (
+                    "\n\n--- Start of chat transcript ---\n"
+                    f"{history}\n--- End of chat transcript ---\n"
+                )
+            return f"Participants in chat: {names}\n{history}"
+        if kind == "privateChat":
+            private_chats = scope.context.private_chats or {}
+            conversations = []
+            for participant in participants:
+                public_id = participant.get("publicId", "")
+                history = _chat_history(
+                    private_chats.get(public_id) or [], stage, self._tz
+                )
+                name = participant.get("name")
+                conversations.append(
+                    f"Private chat with {'undefined' if name is None else name} "
+                    f"({public_id})\n{history}"
+                )
+            return "\n\n".join(conversations)
+        if kind == "survey":
+            return _survey_display(
+                self._stage_answers(stage_id, participants),
+                stage.get("questions") or [],
+                scope.scaffolding,
+            )
+        if kind == "ranking":
+            return _ranking_display(
+                stage,
+                participants,
+                self._stage_answers(stage_id, participants),
+                scope.active,
+            )
+        if kind == "role":
+            data_map = self._cohort(scope.context.cohort_id).get("dataMap") or {}
+            return _role_display(stage, participants, data_map.get(stage_id))
+        self.unsupported_stage_kinds.add(str(kind))
+        return ""
+
+    def _stage_fragment(self, stage_id: str, item: _CompiledItem, scope: _Scope) -> str:
+        """Port of getStageContextForPrompt(), cached per shared inputs."""
+        stage = self._stage(stage_id)
+        include_answers = item.flags[2]
+        participants = scope.participants if include_answers else []
+        kind = stage.get("kind")
+        if kind == "chat":
+            # Only the length of the visible transcript varies between turns
+            marker: Any = len(self._visible_messages(stage_id, scope))
+        elif kind == "privateChat" and include_answers:
+            private_chats = scope.context.private_chats or {}
+            marker = tuple(
+                (
+                    public_id,
+                    len(private_chats.get(public_id) or []),
+                    ((private_chats.get(public_id) or [{}])[-1]).get("id"),
+                )
+                for public_id in scope.participant_ids
+            )
+        else:
+            marker = None
+        key = (
+            stage_id,
+            item.flags,
+            scope.scaffolding,
+            scope.context.cohort_id,
+            scope.variable_key,
+            scope.participant_ids if include_answers else (),
+            scope.active_key if kind in ("chat", "ranking") else None,
+            marker,
+        )
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            self._hits += 1
+            return fragment
+        self._misses += 1
+
+        stage = self._resolved_stage(stage_id, scope)
+        descriptions = stage.get("descriptions") or {}
+        lines = []
+        if scope.scaffolding:
+            name = stage.get("name")
+            lines.append(f"[Stage: {stage_id if name is None else name}]")
+        primary_text = descriptions.get("primaryText") or ""
+        if item.flags[0] and primary_text.strip() != "":
+            lines.append(f"* Stage description: {primary_text}")
+        if item.flags[1]:
+            lines.append(f"* Additional info: {descriptions.get('infoText', '')}")
+        lines.append(self._stage_display(stage, participants, scope))
+        fragment = "\n".join(lines)
+        self._fragments[key] = fragment
+        return fragment
+
+    # =========================================================================
+    # Prompt items
+    # =========================================================================
+
+    def _profile_info(self, scope: _Scope) -> str:
+        """Port of getProfileInfoForPrompt()."""
+        user = scope.user
+        prefix = "Alias: " if scope.scaffolding else ""
+        if scope.is_participant:
+            if not user.get("name"):
+                return "Profile not yet set"
+            suffix = (
+                f"\n{PROMPT_ITEM_PROFILE_INFO_PARTICIPANT_SCAFFOLDING}"
+                if scope.scaffolding
+                else ""
+            )
+            profile_set_id = _active_profile_set_id(scope.context.stage_id)
+            return f"{prefix}{participant_display_name(user, profile_set_id)}{suffix}"
+        return f"{prefix}{user.get('avatar', '')} {user.get('name', '')}"
+
+    def _profile_context(self, scope: _Scope) -> str:
+        """Port of getProfileContextForPrompt()."""
+        context = (scope.user.get("agentConfig") or {}).get("promptContext")
+        if not context:
+            return ""
+        if scope.is_participant and scope.scaffolding:
+            return (
+                f"Private persona context: {context}\n"
+                f"{PROMPT_ITEM_PROFILE_CONTEXT_PARTICIPANT_SCAFFOLDING}"
+            )
+        return context
+
+    def _shuffle_seed(self, shuffle: tuple, scope: _Scope) -> str:
+        strategy, custom_seed = shuffle
+        if strategy == "experiment":
+            return self.experiment.get("id", "")
+        if strategy == "cohort":
+            return scope.context.cohort_id
+        if strategy == "participant":
+            participant = scope.variable_participant or scope.user
+            return participant.get("publicId", "")
+        if strategy == "custom":
+            return custom_seed
+        return ""
+
+    def _render_items(
+        self, items: tuple, first_shuffled_index: int, scope: _Scope, namespace: str
+    ) -> str:
+        """Port of processPromptItems()."""
+        stage_id = scope.context.stage_id
+        output: list[str] = []
+        for index, item in enumerate(items):
+            if not scope.include(item):
+                continue
+            if item.type == "TEXT":
+                output.append(render_template(item.text, scope.values))
+            elif item.type == "CHAT_MEDIATOR_INSTRUCTIONS":
+                output.append(
+                    DEFAULT_MEDIATOR_GROUP_CHAT_TURN_TAKING_PROMPT_INSTRUCTIONS
+                    if scope.turn_based
+                    else DEFAULT_MEDIATOR_GROUP_CHAT_PROMPT_INSTRUCTIONS
+                )
+            elif item.type == "CHAT_PARTICIPANT_INSTRUCTIONS":
+                output.append(
+                    DEFAULT_AGENT_PARTICIPANT_CHAT_TURN_TAKING_PROMPT
+                    if scope.turn_based
+                    else DEFAULT_AGENT_PARTICIPANT_CHAT_PROMPT
+                )
+            elif item.type == "PROFILE_CONTEXT":
+                profile_context = self._profile_context(scope)
+                if profile_context:
+                    output.append(profile_context)
+            elif item.type == "PROFILE_INFO":
+                output.append(self._profile_info(scope))
+            elif item.type == "STAGE_CONTEXT":
+                stage_ids = (
+                    [item.stage_id]
+                    if item.stage_id
+                    else self._preceding_stage_ids(stage_id)
+                )
+                label_stages = scope.scaffolding and scope.is_participant
+                if label_stages:
+                    output.append(
+                        "\n--- Previously completed stages chronologically "
+                        "(read only) ---"
+                    )
+                for context_stage_id in stage_ids:
+                    if context_stage_id == stage_id and label_stages:
+                        output.append("\n--- Current stage ---")
+                    output.append(self._stage_fragment(context_stage_id, item, scope))
+            elif item.type == "GROUP":
+                children = item.items
+                if item.shuffle is not None:
+                    seed = self._shuffle_seed(item.shuffle, scope)
+                    if namespace or index != first_shuffled_index:
+                        seed = f"{seed}::{stage_id}::{namespace}{index}"
+                    order = _shuffle_order(seed, len(children))
+                    children = tuple(children[position] for position in order)
+                group_text = self._render_items(
+                    children, -1, scope, f"{namespace}{index}."
+                )
+                if group_text:
+                    output.append(group_text)
+        return "\n".join(output)
+
+    def render(self, prompt: Any, context: PromptContext) -> str:
+        """
+        Render a prompt for one context.
+
+        Args:
+            prompt: CompiledPrompt, or a prompt config (model or dict)
+            context: Who the prompt is for and at which point
+
+        Returns:
+            The prompt text, with the structured output instructions appended
+            when the config asks for them
+
+        Raises:
+            KeyError: If a stage referenced by a stage context item is not in
+                      the export
+        """
+        if not isinstance(prompt, CompiledPrompt):
+            prompt = compile_prompt(prompt)
+        scope = _Scope(self, prompt, context)
+        text = self._render_items(prompt.items, prompt.first_shuffled_index, scope, "")
+        structured_output = (
+            prompt.turn_based_structured_output
+            if scope.turn_based
+            else prompt.structured_output
+        )
+        return f"{text}\n{structured_output}" if structured_output else text
+
+    def render_many(self, prompt: Any, contexts: Iterable[PromptContext]) -> list[str]:
+        """Render a prompt for many contexts, compiling it once."""
+        if not isinstance(prompt, CompiledPrompt):
+            prompt = compile_prompt(prompt)
+        return [self.render(prompt, context) for context in contexts]
+
+    def cache_info(self) -> dict[str, int]:
+        """Stage context cache statistics."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "fragments": len(self._fragments),
+        }
+
+    def clear_cache(self) -> None:
+        """Drop rendered stage context (e.g., after swapping transcripts)."""
+        self._fragments.clear()
+        self._resolved_stages.clear()
+        self._hits = self._misses = 0
+
+
+def _resolve_question(question: dict, values: dict[str, Any]) -> dict:
+    """Port of resolveSurveyQuestionVariables() for one question."""
+    question = {
+        **question,
+        "questionTitle": render_template(question.get("questionTitle") or "", values),
+    }
+    if question.get("kind") == "mc":
+        question["options"] = [
+            {**option, "text": render_template(option.get("text") or "", values)}
+            for option in question.get("options") or []
+        ]
+    elif question.get("kind") == "scale":
+        for field in ("lowerText", "upperText", "middleText"):
+            question[field] = render_template(question.get(field) or "", values)
+    return question
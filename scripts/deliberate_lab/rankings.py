@@ -0,0 +1,277 @@
+"""
+Ranking aggregation for ItemRanking and ParticipantRanking stages.
+
+Builds a pairwise-preference matrix per cohort from the rankings stored
+in each cohort's public stage data, and derives the winner the server
+computes (getCondorcetElectionWinner in utils/src/utils/algebraic.utils.ts)
+alongside alternative tallies: strict Condorcet winner, Copeland, Borda
+and plurality.
+
+Usage:
+    from deliberate_lab.rankings import tally_ranking_stage
+
+    export = client.export_experiment("exp123")
+    for cohort_id, tally in tally_ranking_stage(export, "ranking-stage").items():
+        print(cohort_id, tally.server_winner, tally.borda_winner)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Sequence
+
+# Hardcoded willingness-to-lead stage / question in the Lost at Sea game;
+# when present, the server only elects among the top WTL participants
+LAS_WTL_STAGE_ID = "wtl"
+LAS_WTL_QUESTION_ID = "wtl"
+
+
+def _first_max(scores: Sequence[float], candidates: list[str]) -> Optional[str]:
+    """Candidate with the highest score (earliest candidate on ties)."""
+    if not candidates:
+        return None
+    best = max(range(len(candidates)), key=lambda index: (scores[index], -index))
+    return candidates[best]
+
+
+def _js_key_order(keys: list[str]) -> list[str]:
+    """
+    Order in which JavaScript iterates object keys: array indices
+    ("0", "12", ...) ascending, then the other keys in insertion order.
+    """
+    indices = [
+        key
+        for key in keys
+        if key.isascii()
+        and key.isdigit()
+        and str(int(key)) == key
+        and int(key) < 2**32 - 1
+    ]
+    index_set = set(indices)
+    return sorted(indices, key=int) + [key for key in keys if key not in index_set]
+
+
+@dataclass
+class RankingTally:
+    """Aggregated rankings of one cohort for one ranking stage."""
+
+    # Candidates in first-seen order (the server's order), then any
+    # configured items nobody ranked
+    candidates: list[str]
+    # Public IDs of the participants whose rankings were counted
+    voters: list[str]
+    # pairwise[i][j]: voters ranking candidates[i] above candidates[j]
+    # (a ranked candidate is above an unranked one)
+    pairwise: list[list[int]]
+    # Voters ranking each candidate first
+    plurality: dict[str, int]
+    # Borda count: n - 1 - position for ranked candidates, 0 if unranked
+    borda: dict[str, int]
+    # Pairwise majority wins per candidate
+    copeland: dict[str, int]
+    # Winner as computed by the server for this cohort ('' if no rankings)
+    server_winner: str
+    # Winner stored in the export's public stage data, if any
+    stored_winner: Optional[str] = None
+    # Candidate beating every other candidate by majority, if one exists
+    condorcet_winner: Optional[str] = None
+    borda_winner: Optional[str] = None
+    plurality_winner: Optional[str] = None
+    copeland_winner: Optional[str] = None
+
+
+def _server_winner(rankings: list[list[str]], candidates: list[str]) -> str:
+    """
+    Port of getCondorcetElectionWinner. Missing candidates have index -1
+    (so they beat ranked ones), pairwise ties count for the second
+    candidate, and ties in wins go to the first candidate in JavaScript
+    key order, as in the server code.
+    """
+    size = len(candidates)
+    if not size:
+        return ""
+    index = {candidate: i for i, candidate in enumerate(candidates)}
+    first_wins = [[0] * size for _ in range(size)]
+    for ranking in rankings:
+        position = [-1] * size
+        for rank, candidate in enumerate(ranking):
+            if position[index[candidate]] == -1:
+                position[index[candidate]] = rank
+        for i in range(size):
+            row = first_wins[i]
+            position_i = position[i]
+            for j in range(i + 1, size):
+                if position_i < position[j]:
+                    row[j] += 1
+
+    wins = [0] * size
+    voters = len(rankings)
+    for i in range(size):
+        for j in range(i + 1, size):
+            i_wins = first_wins[i][j]
+            j_wins = voters - i_wins
+            if i_wins > j_wins:
+                wins[i] += 1
+            elif j_wins > i_wins:
+                wins[j] += 1
+    order = _js_key_order(candidates)
+    return _first_max([wins[index[candidate]] for candidate in order], order) or ""
+
+
+def tally_rankings(
+    rankings: dict[str, list[str]],
+    candidates: Optional[Iterable[str]] = None,
+    stored_winner: Optional[str] = None,
+) -> RankingTally:
+    """
+    Aggregate one cohort's rankings.
+
+    Args:
+        rankings: Map from voter public ID to their ranking (best first)
+        candidates: Additional candidates (e.g., configured ranking items)
+                    to include even if nobody ranked them
+        stored_winner: Winner recorded by the server, for comparison
+
+    Returns:
+        RankingTally
+    """
+    voters = list(rankings)
+    lists = [rankings[voter] or [] for voter in voters]
+
+    ranked: dict[str, None] = {}
+    for ranking in lists:
+        for candidate in ranking:
+            ranked.setdefault(candidate, None)
+    server_candidates = list(ranked)
+    all_candidates = dict(ranked)
+    for candidate in candidates or []:
+        all_candidates.setdefault(candidate, None)
+    names = list(all_candidates)
+    size = len(names)
+    index = {candidate: i for i, candidate in enumerate(names)}
+
+    # Per voter rank vector (unranked = size, below every ranked candidate),
+    # accumulated into the pairwise matrix and positional tallies
+    pairwise = [[0] * size for _ in range(size)]
+    plurality = [0] * size
+    borda = [0] * size
+    for ranking in lists:
+        rank = [size] * size
+        for position, candidate in enumerate(ranking):
+            slot = index[candidate]
+            if rank[slot] == size:
+                rank[slot] = position
+        if ranking:
+            plurality[index[ranking[0]]] += 1
+        length = len(ranking)
+        for i in range(size):
+            rank_i = rank[i]
+            if rank_i == size:
+                continue
+            borda[i] += length - 1 - rank_i
+            row = pairwise[i]
+            for j in range(size):
+                if rank_i < rank[j]:
+                    row[j] += 1
+
+    copeland = [0] * size
+    condorcet_winner = None
+    for i in range(size):
+        beats_all = True
+        for j in range(size):
+            if i == j:
+                continue
+            if pairwise[i][j] > pairwise[j][i]:
+                copeland[i] += 1
+            else:
+                beats_all = False
+        if beats_all and size > 1 and condorcet_winner is None:
+            condorcet_winner = names[i]
+    if size == 1 and lists:
+        condorcet_winner = names[0]
+
+    return RankingTally(
+        candidates=names,
+        voters=voters,
+        pairwise=pairwise,
+        plurality=dict(zip(names, plurality)),
+        borda=dict(zip(names, borda)),
+        copeland=dict(zip(names, copeland)),
+        server_winner=_server_winner(lists, server_candidates),
+        stored_winner=stored_winner,
+        condorcet_winner=condorcet_winner,
+        borda_winner=_first_max(borda, names) if lists else None,
+        plurality_winner=_first_max(plurality, names) if lists else None,
+        copeland_winner=_first_max(copeland, names) if lists else None,
+    )
+
+
+def _wtl_candidates(data_map: dict, num_candidates: int = 2) -> Optional[list[str]]:
+    """Port of getRankingCandidatesFromWTL (None without WTL data)."""
+    wtl = data_map.get(LAS_WTL_STAGE_ID)
+    if not wtl or wtl.get("kind") != "survey":
+        return None
+    answers = wtl.get("participantAnswerMap") or {}
+
+    def score(participant_id: str) -> float:
+        answer = (answers.get(participant_id) or {}).get(LAS_WTL_QUESTION_ID)
+        if not answer or answer.get("kind") != "scale":
+            return 0
+        return answer.get("value", 0)
+
+    # Stable sort, highest score first, as in the server
+    return sorted(answers, key=score, reverse=True)[:num_candidates]
+
+
+def tally_ranking_stage(
+    export: Any, stage_id: str, cohort_ids: Optional[Iterable[str]] = None
+) -> dict[str, RankingTally]:
+    """
+    Aggregate a ranking stage for every cohort of an export.
+
+    Rankings are read from each cohort's public stage data; as on the
+    server, cohorts with Lost at Sea willingness-to-lead data only count
+    the top two WTL participants as candidates.
+
+    Args:
+        export: ExperimentDownload dict or an ExportStore
+        stage_id: ID of the ranking stage
+        cohort_ids: Cohorts to include (all cohorts if omitted)
+
+    Returns:
+        Map from cohort ID to RankingTally (cohorts without data for the
+        stage are omitted)
+    """
+    if hasattr(export, "cohort_ids"):
+        stage = export.stage(stage_id)
+        ids = list(cohort_ids) if cohort_ids is not None else export.cohort_ids()
+        cohorts = (
+            (cohort_id, export.cohort(cohort_id, include_chats=False))
+            for cohort_id in ids
+        )
+    else:
+        stage = (export.get("stageMap") or {})[stage_id]
+        cohort_map = export.get("cohortMap") or {}
+        ids = list(cohort_ids) if cohort_ids is not None else list(cohort_map)
+        cohorts = ((cohort_id, cohort_map[cohort_id]) for cohort_id in ids)
+    if stage.get("kind") != "ranking":
+        raise ValueError(f"Stage {stage_id} is not a ranking stage")
+    items = [item["id"] for item in stage.get("rankingItems") or []]
+
+    tallies = {}
+    for cohort_id, cohort in cohorts:
+        data_map = cohort.get("dataMap") or {}
+        public_data = data_map.get(stage_id)
+        if not public_data or public_data.get("kind") != "ranking":
+            continue
+        rankings = public_data.get("participantAnswerMap") or {}
+        wtl = _wtl_candidates(data_map)
+        if wtl is not None:
+            allowed = set(wtl)
+            rankings = {
+                voter: [candidate for candidate in ranking if candidate in allowed]
+                for voter, ranking in rankings.items()
+            }
+        tallies[cohort_id] = tally_rankings(
+            rankings, candidates=items, stored_winner=public_data.get("winnerId")
+        )
+    return tallies
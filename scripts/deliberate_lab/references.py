@@ -0,0 +1,434 @@
+"""
+Offline reference-integrity checks for ExperimentTemplate.
+
+Pydantic validation checks each part of a template on its own; it cannot
+tell that a condition targets a survey question that does not exist, or
+that a payout item points at a removed ranking stage. The server (or a
+participant) finds those later. check_template_references() finds them
+locally: it indexes the template's IDs (stages, survey questions, cohort
+aliases, variables) in one pass, then checks every cross-reference
+against the indexes in a second pass, so the cost is linear in the size
+of the template.
+
+Checked references:
+    experiment.stageIds               same stages, in the same order, as
+                                      stageConfigs (no duplicate IDs)
+    condition targets                 existing survey question, or a
+                                      defined variable for system variables
+    STAGE_CONTEXT prompt items        existing stage
+    payout items                      stageId / rankingStageId / questionMap
+    reveal items                      existing stage of the revealed kind
+    transfer stages                   survey auto-transfer question, and
+                                      targetCohortAlias vs cohortDefinitions
+    asset allocation stages           stockInfoStageId
+    agent prompt maps                 keys are stage IDs
+
+Conditions that target a survey later than the stage they appear in, and
+agent prompts for stages that are not in the template, are reported as
+warnings.
+
+Usage:
+    from deliberate_lab.references import (
+        check_template_references, find_reference_issues,
+    )
+
+    issues = find_reference_issues(template)     # model, struct or dict
+    for issue in issues:
+        print(issue)          # stageConfigs[4] (payout 'payout')...: ...
+
+    check_template_references(template)          # raises on errors
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+import re
+
+from deliberate_lab.conditions import SYSTEM_VARIABLE_NAMESPACE
+
+# Stage kinds whose questions can be condition targets
+QUESTION_STAGE_KINDS = ("survey", "surveyPerParticipant")
+
+# Reveal item kind -> kind of the stage it reveals
+_REVEAL_STAGE_KINDS = {
+    "chip": "chip",
+    "ranking": "ranking",
+    "survey": "survey",
+    "multiAssetAllocation": "multiAssetAllocation",
+}
+
+# Payout item type -> kind of the stage it pays out for (DEFAULT: any)
+_PAYOUT_STAGE_KINDS = {"CHIP": "chip", "SURVEY": "survey"}
+
+_EXPANDED_VARIABLE = re.compile(r"^(.*)_\d+$")
+
+
+@dataclass
+class ReferenceIssue:
+    """A broken (error) or suspicious (warning) reference."""
+
+    # Where the reference is, e.g. "stageConfigs[3] (payout 'p').payoutItems[0]"
+    path: str
+    message: str
+    severity: str = "error"
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+class TemplateReferenceError(ValueError):
+    """A template has broken references; `issues` lists them all."""
+
+    def __init__(self, issues: list[ReferenceIssue], max_lines: int = 20):
+        self.issues = issues
+        lines = [f"  {issue}" for issue in issues[:max_lines]]
+        if len(issues) > max_lines:
+            lines.append(f"  ... and {len(issues) - max_lines} more")
+        super().__init__(
+            f"{len(issues)} broken reference(s) in template:\n" + "\n".join(lines)
+        )
+
+
+def _template_dict(template: Any) -> dict:
+    """Accept a generated model, a struct or a plain dict."""
+    if isinstance(template, dict):
+        return template
+    if hasattr(template, "model_dump"):
+        return template.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return template.to_dict()
+
+
+class TemplateIndex:
+    """ID indexes of one template, built in a single pass."""
+
+    def __init__(self, template: Any):
+        data = _template_dict(template)
+        experiment = data.get("experiment") or {}
+        self.stage_ids: list[str] = []
+        # Stage ID -> position of its first occurrence in stageConfigs
+        self.stage_positions: dict[str, int] = {}
+        self.stage_kinds: dict[str, str] = {}
+        # Stage ID -> question IDs (question stages only)
+        self.questions: dict[str, set[str]] = {}
+        self.duplicate_stage_ids: list[tuple[int, str]] = []
+        for position, stage in enumerate(data.get("stageConfigs") or []):
+            stage_id = stage.get("id", "")
+            self.stage_ids.append(stage_id)
+            if stage_id in self.stage_positions:
+                self.duplicate_stage_ids.append((position, stage_id))
+                continue
+            self.stage_positions[stage_id] = position
+            self.stage_kinds[stage_id] = stage.get("kind", "")
+            if stage.get("kind") in QUESTION_STAGE_KINDS:
+                self.questions[stage_id] = {
+                    question.get("id") for question in stage.get("questions") or []
+                }
+
+        self.cohort_aliases: set[str] = {
+            definition.get("alias")
+            for definition in experiment.get("cohortDefinitions") or []
+        }
+        self.variables: set[str] = set(experiment.get("variableMap") or {})
+        # Variables also available as name_1, name_2, ... (expanded lists)
+        self.expanded_variables: set[str] = set()
+        for config in experiment.get("variableConfigs") or []:
+            name = (config.get("definition") or {}).get("name")
+            if not name:
+                continue
+            self.variables.add(name)
+            if config.get("type") == "random_permutation" and config.get(
+                "expandListToSeparateVariables", True
+            ):
+                self.expanded_variables.add(name)
+
+    def has_variable(self, name: str) -> bool:
+        """Whether a variable name (or 'name.field') is defined."""
+        base = name.split(".", 1)[0]
+        if base in self.variables:
+            return True
+        match = _EXPANDED_VARIABLE.match(base)
+        return match is not None and match.group(1) in self.expanded_variables
+
+
+class _Checker:
+    """Second pass: checks references against a TemplateIndex."""
+
+    def __init__(self, index: TemplateIndex):
+        self.index = index
+        self.issues: list[ReferenceIssue] = []
+
+    def error(self, path: str, message: str) -> None:
+        self.issues.append(ReferenceIssue(path, message))
+
+    def warning(self, path: str, message: str) -> None:
+        self.issues.append(ReferenceIssue(path, message, "warning"))
+
+    def stage(
+        self, path: str, stage_id: Any, kind: Optional[str] = None, field: str = ""
+    ) -> bool:
+        """Check a stage reference (and its kind); True if it resolves."""
+        what = f"{field} {stage_id!r}" if field else f"stage {stage_id!r}"
+        if stage_id not in self.index.stage_kinds:
+            self.error(path, f"{what} is not a stage in stageConfigs")
+            return False
+        actual = self.index.stage_kinds[stage_id]
+        if kind is not None and actual != kind:
+            self.error(path, f"{what} is a {actual} stage, expected {kind}")
+            return False
+        return True
+
+    def condition_target(
+        self, path: str, target: dict, position: Optional[int]
+    ) -> None:
+        stage_id = target.get("stageId")
+        question_id = target.get("questionId")
+        if stage_id == SYSTEM_VARIABLE_NAMESPACE:
+            if not self.index.has_variable(question_id or ""):
+                self.error(path, f"variable {question_id!r} is not defined")
+            return
+        if stage_id not in self.index.stage_kinds:
+            self.error(path, f"target stage {stage_id!r} is not in stageConfigs")
+            return
+        questions = self.index.questions.get(stage_id)
+        if questions is None:
+            self.error(
+                path,
+                f"target stage {stage_id!r} is a "
+                f"{self.index.stage_kinds[stage_id]} stage, not a survey",
+            )
+        elif question_id not in questions:
+            self.error(path, f"question {question_id!r} is not in survey {stage_id!r}")
+        elif position is not None and self.index.stage_positions[stage_id] > position:
+            self.warning(
+                path, f"targets survey {stage_id!r}, which comes after this stage"
+            )
+
+    def walk(self, node: Any, path: Callable[[], str], position: Optional[int]) -> None:
+        """Check condition targets and stage context items anywhere in node."""
+        if isinstance(node, dict):
+            node_type = node.get("type")
+            if node_type == "comparison" and isinstance(node.get("target"), dict):
+                self.condition_target(path() + ".target", node["target"], position)
+            elif node_type == "STAGE_CONTEXT":
+                self.stage(path() + ".stageId", node.get("stageId"))
+            for key, value in node.items():
+                if isinstance(value, (dict, list)):
+                    self.walk(value, _child(path, f".{key}"), position)
+        elif isinstance(node, list):
+            for i, value in enumerate(node):
+                if isinstance(value, (dict, list)):
+                    self.walk(value, _child(path, f"[{i}]"), position)
+
+    # -------------------------------------------------------------------------
+    # Stage-specific references
+    # -------------------------------------------------------------------------
+
+    def payout(self, path: str, stage: dict) -> None:
+        for i, item in enumerate(stage.get("payoutItems") or []):
+            item_path = f"{path}.payoutItems[{i}]"
+            kind = _PAYOUT_STAGE_KINDS.get(item.get("type"))
+            resolved = self.stage(f"{item_path}.stageId", item.get("stageId"), kind)
+            if item.get("rankingStageId"):
+                self.stage(
+                    f"{item_path}.rankingStageId",
+                    item["rankingStageId"],
+                    "ranking",
+                    "rankingStageId",
+                )
+            if item.get("type") == "SURVEY" and resolved:
+                questions = self.index.questions[item["stageId"]]
+                for question_id in item.get("questionMap") or {}:
+                    if question_id not in questions:
+                        self.error(
+                            f"{item_path}.questionMap",
+                            f"question {question_id!r} is not in survey "
+                            f"{item['stageId']!r}",
+                        )
+
+    def reveal(self, path: str, stage: dict) -> None:
+        for i, item in enumerate(stage.get("items") or []):
+            self.stage(
+                f"{path}.items[{i}].id",
+                item.get("id"),
+                _REVEAL_STAGE_KINDS.get(item.get("kind")),
+            )
+
+    def transfer(self, path: str, stage: dict) -> None:
+        config = stage.get("autoTransferConfig") or {}
+        config_path = f"{path}.autoTransferConfig"
+        if config.get("type") == "survey":
+            survey_id = config.get("surveyStageId")
+            if self.stage(f"{config_path}.surveyStageId", survey_id, "survey"):
+                # Resolved, so it is one of the (str) stage IDs
+                assert isinstance(survey_id, str)
+                question_id = config.get("surveyQuestionId")
+                if question_id not in self.index.questions[survey_id]:
+                    self.error(
+                        f"{config_path}.surveyQuestionId",
+                        f"question {question_id!r} is not in survey {survey_id!r}",
+                    )
+        elif config.get("type") == "condition":
+            for i, group in enumerate(config.get("transferGroups") or []):
+                alias = group.get("targetCohortAlias")
+                if alias and alias not in self.index.cohort_aliases:
+                    self.error(
+                        f"{config_path}.transferGroups[{i}].targetCohortAlias",
+                        f"cohort alias {alias!r} is not in "
+                        "experiment.cohortDefinitions",
+                    )
+
+    def asset_allocation(self, path: str, stage: dict) -> None:
+        if stage.get("kind") == "assetAllocation":
+            path += ".stockConfig"
+            stock_info_id = (stage.get("stockConfig") or {}).get("stockInfoStageId")
+        else:
+            stock_info_id = stage.get("stockInfoStageId")
+        if stock_info_id:
+            self.stage(
+                f"{path}.stockInfoStageId",
+                stock_info_id,
+                "stockinfo",
+                "stockInfoStageId",
+            )
+
+
+def _child(path: Callable[[], str], suffix: str) -> Callable[[], str]:
+    # Paths are only formatted when an issue is reported
+    return lambda: path() + suffix
+
+
+def _stage_label(position: int, stage: dict) -> str:
+    return f"stageConfigs[{position}] ({stage.get('kind')} {stage.get('id')!r})"
+
+
+_STAGE_CHECKS: dict[str, Callable[[_Checker, str, dict], None]] = {
+    "payout": _Checker.payout,
+    "reveal": _Checker.reveal,
+    "transfer": _Checker.transfer,
+    "assetAllocation": _Checker.asset_allocation,
+    "multiAssetAllocation": _Checker.asset_allocation,
+}
+
+
+def _check_stage_ids(checker: _Checker, experiment: dict) -> None:
+    index = checker.index
+    for position, stage_id in index.duplicate_stage_ids:
+        checker.error(
+            f"stageConfigs[{position}].id", f"duplicate stage ID {stage_id!r}"
+        )
+    stage_ids = experiment.get("stageIds")
+    if stage_ids is None:
+        return
+    seen: set[str] = set()
+    for i, stage_id in enumerate(stage_ids):
+        if stage_id in seen:
+            checker.error(f"experiment.stageIds[{i}]", f"duplicate {stage_id!r}")
+        elif stage_id not in index.stage_kinds:
+            checker.error(
+                f"experiment.stageIds[{i}]",
+                f"{stage_id!r} is not a stage in stageConfigs",
+            )
+        seen.add(stage_id)
+    missing = [stage_id for stage_id in index.stage_positions if stage_id not in seen]
+    # Unknown IDs are reported above, so the order check skips them
+    known = [s for s in dict.fromkeys(stage_ids) if s in index.stage_kinds]
+    if missing:
+        checker.error(
+            "experiment.stageIds", f"missing stages from stageConfigs: {missing}"
+        )
+    elif known != list(index.stage_positions):
+        checker.error("experiment.stageIds", "order differs from stageConfigs")
+
+
+def _check_ids_unique(
+    checker: _Checker, path: str, items: Iterable[Any], what: str
+) -> None:
+    seen: set[Any] = set()
+    for i, value in enumerate(items):
+        if value in seen:
+            checker.error(f"{path}[{i}]", f"duplicate {what} {value!r}")
+        seen.add(value)
+
+
+def find_reference_issues(
+    template: Any, index: Optional[TemplateIndex] = None
+) -> list[ReferenceIssue]:
+    """
+    Check every cross-reference in a template.
+
+    Args:
+        template: ExperimentTemplate (model, struct or dict)
+        index: Prebuilt index of the same template (built if omitted)
+
+    Returns:
+        Errors and warnings, in template order
+    """
+    data = _template_dict(template)
+    index = index or TemplateIndex(data)
+    checker = _Checker(index)
+    experiment = data.get("experiment") or {}
+
+    _check_stage_ids(checker, experiment)
+    _check_ids_unique(
+        checker,
+        "experiment.cohortDefinitions",
+        (d.get("alias") for d in experiment.get("cohortDefinitions") or []),
+        "cohort alias",
+    )
+    _check_ids_unique(
+        checker,
+        "experiment.variableConfigs",
+        (
+            (c.get("definition") or {}).get("name")
+            for c in experiment.get("variableConfigs") or []
+        ),
+        "variable name",
+    )
+
+    for position, stage in enumerate(data.get("stageConfigs") or []):
+        label = _stage_label(position, stage)
+        if stage.get("kind") in QUESTION_STAGE_KINDS:
+            _check_ids_unique(
+                checker,
+                f"{label}.questions",
+                (q.get("id") for q in stage.get("questions") or []),
+                "question ID",
+            )
+        check = _STAGE_CHECKS.get(stage.get("kind"))
+        if check is not None:
+            check(checker, label, stage)
+        checker.walk(stage, lambda label=label: label, position)
+
+    for section in ("agentMediators", "agentParticipants"):
+        agents = data.get(section) or []
+        _check_ids_unique(
+            checker,
+            section,
+            ((a.get("persona") or {}).get("id") for a in agents),
+            "persona ID",
+        )
+        for i, agent in enumerate(agents):
+            path = f"{section}[{i}]"
+            for stage_id in agent.get("promptMap") or {}:
+                if stage_id not in index.stage_kinds:
+                    checker.warning(
+                        f"{path}.promptMap",
+                        f"prompt for {stage_id!r}, which is not in stageConfigs",
+                    )
+            checker.walk(agent, lambda path=path: path, None)
+
+    return checker.issues
+
+
+def check_template_references(template: Any) -> list[ReferenceIssue]:
+    """
+    Raise TemplateReferenceError if a template has broken references.
+
+    Returns:
+        The warnings, if there are no errors
+    """
+    issues = find_reference_issues(template)
+    errors = [issue for issue in issues if issue.severity == "error"]
+    if errors:
+        raise TemplateReferenceError(errors)
+    return issues
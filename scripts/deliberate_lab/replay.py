@@ -0,0 +1,703 @@
+"""
+Replay recorded model calls against a local Ollama-compatible stand-in.
+
+Benchmarks mediator and agent participant throughput without spending
+live model quota. Model log entries (Client.iter_experiment_logs(),
+iter_logs_ndjson(), ...) are turned into ReplayCalls that keep the
+recorded prompt, timing and agent, plus the stage's generation settings
+from the agent templates. replay() then re-issues them to an Ollama
+/api/chat endpoint at the recorded pace, scaled by `time_scale` (0 sends
+everything at once), with at most `max_concurrency` requests in flight,
+and reports end-to-end latency split into client queueing, server
+queueing and model time.
+
+OllamaStub is a small in-process stand-in for that endpoint. It answers
+each prompt with the recorded response, takes a configurable time per
+call (a fixed cost plus a cost per token, or the recorded latency), and
+runs at most `parallel` calls at once, queueing the rest like
+OLLAMA_NUM_PARALLEL. Calls beyond `max_queue` get 503 like
+OLLAMA_MAX_QUEUE. A real Ollama server can be used in its place.
+
+Usage:
+    from deliberate_lab.replay import (
+        OllamaStub, StubLatency, concurrency_sweep, load_replay_calls, replay,
+        replicate_calls,
+    )
+
+    calls = load_replay_calls(client.iter_experiment_logs("exp123"), agents=export)
+    with OllamaStub(calls, latency=StubLatency(base=0.2), parallel=4) as stub:
+        report = replay(calls, stub.url, time_scale=0.1, max_concurrency=16)
+        print(report.summary())
+
+        # Ten cohorts' worth of traffic, against 1-32 concurrent requests
+        design = replicate_calls(calls, copies=10, stagger_seconds=5)
+        for level, report in concurrency_sweep(design, stub.url, (1, 8, 32)).items():
+            print(level, report.summary()["latency"])
+"""
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterable, Optional, cast
+import hashlib
+import json
+import math
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from deliberate_lab.chats import to_millis
+from deliberate_lab.conditions import _as_dict
+from deliberate_lab.logs import approximate_tokens
+from deliberate_lab.prompts import _schema_object
+from deliberate_lab.simulation import _percentiles
+
+# Dimensions replay results can be grouped by
+REPLAY_DIMENSIONS = ("agent", "stage", "cohort", "model")
+
+
+def _prompt_key(prompt: str) -> str:
+    return hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# Recorded calls
+# ============================================================================
+
+
+@dataclass
+class ReplayCall:
+    """One recorded model call, ready to be re-issued."""
+
+    # Seconds after the first recorded call
+    offset: float
+    prompt: str
+    model: str = ""
+    agent_id: str = ""
+    stage_id: str = ""
+    cohort_id: str = ""
+    # Recorded queryTimestamp -> responseTimestamp, in seconds (NaN if failed)
+    recorded_latency: float = math.nan
+    # Recorded response text, used by OllamaStub as the reply
+    recorded_text: str = ""
+    # Ollama request options (temperature, num_predict, ...)
+    options: dict = field(default_factory=dict)
+    # Ollama "format": a JSON schema, "json", or None
+    format: Any = None
+
+    def request_body(self, model: Optional[str] = None) -> dict:
+        """Body of the Ollama /api/chat request for this call."""
+        body: dict[str, Any] = {
+            "model": model or self.model,
+            "messages": [{"role": "user", "content": self.prompt}],
+            "stream": False,
+        }
+        if self.options:
+            body["options"] = self.options
+        if self.format is not None:
+            body["format"] = self.format
+        return body
+
+
+def _agent_prompts(source: Any) -> dict[tuple[str, str], dict]:
+    """(agent persona ID, stage ID) -> prompt config from templates/exports."""
+    if source is None:
+        return {}
+    data = _as_dict(source)
+    agents = [
+        *(data.get("agentMediators") or []),
+        *(data.get("agentParticipants") or []),
+        *(data.get("agentMediatorMap") or {}).values(),
+        *(data.get("agentParticipantMap") or {}).values(),
+    ]
+    prompts = {}
+    for agent in agents:
+        persona_id = (agent.get("persona") or {}).get("id", "")
+        for stage_id, prompt in (agent.get("promptMap") or {}).items():
+            prompts[(persona_id, stage_id)] = prompt
+    return prompts
+
+
+def ollama_options(generation_config: Optional[dict]) -> dict:
+    """
+    Ollama request options for a ModelGenerationConfig.
+
+    Mirrors the server's mapGenerationConfig() (unset fields and zero
+    penalties are left to the model's defaults) plus the Ollama provider
+    options (numCtx, numPredict).
+    """
+    config = generation_config or {}
+    options: dict[str, Any] = {}
+    if config.get("maxTokens") is not None:
+        options["num_predict"] = config["maxTokens"]
+    if config.get("temperature") is not None:
+        options["temperature"] = config["temperature"]
+    if config.get("topP") is not None:
+        options["top_p"] = config["topP"]
+    if config.get("stopSequences"):
+        options["stop"] = config["stopSequences"]
+    if config.get("frequencyPenalty"):
+        options["frequency_penalty"] = config["frequencyPenalty"]
+    if config.get("presencePenalty"):
+        options["presence_penalty"] = config["presencePenalty"]
+    ollama = (config.get("providerOptions") or {}).get("ollama") or {}
+    if ollama.get("numCtx") is not None:
+        options["num_ctx"] = ollama["numCtx"]
+    if ollama.get("numPredict") is not None:
+        options["num_predict"] = ollama["numPredict"]
+    return options
+
+
+def ollama_format(structured_output_config: Optional[dict]) -> Any:
+    """Ollama "format" for a StructuredOutputConfig (None if unconstrained)."""
+    config = structured_output_config or {}
+    if not config.get("enabled"):
+        return None
+    if config.get("type") == "JSON_SCHEMA" and config.get("schema"):
+        return _schema_object(config["schema"])
+    if config.get("type") == "JSON_FORMAT":
+        return "json"
+    return None
+
+
+def load_replay_calls(
+    logs: Iterable[dict],
+    agents: Any = None,
+    start_ms: Optional[float] = None,
+    end_ms: Optional[float] = None,
+) -> list[ReplayCall]:
+    """
+    Build replay calls from model log entries.
+
+    Entries without a prompt or query timestamp are skipped. Retries are
+    logged as separate entries and are replayed as such.
+
+    Args:
+        logs: Model log entries (ModelLogEntry dicts)
+        agents: ExperimentTemplate or experiment export whose agent prompt
+                configs supply each call's generation settings and response
+                format, looked up by (agent persona ID, stage ID)
+        start_ms: Only replay calls queried at or after this time
+        end_ms: Only replay calls queried before this time
+
+    Returns:
+        Calls ordered by query time, offsets relative to the first one
+    """
+    prompts = _agent_prompts(agents)
+    timed: list[tuple[float, ReplayCall]] = []
+    for entry in logs:
+        prompt = entry.get("prompt")
+        if not prompt or not entry.get("queryTimestamp"):
+            continue
+        query_ms = to_millis(entry["queryTimestamp"])
+        if start_ms is not None and query_ms < start_ms:
+            continue
+        if end_ms is not None and query_ms >= end_ms:
+            continue
+        agent_config = (entry.get("userProfile") or {}).get("agentConfig") or {}
+        agent_id = agent_config.get("agentId", "")
+        stage_id = entry.get("stageId", "")
+        response = entry.get("response") or {}
+        latency = math.nan
+        if entry.get("responseTimestamp"):
+            latency = (to_millis(entry["responseTimestamp"]) - query_ms) / 1000
+        prompt_config = prompts.get((agent_id, stage_id)) or {}
+        call = ReplayCall(
+            offset=0.0,
+            prompt=prompt,
+            model=(agent_config.get("modelSettings") or {}).get("modelName", ""),
+            agent_id=agent_id,
+            stage_id=stage_id,
+            cohort_id=entry.get("cohortId", ""),
+            recorded_latency=latency,
+            recorded_text=response.get("text") or "",
+            options=ollama_options(prompt_config.get("generationConfig")),
+            format=ollama_format(prompt_config.get("structuredOutputConfig")),
+        )
+        timed.append((query_ms, call))
+
+    timed.sort(key=lambda item: item[0])
+    if not timed:
+        return []
+    first_ms = timed[0][0]
+    for query_ms, call in timed:
+        call.offset = (query_ms - first_ms) / 1000
+    return [call for _, call in timed]
+
+
+def replicate_calls(
+    calls: list[ReplayCall], copies: int, stagger_seconds: float = 0.0
+) -> list[ReplayCall]:
+    """
+    Scale recorded traffic to more cohorts.
+
+    Each copy keeps the recorded timing, shifted by `stagger_seconds` per
+    copy, and gets its cohort ID suffixed with the copy number.
+    """
+    replicated = [
+        replace(
+            call,
+            offset=call.offset + copy * stagger_seconds,
+            cohort_id=f"{call.cohort_id}#{copy}" if copy else call.cohort_id,
+        )
+        for copy in range(copies)
+        for call in calls
+    ]
+    replicated.sort(key=lambda call: call.offset)
+    return replicated
+
+
+# ============================================================================
+# Local stand-in model server
+# ============================================================================
+
+
+@dataclass
+class StubLatency:
+    """
+    Time OllamaStub takes per call.
+
+    A call takes base + per_prompt_token * prompt tokens + per_output_token *
+    output tokens seconds (tokens approximated from text), or, with
+    `recorded`, the call's recorded latency times `scale` where known.
+    """
+
+    base: float = 0.05
+    per_prompt_token: float = 0.0
+    per_output_token: float = 0.0
+    recorded: bool = False
+    scale: float = 1.0
+
+    def seconds(
+        self, prompt_tokens: int, output_tokens: int, recorded: float = math.nan
+    ) -> float:
+        if self.recorded and not math.isnan(recorded):
+            return recorded * self.scale
+        return (
+            self.base
+            + self.per_prompt_token * prompt_tokens
+            + self.per_output_token * output_tokens
+        )
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/api/version":
+            self._send_json(200, {"version": "0.0.0-stub"})
+        elif self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": "stub", "model": "stub"}]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path not in ("/api/chat", "/api/generate"):
+            self._send_json(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON body"})
+            return
+        status, payload = cast(_StubServer, self.server).stub._answer(self.path, body)
+        self._send_json(status, payload)
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Accept bursts of connections from large replays
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple[str, int], stub: OllamaStub):
+        super().__init__(address, _StubHandler)
+        self.stub = stub
+
+
+class OllamaStub:
+    """
+    In-process Ollama-compatible server for replay benchmarks.
+
+    Serves POST /api/chat and /api/generate (non-streaming), plus
+    /api/tags and /api/version for clients that probe the server.
+    """
+
+    def __init__(
+        self,
+        calls: Iterable[ReplayCall] = (),
+        latency: Optional[StubLatency] = None,
+        parallel: int = 4,
+        max_queue: Optional[int] = None,
+        default_response: str = "",
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            calls: Recorded calls whose responses (and latencies, with
+                   StubLatency(recorded=True)) answer matching prompts
+            latency: Time taken per call (default: 50 ms)
+            parallel: Calls processed at once; more wait in a queue
+            max_queue: Queued calls beyond which requests get 503
+                       (unbounded if None)
+            default_response: Reply to prompts without a recorded response
+                              ("{}" is used when a format is requested)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.latency = latency or StubLatency()
+        self.parallel = parallel
+        self.max_queue = max_queue
+        self.default_response = default_response
+        self._recorded: dict[str, tuple[str, float]] = {}
+        for call in calls:
+            self._recorded[_prompt_key(call.prompt)] = (
+                call.recorded_text,
+                call.recorded_latency,
+            )
+        self._slots = threading.Semaphore(parallel)
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._active = 0
+        self.requests = 0
+        self.rejected = 0
+        self.peak_waiting = 0
+        self.peak_active = 0
+        self._server = _StubServer((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as the Ollama provider URL (ends in /api)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> OllamaStub:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="ollama-stub", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> OllamaStub:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, int]:
+        """Request counts and the peak queue depth / concurrency seen."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "rejected": self.rejected,
+                "peakWaiting": self.peak_waiting,
+                "peakActive": self.peak_active,
+            }
+
+    def _answer(self, path: str, body: dict) -> tuple[int, dict]:
+        if path == "/api/chat":
+            messages = body.get("messages") or []
+            prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        else:
+            prompt = str(body.get("prompt", ""))
+        text, recorded = self._recorded.get(_prompt_key(prompt), ("", math.nan))
+        if not text:
+            text = "{}" if body.get("format") else self.default_response
+
+        with self._lock:
+            self.requests += 1
+            if self.max_queue is not None and self._waiting >= self.max_queue:
+                self.rejected += 1
+                return 503, {"error": "server busy, please try again later"}
+            self._waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self._waiting)
+        self._slots.acquire()
+        try:
+            with self._lock:
+                self._waiting -= 1
+                self._active += 1
+                self.peak_active = max(self.peak_active, self._active)
+            prompt_tokens = approximate_tokens(prompt)
+            output_tokens = approximate_tokens(text)
+            seconds = self.latency.seconds(prompt_tokens, output_tokens, recorded)
+            started = time.perf_counter()
+            time.sleep(max(0.0, seconds))
+            duration_ns = int((time.perf_counter() - started) * 1e9)
+        finally:
+            with self._lock:
+                self._active -= 1
+            self._slots.release()
+
+        total_tokens = max(1, prompt_tokens + output_tokens)
+        payload = {
+            "model": body.get("model", ""),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "done": True,
+            "done_reason": "stop",
+            "total_duration": duration_ns,
+            "load_duration": 0,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": duration_ns * prompt_tokens // total_tokens,
+            "eval_count": output_tokens,
+            "eval_duration": duration_ns * output_tokens // total_tokens,
+        }
+        if path == "/api/chat":
+            payload["message"] = {"role": "assistant", "content": text}
+        else:
+            payload["response"] = text
+        return 200, payload
+
+
+# ============================================================================
+# Replay
+# ============================================================================
+
+
+@dataclass
+class ReplayResult:
+    """Timing of one replayed call (seconds since the replay started)."""
+
+    call: ReplayCall
+    # When the recorded timing says the call should be sent
+    scheduled: float
+    # When a worker sent it (after waiting for a free slot)
+    started: float = math.nan
+    finished: float = math.nan
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    # Model time reported by the server (Ollama total_duration)
+    server_seconds: float = math.nan
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def latency(self) -> float:
+        """End-to-end: from the scheduled send time to the response."""
+        return self.finished - self.scheduled
+
+    @property
+    def client_queue(self) -> float:
+        """Time waiting for one of the replay's concurrent slots."""
+        return self.started - self.scheduled
+
+    @property
+    def service(self) -> float:
+        """Time from sending the request to the response."""
+        return self.finished - self.started
+
+    @property
+    def server_queue(self) -> float:
+        """Time the server held the request before the model ran it."""
+        if math.isnan(self.server_seconds):
+            return math.nan
+        return max(0.0, self.service - self.server_seconds)
+
+
+def _finite(values: Iterable[float]) -> list[float]:
+    return [value for value in values if not math.isnan(value)]
+
+
+def _dimension(call: ReplayCall, by: Optional[str]) -> Any:
+    if by is None:
+        return None
+    if by == "model":
+        return call.model
+    return getattr(call, f"{by}_id")
+
+
+def _peak_in_flight(results: list[ReplayResult]) -> int:
+    events = []
+    for result in results:
+        if not math.isnan(result.started) and not math.isnan(result.finished):
+            events.append((result.started, 1))
+            events.append((result.finished, -1))
+    events.sort()
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+@dataclass
+class ReplayReport:
+    """Results of one replay run."""
+
+    results: list[ReplayResult]
+    wall_seconds: float
+    max_concurrency: int
+    time_scale: float
+
+    @property
+    def errors(self) -> list[ReplayResult]:
+        return [result for result in self.results if not result.ok]
+
+    def latency_percentiles(
+        self, by: Optional[str] = None, points: Iterable[int] = (50, 90, 99)
+    ) -> dict[Any, dict]:
+        """
+        End-to-end latency percentiles of successful calls.
+
+        Args:
+            by: Optional dimension to group by (see REPLAY_DIMENSIONS)
+            points: Percentiles to report
+        """
+        if by is not None and by not in REPLAY_DIMENSIONS:
+            raise ValueError(f"Unknown dimension {by!r}; expected {REPLAY_DIMENSIONS}")
+        groups: dict[Any, list[float]] = {}
+        for result in self.results:
+            if not result.ok:
+                continue
+            groups.setdefault(_dimension(result.call, by), []).append(result.latency)
+        return {key: _percentiles(values, points) for key, values in groups.items()}
+
+    def summary(self) -> dict[str, Any]:
+        ok = [result for result in self.results if result.ok]
+        return {
+            "calls": len(self.results),
+            "errors": len(self.results) - len(ok),
+            "maxConcurrency": self.max_concurrency,
+            "timeScale": self.time_scale,
+            "wallSeconds": self.wall_seconds,
+            "throughput": len(ok) / self.wall_seconds if self.wall_seconds else 0.0,
+            "peakInFlight": _peak_in_flight(self.results),
+            "latency": _percentiles([result.latency for result in ok]),
+            "clientQueue": _percentiles([result.client_queue for result in ok]),
+            "serverQueue": _percentiles(_finite(r.server_queue for r in ok)),
+            "model": _percentiles(_finite(r.server_seconds for r in ok)),
+            "recordedLatency": _percentiles(
+                _finite(result.call.recorded_latency for result in self.results)
+            ),
+        }
+
+
+def replay(
+    calls: list[ReplayCall],
+    base_url: str,
+    time_scale: float = 1.0,
+    max_concurrency: int = 8,
+    model: Optional[str] = None,
+    timeout: float = 300.0,
+) -> ReplayReport:
+    """
+    Re-issue recorded calls to an Ollama-compatible server.
+
+    Calls are sent at their recorded offsets times `time_scale` (1 keeps the
+    recorded pace, 0.1 is ten times faster, 0 sends all at once), each as
+    soon as one of `max_concurrency` slots is free. Time spent waiting for a
+    slot counts towards end-to-end latency, as a queue in front of the
+    model would.
+
+    Args:
+        calls: Calls to replay (see load_replay_calls())
+        base_url: Ollama API base URL, e.g., "http://localhost:11434/api"
+        time_scale: Multiplier for the recorded offsets
+        max_concurrency: Requests in flight at most
+        model: Model name to request instead of the recorded ones
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        ReplayReport with one result per call, in call order
+    """
+    chat_url = base_url.rstrip("/") + "/chat"
+    local = threading.local()
+    sessions: list[requests.Session] = []
+    sessions_lock = threading.Lock()
+
+    def session() -> requests.Session:
+        # One connection per worker thread
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            local.session.mount("http://", HTTPAdapter(pool_maxsize=1))
+            local.session.mount("https://", HTTPAdapter(pool_maxsize=1))
+            with sessions_lock:
+                sessions.append(local.session)
+        return local.session
+
+    origin = time.perf_counter()
+
+    def send(result: ReplayResult) -> None:
+        result.started = time.perf_counter() - origin
+        try:
+            response = session().post(
+                chat_url, json=result.call.request_body(model), timeout=timeout
+            )
+            result.status_code = response.status_code
+            if response.ok:
+                payload = response.json()
+                if payload.get("total_duration") is not None:
+                    result.server_seconds = payload["total_duration"] / 1e9
+                result.prompt_tokens = payload.get("prompt_eval_count")
+                result.output_tokens = payload.get("eval_count")
+            else:
+                result.error = f"HTTP {response.status_code}: {response.text[:200]}"
+        except (requests.RequestException, ValueError) as error:
+            result.error = str(error)
+        finally:
+            result.finished = time.perf_counter() - origin
+
+    results = [
+        ReplayResult(call=call, scheduled=call.offset * time_scale) for call in calls
+    ]
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="replay"
+    ) as pool:
+        for result in sorted(results, key=lambda r: r.scheduled):
+            delay = result.scheduled - (time.perf_counter() - origin)
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(send, result)
+    wall_seconds = time.perf_counter() - origin
+    for worker_session in sessions:
+        worker_session.close()
+    return ReplayReport(results, wall_seconds, max_concurrency, time_scale)
+
+
+def concurrency_sweep(
+    calls: list[ReplayCall],
+    base_url: str,
+    levels: Iterable[int] = (1, 2, 4, 8, 16, 32),
+    **kwargs: Any,
+) -> dict[int, ReplayReport]:
+    """
+    Replay the same calls at several concurrency limits.
+
+    Args:
+        calls: Calls to replay
+        base_url: Ollama API base URL
+        levels: max_concurrency values to try, in order
+        **kwargs: Passed to replay() (time_scale, model, timeout)
+
+    Returns:
+        Map from concurrency limit to its ReplayReport
+    """
+    return {
+        level: replay(calls, base_url, max_concurrency=level, **kwargs)
+        for level in levels
+    }
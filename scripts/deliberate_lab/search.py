@@ -0,0 +1,435 @@
+"""
+Full-text search over chats, alerts and model logs of many experiments.
+
+SearchIndex is a positional inverted index fed from experiment exports
+(ExperimentDownload dicts or ExportStores) and model log exports. Each
+chat message, alert and log entry is one document with a text body and
+metadata fields:
+
+    kind        "chat", "alert" or "log"
+    experiment  experiment ID
+    cohort      cohort ID
+    stage       stage ID
+    sender      chat senderId, alert participantId (private ID) or log publicId
+    type        chat message user type (participant, mediator, ...) or log type
+
+Queries are ANDs of words, "quoted phrases" and field:value filters, e.g.
+`"lost at sea" raft stage:chat-1 kind:chat`. They are answered by walking
+the shortest posting list and probing the others with binary search (or by
+a set intersection when the lists are of similar length), so their cost
+depends on the rarest term rather than on the index size.
+
+Usage:
+    from deliberate_lab.search import SearchIndex
+
+    index = SearchIndex()
+    index.add_export(store)                       # chats and alerts
+    index.add_logs(client.export_experiment_logs("exp123"), "exp123")
+    for hit in index.search('"i disagree" kind:chat', limit=20):
+        print(hit.experiment_id, hit.cohort_id, hit.text)
+
+    index.save("search.idx")                      # reopen with SearchIndex.load()
+"""
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+import pickle
+import re
+
+from deliberate_lab.chats import to_millis
+
+INDEX_VERSION = 1
+
+FIELDS = ("kind", "experiment", "cohort", "stage", "sender", "type")
+
+_TOKEN = re.compile(r"\w+")
+_QUERY_PART = re.compile(r'(\w+):("[^"]*"|\S+)|"([^"]*)"|(\S+)')
+
+# Position gap between text parts of one document (e.g., log prompt and
+# response), so phrases never match across parts
+_PART_GAP = 1 << 16
+
+# Intersect by binary search only when the shortest posting list is at
+# least this many times shorter than the next one
+_PROBE_RATIO = 32
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens of a text."""
+    return _TOKEN.findall(text.lower())
+
+
+def parse_query(query: str) -> tuple[list[list[str]], dict[str, str]]:
+    """
+    Split a query into phrases (token lists; single words are one-token
+    phrases) and field filters. Parts like "https://..." whose prefix is
+    not a field are searched as text.
+    """
+    phrases: list[list[str]] = []
+    filters: dict[str, str] = {}
+    for field, value, phrase, word in _QUERY_PART.findall(query):
+        if field in FIELDS:
+            filters[field] = value.strip('"')
+            continue
+        tokens = tokenize(f"{field}:{value}" if field else phrase or word)
+        if tokens:
+            phrases.append(tokens)
+    return phrases, filters
+
+
+@dataclass
+class SearchHit:
+    """One matching document."""
+
+    kind: str
+    experiment_id: str
+    cohort_id: str
+    stage_id: str
+    sender_id: str
+    type: str
+    doc_id: str
+    # Milliseconds since the epoch (NaN if the document has no timestamp)
+    timestamp: float
+    # Document text (None if the index does not keep texts)
+    text: Optional[str] = None
+
+
+class _TermPostings:
+    """Documents containing a term, with the term's positions in each."""
+
+    __slots__ = ("docs", "offsets", "positions")
+
+    def __init__(self):
+        self.docs = array("q")
+        # positions[offsets[k]:offsets[k + 1]] belong to docs[k]
+        self.offsets = array("q", [0])
+        self.positions = array("l")
+
+    def add(self, doc: int, positions: list[int]) -> None:
+        self.docs.append(doc)
+        self.positions.extend(positions)
+        self.offsets.append(len(self.positions))
+
+    def positions_in(self, doc: int) -> Optional[array]:
+        k = bisect_left(self.docs, doc)
+        if k == len(self.docs) or self.docs[k] != doc:
+            return None
+        return self.positions[self.offsets[k] : self.offsets[k + 1]]
+
+
+def _contains(docs: array, doc: int) -> bool:
+    k = bisect_left(docs, doc)
+    return k < len(docs) and docs[k] == doc
+
+
+class SearchIndex:
+    """
+    In-memory positional inverted index over chat, alert and log documents.
+
+    Documents are numbered in insertion order, so every posting list is
+    sorted and new documents are appended without rebuilding. Adding a
+    document that is already indexed (same kind, experiment and ID) is a
+    no-op, so overlapping exports can be fed repeatedly.
+    """
+
+    def __init__(self, keep_text: bool = True):
+        """
+        Args:
+            keep_text: Whether to keep document texts for SearchHit.text
+        """
+        self.keep_text = keep_text
+        self.doc_ids: list[str] = []
+        self.times = array("d")
+        self.texts: list[str] = []
+        self._terms: dict[str, _TermPostings] = {}
+        # Per field: value -> code, code -> value, per-document codes and
+        # value -> sorted document numbers
+        self._field_codes: dict[str, dict[str, int]] = {f: {} for f in FIELDS}
+        self._field_names: dict[str, list[str]] = {f: [] for f in FIELDS}
+        self._field_columns: dict[str, array] = {f: array("l") for f in FIELDS}
+        self._field_docs: dict[str, dict[str, array]] = {f: {} for f in FIELDS}
+        self._keys: set[tuple[str, str, str]] = set()
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    # =========================================================================
+    # Indexing
+    # =========================================================================
+
+    def add_document(
+        self,
+        kind: str,
+        experiment_id: str,
+        doc_id: str,
+        texts: Iterable[str],
+        cohort_id: str = "",
+        stage_id: str = "",
+        sender_id: str = "",
+        type: str = "",  # pylint: disable=redefined-builtin
+        timestamp: Any = None,
+    ) -> bool:
+        """
+        Index one document.
+
+        Args:
+            kind: Document kind ("chat", "alert" or "log")
+            experiment_id: Experiment the document belongs to
+            doc_id: Document ID (message, alert or log entry ID)
+            texts: Text parts; phrases do not match across parts
+            cohort_id, stage_id, sender_id, type: Field values
+            timestamp: Exported timestamp (see deliberate_lab.chats.to_millis)
+
+        Returns:
+            False if the document was already indexed
+        """
+        key = (kind, experiment_id, doc_id)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        doc = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self.times.append(to_millis(timestamp) if timestamp else float("nan"))
+
+        values = (kind, experiment_id, cohort_id, stage_id, sender_id, type)
+        for field, value in zip(FIELDS, values):
+            codes = self._field_codes[field]
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(self._field_names[field])
+                self._field_names[field].append(value)
+                self._field_docs[field][value] = array("q")
+            self._field_columns[field].append(code)
+            self._field_docs[field][value].append(doc)
+
+        term_positions: dict[str, list[int]] = {}
+        parts = []
+        start = 0
+        for text in texts:
+            if not text:
+                continue
+            parts.append(text)
+            tokens = tokenize(text)
+            for position, token in enumerate(tokens, start):
+                term_positions.setdefault(token, []).append(position)
+            start += len(tokens) + _PART_GAP
+        for term, positions in term_positions.items():
+            postings = self._terms.get(term)
+            if postings is None:
+                postings = self._terms[term] = _TermPostings()
+            postings.add(doc, positions)
+        if self.keep_text:
+            self.texts.append("\n".join(parts))
+        return True
+
+    def add_export(self, export: Any, experiment_id: Optional[str] = None) -> int:
+        """
+        Index the chat messages and alerts of an experiment export.
+
+        Args:
+            export: ExperimentDownload dict or an ExportStore
+            experiment_id: Experiment ID (read from the export if omitted)
+
+        Returns:
+            Number of documents added
+        """
+        is_store = hasattr(export, "chat_map")
+        if experiment_id is None:
+            experiment = export.experiment() if is_store else export["experiment"]
+            experiment_id = str(experiment["id"])
+        added = 0
+
+        if is_store:
+            chats = ((c, export.chat_map(c)) for c in export.cohort_ids())
+            alerts = ((p, export.alerts(p)) for p in export.alert_participant_ids())
+        else:
+            chats = (
+                (cohort_id, cohort.get("chatMap") or {})
+                for cohort_id, cohort in (export.get("cohortMap") or {}).items()
+            )
+            alerts = iter((export.get("alerts") or {}).items())
+
+        for cohort_id, chat_map in chats:
+            for stage_id, messages in chat_map.items():
+                for message in messages:
+                    added += self.add_document(
+                        "chat",
+                        experiment_id,
+                        message.get("id", ""),
+                        [message.get("message", "")],
+                        cohort_id=cohort_id,
+                        stage_id=stage_id,
+                        sender_id=message.get("senderId", ""),
+                        type=message.get("type", ""),
+                        timestamp=message.get("timestamp"),
+                    )
+        for participant_id, participant_alerts in alerts:
+            for alert in participant_alerts:
+                added += self.add_document(
+                    "alert",
+                    experiment_id,
+                    alert.get("id", ""),
+                    [alert.get("message", ""), *(alert.get("responses") or [])],
+                    cohort_id=alert.get("cohortId", ""),
+                    stage_id=alert.get("stageId", ""),
+                    sender_id=participant_id,
+                    type=alert.get("status", ""),
+                    timestamp=alert.get("timestamp"),
+                )
+        return added
+
+    def add_logs(self, logs: Iterable[dict], experiment_id: str) -> int:
+        """
+        Index model log entries (prompt, response text and errors).
+
+        Args:
+            logs: Log entries, e.g. from Client.export_experiment_logs()
+            experiment_id: Experiment the logs belong to
+
+        Returns:
+            Number of documents added
+        """
+        added = 0
+        for entry in logs:
+            response = entry.get("response") or {}
+            added += self.add_document(
+                "log",
+                experiment_id,
+                entry.get("id", ""),
+                [
+                    entry.get("prompt", ""),
+                    response.get("text") or "",
+                    response.get("errorMessage") or "",
+                ],
+                cohort_id=entry.get("cohortId", ""),
+                stage_id=entry.get("stageId", ""),
+                sender_id=entry.get("publicId", ""),
+                type=entry.get("type", ""),
+                timestamp=entry.get("createdTimestamp"),
+            )
+        return added
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self, path: str) -> None:
+        """Write the index to a file (reopen with load())."""
+        with open(path, "wb") as f:
+            pickle.dump((INDEX_VERSION, self.__dict__), f, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> SearchIndex:
+        """
+        Load an index written by save(). Only load files you wrote:
+        the format is pickle.
+        """
+        with open(path, "rb") as f:
+            version, state = pickle.load(f)
+        if version != INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {version}")
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _phrase_at(self, doc: int, postings: list[_TermPostings]) -> bool:
+        """Whether the terms occur at consecutive positions in a document."""
+        first = postings[0].positions_in(doc)
+        rest = [set(p.positions_in(doc) or ()) for p in postings[1:]]
+        return any(
+            all(start + i + 1 in positions for i, positions in enumerate(rest))
+            for start in first or ()
+        )
+
+    def search_docs(
+        self, query: str = "", limit: Optional[int] = None, **filters: str
+    ) -> list[int]:
+        """
+        Document numbers matching a query, in insertion order.
+
+        Args:
+            query: Words, "quoted phrases" and field:value filters (all ANDed)
+            limit: Maximum number of results
+            **filters: Additional field filters (kind, experiment, cohort,
+                       stage, sender, type)
+
+        Raises:
+            ValueError: For filters on unknown fields
+        """
+        phrases, query_filters = parse_query(query)
+        for field in filters:
+            if field not in FIELDS:
+                raise ValueError(f"Unknown search field: {field}")
+        query_filters.update(filters)
+
+        lists = []
+        for field, value in query_filters.items():
+            docs = self._field_docs[field].get(value)
+            if docs is None:
+                return []
+            lists.append(docs)
+        phrase_postings = []
+        for phrase in phrases:
+            postings = []
+            for term in phrase:
+                term_postings = self._terms.get(term)
+                if term_postings is None:
+                    return []
+                postings.append(term_postings)
+            lists.extend(p.docs for p in postings)
+            if len(phrase) > 1:
+                phrase_postings.append(postings)
+        if not lists:
+            lists.append(range(len(self.doc_ids)))
+
+        lists.sort(key=len)
+        candidates: Iterable[int] = lists[0]
+        probe = lists[1:]
+        if probe and len(lists[0]) * _PROBE_RATIO > len(probe[0]):
+            # Similar-sized lists: a set intersection beats binary search
+            candidates = sorted(set(lists[0]).intersection(*probe))
+            probe = []
+        results = []
+        for doc in candidates:
+            if probe and not all(_contains(docs, doc) for docs in probe):
+                continue
+            if not all(self._phrase_at(doc, p) for p in phrase_postings):
+                continue
+            results.append(doc)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def count(self, query: str = "", **filters: str) -> int:
+        """Number of documents matching a query."""
+        return len(self.search_docs(query, None, **filters))
+
+    def hit(self, doc: int) -> SearchHit:
+        """SearchHit for a document number."""
+        values = [
+            self._field_names[field][self._field_columns[field][doc]]
+            for field in FIELDS
+        ]
+        return SearchHit(
+            *values,
+            doc_id=self.doc_ids[doc],
+            timestamp=self.times[doc],
+            text=self.texts[doc] if self.keep_text else None,
+        )
+
+    def search(
+        self, query: str = "", limit: Optional[int] = None, **filters: str
+    ) -> list[SearchHit]:
+        """Documents matching a query, as SearchHits (see search_docs())."""
+        return [self.hit(doc) for doc in self.search_docs(query, limit, **filters)]
+
+    def values(self, field: str) -> list[str]:
+        """Distinct values of a field, e.g. all indexed experiment IDs."""
+        return list(self._field_names[field])
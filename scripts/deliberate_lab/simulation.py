@@ -0,0 +1,743 @@
+"""
+Offline simulators for experiment designs.
+
+simulate_condition_transfer() replays the server's condition-based
+auto-transfer (handleConditionAutoTransfer in
+functions/src/participant.utils.ts) over synthetic arrivals, so wait
+times, timeout rates and group balance can be estimated before launch.
+
+simulate_variable_assignment() draws variable values for synthetic
+experiments, cohorts and participants with the same seeding as
+generateVariablesForScope (functions/src/variables.utils.ts), so the
+realized distribution of conditions can be checked before launch.
+
+Usage:
+    from deliberate_lab.simulation import simulate_condition_transfer
+
+    report = simulate_condition_transfer(
+        transfer_stage,                 # TransferStageConfig (model or dict)
+        arrival_rate=0.5,               # participants per second (Poisson)
+        answers={"survey1::stance": {"pro": 0.3, "con": 0.7}},
+        num_arrivals=200_000,
+        seed=1,
+    )
+    print(report.summary())
+
+    from deliberate_lab.simulation import simulate_variable_assignment
+
+    report = simulate_variable_assignment(
+        experiment.variableConfigs, num_participants=1_000_000, cohort_size=4
+    )
+    print(report.summary())
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, Union
+import hashlib
+import json
+import math
+import random
+
+from deliberate_lab.conditions import AnswerTable, _as_dict, compile_condition
+
+# Independent per-target answer distributions: {target key: {value: weight}}
+AnswerDistribution = dict[str, dict[Any, float]]
+
+# Or a callable drawing one participant's target values from an RNG
+AnswerSampler = Callable[[random.Random], dict[str, Any]]
+
+T = TypeVar("T")
+
+# Default TransferStageConfig.timeoutSeconds (utils/src/stages/transfer_stage.ts)
+_DEFAULT_TRANSFER_TIMEOUT = 600
+
+
+def _percentiles(values: list[float], points: Iterable[int] = (50, 90, 99)) -> dict:
+    """Nearest-rank percentiles of `values` (empty dict if no values)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        f"p{point}": ordered[max(0, math.ceil(point / 100 * len(ordered)) - 1)]
+        for point in points
+    }
+
+
+def _imbalance(counts: Iterable[int]) -> Optional[float]:
+    """Ratio of largest to smallest count (None if undefined)."""
+    counts = list(counts)
+    if len(counts) < 2 or min(counts) == 0:
+        return None
+    return max(counts) / min(counts)
+
+
+# ============================================================================
+# Condition-based transfer
+# ============================================================================
+
+
+@dataclass
+class TransferSimulationReport:
+    """Outcome of simulate_condition_transfer()."""
+
+    arrivals: int = 0
+    matched: int = 0
+    timed_out: int = 0
+    # Timed-out participants who matched no composition entry at all
+    timed_out_unmatchable: int = 0
+    # Participants still waiting at the end (only when timeouts are disabled)
+    waiting: int = 0
+    cohorts: int = 0
+    # Simulated seconds from the first arrival to the last event
+    duration: float = 0.0
+    # Seconds each matched participant waited before their cohort formed
+    wait_times: list[float] = field(default_factory=list)
+    # Seconds from the first member's arrival to each cohort forming
+    fill_times: list[float] = field(default_factory=list)
+    # Cohort size -> number of cohorts
+    cohort_sizes: dict[int, int] = field(default_factory=dict)
+    # Transfer group ID -> cohorts formed / participants transferred
+    group_cohorts: dict[str, int] = field(default_factory=dict)
+    group_participants: dict[str, int] = field(default_factory=dict)
+    # Transfer group ID -> composition entry ID -> participants transferred
+    composition_participants: dict[str, dict[str, int]] = field(default_factory=dict)
+    # Target cohort alias -> participants routed (including overflow cohorts)
+    alias_participants: dict[str, int] = field(default_factory=dict)
+    # Overflow cohorts created because an alias cohort was at capacity
+    overflow_transfers: int = 0
+    # New cohorts outside autoCohortParticipantConfig min/max bounds
+    out_of_bounds_cohorts: int = 0
+
+    @property
+    def match_rate(self) -> float:
+        return self.matched / self.arrivals if self.arrivals else 0.0
+
+    @property
+    def timeout_rate(self) -> float:
+        return self.timed_out / self.arrivals if self.arrivals else 0.0
+
+    def summary(self) -> dict:
+        """Headline statistics as a JSON-serializable dict."""
+        return {
+            "arrivals": self.arrivals,
+            "matched": self.matched,
+            "timedOut": self.timed_out,
+            "timedOutUnmatchable": self.timed_out_unmatchable,
+            "waiting": self.waiting,
+            "matchRate": self.match_rate,
+            "timeoutRate": self.timeout_rate,
+            "cohorts": self.cohorts,
+            "duration": self.duration,
+            "waitTime": {
+                "mean": (
+                    sum(self.wait_times) / len(self.wait_times)
+                    if self.wait_times
+                    else None
+                ),
+                **_percentiles(self.wait_times),
+            },
+            "fillTime": {
+                "mean": (
+                    sum(self.fill_times) / len(self.fill_times)
+                    if self.fill_times
+                    else None
+                ),
+                **_percentiles(self.fill_times),
+            },
+            "cohortSizes": dict(sorted(self.cohort_sizes.items())),
+            "groupParticipants": dict(self.group_participants),
+            "groupImbalance": _imbalance(self.group_participants.values()),
+            "aliasParticipants": dict(self.alias_participants),
+            "aliasImbalance": _imbalance(self.alias_participants.values()),
+            "overflowTransfers": self.overflow_transfers,
+            "outOfBoundsCohorts": self.out_of_bounds_cohorts,
+        }
+
+
+def _poisson_arrivals(rate: float, rng: random.Random) -> Iterator[float]:
+    """Arrival times (seconds) of a Poisson process with the given rate."""
+    time = 0.0
+    while True:
+        time += rng.expovariate(rate)
+        yield time
+
+
+def _sample_answer_table(
+    answers: Union[AnswerDistribution, AnswerSampler],
+    size: int,
+    first_index: int,
+    keys: list[str],
+    rng: random.Random,
+) -> AnswerTable:
+    """Draw target values for a batch of synthetic participants."""
+    participant_ids = [str(index) for index in range(first_index, first_index + size)]
+    if callable(answers):
+        return AnswerTable.from_rows(
+            ((participant_id, answers(rng)) for participant_id in participant_ids),
+            keys=keys,
+        )
+    columns = {}
+    for key, distribution in answers.items():
+        values = list(distribution)
+        columns[key] = rng.choices(
+            values, weights=[distribution[value] for value in values], k=size
+        )
+    return AnswerTable(participant_ids, columns)
+
+
+def simulate_condition_transfer(
+    stage: Any,
+    answers: Union[AnswerDistribution, AnswerSampler],
+    num_arrivals: int,
+    arrival_rate: Optional[float] = None,
+    arrival_times: Optional[Iterable[float]] = None,
+    seed: Optional[int] = None,
+    initial_alias_sizes: Optional[dict[str, int]] = None,
+    max_participants_per_cohort: Optional[int] = None,
+    batch_size: int = 1 << 16,
+) -> TransferSimulationReport:
+    """
+    Simulate condition-based auto-transfer for a stream of arrivals.
+
+    Mirrors the server: matching runs when a participant arrives at the
+    transfer stage; each waiting participant sits in the first composition
+    entry they satisfy within each transfer group; a group is ready when
+    every entry has reached minCount and the arriving participant is in
+    it; members are taken oldest first (arriving participant first), up to
+    maxCount per entry. With enableGroupBalancing, the ready group whose
+    target cohort has the fewest participants wins (groups without a
+    targetCohortAlias count as infinitely large). With enableTimeout,
+    participants leave after timeoutSeconds. All participants are assumed
+    to stay connected and to wait in the same cohort.
+
+    Args:
+        stage: TransferStageConfig (model or dict) with a condition
+               autoTransferConfig
+        answers: Either {target key: {value: weight}} (independent per
+                 "stageId::questionId" target), or a callable taking a
+                 random.Random and returning one participant's target values
+        num_arrivals: Number of participants to simulate
+        arrival_rate: Mean arrivals per second (Poisson process)
+        arrival_times: Explicit, non-decreasing arrival times in seconds
+                       (instead of arrival_rate)
+        seed: Random seed for reproducible runs
+        initial_alias_sizes: Participants already in each target cohort alias
+                             (used by group balancing and capacity checks)
+        max_participants_per_cohort: Capacity of alias cohorts; transfers
+                                     that would exceed it go to overflow
+                                     cohorts, as on the server
+        batch_size: Number of arrivals whose answers are drawn and evaluated
+                    together
+
+    Returns:
+        TransferSimulationReport
+    """
+    stage = _as_dict(stage)
+    config = stage.get("autoTransferConfig") or {}
+    if config.get("type") != "condition":
+        raise ValueError("Transfer stage must use a condition autoTransferConfig")
+    if (arrival_rate is None) == (arrival_times is None):
+        raise ValueError("Provide exactly one of arrival_rate or arrival_times")
+
+    rng = random.Random(seed)
+    groups = config.get("transferGroups") or []
+    balancing = bool(config.get("enableGroupBalancing"))
+    # Seconds before waiting participants leave (None: they wait forever)
+    timeout: Optional[float] = None
+    if stage.get("enableTimeout"):
+        timeout = float(stage.get("timeoutSeconds", _DEFAULT_TRANSFER_TIMEOUT))
+    cohort_config = config.get("autoCohortParticipantConfig") or {}
+    cohort_min = cohort_config.get("minParticipantsPerCohort")
+    cohort_max = cohort_config.get("maxParticipantsPerCohort")
+
+    # Compile every composition condition once
+    compiled = [
+        [compile_condition(entry["condition"]) for entry in group["composition"]]
+        for group in groups
+    ]
+    keys = sorted(
+        {key for entries in compiled for c in entries for key in c.dependencies}
+    )
+    alias_sizes = dict(initial_alias_sizes or {})
+
+    # Waiting participants (index -> arrival time) and, per group and entry,
+    # the waiting participants in that bucket; both in arrival order
+    waiting: OrderedDict[int, float] = OrderedDict()
+    buckets = [[OrderedDict() for _ in group["composition"]] for group in groups]
+    # Participant index -> [(group index, entry index)] memberships
+    memberships: dict[int, list[tuple[int, int]]] = {}
+
+    report = TransferSimulationReport()
+    for group in groups:
+        report.group_cohorts[group["id"]] = 0
+        report.group_participants[group["id"]] = 0
+        report.composition_participants[group["id"]] = {
+            entry["id"]: 0 for entry in group["composition"]
+        }
+
+    def remove(index: int) -> None:
+        del waiting[index]
+        for g, e in memberships.pop(index):
+            del buckets[g][e][index]
+
+    def expire(now: float, timeout: float) -> None:
+        while waiting:
+            index, arrived = next(iter(waiting.items()))
+            if arrived + timeout > now:
+                return
+            report.timed_out += 1
+            if not memberships[index]:
+                report.timed_out_unmatchable += 1
+            report.duration = max(report.duration, arrived + timeout)
+            remove(index)
+
+    def alias_size(group: dict) -> float:
+        alias = group.get("targetCohortAlias")
+        return alias_sizes.get(alias, 0) if alias else math.inf
+
+    def form_cohort(g: int, arriving: int, now: float) -> None:
+        group = groups[g]
+        members: list[int] = []
+        for e, entry in enumerate(group["composition"]):
+            bucket = buckets[g][e]
+            selected = [arriving] if arriving in bucket else []
+            for index in bucket:
+                if len(selected) >= entry["maxCount"]:
+                    break
+                if index != arriving:
+                    selected.append(index)
+            selected = selected[: entry["maxCount"]]
+            report.composition_participants[group["id"]][entry["id"]] += len(selected)
+            members.extend(selected)
+
+        first_arrival = min(waiting[index] for index in members)
+        for index in members:
+            report.wait_times.append(now - waiting[index])
+            remove(index)
+
+        size = len(members)
+        report.matched += size
+        report.cohorts += 1
+        report.fill_times.append(now - first_arrival)
+        report.cohort_sizes[size] = report.cohort_sizes.get(size, 0) + 1
+        report.group_cohorts[group["id"]] += 1
+        report.group_participants[group["id"]] += size
+
+        alias = group.get("targetCohortAlias")
+        if alias:
+            report.alias_participants[alias] = (
+                report.alias_participants.get(alias, 0) + size
+            )
+            current = alias_sizes.get(alias, 0)
+            if (
+                max_participants_per_cohort is not None
+                and current + size > max_participants_per_cohort
+            ):
+                # Overflow cohorts are not counted towards the alias cohort
+                report.overflow_transfers += 1
+            else:
+                alias_sizes[alias] = current + size
+        elif (cohort_min is not None and size < cohort_min) or (
+            cohort_max is not None and size > cohort_max
+        ):
+            report.out_of_bounds_cohorts += 1
+
+    if arrival_times is not None:
+        times = iter(arrival_times)
+    else:
+        assert arrival_rate is not None  # checked above
+        times = _poisson_arrivals(arrival_rate, rng)
+    now = 0.0
+    start: Optional[float] = None
+    for first in range(0, num_arrivals, batch_size):
+        size = min(batch_size, num_arrivals - first)
+        table = _sample_answer_table(answers, size, first, keys, rng)
+        masks = [[c.mask(table) for c in entries] for entries in compiled]
+
+        for offset in range(size):
+            try:
+                now = next(times)
+            except StopIteration:
+                break
+            if start is None:
+                start = now
+            index = first + offset
+            report.arrivals += 1
+            if timeout is not None:
+                expire(now, timeout)
+
+            # First matching composition entry within each group
+            waiting[index] = now
+            joined = []
+            for g, group_masks in enumerate(masks):
+                for e, mask in enumerate(group_masks):
+                    if mask[offset]:
+                        buckets[g][e][index] = None
+                        joined.append((g, e))
+                        break
+            memberships[index] = joined
+
+            # Ready groups that include the arriving participant
+            ready = None
+            for g, _ in joined:
+                entries = groups[g]["composition"]
+                if all(
+                    len(buckets[g][e]) >= entry["minCount"]
+                    for e, entry in enumerate(entries)
+                ):
+                    if not balancing:
+                        ready = g
+                        break
+                    if ready is None or alias_size(groups[g]) < alias_size(
+                        groups[ready]
+                    ):
+                        ready = g
+            if ready is not None:
+                form_cohort(ready, index, now)
+            report.duration = max(report.duration, now)
+
+    # No further arrivals: everyone left waiting times out (or waits forever)
+    if timeout is not None:
+        expire(math.inf, timeout)
+    else:
+        report.waiting = len(waiting)
+    if start is not None:
+        report.duration -= start
+    return report
+
+
+# ============================================================================
+# Variable assignment
+# ============================================================================
+
+
+class _SeededRandom:
+    """Port of the seeded LCG in utils/src/utils/random.utils.ts."""
+
+    def __init__(self, seed: str):
+        # Seeds are hashed with md5 (first 4 bytes, big-endian), as in Node
+        digest = hashlib.md5(seed.encode("utf-8")).digest()
+        self.state = int.from_bytes(digest[:4], "big")
+
+    def random(self) -> float:
+        self.state = (1664525 * self.state + 1013904223) % 2**32
+        return self.state / 2**32
+
+    def randint(self, low: int, high: int) -> int:
+        return math.floor(self.random() * (high - low + 1)) + low
+
+
+def _choices(values: list[T], n: int, seed: str) -> list[T]:
+    """Port of choices(): n distinct values drawn without replacement."""
+    rng = _SeededRandom(seed)
+    pool = list(values)
+    return [pool.pop(rng.randint(0, len(pool) - 1)) for _ in range(n)]
+
+
+def _weighted_index(weights: list[float], position: float) -> int:
+    """Index of the first cumulative weight above `position`."""
+    cumulative = 0.0
+    for index, weight in enumerate(weights):
+        cumulative += weight
+        if position < cumulative:
+            return index
+    return len(weights) - 1
+
+
+def _weighted_choice(
+    values: list[str], weights: Optional[list[float]], seed: str
+) -> str:
+    """Port of weightedChoice()."""
+    rng = _SeededRandom(seed)
+    if not weights or len(weights) != len(values) or sum(weights) == 0:
+        return values[rng.randint(0, len(values) - 1)]
+    return values[_weighted_index(weights, rng.random() * sum(weights))]
+
+
+def _weighted_round_robin(
+    values: list[str], position: int, weights: Optional[list[float]]
+) -> str:
+    """Port of weightedRoundRobin()."""
+    if not weights or len(weights) != len(values) or sum(weights) == 0:
+        return values[position % len(values)]
+    return values[_weighted_index(weights, position % sum(weights))]
+
+
+def _parse_json_value(text: str) -> Any:
+    """Port of parseJsonValue(); integral numbers stay integers, as in JS."""
+    try:
+        return json.loads(
+            text,
+            parse_float=lambda s: int(float(s)) if float(s).is_integer() else float(s),
+        )
+    except ValueError:
+        return text
+
+
+def _stringify(value: Any) -> str:
+    """Equivalent of JSON.stringify for parsed variable values."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _expected_shares(config: dict) -> dict[str, float]:
+    """Expected share of each value for a balanced assignment config."""
+    values = config["values"]
+    weights = config.get("weights")
+    if not weights or len(weights) != len(values) or sum(weights) == 0:
+        weights = [1.0] * len(values)
+    total = sum(weights)
+    shares: dict[str, float] = {}
+    for value, weight in zip(values, weights):
+        shares[value] = shares.get(value, 0.0) + weight / total
+    return shares
+
+
+def _max_deviation(counts: dict[str, int], expected: dict[str, float]) -> float:
+    """Largest absolute difference between realized and expected shares."""
+    total = sum(counts.values())
+    if not total:
+        return 0.0
+    return max(
+        abs(counts.get(value, 0) / total - share) for value, share in expected.items()
+    )
+
+
+def _generate_variables(
+    scoped: list[tuple[dict, Optional[int]]],
+    context: dict[str, str],
+    positions: Optional[dict[str, int]] = None,
+) -> dict[str, str]:
+    """
+    Generate the variableMap for one scope context (see
+    generateVariablesForScope). `positions` holds the participant counts
+    used by round-robin assignment, keyed by BalanceAcross value.
+    """
+    variables: dict[str, str] = {}
+    for config, seed_index in scoped:
+        name = config["definition"]["name"]
+        kind = config["type"]
+        if kind == "static":
+            value = config["value"]
+            cohort_values = config.get("cohortValues") or {}
+            if "cohortId" in context:
+                value = cohort_values.get(context["cohortId"], value)
+            variables[name] = _stringify(_parse_json_value(value))
+
+        elif kind == "random_permutation":
+            values = config["values"]
+            if not values:
+                raise ValueError(f'Variable "{name}" has no values to select from')
+            num = config.get("numToSelect")
+            num = max(1, min(int(num) if num is not None else len(values), len(values)))
+            shuffle = config["shuffleConfig"]
+            if shuffle["shuffle"]:
+                strategy = shuffle["seed"]
+                if strategy == "custom":
+                    seed = shuffle.get("customSeed", "")
+                else:
+                    seed = context.get(f"{strategy}Id", "")
+                if seed_index is not None:
+                    seed = f"{seed}::{seed_index}"
+                selected = _choices(values, num, seed)
+            else:
+                selected = values[:num]
+            parsed = [_parse_json_value(value) for value in selected]
+            if config.get("expandListToSeparateVariables"):
+                for index, item in enumerate(parsed):
+                    variables[f"{name}_{index + 1}"] = _stringify(item)
+            else:
+                variables[name] = _stringify(parsed)
+
+        elif kind == "balanced_assignment":
+            if positions is None or not config["values"]:
+                continue  # requires participant scope and a value pool
+            if config["balanceStrategy"] == "random":
+                variables[name] = _weighted_choice(
+                    config["values"],
+                    config.get("weights"),
+                    f"{context['participantId']}-{name}",
+                )
+            else:
+                across = config.get("balanceAcross", "experiment")
+                variables[name] = _weighted_round_robin(
+                    config["values"], positions[across], config.get("weights")
+                )
+    return variables
+
+
+def _scoped_configs(
+    configs: list[dict], scope: str
+) -> list[tuple[dict, Optional[int]]]:
+    """Configs in a scope, with their seed index (None keeps the bare seed)."""
+    scoped = []
+    first_shuffled = True
+    for seed_index, config in enumerate(c for c in configs if c["scope"] == scope):
+        index = None
+        if config["type"] == "random_permutation":
+            index = None if first_shuffled else seed_index
+            if config["shuffleConfig"]["shuffle"]:
+                first_shuffled = False
+        scoped.append((config, index))
+    return scoped
+
+
+@dataclass
+class VariableAssignmentReport:
+    """Outcome of simulate_variable_assignment()."""
+
+    runs: int = 0
+    participants: int = 0
+    cohorts: int = 0
+    # Variable name -> value (JSON string) -> participants who saw it
+    counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    # Balanced assignment variable name -> value -> expected share
+    expected: dict[str, dict[str, float]] = field(default_factory=dict)
+    # Balanced assignment variable name -> max |realized - expected share|,
+    # one entry per run (across the experiment) / per cohort
+    run_deviation: dict[str, list[float]] = field(default_factory=dict)
+    cohort_deviation: dict[str, list[float]] = field(default_factory=dict)
+
+    def shares(self, name: str) -> dict[str, float]:
+        """Realized share of each value of a variable."""
+        counts = self.counts.get(name, {})
+        total = sum(counts.values())
+        if not total:
+            return {}
+        return {value: count / total for value, count in counts.items()}
+
+    def summary(self) -> dict:
+        """Per-variable counts and imbalance statistics."""
+        variables = {}
+        for name, counts in self.counts.items():
+            stats: dict[str, Any] = {
+                "counts": dict(sorted(counts.items(), key=lambda item: -item[1])),
+                "distinctValues": len(counts),
+                "imbalance": _imbalance(counts.values()),
+            }
+            if name in self.expected:
+                total = sum(counts.values())
+                expected = self.expected[name]
+                stats["expected"] = expected
+                stats["chiSquare"] = sum(
+                    (counts.get(value, 0) - share * total) ** 2 / (share * total)
+                    for value, share in expected.items()
+                    if share > 0 and total
+                )
+                stats["runDeviation"] = {
+                    "max": max(self.run_deviation[name], default=0.0),
+                    **_percentiles(self.run_deviation[name]),
+                }
+                stats["cohortDeviation"] = {
+                    "max": max(self.cohort_deviation[name], default=0.0),
+                    **_percentiles(self.cohort_deviation[name]),
+                }
+            variables[name] = stats
+        return {
+            "runs": self.runs,
+            "participants": self.participants,
+            "cohorts": self.cohorts,
+            "variables": variables,
+        }
+
+
+def simulate_variable_assignment(
+    variable_configs: list[Any],
+    num_participants: int,
+    cohort_size: Optional[int] = None,
+    runs: int = 1,
+    experiment_id: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> VariableAssignmentReport:
+    """
+    Draw variable assignments for synthetic experiments.
+
+    Each run creates one experiment, then participants join in order and
+    fill cohorts of `cohort_size` one after another (all participants share
+    one cohort if omitted); cohort-scoped variables are drawn when a cohort
+    is created and participant-scoped ones when a participant joins. Seeds
+    follow the server: shuffles are seeded by experiment / cohort /
+    participant ID or the custom seed, with later shuffled configs in a
+    scope mixing their position into the seed; random balanced assignment
+    is seeded by "<participantId>-<name>"; round robin uses the number of
+    earlier participants in the experiment or cohort (no join races).
+    Static cohortValues are keyed by cohort ID ("cohort-<n>" here).
+
+    Args:
+        variable_configs: Experiment variableConfigs (models or dicts)
+        num_participants: Participants per run
+        cohort_size: Participants per cohort (one cohort if omitted)
+        runs: Number of independent experiments to simulate
+        experiment_id: Fixed experiment ID (reproduces experiment-seeded
+                       shuffles of a real experiment); random per run if omitted
+        seed: Random seed for synthetic IDs
+
+    Returns:
+        VariableAssignmentReport with participant-level counts per variable
+    """
+    configs = [_as_dict(config) for config in variable_configs]
+    scopes = {
+        scope: _scoped_configs(configs, scope)
+        for scope in ("experiment", "cohort", "participant")
+    }
+    balanced = {
+        config["definition"]["name"]: _expected_shares(config)
+        for config, _ in scopes["participant"]
+        if config["type"] == "balanced_assignment" and config["values"]
+    }
+    rng = random.Random(seed)
+    report = VariableAssignmentReport(expected=balanced)
+    report.run_deviation = {name: [] for name in balanced}
+    report.cohort_deviation = {name: [] for name in balanced}
+    size = cohort_size or max(num_participants, 1)
+
+    def count(target: dict[str, dict[str, int]], variables: dict[str, str], n: int):
+        for name, value in variables.items():
+            values = target.setdefault(name, {})
+            values[value] = values.get(value, 0) + n
+
+    for _ in range(runs):
+        context = {"experimentId": experiment_id or f"{rng.getrandbits(64):016x}"}
+        experiment_variables = _generate_variables(scopes["experiment"], context)
+        run_counts: dict[str, dict[str, int]] = {}
+
+        for first in range(0, num_participants, size):
+            members = min(size, num_participants - first)
+            cohort_context = {**context, "cohortId": f"cohort-{report.cohorts}"}
+            report.cohorts += 1
+            shared = {
+                **experiment_variables,
+                **_generate_variables(scopes["cohort"], cohort_context),
+            }
+            count(report.counts, shared, members)
+
+            cohort_counts: dict[str, dict[str, int]] = {}
+            for position in range(members):
+                participant_context = {
+                    **cohort_context,
+                    "participantId": f"{rng.getrandbits(80):020x}",
+                }
+                variables = _generate_variables(
+                    scopes["participant"],
+                    participant_context,
+                    positions={"experiment": first + position, "cohort": position},
+                )
+                count(cohort_counts, variables, 1)
+            for name, values in cohort_counts.items():
+                for target in (report.counts, run_counts):
+                    merged = target.setdefault(name, {})
+                    for value, n in values.items():
+                        merged[value] = merged.get(value, 0) + n
+            for name, expected in balanced.items():
+                report.cohort_deviation[name].append(
+                    _max_deviation(cohort_counts.get(name, {}), expected)
+                )
+
+        for name, expected in balanced.items():
+            report.run_deviation[name].append(
+                _max_deviation(run_counts.get(name, {}), expected)
+            )
+        report.runs += 1
+        report.participants += num_participants
+    return report
@@ -0,0 +1,293 @@
+"""
+Random-access local store for Deliberate Lab experiment exports.
+
+A store is an NDJSON export (see deliberate_lab.ndjson) plus an offset
+index written next to it as `<path>.index.json`. The NDJSON file is read
+through a memory map, so looking up one participant's answers or one
+cohort's chat only decodes the lines involved, regardless of export size.
+
+Usage:
+    import deliberate_lab as dl
+
+    # From an in-memory export
+    store = dl.ExportStore.write("exp123.ndjson", client.export_experiment("exp123"))
+
+    # Or index a file written by Client.export_experiment_to()
+    client.export_experiment_to("exp123", "exp123.ndjson")
+    store = dl.ExportStore.build_index("exp123.ndjson")
+
+    # Later sessions just open the store
+    with dl.ExportStore("exp123.ndjson") as store:
+        answers = store.answer_map("participant-public-id")
+        messages = store.chat("cohort-id", "chat-stage-id")
+"""
+
+from __future__ import annotations
+from typing import Any, Iterator, Optional
+import json
+import mmap
+import os
+
+from deliberate_lab.ndjson import (
+    iter_experiment_records,
+    read_record_header,
+    write_experiment_records,
+)
+
+INDEX_VERSION = 1
+
+# Record type -> index section for records keyed by "id"
+_ID_SECTIONS = {
+    "stage": "stages",
+    "participant": "participants",
+    "cohort": "cohorts",
+    "agentMediator": "agentMediators",
+    "agentParticipant": "agentParticipants",
+}
+
+
+class _IndexBuilder:
+    """Accumulates [offset, length] ranges for records as they are written."""
+
+    def __init__(self):
+        self.index: dict[str, Any] = {
+            "version": INDEX_VERSION,
+            "experiment": None,
+            "stages": {},
+            "participants": {},
+            "cohorts": {},
+            "chats": {},
+            "agentMediators": {},
+            "agentParticipants": {},
+            "alerts": {},
+        }
+
+    @staticmethod
+    def _extend(ranges: dict, key: str, offset: int, length: int) -> None:
+        """Extend the contiguous range for `key` to cover a new line."""
+        if key in ranges:
+            ranges[key][1] = offset + length - ranges[key][0]
+        else:
+            ranges[key] = [offset, length]
+
+    def add(self, record_type: str, keys: dict, offset: int, length: int) -> None:
+        if record_type == "experiment":
+            self.index["experiment"] = [offset, length]
+        elif record_type in _ID_SECTIONS:
+            self.index[_ID_SECTIONS[record_type]][keys["id"]] = [offset, length]
+        elif record_type == "chatMessage":
+            # Messages of one (cohort, stage) are written contiguously
+            chats = self.index["chats"].setdefault(keys["cohortId"], {})
+            self._extend(chats, keys["stageId"], offset, length)
+        elif record_type == "alert":
+            self._extend(self.index["alerts"], keys["participantId"], offset, length)
+
+
+class ExportStore:
+    """
+    Read-only random access to an indexed NDJSON experiment export.
+
+    Lookups raise KeyError for unknown IDs. The store holds an open memory
+    map; use it as a context manager or call close() when done.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open an existing store.
+
+        Args:
+            path: Path to the NDJSON export; its index must exist at
+                  `<path>.index.json` (see write() and build_index())
+        """
+        self.path = path
+        with open(self.index_path(path), "r", encoding="utf-8") as f:
+            self._index = json.load(f)
+        if self._index.get("version") != INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported export store index version: {self._index.get('version')}"
+            )
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        size = os.fstat(self._file.fileno()).st_size
+        self._data: mmap.mmap | bytes = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        )
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    @staticmethod
+    def index_path(path: str) -> str:
+        """Path of the index file for the store at `path`."""
+        return f"{path}.index.json"
+
+    @classmethod
+    def write(cls, path: str, export: dict) -> ExportStore:
+        """
+        Write an export (as returned by Client.export_experiment) to a store.
+
+        Args:
+            path: Destination path for the NDJSON file
+            export: ExperimentDownload dict (full or sectioned)
+
+        Returns:
+            The opened ExportStore
+        """
+        builder = _IndexBuilder()
+        with open(path, "wb") as dest:
+            manifest = write_experiment_records(
+                iter_experiment_records(export), dest, on_record=builder.add
+            )
+        cls._write_index(path, builder, manifest["counts"])
+        return cls(path)
+
+    @classmethod
+    def build_index(cls, path: str) -> ExportStore:
+        """
+        Index an existing NDJSON export (e.g., from Client.export_experiment_to).
+
+        Only record headers are decoded, so indexing is a single fast scan.
+
+        Args:
+            path: Path to the NDJSON export
+
+        Returns:
+            The opened ExportStore
+        """
+        builder = _IndexBuilder()
+        counts: dict[str, int] = {}
+        offset = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    # Blank lines (e.g., a trailing newline) are not records
+                    offset += len(line)
+                    continue
+                header = read_record_header(line)
+                record_type = header.pop("type")
+                counts[record_type] = counts.get(record_type, 0) + 1
+                builder.add(record_type, header, offset, len(line))
+                offset += len(line)
+        cls._write_index(path, builder, counts)
+        return cls(path)
+
+    @classmethod
+    def _write_index(cls, path: str, builder: _IndexBuilder, counts: dict) -> None:
+        builder.index["counts"] = counts
+        with open(cls.index_path(path), "w", encoding="utf-8") as f:
+            json.dump(builder.index, f, separators=(",", ":"))
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> ExportStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read_range(self, span: list[int]) -> Iterator[Any]:
+        """Yield the data of each record line in an [offset, length] range."""
+        offset, length = span
+        for line in self._data[offset : offset + length].splitlines():
+            if line.strip():
+                yield json.loads(line)["data"]
+
+    def _read_one(self, section: str, key: str) -> Any:
+        return next(self._read_range(self._index[section][key]))
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Number of records per record type."""
+        return dict(self._index["counts"])
+
+    def experiment(self) -> dict:
+        """The experiment config."""
+        if self._index["experiment"] is None:
+            raise KeyError("experiment")
+        return next(self._read_range(self._index["experiment"]))
+
+    def stage_ids(self) -> list[str]:
+        return list(self._index["stages"])
+
+    def participant_ids(self) -> list[str]:
+        """Participant public IDs."""
+        return list(self._index["participants"])
+
+    def cohort_ids(self) -> list[str]:
+        return list(self._index["cohorts"])
+
+    def alert_participant_ids(self) -> list[str]:
+        """Private IDs of participants with alerts."""
+        return list(self._index["alerts"])
+
+    def stage(self, stage_id: str) -> dict:
+        """Stage config by stage ID."""
+        return self._read_one("stages", stage_id)
+
+    def participant(self, public_id: str) -> dict:
+        """ParticipantDownload ('profile' and 'answerMap') by public ID."""
+        return self._read_one("participants", public_id)
+
+    def profile(self, public_id: str) -> dict:
+        """Participant profile by public ID."""
+        return self.participant(public_id)["profile"]
+
+    def answer_map(self, public_id: str) -> dict:
+        """Map from stage ID to the participant's stage answer."""
+        return self.participant(public_id).get("answerMap", {})
+
+    def answer(self, public_id: str, stage_id: str) -> Optional[dict]:
+        """The participant's answer for one stage, or None if unanswered."""
+        return self.answer_map(public_id).get(stage_id)
+
+    def cohort(self, cohort_id: str, include_chats: bool = True) -> dict:
+        """
+        CohortDownload ('cohort', 'dataMap' and 'chatMap') by cohort ID.
+
+        Args:
+            cohort_id: The cohort ID
+            include_chats: Whether to read chat transcripts into 'chatMap'
+        """
+        cohort = dict(self._read_one("cohorts", cohort_id))
+        cohort["chatMap"] = self.chat_map(cohort_id) if include_chats else {}
+        return cohort
+
+    def chat_map(self, cohort_id: str) -> dict[str, list[dict]]:
+        """Map from chat stage ID to the cohort's ordered chat messages."""
+        if cohort_id not in self._index["cohorts"]:
+            raise KeyError(cohort_id)
+        return {
+            stage_id: list(self._read_range(span))
+            for stage_id, span in self._index["chats"].get(cohort_id, {}).items()
+        }
+
+    def chat(self, cohort_id: str, stage_id: str) -> list[dict]:
+        """Ordered chat messages of one cohort in one chat stage."""
+        if cohort_id not in self._index["cohorts"]:
+            raise KeyError(cohort_id)
+        span = self._index["chats"].get(cohort_id, {}).get(stage_id)
+        return list(self._read_range(span)) if span else []
+
+    def alerts(self, participant_id: str) -> list[dict]:
+        """Alerts for a participant (keyed by private ID, as in the export)."""
+        span = self._index["alerts"].get(participant_id)
+        return list(self._read_range(span)) if span else []
+
+    def agent_mediator(self, persona_id: str) -> dict:
+        return self._read_one("agentMediators", persona_id)
+
+    def agent_participant(self, persona_id: str) -> dict:
+        return self._read_one("agentParticipants", persona_id)
+
+    def iter_participants(self) -> Iterator[tuple[str, dict]]:
+        """Iterate over (public ID, ParticipantDownload) pairs in file order."""
+        for public_id, span in self._index["participants"].items():
+            yield public_id, next(self._read_range(span))
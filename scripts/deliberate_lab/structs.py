@@ -0,0 +1,7136 @@
+# AUTO-GENERATED FILE — DO NOT EDIT BY HAND.
+# Regenerate via: npm run update-schemas (from repo root).
+#
+# pylint: disable=too-many-lines,invalid-name,redefined-builtin,too-many-statements
+"""
+Lightweight struct types for the Deliberate Lab API schemas.
+
+A faster alternative to the Pydantic models in deliberate_lab.types, for
+bulk work such as decoding many experiment templates or exports. Every
+schema object is a `__slots__` class with the same name and fields as its
+Pydantic model, plus generated from_dict() / to_dict() methods:
+
+- from_dict() checks required fields and union tags (e.g. a stage's
+  'kind'), applies defaults and builds nested structs, but does not check
+  primitive types or value constraints; validate with the Pydantic models
+  when that matters.
+- to_dict() returns the same dict as
+  model_dump(mode="json", by_alias=True, exclude_none=True).
+
+Client methods accept these structs wherever they accept Pydantic models.
+
+Usage:
+    from deliberate_lab import structs
+
+    template = structs.decode(raw_json_bytes, structs.ExperimentTemplate)
+    template.stageConfigs[0].name
+    client.create_experiment(template=template)
+
+    # Convert to and from the Pydantic backend
+    model = template.to_model()
+    template = structs.ExperimentTemplate.from_model(model)
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Optional, TypeVar
+import json
+
+SCHEMA_ID = "DeliberateLabSchemas"
+
+StructT = TypeVar("StructT", bound="Struct")
+
+
+class DecodeError(ValueError):
+    """Raised when data does not match a struct type."""
+
+
+class Struct:
+    """Base class of the generated structs."""
+
+    __slots__ = ()
+    # JSON keys of the fields, in schema order
+    __json_fields__: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls: type[StructT], data: dict) -> StructT:
+        """Build a struct (and its nested structs) from JSON-ready data."""
+        raise NotImplementedError
+
+    def to_dict(self) -> dict:
+        """Same dict as model_dump(mode="json", by_alias=True, exclude_none=True)."""
+        raise NotImplementedError
+
+    @classmethod
+    def from_json(cls: type[StructT], data: bytes | str) -> StructT:
+        return cls.from_dict(json.loads(data))
+
+    def to_json(self) -> bytes:
+        return encode(self)
+
+    @classmethod
+    def from_model(cls: type[StructT], model: Any) -> StructT:
+        """Convert a Pydantic model from deliberate_lab.types."""
+        return cls.from_dict(
+            model.model_dump(mode="json", by_alias=True, exclude_none=True)
+        )
+
+    def to_model(self) -> Any:
+        """Convert to the Pydantic model of the same name (validates)."""
+        from deliberate_lab import types  # pylint: disable=import-outside-toplevel
+
+        return getattr(types, type(self).__name__).model_validate(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if name != "_extra" and getattr(self, name) is not None
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+def decode(data: bytes | str | dict, type: type[StructT]) -> StructT:
+    """Decode JSON bytes / text (or an already parsed dict) into a struct."""
+    parsed = data if isinstance(data, dict) else json.loads(data)
+    return type.from_dict(parsed)
+
+
+def encode(value: Struct) -> bytes:
+    """Encode a struct as compact UTF-8 JSON."""
+    return json.dumps(
+        value.to_dict(), separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _missing(cls: type, error: KeyError) -> DecodeError:
+    return DecodeError(f"{cls.__name__}: missing required field {error}")
+
+
+def _mismatch(cls: type, field: str, expected: Any, value: Any) -> DecodeError:
+    return DecodeError(f"{cls.__name__}: expected {field}={expected!r}, got {value!r}")
+
+
+def _not_object(cls: type, data: Any) -> DecodeError:
+    return DecodeError(f"{cls.__name__}: expected an object, got {data!r:.80}")
+
+
+def _decode_best(
+    value: Any, decoders: tuple[Callable[[dict], Struct], ...], name: str
+) -> Struct:
+    """
+    Decode an untagged union value like Pydantic's smart mode: of the
+    members that accept it, pick the one that uses the most of its keys.
+    """
+    best, best_fields = None, -1
+    for decoder in decoders:
+        try:
+            result = decoder(value)
+        except (DecodeError, KeyError, TypeError, AttributeError):
+            continue
+        fields = sum(1 for key in result.__json_fields__ if key in value)
+        if fields > best_fields:
+            best, best_fields = result, fields
+    if best is None:
+        raise DecodeError(f"{name}: no member matches {value!r:.80}")
+    return best
+
+
+def _encode(value: Any) -> Any:
+    """to_dict() for values of union-typed fields (structs, lists, dicts)."""
+    if isinstance(value, Struct):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    return value
+
+
+class DeliberateLabAPISchemas(Struct):
+    __slots__ = ("experimentCreation",)
+    __json_fields__ = ("experimentCreation",)
+
+    def __init__(self, *, experimentCreation: ExperimentCreation) -> None:
+        self.experimentCreation = experimentCreation
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DeliberateLabAPISchemas:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.experimentCreation = ExperimentCreation.from_dict(
+                data["experimentCreation"]
+            )
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["experimentCreation"] = self.experimentCreation.to_dict()
+        return data
+
+
+class ExperimentCreation(Struct):
+    __slots__ = (
+        "collectionName",
+        "experimentTemplate",
+    )
+    __json_fields__ = (
+        "collectionName",
+        "experimentTemplate",
+    )
+
+    def __init__(
+        self, *, collectionName: str, experimentTemplate: ExperimentTemplate
+    ) -> None:
+        self.collectionName = collectionName
+        self.experimentTemplate = experimentTemplate
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ExperimentCreation:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.collectionName = data["collectionName"]
+            self.experimentTemplate = ExperimentTemplate.from_dict(
+                data["experimentTemplate"]
+            )
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["collectionName"] = self.collectionName
+        data["experimentTemplate"] = self.experimentTemplate.to_dict()
+        return data
+
+
+class ExperimentTemplate(Struct):
+    __slots__ = (
+        "id",
+        "experiment",
+        "stageConfigs",
+        "agentMediators",
+        "agentParticipants",
+    )
+    __json_fields__ = (
+        "id",
+        "experiment",
+        "stageConfigs",
+        "agentMediators",
+        "agentParticipants",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        experiment: Experiment,
+        stageConfigs: list[
+            AssetAllocationStageConfig
+            | MultiAssetAllocationStageConfig
+            | ChatStageConfig
+            | ChipStageConfig
+            | ComprehensionStageConfig
+            | FlipCardStageConfig
+            | InfoStageConfig
+            | PayoutStageConfig
+            | PrivateChatStageConfig
+            | ProfileStageConfig
+            | ItemRankingStageConfig
+            | ParticipantRankingStageConfig
+            | RevealStageConfig
+            | RoleStageConfig
+            | NegotiationProfileStageConfig
+            | NegotiationPayoutStageConfig
+            | SalespersonStageConfig
+            | StockInfoStageConfig
+            | SurveyPerParticipantStageConfig
+            | SurveyStageConfig
+            | TOSStageConfig
+            | TransferStageConfig
+        ],
+        agentMediators: list[AgentMediatorTemplate],
+        agentParticipants: list[AgentParticipantTemplate],
+    ) -> None:
+        self.id = id
+        self.experiment = experiment
+        self.stageConfigs = stageConfigs
+        self.agentMediators = agentMediators
+        self.agentParticipants = agentParticipants
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ExperimentTemplate:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.experiment = Experiment.from_dict(data["experiment"])
+            self.stageConfigs = [_decode_union_0(v0) for v0 in data["stageConfigs"]]
+            self.agentMediators = [
+                AgentMediatorTemplate.from_dict(v0) for v0 in data["agentMediators"]
+            ]
+            self.agentParticipants = [
+                AgentParticipantTemplate.from_dict(v0)
+                for v0 in data["agentParticipants"]
+            ]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["experiment"] = self.experiment.to_dict()
+        data["stageConfigs"] = [v0.to_dict() for v0 in self.stageConfigs]
+        data["agentMediators"] = [v0.to_dict() for v0 in self.agentMediators]
+        data["agentParticipants"] = [v0.to_dict() for v0 in self.agentParticipants]
+        return data
+
+
+class Experiment(Struct):
+    __slots__ = (
+        "id",
+        "versionId",
+        "metadata",
+        "permissions",
+        "defaultCohortConfig",
+        "prolificConfig",
+        "stageIds",
+        "cohortLockMap",
+        "variableConfigs",
+        "variableMap",
+        "cohortDefinitions",
+    )
+    __json_fields__ = (
+        "id",
+        "versionId",
+        "metadata",
+        "permissions",
+        "defaultCohortConfig",
+        "prolificConfig",
+        "stageIds",
+        "cohortLockMap",
+        "variableConfigs",
+        "variableMap",
+        "cohortDefinitions",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        versionId: float,
+        metadata: Metadata,
+        permissions: Permissions,
+        defaultCohortConfig: CohortParticipantConfig,
+        prolificConfig: ProlificConfig,
+        stageIds: list[str],
+        cohortLockMap: dict[str, bool],
+        variableConfigs: (
+            list[
+                StaticVariableConfig
+                | RandomPermutationVariableConfig
+                | BalancedAssignmentVariableConfig
+            ]
+            | None
+        ) = None,
+        variableMap: dict[str, str] | None = None,
+        cohortDefinitions: list[CohortDefinition] | None = None,
+    ) -> None:
+        self.id = id
+        self.versionId = versionId
+        self.metadata = metadata
+        self.permissions = permissions
+        self.defaultCohortConfig = defaultCohortConfig
+        self.prolificConfig = prolificConfig
+        self.stageIds = stageIds
+        self.cohortLockMap = cohortLockMap
+        self.variableConfigs = variableConfigs
+        self.variableMap = variableMap
+        self.cohortDefinitions = cohortDefinitions
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Experiment:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.versionId = data["versionId"]
+            self.metadata = Metadata.from_dict(data["metadata"])
+            self.permissions = Permissions.from_dict(data["permissions"])
+            self.defaultCohortConfig = CohortParticipantConfig.from_dict(
+                data["defaultCohortConfig"]
+            )
+            self.prolificConfig = ProlificConfig.from_dict(data["prolificConfig"])
+            self.stageIds = data["stageIds"]
+            self.cohortLockMap = data["cohortLockMap"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("variableConfigs")
+        self.variableConfigs = (
+            None if value is None else [_decode_union_2(v0) for v0 in value]
+        )
+        self.variableMap = data.get("variableMap")
+        value = data.get("cohortDefinitions")
+        self.cohortDefinitions = (
+            None if value is None else [CohortDefinition.from_dict(v0) for v0 in value]
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["versionId"] = self.versionId
+        data["metadata"] = self.metadata.to_dict()
+        data["permissions"] = self.permissions.to_dict()
+        data["defaultCohortConfig"] = self.defaultCohortConfig.to_dict()
+        data["prolificConfig"] = self.prolificConfig.to_dict()
+        data["stageIds"] = self.stageIds
+        data["cohortLockMap"] = self.cohortLockMap
+        value = self.variableConfigs
+        if value is not None:
+            data["variableConfigs"] = [v0.to_dict() for v0 in value]
+        value = self.variableMap
+        if value is not None:
+            data["variableMap"] = value
+        value = self.cohortDefinitions
+        if value is not None:
+            data["cohortDefinitions"] = [v0.to_dict() for v0 in value]
+        return data
+
+
+class AssetAllocationStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "stockConfig",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "stockConfig",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        stockConfig: StockConfig,
+        kind: str = "assetAllocation",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.stockConfig = stockConfig
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AssetAllocationStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.stockConfig = StockConfig.from_dict(data["stockConfig"])
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "assetAllocation")
+        if value != "assetAllocation":
+            raise _mismatch(cls, "kind", "assetAllocation", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["stockConfig"] = self.stockConfig.to_dict()
+        return data
+
+
+class MultiAssetAllocationStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "stockOptions",
+        "stockInfoStageId",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "stockOptions",
+        "stockInfoStageId",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        stockOptions: list[Stock],
+        stockInfoStageId: str,
+        kind: str = "multiAssetAllocation",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.stockOptions = stockOptions
+        self.stockInfoStageId = stockInfoStageId
+
+    @classmethod
+    def from_dict(cls, data: dict) -> MultiAssetAllocationStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.stockOptions = [Stock.from_dict(v0) for v0 in data["stockOptions"]]
+            self.stockInfoStageId = data["stockInfoStageId"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "multiAssetAllocation")
+        if value != "multiAssetAllocation":
+            raise _mismatch(cls, "kind", "multiAssetAllocation", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["stockOptions"] = [v0.to_dict() for v0 in self.stockOptions]
+        data["stockInfoStageId"] = self.stockInfoStageId
+        return data
+
+
+class ChatStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "timeLimitInMinutes",
+        "timeMinimumInMinutes",
+        "discussions",
+        "isTurnBased",
+        "enableReactionsAndReplies",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "timeLimitInMinutes",
+        "timeMinimumInMinutes",
+        "discussions",
+        "isTurnBased",
+        "enableReactionsAndReplies",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        discussions: list[DefaultChatDiscussion | CompareChatDiscussion],
+        kind: str = "chat",
+        anonymousProfileSetId: str | None = None,
+        timeLimitInMinutes: int | None = None,
+        timeMinimumInMinutes: int | None = None,
+        isTurnBased: bool | None = None,
+        enableReactionsAndReplies: bool | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.timeLimitInMinutes = timeLimitInMinutes
+        self.timeMinimumInMinutes = timeMinimumInMinutes
+        self.discussions = discussions
+        self.isTurnBased = isTurnBased
+        self.enableReactionsAndReplies = enableReactionsAndReplies
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChatStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.discussions = [_decode_union_3(v0) for v0 in data["discussions"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "chat")
+        if value != "chat":
+            raise _mismatch(cls, "kind", "chat", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        self.timeLimitInMinutes = data.get("timeLimitInMinutes")
+        self.timeMinimumInMinutes = data.get("timeMinimumInMinutes")
+        self.isTurnBased = data.get("isTurnBased")
+        self.enableReactionsAndReplies = data.get("enableReactionsAndReplies")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        value = self.timeLimitInMinutes
+        if value is not None:
+            data["timeLimitInMinutes"] = value
+        value = self.timeMinimumInMinutes
+        if value is not None:
+            data["timeMinimumInMinutes"] = value
+        data["discussions"] = [v0.to_dict() for v0 in self.discussions]
+        value = self.isTurnBased
+        if value is not None:
+            data["isTurnBased"] = value
+        value = self.enableReactionsAndReplies
+        if value is not None:
+            data["enableReactionsAndReplies"] = value
+        return data
+
+
+class ChipStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "enableChat",
+        "numRounds",
+        "chips",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "enableChat",
+        "numRounds",
+        "chips",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        enableChat: bool,
+        numRounds: float,
+        chips: list[ChipItem],
+        kind: str = "chip",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.enableChat = enableChat
+        self.numRounds = numRounds
+        self.chips = chips
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChipStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.enableChat = data["enableChat"]
+            self.numRounds = data["numRounds"]
+            self.chips = [ChipItem.from_dict(v0) for v0 in data["chips"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "chip")
+        if value != "chip":
+            raise _mismatch(cls, "kind", "chip", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["enableChat"] = self.enableChat
+        data["numRounds"] = self.numRounds
+        data["chips"] = [v0.to_dict() for v0 in self.chips]
+        return data
+
+
+class ComprehensionStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "questions",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "questions",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        questions: list[TextQuestion | McQuestion],
+        kind: str = "comprehension",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.questions = questions
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ComprehensionStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.questions = [_decode_union_4(v0) for v0 in data["questions"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "comprehension")
+        if value != "comprehension":
+            raise _mismatch(cls, "kind", "comprehension", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["questions"] = [v0.to_dict() for v0 in self.questions]
+        return data
+
+
+class FlipCardStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "cards",
+        "enableSelection",
+        "allowMultipleSelections",
+        "requireConfirmation",
+        "minUniqueCardsFlippedRequirement",
+        "shuffleCards",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "cards",
+        "enableSelection",
+        "allowMultipleSelections",
+        "requireConfirmation",
+        "minUniqueCardsFlippedRequirement",
+        "shuffleCards",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        cards: list[FlipCard],
+        enableSelection: bool,
+        allowMultipleSelections: bool,
+        requireConfirmation: bool,
+        minUniqueCardsFlippedRequirement: float,
+        shuffleCards: bool,
+        kind: str = "flipcard",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.cards = cards
+        self.enableSelection = enableSelection
+        self.allowMultipleSelections = allowMultipleSelections
+        self.requireConfirmation = requireConfirmation
+        self.minUniqueCardsFlippedRequirement = minUniqueCardsFlippedRequirement
+        self.shuffleCards = shuffleCards
+
+    @classmethod
+    def from_dict(cls, data: dict) -> FlipCardStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.cards = [FlipCard.from_dict(v0) for v0 in data["cards"]]
+            self.enableSelection = data["enableSelection"]
+            self.allowMultipleSelections = data["allowMultipleSelections"]
+            self.requireConfirmation = data["requireConfirmation"]
+            self.minUniqueCardsFlippedRequirement = data[
+                "minUniqueCardsFlippedRequirement"
+            ]
+            self.shuffleCards = data["shuffleCards"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "flipcard")
+        if value != "flipcard":
+            raise _mismatch(cls, "kind", "flipcard", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["cards"] = [v0.to_dict() for v0 in self.cards]
+        data["enableSelection"] = self.enableSelection
+        data["allowMultipleSelections"] = self.allowMultipleSelections
+        data["requireConfirmation"] = self.requireConfirmation
+        data["minUniqueCardsFlippedRequirement"] = self.minUniqueCardsFlippedRequirement
+        data["shuffleCards"] = self.shuffleCards
+        return data
+
+
+class InfoStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "infoLines",
+        "youtubeVideoId",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "infoLines",
+        "youtubeVideoId",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        infoLines: list[str],
+        kind: str = "info",
+        anonymousProfileSetId: str | None = None,
+        youtubeVideoId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.infoLines = infoLines
+        self.youtubeVideoId = youtubeVideoId
+
+    @classmethod
+    def from_dict(cls, data: dict) -> InfoStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.infoLines = data["infoLines"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "info")
+        if value != "info":
+            raise _mismatch(cls, "kind", "info", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        self.youtubeVideoId = data.get("youtubeVideoId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["infoLines"] = self.infoLines
+        value = self.youtubeVideoId
+        if value is not None:
+            data["youtubeVideoId"] = value
+        return data
+
+
+class PayoutStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "currency",
+        "payoutItems",
+        "averageAllPayoutItems",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "currency",
+        "payoutItems",
+        "averageAllPayoutItems",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        currency: str,
+        payoutItems: list[DefaultPayoutItem | ChipPayoutItem | SurveyPayoutItem],
+        averageAllPayoutItems: bool,
+        kind: str = "payout",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.currency = currency
+        self.payoutItems = payoutItems
+        self.averageAllPayoutItems = averageAllPayoutItems
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PayoutStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.currency = data["currency"]
+            self.payoutItems = [_decode_union_5(v0) for v0 in data["payoutItems"]]
+            self.averageAllPayoutItems = data["averageAllPayoutItems"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "payout")
+        if value != "payout":
+            raise _mismatch(cls, "kind", "payout", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["currency"] = self.currency
+        data["payoutItems"] = [v0.to_dict() for v0 in self.payoutItems]
+        data["averageAllPayoutItems"] = self.averageAllPayoutItems
+        return data
+
+
+class PrivateChatStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "timeLimitInMinutes",
+        "timeMinimumInMinutes",
+        "isTurnBasedChat",
+        "minNumberOfTurns",
+        "maxNumberOfTurns",
+        "preventCancellation",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "timeLimitInMinutes",
+        "timeMinimumInMinutes",
+        "isTurnBasedChat",
+        "minNumberOfTurns",
+        "maxNumberOfTurns",
+        "preventCancellation",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        kind: str = "privateChat",
+        anonymousProfileSetId: str | None = None,
+        timeLimitInMinutes: int | None = None,
+        timeMinimumInMinutes: int | None = None,
+        isTurnBasedChat: bool | None = None,
+        minNumberOfTurns: float | None = None,
+        maxNumberOfTurns: float | None = None,
+        preventCancellation: bool | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.timeLimitInMinutes = timeLimitInMinutes
+        self.timeMinimumInMinutes = timeMinimumInMinutes
+        self.isTurnBasedChat = isTurnBasedChat
+        self.minNumberOfTurns = minNumberOfTurns
+        self.maxNumberOfTurns = maxNumberOfTurns
+        self.preventCancellation = preventCancellation
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PrivateChatStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "privateChat")
+        if value != "privateChat":
+            raise _mismatch(cls, "kind", "privateChat", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        self.timeLimitInMinutes = data.get("timeLimitInMinutes")
+        self.timeMinimumInMinutes = data.get("timeMinimumInMinutes")
+        self.isTurnBasedChat = data.get("isTurnBasedChat")
+        self.minNumberOfTurns = data.get("minNumberOfTurns")
+        self.maxNumberOfTurns = data.get("maxNumberOfTurns")
+        self.preventCancellation = data.get("preventCancellation")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        value = self.timeLimitInMinutes
+        if value is not None:
+            data["timeLimitInMinutes"] = value
+        value = self.timeMinimumInMinutes
+        if value is not None:
+            data["timeMinimumInMinutes"] = value
+        value = self.isTurnBasedChat
+        if value is not None:
+            data["isTurnBasedChat"] = value
+        value = self.minNumberOfTurns
+        if value is not None:
+            data["minNumberOfTurns"] = value
+        value = self.maxNumberOfTurns
+        if value is not None:
+            data["maxNumberOfTurns"] = value
+        value = self.preventCancellation
+        if value is not None:
+            data["preventCancellation"] = value
+        return data
+
+
+class ProfileStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "profileType",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "profileType",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        profileType: str,
+        kind: str = "profile",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.profileType = profileType
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProfileStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.profileType = data["profileType"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "profile")
+        if value != "profile":
+            raise _mismatch(cls, "kind", "profile", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["profileType"] = self.profileType
+        return data
+
+
+class ItemRankingStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "rankingType",
+        "strategy",
+        "rankingItems",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "rankingType",
+        "strategy",
+        "rankingItems",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        strategy: str,
+        rankingItems: list[RankingItem],
+        kind: str = "ranking",
+        anonymousProfileSetId: str | None = None,
+        rankingType: str = "items",
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.rankingType = rankingType
+        self.strategy = strategy
+        self.rankingItems = rankingItems
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ItemRankingStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.strategy = data["strategy"]
+            self.rankingItems = [
+                RankingItem.from_dict(v0) for v0 in data["rankingItems"]
+            ]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "ranking")
+        if value != "ranking":
+            raise _mismatch(cls, "kind", "ranking", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        value = data.get("rankingType", "items")
+        if value != "items":
+            raise _mismatch(cls, "rankingType", "items", value)
+        self.rankingType = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["rankingType"] = self.rankingType
+        data["strategy"] = self.strategy
+        data["rankingItems"] = [v0.to_dict() for v0 in self.rankingItems]
+        return data
+
+
+class ParticipantRankingStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "rankingType",
+        "strategy",
+        "enableSelfVoting",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "rankingType",
+        "strategy",
+        "enableSelfVoting",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        strategy: str,
+        enableSelfVoting: bool,
+        kind: str = "ranking",
+        anonymousProfileSetId: str | None = None,
+        rankingType: str = "participants",
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.rankingType = rankingType
+        self.strategy = strategy
+        self.enableSelfVoting = enableSelfVoting
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ParticipantRankingStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.strategy = data["strategy"]
+            self.enableSelfVoting = data["enableSelfVoting"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "ranking")
+        if value != "ranking":
+            raise _mismatch(cls, "kind", "ranking", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        value = data.get("rankingType", "participants")
+        if value != "participants":
+            raise _mismatch(cls, "rankingType", "participants", value)
+        self.rankingType = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["rankingType"] = self.rankingType
+        data["strategy"] = self.strategy
+        data["enableSelfVoting"] = self.enableSelfVoting
+        return data
+
+
+class RevealStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "items",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "items",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        items: list[
+            ChipRevealItem
+            | RankingRevealItem
+            | SurveyRevealItem
+            | MultiAssetAllocationRevealItem
+        ],
+        kind: str = "reveal",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.items = items
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RevealStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.items = [_decode_union_6(v0) for v0 in data["items"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "reveal")
+        if value != "reveal":
+            raise _mismatch(cls, "kind", "reveal", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["items"] = [v0.to_dict() for v0 in self.items]
+        return data
+
+
+class RoleStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "roles",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "roles",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        roles: list[Role],
+        kind: str = "role",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.roles = roles
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RoleStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.roles = [Role.from_dict(v0) for v0 in data["roles"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "role")
+        if value != "role":
+            raise _mismatch(cls, "kind", "role", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["roles"] = [v0.to_dict() for v0 in self.roles]
+        return data
+
+
+class NegotiationProfileStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "items",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "items",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        items: list[Item],
+        kind: str = "negotiationProfile",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.items = items
+
+    @classmethod
+    def from_dict(cls, data: dict) -> NegotiationProfileStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.items = [Item.from_dict(v0) for v0 in data["items"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "negotiationProfile")
+        if value != "negotiationProfile":
+            raise _mismatch(cls, "kind", "negotiationProfile", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["items"] = [v0.to_dict() for v0 in self.items]
+        return data
+
+
+class NegotiationPayoutStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        kind: str = "negotiationPayout",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+
+    @classmethod
+    def from_dict(cls, data: dict) -> NegotiationPayoutStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "negotiationPayout")
+        if value != "negotiationPayout":
+            raise _mismatch(cls, "kind", "negotiationPayout", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        return data
+
+
+class SalespersonStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        kind: str = "salesperson",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SalespersonStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "salesperson")
+        if value != "salesperson":
+            raise _mismatch(cls, "kind", "salesperson", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        return data
+
+
+class StockInfoStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "stocks",
+        "visibleStockIds",
+        "showBestYearCard",
+        "showWorstYearCard",
+        "requireViewAllStocks",
+        "useQuarterlyMarkers",
+        "showInvestmentGrowth",
+        "useSharedYAxis",
+        "initialInvestment",
+        "currency",
+        "introText",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "stocks",
+        "visibleStockIds",
+        "showBestYearCard",
+        "showWorstYearCard",
+        "requireViewAllStocks",
+        "useQuarterlyMarkers",
+        "showInvestmentGrowth",
+        "useSharedYAxis",
+        "initialInvestment",
+        "currency",
+        "introText",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        stocks: list[Stock],
+        showBestYearCard: bool,
+        showWorstYearCard: bool,
+        requireViewAllStocks: bool,
+        useQuarterlyMarkers: bool,
+        showInvestmentGrowth: bool,
+        useSharedYAxis: bool,
+        kind: str = "stockinfo",
+        anonymousProfileSetId: str | None = None,
+        visibleStockIds: list[str] | None = None,
+        initialInvestment: float = 1000,
+        currency: str = "USD",
+        introText: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.stocks = stocks
+        self.visibleStockIds = visibleStockIds
+        self.showBestYearCard = showBestYearCard
+        self.showWorstYearCard = showWorstYearCard
+        self.requireViewAllStocks = requireViewAllStocks
+        self.useQuarterlyMarkers = useQuarterlyMarkers
+        self.showInvestmentGrowth = showInvestmentGrowth
+        self.useSharedYAxis = useSharedYAxis
+        self.initialInvestment = initialInvestment
+        self.currency = currency
+        self.introText = introText
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StockInfoStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.stocks = [Stock.from_dict(v0) for v0 in data["stocks"]]
+            self.showBestYearCard = data["showBestYearCard"]
+            self.showWorstYearCard = data["showWorstYearCard"]
+            self.requireViewAllStocks = data["requireViewAllStocks"]
+            self.useQuarterlyMarkers = data["useQuarterlyMarkers"]
+            self.showInvestmentGrowth = data["showInvestmentGrowth"]
+            self.useSharedYAxis = data["useSharedYAxis"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "stockinfo")
+        if value != "stockinfo":
+            raise _mismatch(cls, "kind", "stockinfo", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        self.visibleStockIds = data.get("visibleStockIds")
+        self.initialInvestment = data.get("initialInvestment", 1000)
+        self.currency = data.get("currency", "USD")
+        self.introText = data.get("introText")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["stocks"] = [v0.to_dict() for v0 in self.stocks]
+        value = self.visibleStockIds
+        if value is not None:
+            data["visibleStockIds"] = value
+        data["showBestYearCard"] = self.showBestYearCard
+        data["showWorstYearCard"] = self.showWorstYearCard
+        data["requireViewAllStocks"] = self.requireViewAllStocks
+        data["useQuarterlyMarkers"] = self.useQuarterlyMarkers
+        data["showInvestmentGrowth"] = self.showInvestmentGrowth
+        data["useSharedYAxis"] = self.useSharedYAxis
+        value = self.initialInvestment
+        if value is not None:
+            data["initialInvestment"] = value
+        value = self.currency
+        if value is not None:
+            data["currency"] = value
+        value = self.introText
+        if value is not None:
+            data["introText"] = value
+        return data
+
+
+class SurveyPerParticipantStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "questions",
+        "enableSelfSurvey",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "questions",
+        "enableSelfSurvey",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        questions: list[
+            TextSurveyQuestion
+            | CheckSurveyQuestion
+            | MultipleChoiceSurveyQuestion
+            | ScaleSurveyQuestion
+        ],
+        enableSelfSurvey: bool,
+        kind: str = "surveyPerParticipant",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.questions = questions
+        self.enableSelfSurvey = enableSelfSurvey
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SurveyPerParticipantStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.questions = [_decode_union_7(v0) for v0 in data["questions"]]
+            self.enableSelfSurvey = data["enableSelfSurvey"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "surveyPerParticipant")
+        if value != "surveyPerParticipant":
+            raise _mismatch(cls, "kind", "surveyPerParticipant", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["questions"] = [v0.to_dict() for v0 in self.questions]
+        data["enableSelfSurvey"] = self.enableSelfSurvey
+        return data
+
+
+class SurveyStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "questions",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "questions",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        questions: list[
+            TextSurveyQuestion
+            | CheckSurveyQuestion
+            | MultipleChoiceSurveyQuestion
+            | ScaleSurveyQuestion
+        ],
+        kind: str = "survey",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.questions = questions
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SurveyStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.questions = [_decode_union_7(v0) for v0 in data["questions"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "survey")
+        if value != "survey":
+            raise _mismatch(cls, "kind", "survey", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["questions"] = [v0.to_dict() for v0 in self.questions]
+        return data
+
+
+class TOSStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "tosLines",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "tosLines",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        tosLines: list[str],
+        kind: str = "tos",
+        anonymousProfileSetId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.tosLines = tosLines
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TOSStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.tosLines = data["tosLines"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "tos")
+        if value != "tos":
+            raise _mismatch(cls, "kind", "tos", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["tosLines"] = self.tosLines
+        return data
+
+
+class TransferStageConfig(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "enableTimeout",
+        "timeoutSeconds",
+        "autoTransferConfig",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "name",
+        "descriptions",
+        "progress",
+        "anonymousProfileSetId",
+        "enableTimeout",
+        "timeoutSeconds",
+        "autoTransferConfig",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        descriptions: StageTextConfig,
+        progress: StageProgressConfig,
+        enableTimeout: bool,
+        timeoutSeconds: float,
+        kind: str = "transfer",
+        anonymousProfileSetId: str | None = None,
+        autoTransferConfig: (
+            DefaultAutoTransferConfig
+            | SurveyAutoTransferConfig
+            | ConditionAutoTransferConfig
+            | None
+        ) = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.name = name
+        self.descriptions = descriptions
+        self.progress = progress
+        self.anonymousProfileSetId = anonymousProfileSetId
+        self.enableTimeout = enableTimeout
+        self.timeoutSeconds = timeoutSeconds
+        self.autoTransferConfig = autoTransferConfig
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TransferStageConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.descriptions = StageTextConfig.from_dict(data["descriptions"])
+            self.progress = StageProgressConfig.from_dict(data["progress"])
+            self.enableTimeout = data["enableTimeout"]
+            self.timeoutSeconds = data["timeoutSeconds"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "transfer")
+        if value != "transfer":
+            raise _mismatch(cls, "kind", "transfer", value)
+        self.kind = value
+        self.anonymousProfileSetId = data.get("anonymousProfileSetId")
+        value = data.get("autoTransferConfig")
+        self.autoTransferConfig = None if value is None else _decode_union_8(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["name"] = self.name
+        data["descriptions"] = self.descriptions.to_dict()
+        data["progress"] = self.progress.to_dict()
+        value = self.anonymousProfileSetId
+        if value is not None:
+            data["anonymousProfileSetId"] = value
+        data["enableTimeout"] = self.enableTimeout
+        data["timeoutSeconds"] = self.timeoutSeconds
+        value = self.autoTransferConfig
+        if value is not None:
+            data["autoTransferConfig"] = None if value is None else value.to_dict()
+        return data
+
+
+class AgentMediatorTemplate(Struct):
+    __slots__ = (
+        "persona",
+        "promptMap",
+    )
+    __json_fields__ = (
+        "persona",
+        "promptMap",
+    )
+
+    def __init__(
+        self,
+        *,
+        persona: Persona,
+        promptMap: dict[str, ChatPromptConfig | GenericPromptConfig],
+    ) -> None:
+        self.persona = persona
+        self.promptMap = promptMap
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AgentMediatorTemplate:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.persona = Persona.from_dict(data["persona"])
+            self.promptMap = {
+                k0: _decode_union_10(v0) for k0, v0 in data["promptMap"].items()
+            }
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["persona"] = self.persona.to_dict()
+        data["promptMap"] = {k0: v0.to_dict() for k0, v0 in self.promptMap.items()}
+        return data
+
+
+class AgentParticipantTemplate(Struct):
+    __slots__ = (
+        "persona",
+        "promptMap",
+    )
+    __json_fields__ = (
+        "persona",
+        "promptMap",
+    )
+
+    def __init__(
+        self,
+        *,
+        persona: Persona,
+        promptMap: dict[str, ChatPromptConfig | GenericPromptConfig],
+    ) -> None:
+        self.persona = persona
+        self.promptMap = promptMap
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AgentParticipantTemplate:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.persona = Persona.from_dict(data["persona"])
+            self.promptMap = {
+                k0: _decode_union_10(v0) for k0, v0 in data["promptMap"].items()
+            }
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["persona"] = self.persona.to_dict()
+        data["promptMap"] = {k0: v0.to_dict() for k0, v0 in self.promptMap.items()}
+        return data
+
+
+class Metadata(Struct):
+    __slots__ = (
+        "name",
+        "publicName",
+        "description",
+        "tags",
+    )
+    __json_fields__ = (
+        "name",
+        "publicName",
+        "description",
+        "tags",
+    )
+
+    def __init__(
+        self, *, name: str, publicName: str, description: str, tags: list[str]
+    ) -> None:
+        self.name = name
+        self.publicName = publicName
+        self.description = description
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Metadata:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.name = data["name"]
+            self.publicName = data["publicName"]
+            self.description = data["description"]
+            self.tags = data["tags"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["name"] = self.name
+        data["publicName"] = self.publicName
+        data["description"] = self.description
+        data["tags"] = self.tags
+        return data
+
+
+class Permissions(Struct):
+    __slots__ = (
+        "visibility",
+        "readers",
+    )
+    __json_fields__ = (
+        "visibility",
+        "readers",
+    )
+
+    def __init__(self, *, visibility: str, readers: list[str]) -> None:
+        self.visibility = visibility
+        self.readers = readers
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Permissions:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.visibility = data["visibility"]
+            self.readers = data["readers"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["visibility"] = self.visibility
+        data["readers"] = self.readers
+        return data
+
+
+class CohortParticipantConfig(Struct):
+    __slots__ = (
+        "minParticipantsPerCohort",
+        "maxParticipantsPerCohort",
+        "includeAllParticipantsInCohortCount",
+        "botProtection",
+    )
+    __json_fields__ = (
+        "minParticipantsPerCohort",
+        "maxParticipantsPerCohort",
+        "includeAllParticipantsInCohortCount",
+        "botProtection",
+    )
+
+    def __init__(
+        self,
+        *,
+        includeAllParticipantsInCohortCount: bool,
+        botProtection: bool,
+        minParticipantsPerCohort: int | None = None,
+        maxParticipantsPerCohort: int | None = None,
+    ) -> None:
+        self.minParticipantsPerCohort = minParticipantsPerCohort
+        self.maxParticipantsPerCohort = maxParticipantsPerCohort
+        self.includeAllParticipantsInCohortCount = includeAllParticipantsInCohortCount
+        self.botProtection = botProtection
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CohortParticipantConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.includeAllParticipantsInCohortCount = data[
+                "includeAllParticipantsInCohortCount"
+            ]
+            self.botProtection = data["botProtection"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.minParticipantsPerCohort = data.get("minParticipantsPerCohort")
+        self.maxParticipantsPerCohort = data.get("maxParticipantsPerCohort")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.minParticipantsPerCohort
+        if value is not None:
+            data["minParticipantsPerCohort"] = value
+        value = self.maxParticipantsPerCohort
+        if value is not None:
+            data["maxParticipantsPerCohort"] = value
+        data["includeAllParticipantsInCohortCount"] = (
+            self.includeAllParticipantsInCohortCount
+        )
+        data["botProtection"] = self.botProtection
+        return data
+
+
+class ProlificConfig(Struct):
+    __slots__ = (
+        "enableProlificIntegration",
+        "defaultRedirectCode",
+        "attentionFailRedirectCode",
+        "bootedRedirectCode",
+    )
+    __json_fields__ = (
+        "enableProlificIntegration",
+        "defaultRedirectCode",
+        "attentionFailRedirectCode",
+        "bootedRedirectCode",
+    )
+
+    def __init__(
+        self,
+        *,
+        enableProlificIntegration: bool,
+        defaultRedirectCode: str,
+        attentionFailRedirectCode: str,
+        bootedRedirectCode: str,
+    ) -> None:
+        self.enableProlificIntegration = enableProlificIntegration
+        self.defaultRedirectCode = defaultRedirectCode
+        self.attentionFailRedirectCode = attentionFailRedirectCode
+        self.bootedRedirectCode = bootedRedirectCode
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProlificConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.enableProlificIntegration = data["enableProlificIntegration"]
+            self.defaultRedirectCode = data["defaultRedirectCode"]
+            self.attentionFailRedirectCode = data["attentionFailRedirectCode"]
+            self.bootedRedirectCode = data["bootedRedirectCode"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["enableProlificIntegration"] = self.enableProlificIntegration
+        data["defaultRedirectCode"] = self.defaultRedirectCode
+        data["attentionFailRedirectCode"] = self.attentionFailRedirectCode
+        data["bootedRedirectCode"] = self.bootedRedirectCode
+        return data
+
+
+class StaticVariableConfig(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "scope",
+        "definition",
+        "value",
+        "cohortValues",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "scope",
+        "definition",
+        "value",
+        "cohortValues",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        scope: str,
+        definition: VariableDefinition,
+        value: str,
+        type: str = "static",
+        cohortValues: dict[str, str] | None = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.scope = scope
+        self.definition = definition
+        self.value = value
+        self.cohortValues = cohortValues
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StaticVariableConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.scope = data["scope"]
+            self.definition = VariableDefinition.from_dict(data["definition"])
+            self.value = data["value"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "static")
+        if value != "static":
+            raise _mismatch(cls, "type", "static", value)
+        self.type = value
+        self.cohortValues = data.get("cohortValues")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["scope"] = self.scope
+        data["definition"] = self.definition.to_dict()
+        data["value"] = self.value
+        value = self.cohortValues
+        if value is not None:
+            data["cohortValues"] = value
+        return data
+
+
+class RandomPermutationVariableConfig(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "scope",
+        "definition",
+        "shuffleConfig",
+        "values",
+        "numToSelect",
+        "expandListToSeparateVariables",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "scope",
+        "definition",
+        "shuffleConfig",
+        "values",
+        "numToSelect",
+        "expandListToSeparateVariables",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        scope: str,
+        definition: VariableDefinition,
+        shuffleConfig: ShuffleConfig,
+        values: list[str],
+        type: str = "random_permutation",
+        numToSelect: float | None = None,
+        expandListToSeparateVariables: bool | None = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.scope = scope
+        self.definition = definition
+        self.shuffleConfig = shuffleConfig
+        self.values = values
+        self.numToSelect = numToSelect
+        self.expandListToSeparateVariables = expandListToSeparateVariables
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RandomPermutationVariableConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.scope = data["scope"]
+            self.definition = VariableDefinition.from_dict(data["definition"])
+            self.shuffleConfig = ShuffleConfig.from_dict(data["shuffleConfig"])
+            self.values = data["values"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "random_permutation")
+        if value != "random_permutation":
+            raise _mismatch(cls, "type", "random_permutation", value)
+        self.type = value
+        self.numToSelect = data.get("numToSelect")
+        self.expandListToSeparateVariables = data.get("expandListToSeparateVariables")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["scope"] = self.scope
+        data["definition"] = self.definition.to_dict()
+        data["shuffleConfig"] = self.shuffleConfig.to_dict()
+        data["values"] = self.values
+        value = self.numToSelect
+        if value is not None:
+            data["numToSelect"] = value
+        value = self.expandListToSeparateVariables
+        if value is not None:
+            data["expandListToSeparateVariables"] = value
+        return data
+
+
+class BalancedAssignmentVariableConfig(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "scope",
+        "definition",
+        "values",
+        "weights",
+        "balanceStrategy",
+        "balanceAcross",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "scope",
+        "definition",
+        "values",
+        "weights",
+        "balanceStrategy",
+        "balanceAcross",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        scope: str,
+        definition: VariableDefinition,
+        values: list[str],
+        balanceStrategy: str,
+        balanceAcross: str,
+        type: str = "balanced_assignment",
+        weights: list[float] | None = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.scope = scope
+        self.definition = definition
+        self.values = values
+        self.weights = weights
+        self.balanceStrategy = balanceStrategy
+        self.balanceAcross = balanceAcross
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BalancedAssignmentVariableConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.scope = data["scope"]
+            self.definition = VariableDefinition.from_dict(data["definition"])
+            self.values = data["values"]
+            self.balanceStrategy = data["balanceStrategy"]
+            self.balanceAcross = data["balanceAcross"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "balanced_assignment")
+        if value != "balanced_assignment":
+            raise _mismatch(cls, "type", "balanced_assignment", value)
+        self.type = value
+        self.weights = data.get("weights")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["scope"] = self.scope
+        data["definition"] = self.definition.to_dict()
+        data["values"] = self.values
+        value = self.weights
+        if value is not None:
+            data["weights"] = value
+        data["balanceStrategy"] = self.balanceStrategy
+        data["balanceAcross"] = self.balanceAcross
+        return data
+
+
+class CohortDefinition(Struct):
+    __slots__ = (
+        "id",
+        "alias",
+        "name",
+        "description",
+        "generatedCohortId",
+        "maxParticipantsPerCohort",
+    )
+    __json_fields__ = (
+        "id",
+        "alias",
+        "name",
+        "description",
+        "generatedCohortId",
+        "maxParticipantsPerCohort",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        alias: str,
+        name: str,
+        description: str | None = None,
+        generatedCohortId: str | None = None,
+        maxParticipantsPerCohort: int | None = None,
+    ) -> None:
+        self.id = id
+        self.alias = alias
+        self.name = name
+        self.description = description
+        self.generatedCohortId = generatedCohortId
+        self.maxParticipantsPerCohort = maxParticipantsPerCohort
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CohortDefinition:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.alias = data["alias"]
+            self.name = data["name"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.description = data.get("description")
+        self.generatedCohortId = data.get("generatedCohortId")
+        self.maxParticipantsPerCohort = data.get("maxParticipantsPerCohort")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["alias"] = self.alias
+        data["name"] = self.name
+        value = self.description
+        if value is not None:
+            data["description"] = value
+        value = self.generatedCohortId
+        if value is not None:
+            data["generatedCohortId"] = value
+        value = self.maxParticipantsPerCohort
+        if value is not None:
+            data["maxParticipantsPerCohort"] = value
+        return data
+
+
+class StageTextConfig(Struct):
+    __slots__ = (
+        "primaryText",
+        "infoText",
+        "helpText",
+    )
+    __json_fields__ = (
+        "primaryText",
+        "infoText",
+        "helpText",
+    )
+
+    def __init__(self, *, primaryText: str, infoText: str, helpText: str) -> None:
+        self.primaryText = primaryText
+        self.infoText = infoText
+        self.helpText = helpText
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StageTextConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.primaryText = data["primaryText"]
+            self.infoText = data["infoText"]
+            self.helpText = data["helpText"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["primaryText"] = self.primaryText
+        data["infoText"] = self.infoText
+        data["helpText"] = self.helpText
+        return data
+
+
+class StageProgressConfig(Struct):
+    __slots__ = (
+        "minParticipants",
+        "waitForAllParticipants",
+        "showParticipantProgress",
+    )
+    __json_fields__ = (
+        "minParticipants",
+        "waitForAllParticipants",
+        "showParticipantProgress",
+    )
+
+    def __init__(
+        self,
+        *,
+        minParticipants: int,
+        waitForAllParticipants: bool,
+        showParticipantProgress: bool,
+    ) -> None:
+        self.minParticipants = minParticipants
+        self.waitForAllParticipants = waitForAllParticipants
+        self.showParticipantProgress = showParticipantProgress
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StageProgressConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.minParticipants = data["minParticipants"]
+            self.waitForAllParticipants = data["waitForAllParticipants"]
+            self.showParticipantProgress = data["showParticipantProgress"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["minParticipants"] = self.minParticipants
+        data["waitForAllParticipants"] = self.waitForAllParticipants
+        data["showParticipantProgress"] = self.showParticipantProgress
+        return data
+
+
+class StockConfig(Struct):
+    __slots__ = (
+        "stockInfoStageId",
+        "stockAId",
+        "stockBId",
+        "stockA",
+        "stockB",
+    )
+    __json_fields__ = (
+        "stockInfoStageId",
+        "stockAId",
+        "stockBId",
+        "stockA",
+        "stockB",
+    )
+
+    def __init__(
+        self,
+        *,
+        stockInfoStageId: str | None = None,
+        stockAId: str | None = None,
+        stockBId: str | None = None,
+        stockA: Stock | None = None,
+        stockB: Stock | None = None,
+    ) -> None:
+        self.stockInfoStageId = stockInfoStageId
+        self.stockAId = stockAId
+        self.stockBId = stockBId
+        self.stockA = stockA
+        self.stockB = stockB
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StockConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        self.stockInfoStageId = data.get("stockInfoStageId")
+        self.stockAId = data.get("stockAId")
+        self.stockBId = data.get("stockBId")
+        value = data.get("stockA")
+        self.stockA = None if value is None else Stock.from_dict(value)
+        value = data.get("stockB")
+        self.stockB = None if value is None else Stock.from_dict(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.stockInfoStageId
+        if value is not None:
+            data["stockInfoStageId"] = value
+        value = self.stockAId
+        if value is not None:
+            data["stockAId"] = value
+        value = self.stockBId
+        if value is not None:
+            data["stockBId"] = value
+        value = self.stockA
+        if value is not None:
+            data["stockA"] = value.to_dict()
+        value = self.stockB
+        if value is not None:
+            data["stockB"] = value.to_dict()
+        return data
+
+
+class Stock(Struct):
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "csvData",
+        "parsedData",
+        "customCards",
+    )
+    __json_fields__ = (
+        "id",
+        "name",
+        "description",
+        "csvData",
+        "parsedData",
+        "customCards",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        description: str,
+        csvData: str,
+        parsedData: list[ParsedItem],
+        customCards: list[CustomCard],
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.csvData = csvData
+        self.parsedData = parsedData
+        self.customCards = customCards
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Stock:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.description = data["description"]
+            self.csvData = data["csvData"]
+            self.parsedData = [ParsedItem.from_dict(v0) for v0 in data["parsedData"]]
+            self.customCards = [CustomCard.from_dict(v0) for v0 in data["customCards"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["name"] = self.name
+        data["description"] = self.description
+        data["csvData"] = self.csvData
+        data["parsedData"] = [v0.to_dict() for v0 in self.parsedData]
+        data["customCards"] = [v0.to_dict() for v0 in self.customCards]
+        return data
+
+
+class DefaultChatDiscussion(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "description",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "description",
+    )
+
+    def __init__(self, *, id: str, description: str, type: str = "DEFAULT") -> None:
+        self.id = id
+        self.type = type
+        self.description = description
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DefaultChatDiscussion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.description = data["description"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "DEFAULT")
+        if value != "DEFAULT":
+            raise _mismatch(cls, "type", "DEFAULT", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["description"] = self.description
+        return data
+
+
+class CompareChatDiscussion(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "description",
+        "items",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "description",
+        "items",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        description: str,
+        items: list[DiscussionItem],
+        type: str = "COMPARE",
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.description = description
+        self.items = items
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CompareChatDiscussion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.description = data["description"]
+            self.items = [DiscussionItem.from_dict(v0) for v0 in data["items"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "COMPARE")
+        if value != "COMPARE":
+            raise _mismatch(cls, "type", "COMPARE", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["description"] = self.description
+        data["items"] = [v0.to_dict() for v0 in self.items]
+        return data
+
+
+class ChipItem(Struct):
+    __slots__ = (
+        "id",
+        "name",
+        "avatar",
+        "canBuy",
+        "canSell",
+        "startingQuantity",
+        "lowerValue",
+        "upperValue",
+    )
+    __json_fields__ = (
+        "id",
+        "name",
+        "avatar",
+        "canBuy",
+        "canSell",
+        "startingQuantity",
+        "lowerValue",
+        "upperValue",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        avatar: str,
+        canBuy: bool,
+        canSell: bool,
+        startingQuantity: float,
+        lowerValue: float,
+        upperValue: float,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.avatar = avatar
+        self.canBuy = canBuy
+        self.canSell = canSell
+        self.startingQuantity = startingQuantity
+        self.lowerValue = lowerValue
+        self.upperValue = upperValue
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChipItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.avatar = data["avatar"]
+            self.canBuy = data["canBuy"]
+            self.canSell = data["canSell"]
+            self.startingQuantity = data["startingQuantity"]
+            self.lowerValue = data["lowerValue"]
+            self.upperValue = data["upperValue"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["name"] = self.name
+        data["avatar"] = self.avatar
+        data["canBuy"] = self.canBuy
+        data["canSell"] = self.canSell
+        data["startingQuantity"] = self.startingQuantity
+        data["lowerValue"] = self.lowerValue
+        data["upperValue"] = self.upperValue
+        return data
+
+
+class TextQuestion(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "correctAnswer",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "correctAnswer",
+    )
+
+    def __init__(
+        self, *, id: str, questionTitle: str, correctAnswer: str, kind: str = "text"
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.questionTitle = questionTitle
+        self.correctAnswer = correctAnswer
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TextQuestion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.questionTitle = data["questionTitle"]
+            self.correctAnswer = data["correctAnswer"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "text")
+        if value != "text":
+            raise _mismatch(cls, "kind", "text", value)
+        self.kind = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["questionTitle"] = self.questionTitle
+        data["correctAnswer"] = self.correctAnswer
+        return data
+
+
+class McQuestion(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "options",
+        "correctAnswerId",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "options",
+        "correctAnswerId",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        questionTitle: str,
+        options: list[MultipleChoiceItem],
+        correctAnswerId: str,
+        kind: str = "mc",
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.questionTitle = questionTitle
+        self.options = options
+        self.correctAnswerId = correctAnswerId
+
+    @classmethod
+    def from_dict(cls, data: dict) -> McQuestion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.questionTitle = data["questionTitle"]
+            self.options = [MultipleChoiceItem.from_dict(v0) for v0 in data["options"]]
+            self.correctAnswerId = data["correctAnswerId"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "mc")
+        if value != "mc":
+            raise _mismatch(cls, "kind", "mc", value)
+        self.kind = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["questionTitle"] = self.questionTitle
+        data["options"] = [v0.to_dict() for v0 in self.options]
+        data["correctAnswerId"] = self.correctAnswerId
+        return data
+
+
+class FlipCard(Struct):
+    __slots__ = (
+        "id",
+        "title",
+        "frontContent",
+        "backContent",
+    )
+    __json_fields__ = (
+        "id",
+        "title",
+        "frontContent",
+        "backContent",
+    )
+
+    def __init__(
+        self, *, id: str, title: str, frontContent: str, backContent: str
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.frontContent = frontContent
+        self.backContent = backContent
+
+    @classmethod
+    def from_dict(cls, data: dict) -> FlipCard:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.title = data["title"]
+            self.frontContent = data["frontContent"]
+            self.backContent = data["backContent"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["title"] = self.title
+        data["frontContent"] = self.frontContent
+        data["backContent"] = self.backContent
+        return data
+
+
+class DefaultPayoutItem(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "name",
+        "description",
+        "isActive",
+        "stageId",
+        "baseCurrencyAmount",
+        "randomSelectionId",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "name",
+        "description",
+        "isActive",
+        "stageId",
+        "baseCurrencyAmount",
+        "randomSelectionId",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        description: str,
+        isActive: bool,
+        stageId: str,
+        baseCurrencyAmount: float,
+        randomSelectionId: str,
+        type: str = "DEFAULT",
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.name = name
+        self.description = description
+        self.isActive = isActive
+        self.stageId = stageId
+        self.baseCurrencyAmount = baseCurrencyAmount
+        self.randomSelectionId = randomSelectionId
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DefaultPayoutItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.description = data["description"]
+            self.isActive = data["isActive"]
+            self.stageId = data["stageId"]
+            self.baseCurrencyAmount = data["baseCurrencyAmount"]
+            self.randomSelectionId = data["randomSelectionId"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "DEFAULT")
+        if value != "DEFAULT":
+            raise _mismatch(cls, "type", "DEFAULT", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["name"] = self.name
+        data["description"] = self.description
+        data["isActive"] = self.isActive
+        data["stageId"] = self.stageId
+        data["baseCurrencyAmount"] = self.baseCurrencyAmount
+        data["randomSelectionId"] = self.randomSelectionId
+        return data
+
+
+class ChipPayoutItem(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "name",
+        "description",
+        "isActive",
+        "stageId",
+        "baseCurrencyAmount",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "name",
+        "description",
+        "isActive",
+        "stageId",
+        "baseCurrencyAmount",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        description: str,
+        isActive: bool,
+        stageId: str,
+        baseCurrencyAmount: float,
+        type: str = "CHIP",
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.name = name
+        self.description = description
+        self.isActive = isActive
+        self.stageId = stageId
+        self.baseCurrencyAmount = baseCurrencyAmount
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChipPayoutItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.description = data["description"]
+            self.isActive = data["isActive"]
+            self.stageId = data["stageId"]
+            self.baseCurrencyAmount = data["baseCurrencyAmount"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "CHIP")
+        if value != "CHIP":
+            raise _mismatch(cls, "type", "CHIP", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["name"] = self.name
+        data["description"] = self.description
+        data["isActive"] = self.isActive
+        data["stageId"] = self.stageId
+        data["baseCurrencyAmount"] = self.baseCurrencyAmount
+        return data
+
+
+class SurveyPayoutItem(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "name",
+        "description",
+        "isActive",
+        "stageId",
+        "baseCurrencyAmount",
+        "rankingStageId",
+        "questionMap",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "name",
+        "description",
+        "isActive",
+        "stageId",
+        "baseCurrencyAmount",
+        "rankingStageId",
+        "questionMap",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        description: str,
+        isActive: bool,
+        stageId: str,
+        baseCurrencyAmount: float,
+        questionMap: dict[str, float | None],
+        type: str = "SURVEY",
+        rankingStageId: str | None = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.name = name
+        self.description = description
+        self.isActive = isActive
+        self.stageId = stageId
+        self.baseCurrencyAmount = baseCurrencyAmount
+        self.rankingStageId = rankingStageId
+        self.questionMap = questionMap
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SurveyPayoutItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.description = data["description"]
+            self.isActive = data["isActive"]
+            self.stageId = data["stageId"]
+            self.baseCurrencyAmount = data["baseCurrencyAmount"]
+            self.questionMap = data["questionMap"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "SURVEY")
+        if value != "SURVEY":
+            raise _mismatch(cls, "type", "SURVEY", value)
+        self.type = value
+        self.rankingStageId = data.get("rankingStageId")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["name"] = self.name
+        data["description"] = self.description
+        data["isActive"] = self.isActive
+        data["stageId"] = self.stageId
+        data["baseCurrencyAmount"] = self.baseCurrencyAmount
+        value = self.rankingStageId
+        if value is not None:
+            data["rankingStageId"] = value
+        data["questionMap"] = self.questionMap
+        return data
+
+
+class RankingItem(Struct):
+    __slots__ = (
+        "id",
+        "imageId",
+        "text",
+    )
+    __json_fields__ = (
+        "id",
+        "imageId",
+        "text",
+    )
+
+    def __init__(self, *, id: str, imageId: str, text: str) -> None:
+        self.id = id
+        self.imageId = imageId
+        self.text = text
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RankingItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.imageId = data["imageId"]
+            self.text = data["text"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["imageId"] = self.imageId
+        data["text"] = self.text
+        return data
+
+
+class ChipRevealItem(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "revealAudience",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "revealAudience",
+    )
+
+    def __init__(self, *, id: str, revealAudience: str, kind: str = "chip") -> None:
+        self.id = id
+        self.kind = kind
+        self.revealAudience = revealAudience
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChipRevealItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.revealAudience = data["revealAudience"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "chip")
+        if value != "chip":
+            raise _mismatch(cls, "kind", "chip", value)
+        self.kind = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["revealAudience"] = self.revealAudience
+        return data
+
+
+class RankingRevealItem(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "revealAudience",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "revealAudience",
+    )
+
+    def __init__(self, *, id: str, revealAudience: str, kind: str = "ranking") -> None:
+        self.id = id
+        self.kind = kind
+        self.revealAudience = revealAudience
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RankingRevealItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.revealAudience = data["revealAudience"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "ranking")
+        if value != "ranking":
+            raise _mismatch(cls, "kind", "ranking", value)
+        self.kind = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["revealAudience"] = self.revealAudience
+        return data
+
+
+class SurveyRevealItem(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "revealAudience",
+        "revealScorableOnly",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "revealAudience",
+        "revealScorableOnly",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        revealAudience: str,
+        revealScorableOnly: bool,
+        kind: str = "survey",
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.revealAudience = revealAudience
+        self.revealScorableOnly = revealScorableOnly
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SurveyRevealItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.revealAudience = data["revealAudience"]
+            self.revealScorableOnly = data["revealScorableOnly"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "survey")
+        if value != "survey":
+            raise _mismatch(cls, "kind", "survey", value)
+        self.kind = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["revealAudience"] = self.revealAudience
+        data["revealScorableOnly"] = self.revealScorableOnly
+        return data
+
+
+class MultiAssetAllocationRevealItem(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "revealAudience",
+        "displayMode",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "revealAudience",
+        "displayMode",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        revealAudience: str,
+        displayMode: str,
+        kind: str = "multiAssetAllocation",
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.revealAudience = revealAudience
+        self.displayMode = displayMode
+
+    @classmethod
+    def from_dict(cls, data: dict) -> MultiAssetAllocationRevealItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.revealAudience = data["revealAudience"]
+            self.displayMode = data["displayMode"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "multiAssetAllocation")
+        if value != "multiAssetAllocation":
+            raise _mismatch(cls, "kind", "multiAssetAllocation", value)
+        self.kind = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["revealAudience"] = self.revealAudience
+        data["displayMode"] = self.displayMode
+        return data
+
+
+class Role(Struct):
+    __slots__ = (
+        "id",
+        "name",
+        "displayLines",
+        "minParticipants",
+        "maxParticipants",
+    )
+    __json_fields__ = (
+        "id",
+        "name",
+        "displayLines",
+        "minParticipants",
+        "maxParticipants",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        displayLines: list[str],
+        minParticipants: int,
+        maxParticipants: int | None = None,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.displayLines = displayLines
+        self.minParticipants = minParticipants
+        self.maxParticipants = maxParticipants
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Role:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.displayLines = data["displayLines"]
+            self.minParticipants = data["minParticipants"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.maxParticipants = data.get("maxParticipants")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["name"] = self.name
+        data["displayLines"] = self.displayLines
+        data["minParticipants"] = self.minParticipants
+        value = self.maxParticipants
+        if value is not None:
+            data["maxParticipants"] = value
+        return data
+
+
+class Item(Struct):
+    __slots__ = (
+        "id",
+        "name",
+        "avatar",
+        "displayLines",
+    )
+    __json_fields__ = (
+        "id",
+        "name",
+        "avatar",
+        "displayLines",
+    )
+
+    def __init__(
+        self, *, id: str, name: str, avatar: str, displayLines: list[str]
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.avatar = avatar
+        self.displayLines = displayLines
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Item:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.avatar = data["avatar"]
+            self.displayLines = data["displayLines"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["name"] = self.name
+        data["avatar"] = self.avatar
+        data["displayLines"] = self.displayLines
+        return data
+
+
+class TextSurveyQuestion(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "condition",
+        "minCharCount",
+        "maxCharCount",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "condition",
+        "minCharCount",
+        "maxCharCount",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        questionTitle: str,
+        kind: str = "text",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+        minCharCount: float | None = None,
+        maxCharCount: float | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.questionTitle = questionTitle
+        self.condition = condition
+        self.minCharCount = minCharCount
+        self.maxCharCount = maxCharCount
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TextSurveyQuestion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.questionTitle = data["questionTitle"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "text")
+        if value != "text":
+            raise _mismatch(cls, "kind", "text", value)
+        self.kind = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        self.minCharCount = data.get("minCharCount")
+        self.maxCharCount = data.get("maxCharCount")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["questionTitle"] = self.questionTitle
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        value = self.minCharCount
+        if value is not None:
+            data["minCharCount"] = value
+        value = self.maxCharCount
+        if value is not None:
+            data["maxCharCount"] = value
+        return data
+
+
+class CheckSurveyQuestion(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "isRequired",
+        "condition",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "isRequired",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        questionTitle: str,
+        isRequired: bool,
+        kind: str = "check",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.questionTitle = questionTitle
+        self.isRequired = isRequired
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CheckSurveyQuestion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.questionTitle = data["questionTitle"]
+            self.isRequired = data["isRequired"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "check")
+        if value != "check":
+            raise _mismatch(cls, "kind", "check", value)
+        self.kind = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["questionTitle"] = self.questionTitle
+        data["isRequired"] = self.isRequired
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class MultipleChoiceSurveyQuestion(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "options",
+        "correctAnswerId",
+        "displayType",
+        "condition",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "options",
+        "correctAnswerId",
+        "displayType",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        questionTitle: str,
+        options: list[MultipleChoiceItem],
+        kind: str = "mc",
+        correctAnswerId: str | None = None,
+        displayType: str | None = None,
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.questionTitle = questionTitle
+        self.options = options
+        self.correctAnswerId = correctAnswerId
+        self.displayType = displayType
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> MultipleChoiceSurveyQuestion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.questionTitle = data["questionTitle"]
+            self.options = [MultipleChoiceItem.from_dict(v0) for v0 in data["options"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "mc")
+        if value != "mc":
+            raise _mismatch(cls, "kind", "mc", value)
+        self.kind = value
+        self.correctAnswerId = data.get("correctAnswerId")
+        self.displayType = data.get("displayType")
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["questionTitle"] = self.questionTitle
+        data["options"] = [v0.to_dict() for v0 in self.options]
+        value = self.correctAnswerId
+        if value is not None:
+            data["correctAnswerId"] = value
+        value = self.displayType
+        if value is not None:
+            data["displayType"] = value
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class ScaleSurveyQuestion(Struct):
+    __slots__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "upperValue",
+        "upperText",
+        "lowerValue",
+        "lowerText",
+        "middleText",
+        "useSlider",
+        "stepSize",
+        "condition",
+    )
+    __json_fields__ = (
+        "id",
+        "kind",
+        "questionTitle",
+        "upperValue",
+        "upperText",
+        "lowerValue",
+        "lowerText",
+        "middleText",
+        "useSlider",
+        "stepSize",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        questionTitle: str,
+        upperValue: int,
+        upperText: str,
+        lowerValue: int,
+        lowerText: str,
+        kind: str = "scale",
+        middleText: str | None = None,
+        useSlider: bool | None = None,
+        stepSize: int | None = None,
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.id = id
+        self.kind = kind
+        self.questionTitle = questionTitle
+        self.upperValue = upperValue
+        self.upperText = upperText
+        self.lowerValue = lowerValue
+        self.lowerText = lowerText
+        self.middleText = middleText
+        self.useSlider = useSlider
+        self.stepSize = stepSize
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ScaleSurveyQuestion:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.questionTitle = data["questionTitle"]
+            self.upperValue = data["upperValue"]
+            self.upperText = data["upperText"]
+            self.lowerValue = data["lowerValue"]
+            self.lowerText = data["lowerText"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("kind", "scale")
+        if value != "scale":
+            raise _mismatch(cls, "kind", "scale", value)
+        self.kind = value
+        self.middleText = data.get("middleText")
+        self.useSlider = data.get("useSlider")
+        self.stepSize = data.get("stepSize")
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["kind"] = self.kind
+        data["questionTitle"] = self.questionTitle
+        data["upperValue"] = self.upperValue
+        data["upperText"] = self.upperText
+        data["lowerValue"] = self.lowerValue
+        data["lowerText"] = self.lowerText
+        value = self.middleText
+        if value is not None:
+            data["middleText"] = value
+        value = self.useSlider
+        if value is not None:
+            data["useSlider"] = value
+        value = self.stepSize
+        if value is not None:
+            data["stepSize"] = value
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class DefaultAutoTransferConfig(Struct):
+    __slots__ = (
+        "type",
+        "autoCohortParticipantConfig",
+        "minParticipants",
+        "maxParticipants",
+    )
+    __json_fields__ = (
+        "type",
+        "autoCohortParticipantConfig",
+        "minParticipants",
+        "maxParticipants",
+    )
+
+    def __init__(
+        self,
+        *,
+        autoCohortParticipantConfig: CohortParticipantConfig,
+        minParticipants: int,
+        maxParticipants: int,
+        type: str = "default",
+    ) -> None:
+        self.type = type
+        self.autoCohortParticipantConfig = autoCohortParticipantConfig
+        self.minParticipants = minParticipants
+        self.maxParticipants = maxParticipants
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DefaultAutoTransferConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.autoCohortParticipantConfig = CohortParticipantConfig.from_dict(
+                data["autoCohortParticipantConfig"]
+            )
+            self.minParticipants = data["minParticipants"]
+            self.maxParticipants = data["maxParticipants"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "default")
+        if value != "default":
+            raise _mismatch(cls, "type", "default", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        data["autoCohortParticipantConfig"] = self.autoCohortParticipantConfig.to_dict()
+        data["minParticipants"] = self.minParticipants
+        data["maxParticipants"] = self.maxParticipants
+        return data
+
+
+class SurveyAutoTransferConfig(Struct):
+    __slots__ = (
+        "type",
+        "autoCohortParticipantConfig",
+        "surveyStageId",
+        "surveyQuestionId",
+        "participantCounts",
+    )
+    __json_fields__ = (
+        "type",
+        "autoCohortParticipantConfig",
+        "surveyStageId",
+        "surveyQuestionId",
+        "participantCounts",
+    )
+
+    def __init__(
+        self,
+        *,
+        autoCohortParticipantConfig: CohortParticipantConfig,
+        surveyStageId: str,
+        surveyQuestionId: str,
+        participantCounts: dict[str, int],
+        type: str = "survey",
+    ) -> None:
+        self.type = type
+        self.autoCohortParticipantConfig = autoCohortParticipantConfig
+        self.surveyStageId = surveyStageId
+        self.surveyQuestionId = surveyQuestionId
+        self.participantCounts = participantCounts
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SurveyAutoTransferConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.autoCohortParticipantConfig = CohortParticipantConfig.from_dict(
+                data["autoCohortParticipantConfig"]
+            )
+            self.surveyStageId = data["surveyStageId"]
+            self.surveyQuestionId = data["surveyQuestionId"]
+            self.participantCounts = data["participantCounts"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "survey")
+        if value != "survey":
+            raise _mismatch(cls, "type", "survey", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        data["autoCohortParticipantConfig"] = self.autoCohortParticipantConfig.to_dict()
+        data["surveyStageId"] = self.surveyStageId
+        data["surveyQuestionId"] = self.surveyQuestionId
+        data["participantCounts"] = self.participantCounts
+        return data
+
+
+class ConditionAutoTransferConfig(Struct):
+    __slots__ = (
+        "type",
+        "autoCohortParticipantConfig",
+        "transferGroups",
+        "enableGroupBalancing",
+    )
+    __json_fields__ = (
+        "type",
+        "autoCohortParticipantConfig",
+        "transferGroups",
+        "enableGroupBalancing",
+    )
+
+    def __init__(
+        self,
+        *,
+        autoCohortParticipantConfig: CohortParticipantConfig,
+        transferGroups: list[TransferGroup],
+        type: str = "condition",
+        enableGroupBalancing: bool | None = None,
+    ) -> None:
+        self.type = type
+        self.autoCohortParticipantConfig = autoCohortParticipantConfig
+        self.transferGroups = transferGroups
+        self.enableGroupBalancing = enableGroupBalancing
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ConditionAutoTransferConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.autoCohortParticipantConfig = CohortParticipantConfig.from_dict(
+                data["autoCohortParticipantConfig"]
+            )
+            self.transferGroups = [
+                TransferGroup.from_dict(v0) for v0 in data["transferGroups"]
+            ]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "condition")
+        if value != "condition":
+            raise _mismatch(cls, "type", "condition", value)
+        self.type = value
+        self.enableGroupBalancing = data.get("enableGroupBalancing")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        data["autoCohortParticipantConfig"] = self.autoCohortParticipantConfig.to_dict()
+        data["transferGroups"] = [v0.to_dict() for v0 in self.transferGroups]
+        value = self.enableGroupBalancing
+        if value is not None:
+            data["enableGroupBalancing"] = value
+        return data
+
+
+class Persona(Struct):
+    __slots__ = (
+        "id",
+        "name",
+        "defaultModelSettings",
+        "defaultProfile",
+    )
+    __json_fields__ = (
+        "id",
+        "name",
+        "defaultModelSettings",
+        "defaultProfile",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        defaultModelSettings: AgentModelSettings | None = None,
+        defaultProfile: ParticipantProfileBase | None = None,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.defaultModelSettings = defaultModelSettings
+        self.defaultProfile = defaultProfile
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Persona:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("defaultModelSettings")
+        self.defaultModelSettings = (
+            None if value is None else AgentModelSettings.from_dict(value)
+        )
+        value = data.get("defaultProfile")
+        self.defaultProfile = (
+            None if value is None else ParticipantProfileBase.from_dict(value)
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["name"] = self.name
+        value = self.defaultModelSettings
+        if value is not None:
+            data["defaultModelSettings"] = value.to_dict()
+        value = self.defaultProfile
+        if value is not None:
+            data["defaultProfile"] = value.to_dict()
+        return data
+
+
+class ChatPromptConfig(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "prompt",
+        "includeScaffoldingInPrompt",
+        "numRetries",
+        "generationConfig",
+        "structuredOutputConfig",
+        "chatSettings",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "prompt",
+        "includeScaffoldingInPrompt",
+        "numRetries",
+        "generationConfig",
+        "structuredOutputConfig",
+        "chatSettings",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        type: str,
+        prompt: list[
+            TextPromptItem
+            | ProfileInfoPromptItem
+            | ProfileContextPromptItem
+            | StageContextPromptItem
+            | ChatMediatorInstructionsPromptItem
+            | ChatParticipantInstructionsPromptItem
+            | PromptItemGroup
+        ],
+        includeScaffoldingInPrompt: bool | None = None,
+        numRetries: int | None = None,
+        generationConfig: ModelGenerationConfig | None = None,
+        structuredOutputConfig: (
+            StructuredOutputConfig | ChatMediatorStructuredOutputConfig | None
+        ) = None,
+        chatSettings: AgentChatSettings | None = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.prompt = prompt
+        self.includeScaffoldingInPrompt = includeScaffoldingInPrompt
+        self.numRetries = numRetries
+        self.generationConfig = generationConfig
+        self.structuredOutputConfig = structuredOutputConfig
+        self.chatSettings = chatSettings
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChatPromptConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.type = data["type"]
+            self.prompt = [_decode_union_13(v0) for v0 in data["prompt"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.includeScaffoldingInPrompt = data.get("includeScaffoldingInPrompt")
+        self.numRetries = data.get("numRetries")
+        value = data.get("generationConfig")
+        self.generationConfig = (
+            None if value is None else ModelGenerationConfig.from_dict(value)
+        )
+        value = data.get("structuredOutputConfig")
+        self.structuredOutputConfig = None if value is None else _decode_union_14(value)
+        value = data.get("chatSettings")
+        self.chatSettings = (
+            None if value is None else AgentChatSettings.from_dict(value)
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["prompt"] = [v0.to_dict() for v0 in self.prompt]
+        value = self.includeScaffoldingInPrompt
+        if value is not None:
+            data["includeScaffoldingInPrompt"] = value
+        value = self.numRetries
+        if value is not None:
+            data["numRetries"] = value
+        value = self.generationConfig
+        if value is not None:
+            data["generationConfig"] = value.to_dict()
+        value = self.structuredOutputConfig
+        if value is not None:
+            data["structuredOutputConfig"] = value.to_dict()
+        value = self.chatSettings
+        if value is not None:
+            data["chatSettings"] = value.to_dict()
+        return data
+
+
+class GenericPromptConfig(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "prompt",
+        "includeScaffoldingInPrompt",
+        "numRetries",
+        "generationConfig",
+        "structuredOutputConfig",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "prompt",
+        "includeScaffoldingInPrompt",
+        "numRetries",
+        "generationConfig",
+        "structuredOutputConfig",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        type: str,
+        prompt: list[
+            TextPromptItem
+            | ProfileInfoPromptItem
+            | ProfileContextPromptItem
+            | StageContextPromptItem
+            | ChatMediatorInstructionsPromptItem
+            | ChatParticipantInstructionsPromptItem
+            | PromptItemGroup
+        ],
+        includeScaffoldingInPrompt: bool | None = None,
+        numRetries: int | None = None,
+        generationConfig: ModelGenerationConfig | None = None,
+        structuredOutputConfig: StructuredOutputConfig | None = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.prompt = prompt
+        self.includeScaffoldingInPrompt = includeScaffoldingInPrompt
+        self.numRetries = numRetries
+        self.generationConfig = generationConfig
+        self.structuredOutputConfig = structuredOutputConfig
+
+    @classmethod
+    def from_dict(cls, data: dict) -> GenericPromptConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.type = data["type"]
+            self.prompt = [_decode_union_13(v0) for v0 in data["prompt"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.includeScaffoldingInPrompt = data.get("includeScaffoldingInPrompt")
+        self.numRetries = data.get("numRetries")
+        value = data.get("generationConfig")
+        self.generationConfig = (
+            None if value is None else ModelGenerationConfig.from_dict(value)
+        )
+        value = data.get("structuredOutputConfig")
+        self.structuredOutputConfig = (
+            None if value is None else StructuredOutputConfig.from_dict(value)
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["prompt"] = [v0.to_dict() for v0 in self.prompt]
+        value = self.includeScaffoldingInPrompt
+        if value is not None:
+            data["includeScaffoldingInPrompt"] = value
+        value = self.numRetries
+        if value is not None:
+            data["numRetries"] = value
+        value = self.generationConfig
+        if value is not None:
+            data["generationConfig"] = value.to_dict()
+        value = self.structuredOutputConfig
+        if value is not None:
+            data["structuredOutputConfig"] = value.to_dict()
+        return data
+
+
+class VariableDefinition(Struct):
+    __slots__ = (
+        "name",
+        "description",
+        "schema",
+    )
+    __json_fields__ = (
+        "name",
+        "description",
+        "schema",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        description: str,
+        schema: String | Number | Integer | Boolean | Object | Array,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.schema = schema
+
+    @classmethod
+    def from_dict(cls, data: dict) -> VariableDefinition:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.name = data["name"]
+            self.description = data["description"]
+            self.schema = _decode_union_15(data["schema"])
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["name"] = self.name
+        data["description"] = self.description
+        data["schema"] = self.schema.to_dict()
+        return data
+
+
+class ShuffleConfig(Struct):
+    __slots__ = (
+        "shuffle",
+        "seed",
+        "customSeed",
+    )
+    __json_fields__ = (
+        "shuffle",
+        "seed",
+        "customSeed",
+    )
+
+    def __init__(self, *, shuffle: bool, seed: str, customSeed: str) -> None:
+        self.shuffle = shuffle
+        self.seed = seed
+        self.customSeed = customSeed
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ShuffleConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.shuffle = data["shuffle"]
+            self.seed = data["seed"]
+            self.customSeed = data["customSeed"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["shuffle"] = self.shuffle
+        data["seed"] = self.seed
+        data["customSeed"] = self.customSeed
+        return data
+
+
+class ParsedItem(Struct):
+    __slots__ = (
+        "date",
+        "close",
+    )
+    __json_fields__ = (
+        "date",
+        "close",
+    )
+
+    def __init__(self, *, date: str, close: float) -> None:
+        self.date = date
+        self.close = close
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ParsedItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.date = data["date"]
+            self.close = data["close"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["date"] = self.date
+        data["close"] = self.close
+        return data
+
+
+class CustomCard(Struct):
+    __slots__ = (
+        "id",
+        "title",
+        "value",
+        "subtext",
+        "enabled",
+    )
+    __json_fields__ = (
+        "id",
+        "title",
+        "value",
+        "subtext",
+        "enabled",
+    )
+
+    def __init__(
+        self, *, id: str, title: str, value: str, subtext: str, enabled: bool
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.value = value
+        self.subtext = subtext
+        self.enabled = enabled
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CustomCard:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.title = data["title"]
+            self.value = data["value"]
+            self.subtext = data["subtext"]
+            self.enabled = data["enabled"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["title"] = self.title
+        data["value"] = self.value
+        data["subtext"] = self.subtext
+        data["enabled"] = self.enabled
+        return data
+
+
+class DiscussionItem(Struct):
+    __slots__ = (
+        "id",
+        "imageId",
+        "name",
+    )
+    __json_fields__ = (
+        "id",
+        "imageId",
+        "name",
+    )
+
+    def __init__(self, *, id: str, imageId: str, name: str) -> None:
+        self.id = id
+        self.imageId = imageId
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, data: dict) -> DiscussionItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.imageId = data["imageId"]
+            self.name = data["name"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["imageId"] = self.imageId
+        data["name"] = self.name
+        return data
+
+
+class MultipleChoiceItem(Struct):
+    __slots__ = (
+        "id",
+        "imageId",
+        "text",
+    )
+    __json_fields__ = (
+        "id",
+        "imageId",
+        "text",
+    )
+
+    def __init__(self, *, id: str, imageId: str, text: str) -> None:
+        self.id = id
+        self.imageId = imageId
+        self.text = text
+
+    @classmethod
+    def from_dict(cls, data: dict) -> MultipleChoiceItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.imageId = data["imageId"]
+            self.text = data["text"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["imageId"] = self.imageId
+        data["text"] = self.text
+        return data
+
+
+class ComparisonCondition(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "target",
+        "operator",
+        "value",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "target",
+        "operator",
+        "value",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        target: ConditionTargetReference,
+        operator: str,
+        value: str | float | bool,
+        type: str = "comparison",
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.target = target
+        self.operator = operator
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ComparisonCondition:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.target = ConditionTargetReference.from_dict(data["target"])
+            self.operator = data["operator"]
+            self.value = data["value"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "comparison")
+        if value != "comparison":
+            raise _mismatch(cls, "type", "comparison", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["target"] = self.target.to_dict()
+        data["operator"] = self.operator
+        data["value"] = self.value
+        return data
+
+
+class ConditionGroup(Struct):
+    __slots__ = (
+        "id",
+        "type",
+        "operator",
+        "conditions",
+    )
+    __json_fields__ = (
+        "id",
+        "type",
+        "operator",
+        "conditions",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        operator: str,
+        conditions: list[ComparisonCondition | ConditionGroup],
+        type: str = "group",
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.operator = operator
+        self.conditions = conditions
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ConditionGroup:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.operator = data["operator"]
+            self.conditions = [_decode_union_16(v0) for v0 in data["conditions"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "group")
+        if value != "group":
+            raise _mismatch(cls, "type", "group", value)
+        self.type = value
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["type"] = self.type
+        data["operator"] = self.operator
+        data["conditions"] = [v0.to_dict() for v0 in self.conditions]
+        return data
+
+
+class TransferGroup(Struct):
+    __slots__ = (
+        "id",
+        "name",
+        "composition",
+        "targetCohortAlias",
+    )
+    __json_fields__ = (
+        "id",
+        "name",
+        "composition",
+        "targetCohortAlias",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        name: str,
+        composition: list[GroupComposition],
+        targetCohortAlias: str | None = None,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.composition = composition
+        self.targetCohortAlias = targetCohortAlias
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TransferGroup:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.name = data["name"]
+            self.composition = [
+                GroupComposition.from_dict(v0) for v0 in data["composition"]
+            ]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.targetCohortAlias = data.get("targetCohortAlias")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["name"] = self.name
+        data["composition"] = [v0.to_dict() for v0 in self.composition]
+        value = self.targetCohortAlias
+        if value is not None:
+            data["targetCohortAlias"] = value
+        return data
+
+
+class AgentModelSettings(Struct):
+    __slots__ = (
+        "apiType",
+        "modelName",
+    )
+    __json_fields__ = (
+        "apiType",
+        "modelName",
+    )
+
+    def __init__(self, *, apiType: str, modelName: str) -> None:
+        self.apiType = apiType
+        self.modelName = modelName
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AgentModelSettings:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.apiType = data["apiType"]
+            self.modelName = data["modelName"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["apiType"] = self.apiType
+        data["modelName"] = self.modelName
+        return data
+
+
+class ParticipantProfileBase(Struct):
+    __slots__ = (
+        "pronouns",
+        "avatar",
+        "name",
+    )
+    __json_fields__ = (
+        "pronouns",
+        "avatar",
+        "name",
+    )
+
+    def __init__(
+        self,
+        *,
+        pronouns: str | None = None,
+        avatar: str | None = None,
+        name: str | None = None,
+    ) -> None:
+        self.pronouns = pronouns
+        self.avatar = avatar
+        self.name = name
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ParticipantProfileBase:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        self.pronouns = data.get("pronouns")
+        self.avatar = data.get("avatar")
+        self.name = data.get("name")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.pronouns
+        if value is not None:
+            data["pronouns"] = value
+        value = self.avatar
+        if value is not None:
+            data["avatar"] = value
+        value = self.name
+        if value is not None:
+            data["name"] = value
+        return data
+
+
+class TextPromptItem(Struct):
+    __slots__ = (
+        "type",
+        "text",
+        "condition",
+    )
+    __json_fields__ = (
+        "type",
+        "text",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        text: str,
+        type: str = "TEXT",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.type = type
+        self.text = text
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TextPromptItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.text = data["text"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "TEXT")
+        if value != "TEXT":
+            raise _mismatch(cls, "type", "TEXT", value)
+        self.type = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        data["text"] = self.text
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class ProfileInfoPromptItem(Struct):
+    __slots__ = (
+        "type",
+        "condition",
+    )
+    __json_fields__ = (
+        "type",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: str = "PROFILE_INFO",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.type = type
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProfileInfoPromptItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "PROFILE_INFO")
+        if value != "PROFILE_INFO":
+            raise _mismatch(cls, "type", "PROFILE_INFO", value)
+        self.type = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class ProfileContextPromptItem(Struct):
+    __slots__ = (
+        "type",
+        "condition",
+    )
+    __json_fields__ = (
+        "type",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: str = "PROFILE_CONTEXT",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.type = type
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProfileContextPromptItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "PROFILE_CONTEXT")
+        if value != "PROFILE_CONTEXT":
+            raise _mismatch(cls, "type", "PROFILE_CONTEXT", value)
+        self.type = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class StageContextPromptItem(Struct):
+    __slots__ = (
+        "type",
+        "stageId",
+        "includePrimaryText",
+        "includeInfoText",
+        "includeHelpText",
+        "includeStageDisplay",
+        "includeParticipantAnswers",
+        "condition",
+    )
+    __json_fields__ = (
+        "type",
+        "stageId",
+        "includePrimaryText",
+        "includeInfoText",
+        "includeHelpText",
+        "includeStageDisplay",
+        "includeParticipantAnswers",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        stageId: str,
+        includePrimaryText: bool,
+        includeInfoText: bool,
+        includeHelpText: bool,
+        includeStageDisplay: bool,
+        includeParticipantAnswers: bool,
+        type: str = "STAGE_CONTEXT",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.type = type
+        self.stageId = stageId
+        self.includePrimaryText = includePrimaryText
+        self.includeInfoText = includeInfoText
+        self.includeHelpText = includeHelpText
+        self.includeStageDisplay = includeStageDisplay
+        self.includeParticipantAnswers = includeParticipantAnswers
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StageContextPromptItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.stageId = data["stageId"]
+            self.includePrimaryText = data["includePrimaryText"]
+            self.includeInfoText = data["includeInfoText"]
+            self.includeHelpText = data["includeHelpText"]
+            self.includeStageDisplay = data["includeStageDisplay"]
+            self.includeParticipantAnswers = data["includeParticipantAnswers"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "STAGE_CONTEXT")
+        if value != "STAGE_CONTEXT":
+            raise _mismatch(cls, "type", "STAGE_CONTEXT", value)
+        self.type = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        data["stageId"] = self.stageId
+        data["includePrimaryText"] = self.includePrimaryText
+        data["includeInfoText"] = self.includeInfoText
+        data["includeHelpText"] = self.includeHelpText
+        data["includeStageDisplay"] = self.includeStageDisplay
+        data["includeParticipantAnswers"] = self.includeParticipantAnswers
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class ChatMediatorInstructionsPromptItem(Struct):
+    __slots__ = (
+        "type",
+        "condition",
+    )
+    __json_fields__ = (
+        "type",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: str = "CHAT_MEDIATOR_INSTRUCTIONS",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.type = type
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChatMediatorInstructionsPromptItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "CHAT_MEDIATOR_INSTRUCTIONS")
+        if value != "CHAT_MEDIATOR_INSTRUCTIONS":
+            raise _mismatch(cls, "type", "CHAT_MEDIATOR_INSTRUCTIONS", value)
+        self.type = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class ChatParticipantInstructionsPromptItem(Struct):
+    __slots__ = (
+        "type",
+        "condition",
+    )
+    __json_fields__ = (
+        "type",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: str = "CHAT_PARTICIPANT_INSTRUCTIONS",
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.type = type
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChatParticipantInstructionsPromptItem:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "CHAT_PARTICIPANT_INSTRUCTIONS")
+        if value != "CHAT_PARTICIPANT_INSTRUCTIONS":
+            raise _mismatch(cls, "type", "CHAT_PARTICIPANT_INSTRUCTIONS", value)
+        self.type = value
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class PromptItemGroup(Struct):
+    __slots__ = (
+        "type",
+        "title",
+        "items",
+        "shuffleConfig",
+        "condition",
+    )
+    __json_fields__ = (
+        "type",
+        "title",
+        "items",
+        "shuffleConfig",
+        "condition",
+    )
+
+    def __init__(
+        self,
+        *,
+        title: str,
+        items: list[
+            TextPromptItem
+            | ProfileInfoPromptItem
+            | ProfileContextPromptItem
+            | StageContextPromptItem
+            | ChatMediatorInstructionsPromptItem
+            | ChatParticipantInstructionsPromptItem
+            | PromptItemGroup
+        ],
+        type: str = "GROUP",
+        shuffleConfig: ShuffleConfig | None = None,
+        condition: ComparisonCondition | ConditionGroup | None = None,
+    ) -> None:
+        self.type = type
+        self.title = title
+        self.items = items
+        self.shuffleConfig = shuffleConfig
+        self.condition = condition
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PromptItemGroup:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.title = data["title"]
+            self.items = [_decode_union_13(v0) for v0 in data["items"]]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("type", "GROUP")
+        if value != "GROUP":
+            raise _mismatch(cls, "type", "GROUP", value)
+        self.type = value
+        value = data.get("shuffleConfig")
+        self.shuffleConfig = None if value is None else ShuffleConfig.from_dict(value)
+        value = data.get("condition")
+        self.condition = None if value is None else _decode_union_11(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        data["title"] = self.title
+        data["items"] = [v0.to_dict() for v0 in self.items]
+        value = self.shuffleConfig
+        if value is not None:
+            data["shuffleConfig"] = value.to_dict()
+        value = self.condition
+        if value is not None:
+            data["condition"] = None if value is None else value.to_dict()
+        return data
+
+
+class ModelGenerationConfig(Struct):
+    __slots__ = (
+        "maxTokens",
+        "stopSequences",
+        "temperature",
+        "topP",
+        "frequencyPenalty",
+        "presencePenalty",
+        "reasoningLevel",
+        "reasoningBudget",
+        "includeReasoning",
+        "disableSafetyFilters",
+        "providerOptions",
+        "customRequestBodyFields",
+    )
+    __json_fields__ = (
+        "maxTokens",
+        "stopSequences",
+        "temperature",
+        "topP",
+        "frequencyPenalty",
+        "presencePenalty",
+        "reasoningLevel",
+        "reasoningBudget",
+        "includeReasoning",
+        "disableSafetyFilters",
+        "providerOptions",
+        "customRequestBodyFields",
+    )
+
+    def __init__(
+        self,
+        *,
+        maxTokens: int | None = None,
+        stopSequences: list[str] | None = None,
+        temperature: float | None = None,
+        topP: float | None = None,
+        frequencyPenalty: float | None = None,
+        presencePenalty: float | None = None,
+        reasoningLevel: str | None = None,
+        reasoningBudget: int | None = None,
+        includeReasoning: bool | None = None,
+        disableSafetyFilters: bool | None = None,
+        providerOptions: ProviderOptionsMap | None = None,
+        customRequestBodyFields: list[CustomRequestBodyField] | None = None,
+    ) -> None:
+        self.maxTokens = maxTokens
+        self.stopSequences = stopSequences
+        self.temperature = temperature
+        self.topP = topP
+        self.frequencyPenalty = frequencyPenalty
+        self.presencePenalty = presencePenalty
+        self.reasoningLevel = reasoningLevel
+        self.reasoningBudget = reasoningBudget
+        self.includeReasoning = includeReasoning
+        self.disableSafetyFilters = disableSafetyFilters
+        self.providerOptions = providerOptions
+        self.customRequestBodyFields = customRequestBodyFields
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ModelGenerationConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        self.maxTokens = data.get("maxTokens")
+        self.stopSequences = data.get("stopSequences")
+        self.temperature = data.get("temperature")
+        self.topP = data.get("topP")
+        self.frequencyPenalty = data.get("frequencyPenalty")
+        self.presencePenalty = data.get("presencePenalty")
+        self.reasoningLevel = data.get("reasoningLevel")
+        self.reasoningBudget = data.get("reasoningBudget")
+        self.includeReasoning = data.get("includeReasoning")
+        self.disableSafetyFilters = data.get("disableSafetyFilters")
+        value = data.get("providerOptions")
+        self.providerOptions = (
+            None if value is None else _decode_provideroptionsmap_17(value)
+        )
+        value = data.get("customRequestBodyFields")
+        self.customRequestBodyFields = (
+            None if value is None else _decode_optional_18(value)
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.maxTokens
+        if value is not None:
+            data["maxTokens"] = value
+        value = self.stopSequences
+        if value is not None:
+            data["stopSequences"] = value
+        value = self.temperature
+        if value is not None:
+            data["temperature"] = value
+        value = self.topP
+        if value is not None:
+            data["topP"] = value
+        value = self.frequencyPenalty
+        if value is not None:
+            data["frequencyPenalty"] = value
+        value = self.presencePenalty
+        if value is not None:
+            data["presencePenalty"] = value
+        value = self.reasoningLevel
+        if value is not None:
+            data["reasoningLevel"] = value
+        value = self.reasoningBudget
+        if value is not None:
+            data["reasoningBudget"] = value
+        value = self.includeReasoning
+        if value is not None:
+            data["includeReasoning"] = value
+        value = self.disableSafetyFilters
+        if value is not None:
+            data["disableSafetyFilters"] = value
+        value = self.providerOptions
+        if value is not None:
+            data["providerOptions"] = None if value is None else value.to_dict()
+        value = self.customRequestBodyFields
+        if value is not None:
+            data["customRequestBodyFields"] = _encode(value)
+        return data
+
+
+class StructuredOutputConfig(Struct):
+    __slots__ = (
+        "enabled",
+        "type",
+        "schema",
+        "appendToPrompt",
+    )
+    __json_fields__ = (
+        "enabled",
+        "type",
+        "schema",
+        "appendToPrompt",
+    )
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        type: str,
+        appendToPrompt: bool,
+        schema: StructuredOutputSchema | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.type = type
+        self.schema = schema
+        self.appendToPrompt = appendToPrompt
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StructuredOutputConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.enabled = data["enabled"]
+            self.type = data["type"]
+            self.appendToPrompt = data["appendToPrompt"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("schema")
+        self.schema = (
+            None if value is None else _decode_structuredoutputschema_19(value)
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["enabled"] = self.enabled
+        data["type"] = self.type
+        value = self.schema
+        if value is not None:
+            data["schema"] = None if value is None else value.to_dict()
+        data["appendToPrompt"] = self.appendToPrompt
+        return data
+
+
+class ChatMediatorStructuredOutputConfig(Struct):
+    __slots__ = (
+        "enabled",
+        "type",
+        "schema",
+        "appendToPrompt",
+        "shouldRespondField",
+        "messageField",
+        "explanationField",
+        "readyToEndField",
+    )
+    __json_fields__ = (
+        "enabled",
+        "type",
+        "schema",
+        "appendToPrompt",
+        "shouldRespondField",
+        "messageField",
+        "explanationField",
+        "readyToEndField",
+    )
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        type: str,
+        appendToPrompt: bool,
+        shouldRespondField: str,
+        messageField: str,
+        explanationField: str,
+        readyToEndField: str,
+        schema: StructuredOutputSchema | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.type = type
+        self.schema = schema
+        self.appendToPrompt = appendToPrompt
+        self.shouldRespondField = shouldRespondField
+        self.messageField = messageField
+        self.explanationField = explanationField
+        self.readyToEndField = readyToEndField
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChatMediatorStructuredOutputConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.enabled = data["enabled"]
+            self.type = data["type"]
+            self.appendToPrompt = data["appendToPrompt"]
+            self.shouldRespondField = data["shouldRespondField"]
+            self.messageField = data["messageField"]
+            self.explanationField = data["explanationField"]
+            self.readyToEndField = data["readyToEndField"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        value = data.get("schema")
+        self.schema = (
+            None if value is None else _decode_structuredoutputschema_19(value)
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["enabled"] = self.enabled
+        data["type"] = self.type
+        value = self.schema
+        if value is not None:
+            data["schema"] = None if value is None else value.to_dict()
+        data["appendToPrompt"] = self.appendToPrompt
+        data["shouldRespondField"] = self.shouldRespondField
+        data["messageField"] = self.messageField
+        data["explanationField"] = self.explanationField
+        data["readyToEndField"] = self.readyToEndField
+        return data
+
+
+class AgentChatSettings(Struct):
+    __slots__ = (
+        "wordsPerMinute",
+        "minMessagesBeforeResponding",
+        "canSelfTriggerCalls",
+        "maxResponses",
+        "initialMessage",
+    )
+    __json_fields__ = (
+        "wordsPerMinute",
+        "minMessagesBeforeResponding",
+        "canSelfTriggerCalls",
+        "maxResponses",
+        "initialMessage",
+    )
+
+    def __init__(
+        self,
+        *,
+        minMessagesBeforeResponding: int,
+        canSelfTriggerCalls: bool,
+        initialMessage: str,
+        wordsPerMinute: float | None = None,
+        maxResponses: int | None = None,
+    ) -> None:
+        self.wordsPerMinute = wordsPerMinute
+        self.minMessagesBeforeResponding = minMessagesBeforeResponding
+        self.canSelfTriggerCalls = canSelfTriggerCalls
+        self.maxResponses = maxResponses
+        self.initialMessage = initialMessage
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AgentChatSettings:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.minMessagesBeforeResponding = data["minMessagesBeforeResponding"]
+            self.canSelfTriggerCalls = data["canSelfTriggerCalls"]
+            self.initialMessage = data["initialMessage"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.wordsPerMinute = data.get("wordsPerMinute")
+        self.maxResponses = data.get("maxResponses")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.wordsPerMinute
+        if value is not None:
+            data["wordsPerMinute"] = value
+        data["minMessagesBeforeResponding"] = self.minMessagesBeforeResponding
+        data["canSelfTriggerCalls"] = self.canSelfTriggerCalls
+        value = self.maxResponses
+        if value is not None:
+            data["maxResponses"] = value
+        data["initialMessage"] = self.initialMessage
+        return data
+
+
+class String(Struct):
+    __slots__ = (
+        "type",
+        "_extra",
+    )
+    __json_fields__ = ("type",)
+
+    def __init__(self, *, type: str = "string", **extra: Any) -> None:
+        self.type = type
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> String:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "string")
+        if value != "string":
+            raise _mismatch(cls, "type", "string", value)
+        self.type = value
+        self._extra = {
+            key: value for key, value in data.items() if key not in cls.__json_fields__
+        }
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        for key, value in self._extra.items():
+            if value is not None:
+                data[key] = _encode(value)
+        return data
+
+
+class Number(Struct):
+    __slots__ = (
+        "type",
+        "_extra",
+    )
+    __json_fields__ = ("type",)
+
+    def __init__(self, *, type: str = "number", **extra: Any) -> None:
+        self.type = type
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Number:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "number")
+        if value != "number":
+            raise _mismatch(cls, "type", "number", value)
+        self.type = value
+        self._extra = {
+            key: value for key, value in data.items() if key not in cls.__json_fields__
+        }
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        for key, value in self._extra.items():
+            if value is not None:
+                data[key] = _encode(value)
+        return data
+
+
+class Integer(Struct):
+    __slots__ = (
+        "type",
+        "_extra",
+    )
+    __json_fields__ = ("type",)
+
+    def __init__(self, *, type: str = "integer", **extra: Any) -> None:
+        self.type = type
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Integer:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "integer")
+        if value != "integer":
+            raise _mismatch(cls, "type", "integer", value)
+        self.type = value
+        self._extra = {
+            key: value for key, value in data.items() if key not in cls.__json_fields__
+        }
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        for key, value in self._extra.items():
+            if value is not None:
+                data[key] = _encode(value)
+        return data
+
+
+class Boolean(Struct):
+    __slots__ = (
+        "type",
+        "_extra",
+    )
+    __json_fields__ = ("type",)
+
+    def __init__(self, *, type: str = "boolean", **extra: Any) -> None:
+        self.type = type
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Boolean:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "boolean")
+        if value != "boolean":
+            raise _mismatch(cls, "type", "boolean", value)
+        self.type = value
+        self._extra = {
+            key: value for key, value in data.items() if key not in cls.__json_fields__
+        }
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        for key, value in self._extra.items():
+            if value is not None:
+                data[key] = _encode(value)
+        return data
+
+
+class Object(Struct):
+    __slots__ = (
+        "type",
+        "properties",
+        "_extra",
+    )
+    __json_fields__ = (
+        "type",
+        "properties",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: str = "object",
+        properties: (
+            dict[str, String | Number | Integer | Boolean | Object | Array] | None
+        ) = None,
+        **extra: Any,
+    ) -> None:
+        self.type = type
+        self.properties = properties
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Object:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "object")
+        if value != "object":
+            raise _mismatch(cls, "type", "object", value)
+        self.type = value
+        value = data.get("properties")
+        self.properties = (
+            None
+            if value is None
+            else {k0: _decode_union_15(v0) for k0, v0 in value.items()}
+        )
+        self._extra = {
+            key: value for key, value in data.items() if key not in cls.__json_fields__
+        }
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.properties
+        if value is not None:
+            data["properties"] = {k0: v0.to_dict() for k0, v0 in value.items()}
+        for key, value in self._extra.items():
+            if value is not None:
+                data[key] = _encode(value)
+        return data
+
+
+class Array(Struct):
+    __slots__ = (
+        "type",
+        "items",
+        "_extra",
+    )
+    __json_fields__ = (
+        "type",
+        "items",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: str = "array",
+        items: String | Number | Integer | Boolean | Object | Array | None = None,
+        **extra: Any,
+    ) -> None:
+        self.type = type
+        self.items = items
+        self._extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Array:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "array")
+        if value != "array":
+            raise _mismatch(cls, "type", "array", value)
+        self.type = value
+        value = data.get("items")
+        self.items = None if value is None else _decode_union_15(value)
+        self._extra = {
+            key: value for key, value in data.items() if key not in cls.__json_fields__
+        }
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.items
+        if value is not None:
+            data["items"] = value.to_dict()
+        for key, value in self._extra.items():
+            if value is not None:
+                data[key] = _encode(value)
+        return data
+
+
+class ConditionTargetReference(Struct):
+    __slots__ = (
+        "stageId",
+        "questionId",
+    )
+    __json_fields__ = (
+        "stageId",
+        "questionId",
+    )
+
+    def __init__(self, *, stageId: str, questionId: str) -> None:
+        self.stageId = stageId
+        self.questionId = questionId
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ConditionTargetReference:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.stageId = data["stageId"]
+            self.questionId = data["questionId"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["stageId"] = self.stageId
+        data["questionId"] = self.questionId
+        return data
+
+
+class GroupComposition(Struct):
+    __slots__ = (
+        "id",
+        "condition",
+        "minCount",
+        "maxCount",
+    )
+    __json_fields__ = (
+        "id",
+        "condition",
+        "minCount",
+        "maxCount",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        condition: ComparisonCondition | ConditionGroup,
+        minCount: int,
+        maxCount: int,
+    ) -> None:
+        self.id = id
+        self.condition = condition
+        self.minCount = minCount
+        self.maxCount = maxCount
+
+    @classmethod
+    def from_dict(cls, data: dict) -> GroupComposition:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.id = data["id"]
+            self.condition = _decode_union_16(data["condition"])
+            self.minCount = data["minCount"]
+            self.maxCount = data["maxCount"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["id"] = self.id
+        data["condition"] = self.condition.to_dict()
+        data["minCount"] = self.minCount
+        data["maxCount"] = self.maxCount
+        return data
+
+
+class ProviderOptionsMap(Struct):
+    __slots__ = (
+        "google",
+        "anthropic",
+        "openai",
+        "ollama",
+    )
+    __json_fields__ = (
+        "google",
+        "anthropic",
+        "openai",
+        "ollama",
+    )
+
+    def __init__(
+        self,
+        *,
+        google: GoogleProviderOptions | None = None,
+        anthropic: AnthropicProviderOptions | None = None,
+        openai: OpenAIProviderOptions | None = None,
+        ollama: OllamaProviderOptions | None = None,
+    ) -> None:
+        self.google = google
+        self.anthropic = anthropic
+        self.openai = openai
+        self.ollama = ollama
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ProviderOptionsMap:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("google")
+        self.google = None if value is None else GoogleProviderOptions.from_dict(value)
+        value = data.get("anthropic")
+        self.anthropic = (
+            None if value is None else AnthropicProviderOptions.from_dict(value)
+        )
+        value = data.get("openai")
+        self.openai = None if value is None else OpenAIProviderOptions.from_dict(value)
+        value = data.get("ollama")
+        self.ollama = None if value is None else OllamaProviderOptions.from_dict(value)
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.google
+        if value is not None:
+            data["google"] = value.to_dict()
+        value = self.anthropic
+        if value is not None:
+            data["anthropic"] = value.to_dict()
+        value = self.openai
+        if value is not None:
+            data["openai"] = value.to_dict()
+        value = self.ollama
+        if value is not None:
+            data["ollama"] = value.to_dict()
+        return data
+
+
+class CustomRequestBodyField(Struct):
+    __slots__ = (
+        "name",
+        "value",
+    )
+    __json_fields__ = (
+        "name",
+        "value",
+    )
+
+    def __init__(self, *, name: str, value: str) -> None:
+        self.name = name
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CustomRequestBodyField:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.name = data["name"]
+            self.value = data["value"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["name"] = self.name
+        data["value"] = self.value
+        return data
+
+
+class StructuredOutputSchema(Struct):
+    __slots__ = (
+        "type",
+        "description",
+        "properties",
+        "arrayItems",
+        "enumItems",
+    )
+    __json_fields__ = (
+        "type",
+        "description",
+        "properties",
+        "arrayItems",
+        "enumItems",
+    )
+
+    def __init__(
+        self,
+        *,
+        type: str,
+        description: str | None = None,
+        properties: list[StructuredOutputSchemaProperty] | None = None,
+        arrayItems: StructuredOutputSchema | None = None,
+        enumItems: list[str] | None = None,
+    ) -> None:
+        self.type = type
+        self.description = description
+        self.properties = properties
+        self.arrayItems = arrayItems
+        self.enumItems = enumItems
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StructuredOutputSchema:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.type = data["type"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.description = data.get("description")
+        value = data.get("properties")
+        self.properties = None if value is None else _decode_optional_20(value)
+        value = data.get("arrayItems")
+        self.arrayItems = (
+            None if value is None else _decode_structuredoutputschema_19(value)
+        )
+        self.enumItems = data.get("enumItems")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.description
+        if value is not None:
+            data["description"] = value
+        value = self.properties
+        if value is not None:
+            data["properties"] = _encode(value)
+        value = self.arrayItems
+        if value is not None:
+            data["arrayItems"] = None if value is None else value.to_dict()
+        value = self.enumItems
+        if value is not None:
+            data["enumItems"] = value
+        return data
+
+
+class GoogleProviderOptions(Struct):
+    __slots__ = (
+        "thinkingConfig",
+        "safetySettings",
+    )
+    __json_fields__ = (
+        "thinkingConfig",
+        "safetySettings",
+    )
+
+    def __init__(
+        self,
+        *,
+        thinkingConfig: GoogleThinkingConfig | None = None,
+        safetySettings: list[GoogleSafetySetting] | None = None,
+    ) -> None:
+        self.thinkingConfig = thinkingConfig
+        self.safetySettings = safetySettings
+
+    @classmethod
+    def from_dict(cls, data: dict) -> GoogleProviderOptions:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("thinkingConfig")
+        self.thinkingConfig = (
+            None if value is None else GoogleThinkingConfig.from_dict(value)
+        )
+        value = data.get("safetySettings")
+        self.safetySettings = (
+            None
+            if value is None
+            else [GoogleSafetySetting.from_dict(v0) for v0 in value]
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.thinkingConfig
+        if value is not None:
+            data["thinkingConfig"] = value.to_dict()
+        value = self.safetySettings
+        if value is not None:
+            data["safetySettings"] = [v0.to_dict() for v0 in value]
+        return data
+
+
+class AnthropicProviderOptions(Struct):
+    __slots__ = (
+        "thinking",
+        "effort",
+        "cacheControl",
+        "sendReasoning",
+    )
+    __json_fields__ = (
+        "thinking",
+        "effort",
+        "cacheControl",
+        "sendReasoning",
+    )
+
+    def __init__(
+        self,
+        *,
+        thinking: AnthropicThinkingConfig | None = None,
+        effort: str | None = None,
+        cacheControl: AnthropicCacheControl | None = None,
+        sendReasoning: bool | None = None,
+    ) -> None:
+        self.thinking = thinking
+        self.effort = effort
+        self.cacheControl = cacheControl
+        self.sendReasoning = sendReasoning
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AnthropicProviderOptions:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("thinking")
+        self.thinking = (
+            None if value is None else AnthropicThinkingConfig.from_dict(value)
+        )
+        self.effort = data.get("effort")
+        value = data.get("cacheControl")
+        self.cacheControl = (
+            None if value is None else AnthropicCacheControl.from_dict(value)
+        )
+        self.sendReasoning = data.get("sendReasoning")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.thinking
+        if value is not None:
+            data["thinking"] = value.to_dict()
+        value = self.effort
+        if value is not None:
+            data["effort"] = value
+        value = self.cacheControl
+        if value is not None:
+            data["cacheControl"] = value.to_dict()
+        value = self.sendReasoning
+        if value is not None:
+            data["sendReasoning"] = value
+        return data
+
+
+class OpenAIProviderOptions(Struct):
+    __slots__ = (
+        "reasoningEffort",
+        "parallelToolCalls",
+    )
+    __json_fields__ = (
+        "reasoningEffort",
+        "parallelToolCalls",
+    )
+
+    def __init__(
+        self,
+        *,
+        reasoningEffort: str | None = None,
+        parallelToolCalls: bool | None = None,
+    ) -> None:
+        self.reasoningEffort = reasoningEffort
+        self.parallelToolCalls = parallelToolCalls
+
+    @classmethod
+    def from_dict(cls, data: dict) -> OpenAIProviderOptions:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        self.reasoningEffort = data.get("reasoningEffort")
+        self.parallelToolCalls = data.get("parallelToolCalls")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.reasoningEffort
+        if value is not None:
+            data["reasoningEffort"] = value
+        value = self.parallelToolCalls
+        if value is not None:
+            data["parallelToolCalls"] = value
+        return data
+
+
+class OllamaProviderOptions(Struct):
+    __slots__ = (
+        "numCtx",
+        "numPredict",
+    )
+    __json_fields__ = (
+        "numCtx",
+        "numPredict",
+    )
+
+    def __init__(
+        self, *, numCtx: int | None = None, numPredict: int | None = None
+    ) -> None:
+        self.numCtx = numCtx
+        self.numPredict = numPredict
+
+    @classmethod
+    def from_dict(cls, data: dict) -> OllamaProviderOptions:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        self.numCtx = data.get("numCtx")
+        self.numPredict = data.get("numPredict")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.numCtx
+        if value is not None:
+            data["numCtx"] = value
+        value = self.numPredict
+        if value is not None:
+            data["numPredict"] = value
+        return data
+
+
+class StructuredOutputSchemaProperty(Struct):
+    __slots__ = (
+        "name",
+        "schema",
+    )
+    __json_fields__ = (
+        "name",
+        "schema",
+    )
+
+    def __init__(self, *, name: str, schema: StructuredOutputSchema) -> None:
+        self.name = name
+        self.schema = schema
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StructuredOutputSchemaProperty:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.name = data["name"]
+            self.schema = StructuredOutputSchema.from_dict(data["schema"])
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["name"] = self.name
+        data["schema"] = self.schema.to_dict()
+        return data
+
+
+class GoogleThinkingConfig(Struct):
+    __slots__ = (
+        "thinkingBudget",
+        "includeThoughts",
+        "thinkingLevel",
+    )
+    __json_fields__ = (
+        "thinkingBudget",
+        "includeThoughts",
+        "thinkingLevel",
+    )
+
+    def __init__(
+        self,
+        *,
+        thinkingBudget: int | None = None,
+        includeThoughts: bool | None = None,
+        thinkingLevel: str | None = None,
+    ) -> None:
+        self.thinkingBudget = thinkingBudget
+        self.includeThoughts = includeThoughts
+        self.thinkingLevel = thinkingLevel
+
+    @classmethod
+    def from_dict(cls, data: dict) -> GoogleThinkingConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        self.thinkingBudget = data.get("thinkingBudget")
+        self.includeThoughts = data.get("includeThoughts")
+        self.thinkingLevel = data.get("thinkingLevel")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        value = self.thinkingBudget
+        if value is not None:
+            data["thinkingBudget"] = value
+        value = self.includeThoughts
+        if value is not None:
+            data["includeThoughts"] = value
+        value = self.thinkingLevel
+        if value is not None:
+            data["thinkingLevel"] = value
+        return data
+
+
+class GoogleSafetySetting(Struct):
+    __slots__ = (
+        "category",
+        "threshold",
+    )
+    __json_fields__ = (
+        "category",
+        "threshold",
+    )
+
+    def __init__(self, *, category: str, threshold: str) -> None:
+        self.category = category
+        self.threshold = threshold
+
+    @classmethod
+    def from_dict(cls, data: dict) -> GoogleSafetySetting:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.category = data["category"]
+            self.threshold = data["threshold"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["category"] = self.category
+        data["threshold"] = self.threshold
+        return data
+
+
+class AnthropicThinkingConfig(Struct):
+    __slots__ = (
+        "type",
+        "budgetTokens",
+    )
+    __json_fields__ = (
+        "type",
+        "budgetTokens",
+    )
+
+    def __init__(self, *, type: str, budgetTokens: int | None = None) -> None:
+        self.type = type
+        self.budgetTokens = budgetTokens
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AnthropicThinkingConfig:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        try:
+            self.type = data["type"]
+        except KeyError as error:
+            raise _missing(cls, error) from None
+        self.budgetTokens = data.get("budgetTokens")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.budgetTokens
+        if value is not None:
+            data["budgetTokens"] = value
+        return data
+
+
+class AnthropicCacheControl(Struct):
+    __slots__ = (
+        "type",
+        "ttl",
+    )
+    __json_fields__ = (
+        "type",
+        "ttl",
+    )
+
+    def __init__(self, *, type: str = "ephemeral", ttl: str | None = None) -> None:
+        self.type = type
+        self.ttl = ttl
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AnthropicCacheControl:
+        if not isinstance(data, dict):
+            raise _not_object(cls, data)
+        self = cls.__new__(cls)
+        value = data.get("type", "ephemeral")
+        if value != "ephemeral":
+            raise _mismatch(cls, "type", "ephemeral", value)
+        self.type = value
+        self.ttl = data.get("ttl")
+        return self
+
+    def to_dict(self) -> dict:
+        data: dict[str, Any] = {}
+        data["type"] = self.type
+        value = self.ttl
+        if value is not None:
+            data["ttl"] = value
+        return data
+
+
+# Union decoders: dispatch on tag fields such as 'kind'
+
+
+def _decode_union_0(value: dict) -> Struct:
+    decoder = _DECODE_UNION_0.get(value.get("kind"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                AssetAllocationStageConfig.from_dict,
+                MultiAssetAllocationStageConfig.from_dict,
+                ChatStageConfig.from_dict,
+                ChipStageConfig.from_dict,
+                ComprehensionStageConfig.from_dict,
+                FlipCardStageConfig.from_dict,
+                InfoStageConfig.from_dict,
+                PayoutStageConfig.from_dict,
+                PrivateChatStageConfig.from_dict,
+                ProfileStageConfig.from_dict,
+                ItemRankingStageConfig.from_dict,
+                ParticipantRankingStageConfig.from_dict,
+                RevealStageConfig.from_dict,
+                RoleStageConfig.from_dict,
+                NegotiationProfileStageConfig.from_dict,
+                NegotiationPayoutStageConfig.from_dict,
+                SalespersonStageConfig.from_dict,
+                StockInfoStageConfig.from_dict,
+                SurveyPerParticipantStageConfig.from_dict,
+                SurveyStageConfig.from_dict,
+                TOSStageConfig.from_dict,
+                TransferStageConfig.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_1(value: dict) -> Struct:
+    decoder = _DECODE_UNION_1.get(value.get("rankingType"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                ItemRankingStageConfig.from_dict,
+                ParticipantRankingStageConfig.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_2(value: dict) -> Struct:
+    decoder = _DECODE_UNION_2.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                StaticVariableConfig.from_dict,
+                RandomPermutationVariableConfig.from_dict,
+                BalancedAssignmentVariableConfig.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_3(value: dict) -> Struct:
+    decoder = _DECODE_UNION_3.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                DefaultChatDiscussion.from_dict,
+                CompareChatDiscussion.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_4(value: dict) -> Struct:
+    decoder = _DECODE_UNION_4.get(value.get("kind"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                TextQuestion.from_dict,
+                McQuestion.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_5(value: dict) -> Struct:
+    decoder = _DECODE_UNION_5.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                DefaultPayoutItem.from_dict,
+                ChipPayoutItem.from_dict,
+                SurveyPayoutItem.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_6(value: dict) -> Struct:
+    decoder = _DECODE_UNION_6.get(value.get("kind"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                ChipRevealItem.from_dict,
+                RankingRevealItem.from_dict,
+                SurveyRevealItem.from_dict,
+                MultiAssetAllocationRevealItem.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_7(value: dict) -> Struct:
+    decoder = _DECODE_UNION_7.get(value.get("kind"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                TextSurveyQuestion.from_dict,
+                CheckSurveyQuestion.from_dict,
+                MultipleChoiceSurveyQuestion.from_dict,
+                ScaleSurveyQuestion.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_8(value: Any) -> Any:
+    if value is None:
+        return None
+    return _decode_union_9(value)
+
+
+def _decode_union_9(value: dict) -> Struct:
+    decoder = _DECODE_UNION_9.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                DefaultAutoTransferConfig.from_dict,
+                SurveyAutoTransferConfig.from_dict,
+                ConditionAutoTransferConfig.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_10(value: dict) -> Struct:
+    decoder = _DECODE_UNION_10.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                ChatPromptConfig.from_dict,
+                GenericPromptConfig.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_11(value: Any) -> Any:
+    if value is None:
+        return None
+    return _decode_union_12(value)
+
+
+def _decode_union_12(value: dict) -> Struct:
+    decoder = _DECODE_UNION_12.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                ComparisonCondition.from_dict,
+                ConditionGroup.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_13(value: dict) -> Struct:
+    decoder = _DECODE_UNION_13.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                TextPromptItem.from_dict,
+                ProfileInfoPromptItem.from_dict,
+                ProfileContextPromptItem.from_dict,
+                StageContextPromptItem.from_dict,
+                ChatMediatorInstructionsPromptItem.from_dict,
+                ChatParticipantInstructionsPromptItem.from_dict,
+                PromptItemGroup.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_14(value: dict) -> Struct:
+    return _decode_best(
+        value,
+        (
+            StructuredOutputConfig.from_dict,
+            ChatMediatorStructuredOutputConfig.from_dict,
+        ),
+        "union",
+    )
+
+
+def _decode_union_15(value: dict) -> Struct:
+    decoder = _DECODE_UNION_15.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                String.from_dict,
+                Number.from_dict,
+                Integer.from_dict,
+                Boolean.from_dict,
+                Object.from_dict,
+                Array.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_union_16(value: dict) -> Struct:
+    decoder = _DECODE_UNION_16.get(value.get("type"))
+    if decoder is None:
+        return _decode_best(
+            value,
+            (
+                ComparisonCondition.from_dict,
+                ConditionGroup.from_dict,
+            ),
+            "union",
+        )
+    return decoder(value)
+
+
+def _decode_provideroptionsmap_17(value: Any) -> Any:
+    if value is None:
+        return None
+    return ProviderOptionsMap.from_dict(value)
+
+
+def _decode_optional_18(value: Any) -> Any:
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        return value
+    return [CustomRequestBodyField.from_dict(v0) for v0 in value]
+
+
+def _decode_structuredoutputschema_19(value: Any) -> Any:
+    if value is None:
+        return None
+    return StructuredOutputSchema.from_dict(value)
+
+
+def _decode_optional_20(value: Any) -> Any:
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        return value
+    return [StructuredOutputSchemaProperty.from_dict(v0) for v0 in value]
+
+
+_DECODE_UNION_1: dict[Any, Callable[[dict], Struct]] = {
+    "items": ItemRankingStageConfig.from_dict,
+    "participants": ParticipantRankingStageConfig.from_dict,
+}
+
+
+_DECODE_UNION_0: dict[Any, Callable[[dict], Struct]] = {
+    "assetAllocation": AssetAllocationStageConfig.from_dict,
+    "multiAssetAllocation": MultiAssetAllocationStageConfig.from_dict,
+    "chat": ChatStageConfig.from_dict,
+    "chip": ChipStageConfig.from_dict,
+    "comprehension": ComprehensionStageConfig.from_dict,
+    "flipcard": FlipCardStageConfig.from_dict,
+    "info": InfoStageConfig.from_dict,
+    "payout": PayoutStageConfig.from_dict,
+    "privateChat": PrivateChatStageConfig.from_dict,
+    "profile": ProfileStageConfig.from_dict,
+    "ranking": _decode_union_1,
+    "reveal": RevealStageConfig.from_dict,
+    "role": RoleStageConfig.from_dict,
+    "negotiationProfile": NegotiationProfileStageConfig.from_dict,
+    "negotiationPayout": NegotiationPayoutStageConfig.from_dict,
+    "salesperson": SalespersonStageConfig.from_dict,
+    "stockinfo": StockInfoStageConfig.from_dict,
+    "surveyPerParticipant": SurveyPerParticipantStageConfig.from_dict,
+    "survey": SurveyStageConfig.from_dict,
+    "tos": TOSStageConfig.from_dict,
+    "transfer": TransferStageConfig.from_dict,
+}
+
+
+_DECODE_UNION_2: dict[Any, Callable[[dict], Struct]] = {
+    "static": StaticVariableConfig.from_dict,
+    "random_permutation": RandomPermutationVariableConfig.from_dict,
+    "balanced_assignment": BalancedAssignmentVariableConfig.from_dict,
+}
+
+
+_DECODE_UNION_3: dict[Any, Callable[[dict], Struct]] = {
+    "DEFAULT": DefaultChatDiscussion.from_dict,
+    "COMPARE": CompareChatDiscussion.from_dict,
+}
+
+
+_DECODE_UNION_4: dict[Any, Callable[[dict], Struct]] = {
+    "text": TextQuestion.from_dict,
+    "mc": McQuestion.from_dict,
+}
+
+
+_DECODE_UNION_5: dict[Any, Callable[[dict], Struct]] = {
+    "DEFAULT": DefaultPayoutItem.from_dict,
+    "CHIP": ChipPayoutItem.from_dict,
+    "SURVEY": SurveyPayoutItem.from_dict,
+}
+
+
+_DECODE_UNION_6: dict[Any, Callable[[dict], Struct]] = {
+    "chip": ChipRevealItem.from_dict,
+    "ranking": RankingRevealItem.from_dict,
+    "survey": SurveyRevealItem.from_dict,
+    "multiAssetAllocation": MultiAssetAllocationRevealItem.from_dict,
+}
+
+
+_DECODE_UNION_7: dict[Any, Callable[[dict], Struct]] = {
+    "text": TextSurveyQuestion.from_dict,
+    "check": CheckSurveyQuestion.from_dict,
+    "mc": MultipleChoiceSurveyQuestion.from_dict,
+    "scale": ScaleSurveyQuestion.from_dict,
+}
+
+
+_DECODE_UNION_9: dict[Any, Callable[[dict], Struct]] = {
+    "default": DefaultAutoTransferConfig.from_dict,
+    "survey": SurveyAutoTransferConfig.from_dict,
+    "condition": ConditionAutoTransferConfig.from_dict,
+}
+
+
+_DECODE_UNION_10: dict[Any, Callable[[dict], Struct]] = {
+    "info": GenericPromptConfig.from_dict,
+    "tos": GenericPromptConfig.from_dict,
+    "profile": GenericPromptConfig.from_dict,
+    "chip": GenericPromptConfig.from_dict,
+    "comprehension": GenericPromptConfig.from_dict,
+    "flipcard": GenericPromptConfig.from_dict,
+    "ranking": GenericPromptConfig.from_dict,
+    "payout": GenericPromptConfig.from_dict,
+    "reveal": GenericPromptConfig.from_dict,
+    "salesperson": GenericPromptConfig.from_dict,
+    "stockinfo": GenericPromptConfig.from_dict,
+    "assetAllocation": GenericPromptConfig.from_dict,
+    "multiAssetAllocation": GenericPromptConfig.from_dict,
+    "role": GenericPromptConfig.from_dict,
+    "negotiationProfile": GenericPromptConfig.from_dict,
+    "negotiationPayout": GenericPromptConfig.from_dict,
+    "survey": GenericPromptConfig.from_dict,
+    "surveyPerParticipant": GenericPromptConfig.from_dict,
+    "transfer": GenericPromptConfig.from_dict,
+}
+
+
+_DECODE_UNION_12: dict[Any, Callable[[dict], Struct]] = {
+    "comparison": ComparisonCondition.from_dict,
+    "group": ConditionGroup.from_dict,
+}
+
+
+_DECODE_UNION_13: dict[Any, Callable[[dict], Struct]] = {
+    "TEXT": TextPromptItem.from_dict,
+    "PROFILE_INFO": ProfileInfoPromptItem.from_dict,
+    "PROFILE_CONTEXT": ProfileContextPromptItem.from_dict,
+    "STAGE_CONTEXT": StageContextPromptItem.from_dict,
+    "CHAT_MEDIATOR_INSTRUCTIONS": ChatMediatorInstructionsPromptItem.from_dict,
+    "CHAT_PARTICIPANT_INSTRUCTIONS": ChatParticipantInstructionsPromptItem.from_dict,
+    "GROUP": PromptItemGroup.from_dict,
+}
+
+
+_DECODE_UNION_15: dict[Any, Callable[[dict], Struct]] = {
+    "string": String.from_dict,
+    "number": Number.from_dict,
+    "integer": Integer.from_dict,
+    "boolean": Boolean.from_dict,
+    "object": Object.from_dict,
+    "array": Array.from_dict,
+}
+
+
+_DECODE_UNION_16: dict[Any, Callable[[dict], Struct]] = {
+    "comparison": ComparisonCondition.from_dict,
+    "group": ConditionGroup.from_dict,
+}
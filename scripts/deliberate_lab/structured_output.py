@@ -0,0 +1,470 @@
+"""
+Bulk conformance checks of logged model responses against structured
+output schemas.
+
+A StructuredOutputSchema tree is compiled once (compile_schema()) into
+a generated Python function that tests a response with inline type
+checks, one block per schema node, so validating a response does no
+schema interpretation. Only responses that fail are checked again by
+nested checker functions that find the path of the first mismatch.
+
+check_log_conformance() runs compiled schemas over a stream of model log
+entries (from Client.iter_experiment_logs(), iter_logs_ndjson(), a
+LogArchive, ...), picking each entry's schema by agent persona ID and
+stage ID, optionally across worker processes, and reports conformance
+per agent with samples of the failures.
+
+Responses are read as the server does (getStructuredOutput in
+utils/src/model_response.ts): the provider's parsed object if there is
+one, else the response text with ```json fences removed. The server's
+jsonrepair fallback is not replicated, so malformed JSON the server
+could repair counts as a parse failure here.
+
+Usage:
+    from deliberate_lab.structured_output import (
+        check_log_conformance, compile_schema, structured_output_schemas,
+    )
+
+    schemas = structured_output_schemas(template)   # or an export
+    report = check_log_conformance(
+        client.iter_experiment_logs("exp123"), schemas, workers=4
+    )
+    print(report.summary())
+
+    validator = compile_schema(schema)
+    validator.validate({"response": "hi"})   # None, or "$.shouldRespond: ..."
+"""
+
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+import itertools
+import json
+import re
+
+from deliberate_lab.conditions import _as_dict
+
+# (path suffix, message) of the first mismatch, or None if the value conforms
+_Check = Callable[[Any], Optional[tuple[str, str]]]
+
+# (agent persona ID, stage ID) -> StructuredOutputSchema (dict)
+SchemaMap = dict[tuple[str, str], dict]
+
+# Log entries per worker task in check_log_conformance(workers=...)
+_CHUNK_SIZE = 2000
+
+_FENCE = re.compile(r"```json\s*|\s*```")
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return type(value).__name__
+
+
+def _mismatch(expected: str, value: Any) -> tuple[str, str]:
+    return "", f"expected {expected}, got {_json_type(value)}"
+
+
+def _compile_node(schema: dict) -> _Check:
+    """Compile one schema node (and its children) into a checker."""
+    data_type = schema.get("type")
+    enum_items = schema.get("enumItems")
+    allowed = frozenset(enum_items) if enum_items is not None else None
+
+    if data_type in ("STRING", "ENUM"):
+        if allowed is None:
+            return lambda value: (
+                None if isinstance(value, str) else _mismatch("string", value)
+            )
+
+        def check_enum(value: Any) -> Optional[tuple[str, str]]:
+            if not isinstance(value, str):
+                return _mismatch("string", value)
+            if value not in allowed:
+                return "", f"{value!r} is not one of {sorted(allowed)}"
+            return None
+
+        return check_enum
+
+    if data_type == "NUMBER":
+        return lambda value: (
+            None if type(value) in (int, float) else _mismatch("number", value)
+        )
+
+    if data_type == "INTEGER":
+        return lambda value: (
+            None
+            if type(value) is int or (type(value) is float and value.is_integer())
+            else _mismatch("integer", value)
+        )
+
+    if data_type == "BOOLEAN":
+        return lambda value: (
+            None if type(value) is bool else _mismatch("boolean", value)
+        )
+
+    if data_type == "ARRAY":
+        items = schema.get("arrayItems")
+        if items is None:
+            return lambda value: (
+                None if isinstance(value, list) else _mismatch("array", value)
+            )
+        check_item = _compile_node(items)
+
+        def check_array(value: Any) -> Optional[tuple[str, str]]:
+            if not isinstance(value, list):
+                return _mismatch("array", value)
+            for i, item in enumerate(value):
+                error = check_item(item)
+                if error is not None:
+                    return f"[{i}]{error[0]}", error[1]
+            return None
+
+        return check_array
+
+    if data_type == "OBJECT":
+        # All properties are required (schemaToObject in structured_output.ts);
+        # other keys are allowed
+        properties = [
+            (prop["name"], _compile_node(prop["schema"]))
+            for prop in schema.get("properties") or []
+        ]
+
+        def check_object(value: Any) -> Optional[tuple[str, str]]:
+            if not isinstance(value, dict):
+                return _mismatch("object", value)
+            for name, check_property in properties:
+                if name not in value:
+                    return "", f"missing property {name!r}"
+                error = check_property(value[name])
+                if error is not None:
+                    return f".{name}{error[0]}", error[1]
+            return None
+
+        return check_object
+
+    raise ValueError(f"Unknown structured output data type: {data_type!r}")
+
+
+def _generate_is_valid(schema: dict) -> Callable[[Any], bool]:
+    """
+    Generate and compile a flat Python function testing conformance.
+
+    Each schema node becomes a few inline type tests (and a loop per
+    array), so a conforming response costs no function call per node.
+    """
+    lines = ["def is_valid(x0):"]
+    namespace: dict[str, Any] = {"_missing": object()}
+    counter = itertools.count(1)
+
+    def emit(node: dict, var: str, depth: int) -> None:
+        indent = "    " * depth
+        data_type = node.get("type")
+        if data_type in ("STRING", "ENUM"):
+            lines.append(f"{indent}if not isinstance({var}, str): return False")
+            if node.get("enumItems") is not None:
+                name = f"_enum{next(counter)}"
+                namespace[name] = frozenset(node["enumItems"])
+                lines.append(f"{indent}if {var} not in {name}: return False")
+        elif data_type == "NUMBER":
+            lines.append(
+                f"{indent}if type({var}) is not int and type({var}) is not float:"
+                " return False"
+            )
+        elif data_type == "INTEGER":
+            lines.append(
+                f"{indent}if type({var}) is not int and not"
+                f" (type({var}) is float and {var}.is_integer()): return False"
+            )
+        elif data_type == "BOOLEAN":
+            lines.append(f"{indent}if type({var}) is not bool: return False")
+        elif data_type == "ARRAY":
+            lines.append(f"{indent}if not isinstance({var}, list): return False")
+            if node.get("arrayItems") is not None:
+                item = f"x{next(counter)}"
+                lines.append(f"{indent}for {item} in {var}:")
+                emit(node["arrayItems"], item, depth + 1)
+        elif data_type == "OBJECT":
+            lines.append(f"{indent}if not isinstance({var}, dict): return False")
+            for prop in node.get("properties") or []:
+                child = f"x{next(counter)}"
+                lines.append(f"{indent}{child} = {var}.get({prop['name']!r}, _missing)")
+                lines.append(f"{indent}if {child} is _missing: return False")
+                emit(prop["schema"], child, depth)
+        else:
+            raise ValueError(f"Unknown structured output data type: {data_type!r}")
+
+    emit(schema, "x0", 1)
+    lines.append("    return True")
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["is_valid"]
+
+
+class CompiledSchema:
+    """
+    A StructuredOutputSchema compiled for repeated validation.
+
+    Conformance is tested by a generated function; the checker functions
+    that locate the mismatch only run for responses that fail.
+    """
+
+    def __init__(self, schema: Any):
+        self.schema = _as_dict(schema)
+        self._check = _compile_node(self.schema)
+        self.is_valid = _generate_is_valid(self.schema)
+
+    def validate(self, value: Any) -> Optional[str]:
+        """None if the value conforms, else the first mismatch, e.g.
+        "$.items[2].score: expected number, got string"."""
+        if self.is_valid(value):
+            return None
+        error = self._check(value)
+        return f"${error[0]}: {error[1]}" if error is not None else None
+
+
+def compile_schema(schema: Any) -> CompiledSchema:
+    """Compile a StructuredOutputSchema (model or dict) for repeated use."""
+    return CompiledSchema(schema)
+
+
+def structured_output_schemas(source: Any) -> SchemaMap:
+    """
+    Response schemas of every agent prompt with structured output enabled.
+
+    Args:
+        source: ExperimentTemplate (model or dict), or an experiment export
+                (agentMediatorMap / agentParticipantMap)
+
+    Returns:
+        Map from (agent persona ID, stage ID) to the schema dict
+    """
+    data = _as_dict(source)
+    agents = [
+        *(data.get("agentMediators") or []),
+        *(data.get("agentParticipants") or []),
+        *(data.get("agentMediatorMap") or {}).values(),
+        *(data.get("agentParticipantMap") or {}).values(),
+    ]
+    schemas: SchemaMap = {}
+    for agent in agents:
+        persona_id = (agent.get("persona") or {}).get("id", "")
+        for stage_id, prompt in (agent.get("promptMap") or {}).items():
+            config = prompt.get("structuredOutputConfig") or {}
+            if config.get("enabled") and config.get("schema"):
+                schemas[(persona_id, stage_id)] = config["schema"]
+    return schemas
+
+
+def parse_response(response: dict) -> tuple[Any, Optional[str]]:
+    """
+    The structured output of a ModelResponse, as the server reads it.
+
+    Returns:
+        (value, None), or (None, parse error message)
+    """
+    parsed = response.get("parsedResponse")
+    if isinstance(parsed, dict):
+        return parsed, None
+    text = response.get("text")
+    if not text:
+        return None, "no response text"
+    if "```" in text:
+        text = _FENCE.sub("", text)
+    try:
+        return json.loads(text.strip()), None
+    except ValueError as error:
+        return None, f"invalid JSON: {error}"
+
+
+# Statuses of responses that carry model output to check
+_OUTPUT_STATUSES = ("ok", "structured_output_parse_error")
+
+
+@dataclass
+class AgentConformance:
+    """Conformance of one agent's responses."""
+
+    checked: int = 0
+    conforming: int = 0
+    parse_errors: int = 0
+    schema_errors: int = 0
+    # Up to max_samples (log ID, stage ID, error message) per agent
+    samples: list[tuple[str, str, str]] = field(default_factory=list)
+
+    @property
+    def conformance_rate(self) -> float:
+        return self.conforming / self.checked if self.checked else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "checked": self.checked,
+            "conforming": self.conforming,
+            "parseErrors": self.parse_errors,
+            "schemaErrors": self.schema_errors,
+            "conformanceRate": self.conformance_rate,
+            "samples": [
+                {"logId": log_id, "stageId": stage_id, "error": error}
+                for log_id, stage_id, error in self.samples
+            ],
+        }
+
+
+@dataclass
+class ConformanceReport:
+    """Outcome of check_log_conformance()."""
+
+    # Agent persona ID -> conformance
+    agents: dict[str, AgentConformance] = field(default_factory=dict)
+    # Log entries with no schema for their agent and stage
+    unmatched: int = 0
+    # Entries whose response carries no output (provider or config errors)
+    no_output: int = 0
+
+    def summary(self) -> dict:
+        """Per-agent conformance as a JSON-serializable dict."""
+        return {
+            "agents": {
+                agent_id: conformance.summary()
+                for agent_id, conformance in sorted(self.agents.items())
+            },
+            "unmatched": self.unmatched,
+            "noOutput": self.no_output,
+        }
+
+
+# (log ID, agent ID, stage ID, response) extracted from a log entry
+_Item = tuple[str, str, str, dict]
+
+# Compiled schemas of a worker process (set by _init_worker)
+_worker_schemas: dict[tuple[str, str], CompiledSchema] = {}
+
+
+def _compile_all(schemas: SchemaMap) -> dict[tuple[str, str], CompiledSchema]:
+    # Prompts often share a schema, so compile each distinct one once
+    compiled: dict[str, CompiledSchema] = {}
+    result = {}
+    for key, schema in schemas.items():
+        text = json.dumps(_as_dict(schema), sort_keys=True)
+        if text not in compiled:
+            compiled[text] = CompiledSchema(schema)
+        result[key] = compiled[text]
+    return result
+
+
+def _init_worker(schemas: SchemaMap) -> None:
+    global _worker_schemas  # pylint: disable=global-statement
+    _worker_schemas = _compile_all(schemas)
+
+
+def _check_items(
+    items: list[_Item],
+    compiled: Optional[dict[tuple[str, str], CompiledSchema]] = None,
+) -> list[tuple[str, str, str, Optional[str], bool]]:
+    """(log ID, agent ID, stage ID, error or None, parse error?) per item."""
+    compiled = compiled if compiled is not None else _worker_schemas
+    results = []
+    for log_id, agent_id, stage_id, response in items:
+        value, parse_error = parse_response(response)
+        if parse_error is not None:
+            results.append((log_id, agent_id, stage_id, parse_error, True))
+            continue
+        error = compiled[(agent_id, stage_id)].validate(value)
+        results.append((log_id, agent_id, stage_id, error, False))
+    return results
+
+
+def _chunks(items: Iterator[_Item], size: int) -> Iterator[list[_Item]]:
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def check_log_conformance(
+    logs: Iterable[dict],
+    schemas: SchemaMap,
+    workers: int = 0,
+    max_samples: int = 5,
+) -> ConformanceReport:
+    """
+    Check logged model responses against their agents' schemas.
+
+    Args:
+        logs: Model log entries, consumed one at a time
+        schemas: (agent persona ID, stage ID) -> schema, e.g. from
+                 structured_output_schemas()
+        workers: Check responses in this many worker processes (0 or 1
+                 checks in this process)
+        max_samples: Failure samples kept per agent
+
+    Returns:
+        ConformanceReport with per-agent rates and failure samples
+    """
+    report = ConformanceReport()
+
+    def items() -> Iterator[_Item]:
+        for entry in logs:
+            profile = entry.get("userProfile") or {}
+            agent_id = (profile.get("agentConfig") or {}).get("agentId", "")
+            stage_id = entry.get("stageId", "")
+            if (agent_id, stage_id) not in schemas:
+                report.unmatched += 1
+                continue
+            response = entry.get("response") or {}
+            if response.get("status") not in _OUTPUT_STATUSES:
+                report.no_output += 1
+                continue
+            yield entry.get("id", ""), agent_id, stage_id, response
+
+    def tally(results: list[tuple[str, str, str, Optional[str], bool]]) -> None:
+        for log_id, agent_id, stage_id, error, parse_error in results:
+            agent = report.agents.get(agent_id)
+            if agent is None:
+                agent = report.agents[agent_id] = AgentConformance()
+            agent.checked += 1
+            if error is None:
+                agent.conforming += 1
+                continue
+            if parse_error:
+                agent.parse_errors += 1
+            else:
+                agent.schema_errors += 1
+            if len(agent.samples) < max_samples:
+                agent.samples.append((log_id, stage_id, error))
+
+    if workers <= 1:
+        compiled = _compile_all(schemas)
+        for chunk in _chunks(items(), _CHUNK_SIZE):
+            tally(_check_items(chunk, compiled))
+        return report
+
+    plain = {key: _as_dict(schema) for key, schema in schemas.items()}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(plain,)
+    ) as executor:
+        # Bound the chunks in flight so logs are read lazily
+        pending = set()
+        for chunk in _chunks(items(), _CHUNK_SIZE):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tally(future.result())
+            pending.add(executor.submit(_check_items, chunk))
+        for future in pending:
+            tally(future.result())
+    return report
@@ -0,0 +1,298 @@
+"""
+Analysis-ready survey matrices from Deliberate Lab experiment exports.
+
+Builds dense participant x question matrices for scale, check and
+multiple choice questions of survey stages. Values are stored row-major
+in an array('d') with a parallel missing-value mask, so a 100k-participant
+export costs 9 bytes per cell, and participants are read one at a time
+(e.g., from an ExportStore) rather than materialized as dicts.
+
+Encodings:
+    scale: the selected value
+    check: 1.0 if checked, 0.0 if not
+    mc:    index of the selected option in the column's categories
+           (question options in order; unknown choice IDs are appended)
+    Missing answers are NaN in `values` and 1 in `missing`.
+
+The buffers can be wrapped without copying, e.g.:
+    numpy.frombuffer(matrix.values).reshape(matrix.shape)
+
+Usage:
+    from deliberate_lab.surveys import build_survey_matrix
+
+    matrix = build_survey_matrix(store)
+    ages = matrix.column("demographics", "age")
+"""
+
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Mapping, Optional, TextIO
+import csv
+import math
+
+# Question kinds encoded as numbers; text answers are kept separately
+NUMERIC_QUESTION_KINDS = ("scale", "check", "mc")
+
+
+@dataclass
+class SurveyColumn:
+    """Metadata for one matrix column (one survey question)."""
+
+    stage_id: str
+    question_id: str
+    kind: str
+    title: str
+    # Multiple choice option IDs; the encoded value is an index into this
+    categories: list[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.stage_id}::{self.question_id}"
+
+
+class SurveyMatrix:
+    """
+    Dense survey answer matrix.
+
+    Rows are respondents (participant public IDs), or (respondent, target)
+    pairs for survey-per-participant stages.
+    """
+
+    def __init__(self, columns: list[SurveyColumn]):
+        self.columns = columns
+        self.row_ids: list[str] = []
+        # Target participant per row (survey-per-participant matrices only)
+        self.targets: Optional[list[str]] = None
+        self.values = array("d")
+        self.missing = bytearray()
+        # Column key -> text answers per row, for text questions (if requested)
+        self.text: dict[str, list[Optional[str]]] = {}
+        self._index = {column.key: j for j, column in enumerate(columns)}
+        self._category_index = [
+            {choice: code for code, choice in enumerate(column.categories)}
+            for column in columns
+        ]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.row_ids), len(self.columns)
+
+    def column_index(self, stage_id: str, question_id: str) -> int:
+        return self._index[f"{stage_id}::{question_id}"]
+
+    def _encode(self, j: int, answer: Optional[dict]) -> float:
+        """Numeric encoding of an answer for column j (NaN if missing)."""
+        if not answer:
+            return math.nan
+        kind = self.columns[j].kind
+        if answer.get("kind") != kind:
+            return math.nan
+        if kind == "scale":
+            value = answer.get("value")
+            return math.nan if value is None else float(value)
+        if kind == "check":
+            return 1.0 if answer.get("isChecked") else 0.0
+        choice = answer.get("choiceId")
+        if choice is None:
+            return math.nan
+        codes = self._category_index[j]
+        if choice not in codes:
+            codes[choice] = len(codes)
+            self.columns[j].categories.append(choice)
+        return float(codes[choice])
+
+    def append_row(
+        self,
+        row_id: str,
+        answers: Mapping[str, Optional[dict]],
+        target: Optional[str] = None,
+    ) -> None:
+        """Append a row from a map of column key to survey answer."""
+        self.row_ids.append(row_id)
+        if target is not None:
+            if self.targets is None:
+                self.targets = []
+            self.targets.append(target)
+        for j, column in enumerate(self.columns):
+            value = self._encode(j, answers.get(column.key))
+            self.values.append(value)
+            self.missing.append(value != value)  # NaN check
+        for key, texts in self.text.items():
+            answer = answers.get(key)
+            if answer and answer.get("kind") == "text":
+                texts.append(answer.get("answer"))
+            else:
+                texts.append(None)
+
+    def value(self, i: int, j: int) -> float:
+        return self.values[i * len(self.columns) + j]
+
+    def row(self, i: int) -> list[float]:
+        width = len(self.columns)
+        return self.values[i * width : (i + 1) * width].tolist()
+
+    def column(self, stage_id: str, question_id: str) -> list[float]:
+        """All values of one question (NaN where missing)."""
+        j = self.column_index(stage_id, question_id)
+        return self.values[j :: len(self.columns)].tolist()
+
+    def column_missing(self, stage_id: str, question_id: str) -> bytes:
+        """Missing-value mask (one 0/1 byte per row) for one question."""
+        j = self.column_index(stage_id, question_id)
+        return bytes(self.missing[j :: len(self.columns)])
+
+    def one_hot(self, stage_id: str, question_id: str) -> dict[str, list[int]]:
+        """Indicator vectors per category of a multiple choice question."""
+        j = self.column_index(stage_id, question_id)
+        codes = self.values[j :: len(self.columns)]
+        return {
+            category: [int(code == index) for code in codes]
+            for index, category in enumerate(self.columns[j].categories)
+        }
+
+    def write_csv(self, dest: TextIO, decode_categories: bool = False) -> None:
+        """
+        Write the matrix as CSV (one header row, empty cells for missing).
+
+        Args:
+            dest: Text stream to write to (open with newline="")
+            decode_categories: Write option IDs instead of category codes
+        """
+        writer = csv.writer(dest)
+        header = ["participantId"]
+        if self.targets is not None:
+            header.append("targetParticipantId")
+        writer.writerow(header + [column.key for column in self.columns])
+        width = len(self.columns)
+        for i, row_id in enumerate(self.row_ids):
+            cells: list[Any] = [row_id]
+            if self.targets is not None:
+                cells.append(self.targets[i])
+            for j, column in enumerate(self.columns):
+                offset = i * width + j
+                if self.missing[offset]:
+                    cells.append("")
+                elif column.kind == "mc" and decode_categories:
+                    cells.append(column.categories[int(self.values[offset])])
+                else:
+                    value = self.values[offset]
+                    cells.append(int(value) if value.is_integer() else value)
+            writer.writerow(cells)
+
+
+def _survey_stages(stage_map: dict, kind: str, stage_ids: Optional[Iterable[str]]):
+    wanted = set(stage_ids) if stage_ids is not None else None
+    return [
+        stage
+        for stage_id, stage in stage_map.items()
+        if stage.get("kind") == kind and (wanted is None or stage_id in wanted)
+    ]
+
+
+def _columns(stages: list[dict]) -> tuple[list[SurveyColumn], list[SurveyColumn]]:
+    """Numeric and text columns for the questions of the given stages."""
+    numeric, text = [], []
+    for stage in stages:
+        for question in stage.get("questions") or []:
+            column = SurveyColumn(
+                stage_id=stage["id"],
+                question_id=question["id"],
+                kind=question["kind"],
+                title=question.get("questionTitle", ""),
+                categories=[option["id"] for option in question.get("options") or []],
+            )
+            if column.kind in NUMERIC_QUESTION_KINDS:
+                numeric.append(column)
+            elif column.kind == "text":
+                text.append(column)
+    return numeric, text
+
+
+def _export_parts(export: Any) -> tuple[dict, Iterator]:
+    """Stage map and (public ID, participant) iterator for a dict or ExportStore."""
+    if hasattr(export, "iter_participants"):
+        stage_map = {
+            stage_id: export.stage(stage_id) for stage_id in export.stage_ids()
+        }
+        return stage_map, export.iter_participants()
+    return export.get("stageMap") or {}, iter(
+        (export.get("participantMap") or {}).items()
+    )
+
+
+def build_survey_matrix(
+    export: Any,
+    stage_ids: Optional[Iterable[str]] = None,
+    include_text: bool = False,
+) -> SurveyMatrix:
+    """
+    Build a participant x question matrix for survey stages.
+
+    Args:
+        export: ExperimentDownload dict or an ExportStore
+        stage_ids: Survey stages to include (all survey stages if omitted)
+        include_text: Whether to also collect text answers in `matrix.text`
+
+    Returns:
+        SurveyMatrix with one row per participant and one column per
+        scale / check / multiple choice question, in stageMap order
+    """
+    stage_map, participants = _export_parts(export)
+    stages = _survey_stages(stage_map, "survey", stage_ids)
+    numeric, text = _columns(stages)
+    matrix = SurveyMatrix(numeric)
+    if include_text:
+        matrix.text = {column.key: [] for column in text}
+
+    for public_id, participant in participants:
+        answers: dict[str, Optional[dict]] = {}
+        for stage in stages:
+            stage_answer = (participant.get("answerMap") or {}).get(stage["id"])
+            if not stage_answer or stage_answer.get("kind") != "survey":
+                continue
+            for question_id, answer in (stage_answer.get("answerMap") or {}).items():
+                answers[f"{stage['id']}::{question_id}"] = answer
+        matrix.append_row(public_id, answers)
+    return matrix
+
+
+def build_survey_per_participant_matrix(
+    export: Any, stage_id: str, include_text: bool = False
+) -> SurveyMatrix:
+    """
+    Build a (respondent, target) x question matrix for a per-participant survey.
+
+    Args:
+        export: ExperimentDownload dict or an ExportStore
+        stage_id: ID of the survey-per-participant stage
+        include_text: Whether to also collect text answers in `matrix.text`
+
+    Returns:
+        SurveyMatrix with one row per respondent and target participant
+        they answered about (`matrix.targets` holds the target IDs)
+    """
+    stage_map, participants = _export_parts(export)
+    stage = stage_map[stage_id]
+    if stage.get("kind") != "surveyPerParticipant":
+        raise ValueError(f"Stage {stage_id} is not a survey-per-participant stage")
+    numeric, text = _columns([stage])
+    matrix = SurveyMatrix(numeric)
+    matrix.targets = []
+    if include_text:
+        matrix.text = {column.key: [] for column in text}
+
+    for public_id, participant in participants:
+        stage_answer = (participant.get("answerMap") or {}).get(stage_id)
+        if not stage_answer or stage_answer.get("kind") != "surveyPerParticipant":
+            continue
+        # Regroup {question: {target: answer}} by target
+        by_target: dict[str, dict[str, dict]] = {}
+        answer_map = stage_answer.get("answerMap") or {}
+        for question_id, target_answers in answer_map.items():
+            key = f"{stage_id}::{question_id}"
+            for target, answer in (target_answers or {}).items():
+                by_target.setdefault(target, {})[key] = answer
+        for target, answers in by_target.items():
+            matrix.append_row(public_id, answers, target=target)
+    return matrix
@@ -0,0 +1,558 @@
+"""
+Factorial parameter sweeps over an ExperimentTemplate.
+
+An ExperimentSweep crosses parameter axes (mediator prompts, generation
+configs, variable values, stage orderings, or any function of a
+TemplateBuilder) over a base template. Variants are generated lazily, one
+per combination of levels, from copies of a TemplateBuilder, so each
+variant only validates the parts its levels changed. Variants with the
+same content (ignoring IDs and the experiment name) are detected by hash
+and created once.
+
+submit() creates one experiment per distinct variant with a bounded
+number of requests in flight, within the client's shared rate-limit
+budget (the API allows 100 requests per 15 minutes per key), waiting and
+retrying when the server still answers 429. Every result is appended to
+an NDJSON manifest as it completes, so an interrupted sweep resumes where
+it stopped when submit() is called again with the same manifest.
+
+Usage:
+    from deliberate_lab.sweep import (
+        ExperimentSweep, generation_config_axis, mediator_prompt_axis,
+        stage_order_axis, variable_axis,
+    )
+
+    sweep = ExperimentSweep(base_template, [
+        mediator_prompt_axis("prompt", "facilitator", {
+            "neutral": "Summarize the discussion neutrally.",
+            "socratic": "Ask one probing question.",
+        }),
+        generation_config_axis("temperature", "facilitator", {
+            "low": {"temperature": 0.2}, "high": {"temperature": 1.0},
+        }),
+        stage_order_axis("order", {
+            "survey-first": ["tos", "survey", "chat"],
+            "chat-first": ["tos", "chat", "survey"],
+        }),
+    ])
+    report = sweep.submit(client, "sweep.manifest.ndjson", max_workers=4)
+    print(report.summary())
+    read_sweep_manifest("sweep.manifest.ndjson")  # condition -> experiment ID
+"""
+
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+
+from deliberate_lab.builder import TemplateBuilder, _part_dict
+from deliberate_lab.client import (
+    RATE_LIMIT_WINDOW_SECONDS,
+    APIError,
+    Client,
+    _RequestBudget,
+)
+from deliberate_lab.references import check_template_references
+
+# Times a request answered with 429 is retried before it counts as failed
+_MAX_RATE_LIMIT_RETRIES = 5
+
+
+@dataclass
+class Axis:
+    """
+    One factor of a sweep.
+
+    `levels` maps each level's label to a function that applies the level
+    to a variant's TemplateBuilder (in place). Functions must not mutate
+    parts already in the builder; they replace them instead.
+    """
+
+    name: str
+    levels: dict[str, Callable[[TemplateBuilder], Any]]
+
+
+def _text_prompt(prompt: Any) -> list:
+    """Prompt items from a string (one TEXT item) or a list of items."""
+    if isinstance(prompt, str):
+        return [{"type": "TEXT", "text": prompt}]
+    return [_part_dict(item) for item in prompt]
+
+
+def _update_prompts(
+    builder: TemplateBuilder,
+    persona_id: str,
+    stage_id: Optional[str],
+    update: Callable[[dict], dict],
+) -> None:
+    """Replace a mediator with a copy whose prompt configs are updated."""
+    agent = _part_dict(builder.agent_mediator(persona_id))
+    prompt_map = dict(agent["promptMap"])
+    stage_ids = [stage_id] if stage_id is not None else list(prompt_map)
+    for key in stage_ids:
+        if key not in prompt_map:
+            raise KeyError(f"Mediator {persona_id!r} has no prompt for stage {key!r}")
+        prompt_map[key] = update(dict(prompt_map[key]))
+    builder.replace_agent_mediator(persona_id, {**agent, "promptMap": prompt_map})
+
+
+def mediator_prompt_axis(
+    name: str,
+    persona_id: str,
+    levels: dict[str, Any],
+    stage_id: Optional[str] = None,
+) -> Axis:
+    """
+    Vary the prompt of an agent mediator.
+
+    Args:
+        name: Axis name
+        persona_id: Persona ID of the mediator
+        levels: Label -> prompt text, or list of prompt items
+        stage_id: Only change the prompt for this stage (all stages if omitted)
+    """
+
+    def level(prompt: Any) -> Callable[[TemplateBuilder], None]:
+        items = _text_prompt(prompt)
+        return lambda builder: _update_prompts(
+            builder, persona_id, stage_id, lambda config: {**config, "prompt": items}
+        )
+
+    return Axis(name, {label: level(prompt) for label, prompt in levels.items()})
+
+
+def generation_config_axis(
+    name: str,
+    persona_id: str,
+    levels: dict[str, Any],
+    stage_id: Optional[str] = None,
+) -> Axis:
+    """
+    Vary the ModelGenerationConfig of an agent mediator's prompts.
+
+    Args:
+        name: Axis name
+        persona_id: Persona ID of the mediator
+        levels: Label -> ModelGenerationConfig (model or dict); a level
+                replaces the whole config
+        stage_id: Only change the config for this stage (all stages if omitted)
+    """
+
+    def level(config: Any) -> Callable[[TemplateBuilder], None]:
+        generation_config = _part_dict(config)
+        return lambda builder: _update_prompts(
+            builder,
+            persona_id,
+            stage_id,
+            lambda prompt: {**prompt, "generationConfig": generation_config},
+        )
+
+    return Axis(name, {label: level(config) for label, config in levels.items()})
+
+
+def variable_axis(name: str, variable_id: str, levels: dict[str, Any]) -> Axis:
+    """
+    Vary a variable config's value(s).
+
+    Args:
+        name: Axis name
+        variable_id: ID of the variable config
+        levels: Label -> value. A string sets 'value' (static variables);
+                a list sets 'values' (random permutation and balanced
+                assignment variables). Values are JSON strings, as in the
+                variable config itself.
+    """
+
+    def level(value: Any) -> Callable[[TemplateBuilder], None]:
+        key = "values" if isinstance(value, list) else "value"
+
+        def apply(builder: TemplateBuilder) -> None:
+            configs = builder.experiment.get("variableConfigs") or []
+            for config in configs:
+                if config.get("id") == variable_id:
+                    builder.replace_variable_config(variable_id, {**config, key: value})
+                    return
+            raise KeyError(f"No variable config with ID: {variable_id}")
+
+        return apply
+
+    return Axis(name, {label: level(value) for label, value in levels.items()})
+
+
+def stage_order_axis(name: str, levels: dict[str, list[str]]) -> Axis:
+    """
+    Vary the order of stages.
+
+    Args:
+        name: Axis name
+        levels: Label -> every stage ID, in the order to use
+    """
+
+    def level(stage_ids: list[str]) -> Callable[[TemplateBuilder], None]:
+        def apply(builder: TemplateBuilder) -> None:
+            builder.reorder_stages(stage_ids)
+
+        return apply
+
+    return Axis(name, {label: level(ids) for label, ids in levels.items()})
+
+
+@dataclass
+class SweepVariant:
+    """One combination of levels."""
+
+    # Axis name -> level label
+    levels: dict[str, str]
+    # Condition key, e.g. "prompt=socratic, temperature=low"
+    condition: str
+    # Content hash (ignores IDs and the experiment name)
+    content_hash: str
+    builder: TemplateBuilder
+    # Condition key of an earlier variant with the same content
+    duplicate_of: Optional[str] = None
+
+
+@dataclass
+class SweepReport:
+    """Outcome of ExperimentSweep.submit()."""
+
+    manifest_path: str
+    conditions: int = 0
+    created: int = 0
+    # Conditions already in the manifest from an earlier run
+    resumed: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    # Seconds spent waiting for the rate limit, summed over threads
+    rate_limit_wait: float = 0.0
+    elapsed: float = 0.0
+    # Condition key -> error message
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        """Counts as a JSON-serializable dict."""
+        return {
+            "manifestPath": self.manifest_path,
+            "conditions": self.conditions,
+            "created": self.created,
+            "resumed": self.resumed,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "rateLimitWait": self.rate_limit_wait,
+            "elapsed": self.elapsed,
+        }
+
+
+def _retry_after(error: APIError) -> float:
+    """Seconds to wait after a 429, from the RateLimit-Reset header."""
+    headers = error.response.headers if error.response is not None else {}
+    for header in ("RateLimit-Reset", "Retry-After"):
+        try:
+            return max(1.0, float(headers[header]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return 60.0
+
+
+def read_sweep_manifest(path: str) -> dict[str, dict]:
+    """
+    Latest manifest record per condition key.
+
+    Records have 'condition', 'levels', 'hash' and either 'experimentId'
+    (plus 'duplicateOf' for duplicates) or 'error'.
+    """
+    records: dict[str, dict] = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line cut short by an interrupted run
+                continue
+            records[record["condition"]] = record
+    return records
+
+
+class ExperimentSweep:
+    """A full-factorial design over a base ExperimentTemplate."""
+
+    def __init__(
+        self,
+        base: Any,
+        axes: Iterable[Axis] = (),
+        name_format: str = "{name} [{condition}]",
+    ):
+        """
+        Args:
+            base: Base ExperimentTemplate (model, struct or dict) or
+                  TemplateBuilder
+            axes: Sweep axes; more can be added with add_axis()
+            name_format: Experiment name of each variant; may use {name}
+                         (the base name), {condition} and axis names
+        """
+        self._base = (
+            base.copy()
+            if isinstance(base, TemplateBuilder)
+            else TemplateBuilder.from_template(base)
+        )
+        self._base_name = self._base.experiment["metadata"]["name"]
+        self.axes: list[Axis] = []
+        self.name_format = name_format
+        # id(part) -> (part, digest), shared by all variants
+        self._digests: dict[int, tuple[Any, str]] = {}
+        for axis in axes:
+            self.add_axis(axis)
+
+    def add_axis(self, axis: Axis) -> ExperimentSweep:
+        if any(existing.name == axis.name for existing in self.axes):
+            raise ValueError(f"Duplicate axis name: {axis.name}")
+        if not axis.levels:
+            raise ValueError(f"Axis {axis.name!r} has no levels")
+        self.axes.append(axis)
+        return self
+
+    def __len__(self) -> int:
+        """Number of conditions (combinations of levels)."""
+        count = 1
+        for axis in self.axes:
+            count *= len(axis.levels)
+        return count
+
+    def conditions(self) -> Iterator[dict[str, str]]:
+        """Every combination of levels, as axis name -> level label."""
+        names = [axis.name for axis in self.axes]
+        for labels in itertools.product(*(list(axis.levels) for axis in self.axes)):
+            yield dict(zip(names, labels))
+
+    @staticmethod
+    def condition_key(levels: dict[str, str]) -> str:
+        return ", ".join(f"{name}={label}" for name, label in levels.items())
+
+    def _digest(self, part: Any) -> str:
+        cached = self._digests.get(id(part))
+        if cached is not None:
+            return cached[1]
+        digest = hashlib.sha256(
+            json.dumps(_part_dict(part), sort_keys=True, separators=(",", ":")).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+        self._digests[id(part)] = (part, digest)
+        return digest
+
+    def _content_hash(self, builder: TemplateBuilder) -> str:
+        # pylint: disable=protected-access
+        experiment = {**builder.experiment, "id": None}
+        experiment["metadata"] = {**experiment["metadata"], "name": None}
+        content = hashlib.sha256(
+            json.dumps(experiment, sort_keys=True, default=str).encode("utf-8")
+        )
+        for section in (
+            builder._stages,
+            builder._agent_mediators,
+            builder._agent_participants,
+        ):
+            content.update(b"|")
+            for part in section:
+                content.update(self._digest(part).encode("ascii"))
+        return content.hexdigest()
+
+    def variant(self, levels: dict[str, str]) -> SweepVariant:
+        """The variant for one combination of levels."""
+        builder = self._base.copy()
+        for axis in self.axes:
+            axis.levels[levels[axis.name]](builder)
+        condition = self.condition_key(levels)
+        content_hash = self._content_hash(builder)
+        builder.set_experiment(
+            metadata={
+                **builder.experiment["metadata"],
+                "name": self.name_format.format(
+                    **levels, name=self._base_name, condition=condition
+                ),
+            }
+        )
+        return SweepVariant(levels, condition, content_hash, builder)
+
+    def variants(self) -> Iterator[SweepVariant]:
+        """
+        Every variant, generated lazily in condition order. Variants whose
+        content matches an earlier one have `duplicate_of` set.
+        """
+        seen: dict[str, str] = {}
+        for levels in self.conditions():
+            variant = self.variant(levels)
+            variant.duplicate_of = seen.setdefault(
+                variant.content_hash, variant.condition
+            )
+            if variant.duplicate_of == variant.condition:
+                variant.duplicate_of = None
+            yield variant
+
+    def submit(
+        self,
+        client: Client,
+        manifest_path: str,
+        max_workers: int = 4,
+        max_requests: Optional[int] = None,
+        window_seconds: float = RATE_LIMIT_WINDOW_SECONDS,
+        on_record: Optional[Callable[[dict], None]] = None,
+        check_references: bool = True,
+    ) -> SweepReport:
+        """
+        Create one experiment per distinct variant.
+
+        Conditions the manifest already maps to an experiment are skipped,
+        so calling submit() again after an interruption (or failures)
+        finishes the sweep. Variants are validated (and their references
+        checked) before submission; invalid ones are recorded as failed.
+
+        Args:
+            client: API client
+            manifest_path: NDJSON manifest to append results to (and resume
+                           from)
+            max_workers: Requests in flight at once
+            max_requests: Requests allowed per window for this sweep, on
+                          top of the client's own budget (which is shared
+                          by every thread using the client); None relies on
+                          the client's budget alone
+            window_seconds: Rate limit window for `max_requests`
+            on_record: Called with each manifest record as it is written
+            check_references: Check each variant with
+                              check_template_references() before creating it
+
+        Returns:
+            SweepReport; read_sweep_manifest() gives condition -> experiment
+        """
+        start = time.monotonic()
+        report = SweepReport(manifest_path=manifest_path)
+        done = read_sweep_manifest(manifest_path)
+        # Content hash -> experiment ID of conditions already created
+        created = {
+            record["hash"]: record["experimentId"]
+            for record in done.values()
+            if "experimentId" in record and "duplicateOf" not in record
+        }
+        budget = (
+            _RequestBudget(max_requests, window_seconds)
+            if max_requests is not None
+            else None
+        )
+        # Waits on the client's budget are counted from its running total,
+        # so they include other threads' requests made meanwhile
+        client_waited = client.budget.waited if client.budget is not None else 0.0
+        lock = threading.Lock()
+
+        def create(variant: SweepVariant) -> str:
+            template = variant.builder.build().model_dump(
+                mode="json", by_alias=True, exclude_none=True
+            )
+            if check_references:
+                check_template_references(template)
+            for attempt in itertools.count():
+                if budget is not None:
+                    budget.acquire()
+                try:
+                    response = client.create_experiment(template=template)
+                    return response["experiment"]["id"]
+                except APIError as error:
+                    status = getattr(error.response, "status_code", None)
+                    if status != 429 or attempt >= _MAX_RATE_LIMIT_RETRIES:
+                        raise
+                    delay = _retry_after(error)
+                    with lock:
+                        report.rate_limit_wait += delay
+                    time.sleep(delay)
+            raise AssertionError("unreachable")
+
+        with open(manifest_path, "a", encoding="utf-8") as manifest:
+
+            def record(variant: SweepVariant, **result: Any) -> None:
+                entry = {
+                    "condition": variant.condition,
+                    "levels": variant.levels,
+                    "hash": variant.content_hash,
+                    **result,
+                }
+                manifest.write(json.dumps(entry) + "\n")
+                manifest.flush()
+                if on_record is not None:
+                    on_record(entry)
+
+            def finish(future: Future, variant: SweepVariant) -> None:
+                try:
+                    experiment_id = future.result()
+                except Exception as error:  # pylint: disable=broad-except
+                    report.failed += 1
+                    report.errors[variant.condition] = str(error)
+                    record(variant, error=str(error))
+                    return
+                created[variant.content_hash] = experiment_id
+                report.created += 1
+                record(variant, experimentId=experiment_id)
+
+            # Duplicates wait for the variant they copy to be created
+            duplicates: list[SweepVariant] = []
+            pending: dict[Future, SweepVariant] = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for variant in self.variants():
+                    report.conditions += 1
+                    previous = done.get(variant.condition)
+                    if previous is not None and "experimentId" in previous:
+                        report.resumed += 1
+                        continue
+                    if variant.duplicate_of is not None or (
+                        variant.content_hash in created
+                    ):
+                        duplicates.append(variant)
+                        continue
+                    # Bound in-flight work so variants are generated lazily
+                    while len(pending) >= 2 * max_workers:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            finish(future, pending.pop(future))
+                    pending[executor.submit(create, variant)] = variant
+                finished, _ = wait(pending)
+                for future in finished:
+                    finish(future, pending.pop(future))
+
+            for variant in duplicates:
+                experiment_id = created.get(variant.content_hash)
+                if experiment_id is None:
+                    report.failed += 1
+                    message = f"Duplicate of failed condition {variant.duplicate_of}"
+                    report.errors[variant.condition] = message
+                    record(variant, error=message)
+                    continue
+                report.duplicates += 1
+                record(
+                    variant,
+                    experimentId=experiment_id,
+                    duplicateOf=variant.duplicate_of
+                    or self._original_condition(done, variant.content_hash),
+                )
+
+        if budget is not None:
+            report.rate_limit_wait += budget.waited
+        if client.budget is not None:
+            report.rate_limit_wait += client.budget.waited - client_waited
+        report.elapsed = time.monotonic() - start
+        return report
+
+    @staticmethod
+    def _original_condition(done: dict[str, dict], content_hash: str) -> str:
+        for condition, record in done.items():
+            if record.get("hash") == content_hash and "duplicateOf" not in record:
+                return condition
+        return ""
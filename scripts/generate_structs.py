@@ -0,0 +1,627 @@
+"""
+Generate deliberate_lab/structs.py from docs/assets/api/schemas.json.
+
+structs.py is a lightweight alternative to the Pydantic models in
+deliberate_lab/types.py: one `__slots__` class per schema object, each with
+generated from_dict() / to_dict() methods that read and write the JSON
+shape directly. to_dict() produces the same output as
+model_dump(mode="json", by_alias=True, exclude_none=True) on the matching
+Pydantic model.
+
+Usage (from the scripts directory; run by update_schemas.sh):
+    uv run python generate_structs.py
+"""
+
+from __future__ import annotations
+from typing import Any, Optional
+import json
+import keyword
+import os
+import re
+import sys
+
+SCHEMA_PATH = os.path.join("..", "docs", "assets", "api", "schemas.json")
+OUTPUT_PATH = os.path.join("deliberate_lab", "structs.py")
+
+_PRIMITIVES = {
+    "string": "str",
+    "number": "float",
+    "integer": "int",
+    "boolean": "bool",
+    "null": "None",
+}
+
+HEADER = '''\
+# AUTO-GENERATED FILE — DO NOT EDIT BY HAND.
+# Regenerate via: npm run update-schemas (from repo root).
+#
+# pylint: disable=too-many-lines,invalid-name,redefined-builtin,too-many-statements
+"""
+Lightweight struct types for the Deliberate Lab API schemas.
+
+A faster alternative to the Pydantic models in deliberate_lab.types, for
+bulk work such as decoding many experiment templates or exports. Every
+schema object is a `__slots__` class with the same name and fields as its
+Pydantic model, plus generated from_dict() / to_dict() methods:
+
+- from_dict() checks required fields and union tags (e.g. a stage's
+  'kind'), applies defaults and builds nested structs, but does not check
+  primitive types or value constraints; validate with the Pydantic models
+  when that matters.
+- to_dict() returns the same dict as
+  model_dump(mode="json", by_alias=True, exclude_none=True).
+
+Client methods accept these structs wherever they accept Pydantic models.
+
+Usage:
+    from deliberate_lab import structs
+
+    template = structs.decode(raw_json_bytes, structs.ExperimentTemplate)
+    template.stageConfigs[0].name
+    client.create_experiment(template=template)
+
+    # Convert to and from the Pydantic backend
+    model = template.to_model()
+    template = structs.ExperimentTemplate.from_model(model)
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Optional, TypeVar
+import json
+
+SCHEMA_ID = {schema_id!r}
+
+StructT = TypeVar("StructT", bound="Struct")
+
+
+class DecodeError(ValueError):
+    """Raised when data does not match a struct type."""
+
+
+class Struct:
+    """Base class of the generated structs."""
+
+    __slots__ = ()
+    # JSON keys of the fields, in schema order
+    __json_fields__: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls: type[StructT], data: dict) -> StructT:
+        """Build a struct (and its nested structs) from JSON-ready data."""
+        raise NotImplementedError
+
+    def to_dict(self) -> dict:
+        """Same dict as model_dump(mode="json", by_alias=True, exclude_none=True)."""
+        raise NotImplementedError
+
+    @classmethod
+    def from_json(cls: type[StructT], data: bytes | str) -> StructT:
+        return cls.from_dict(json.loads(data))
+
+    def to_json(self) -> bytes:
+        return encode(self)
+
+    @classmethod
+    def from_model(cls: type[StructT], model: Any) -> StructT:
+        """Convert a Pydantic model from deliberate_lab.types."""
+        return cls.from_dict(
+            model.model_dump(mode="json", by_alias=True, exclude_none=True)
+        )
+
+    def to_model(self) -> Any:
+        """Convert to the Pydantic model of the same name (validates)."""
+        from deliberate_lab import types  # pylint: disable=import-outside-toplevel
+
+        return getattr(types, type(self).__name__).model_validate(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{{name}}={{getattr(self, name)!r}}"
+            for name in self.__slots__
+            if name != "_extra" and getattr(self, name) is not None
+        )
+        return f"{{type(self).__name__}}({{fields}})"
+
+
+def decode(data: bytes | str | dict, type: type[StructT]) -> StructT:
+    """Decode JSON bytes / text (or an already parsed dict) into a struct."""
+    parsed = data if isinstance(data, dict) else json.loads(data)
+    return type.from_dict(parsed)
+
+
+def encode(value: Struct) -> bytes:
+    """Encode a struct as compact UTF-8 JSON."""
+    return json.dumps(
+        value.to_dict(), separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _missing(cls: type, error: KeyError) -> DecodeError:
+    return DecodeError(f"{{cls.__name__}}: missing required field {{error}}")
+
+
+def _mismatch(cls: type, field: str, expected: Any, value: Any) -> DecodeError:
+    return DecodeError(
+        f"{{cls.__name__}}: expected {{field}}={{expected!r}}, got {{value!r}}"
+    )
+
+
+def _not_object(cls: type, data: Any) -> DecodeError:
+    return DecodeError(f"{{cls.__name__}}: expected an object, got {{data!r:.80}}")
+
+
+def _decode_best(
+    value: Any, decoders: tuple[Callable[[dict], Struct], ...], name: str
+) -> Struct:
+    """
+    Decode an untagged union value like Pydantic's smart mode: of the
+    members that accept it, pick the one that uses the most of its keys.
+    """
+    best, best_fields = None, -1
+    for decoder in decoders:
+        try:
+            result = decoder(value)
+        except (DecodeError, KeyError, TypeError, AttributeError):
+            continue
+        fields = sum(1 for key in result.__json_fields__ if key in value)
+        if fields > best_fields:
+            best, best_fields = result, fields
+    if best is None:
+        raise DecodeError(f"{{name}}: no member matches {{value!r:.80}}")
+    return best
+
+
+def _encode(value: Any) -> Any:
+    """to_dict() for values of union-typed fields (structs, lists, dicts)."""
+    if isinstance(value, Struct):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {{key: _encode(item) for key, item in value.items()}}
+    return value
+'''
+
+
+class TypeRef:
+    """A field type: kind is prim, const, enum, any, list, dict, class or union."""
+
+    def __init__(self, kind: str, value: Any = None, items: Any = None):
+        self.kind = kind
+        self.value = value
+        self.items = items
+
+    @property
+    def nullable(self) -> bool:
+        if self.kind == "prim":
+            return self.value == "None"
+        if self.kind == "union":
+            return any(member.nullable for member in self.items)
+        return self.kind == "any"
+
+    def has_structs(self) -> bool:
+        if self.kind == "class":
+            return True
+        if self.kind in ("list", "dict"):
+            return self.items.has_structs()
+        if self.kind == "union":
+            return any(member.has_structs() for member in self.items)
+        return False
+
+    def annotation(self) -> str:
+        if self.kind == "prim":
+            return self.value
+        if self.kind in ("const", "enum"):
+            return "str" if all(isinstance(v, str) for v in self.value) else "Any"
+        if self.kind == "any":
+            return "Any"
+        if self.kind == "list":
+            return f"list[{self.items.annotation()}]"
+        if self.kind == "dict":
+            return f"dict[str, {self.items.annotation()}]"
+        if self.kind == "class":
+            return self.value
+        names: list[str] = []
+        for member in self.items:
+            name = member.annotation()
+            if name not in names:
+                names.append(name)
+        if "None" in names:
+            names.remove("None")
+            names.append("None")
+        return " | ".join(names)
+
+
+class Field:
+    def __init__(self, key: str, type_ref: TypeRef, required: bool, default: Any):
+        self.key = key
+        self.name = key + "_" if keyword.iskeyword(key) else key
+        self.type = type_ref
+        self.required = required
+        self.default = default
+
+    @property
+    def const(self) -> Optional[Any]:
+        if self.type.kind == "const":
+            return self.type.value[0]
+        return None
+
+
+class StructDef:
+    def __init__(self, name: str, schema: dict):
+        self.name = name
+        self.schema = schema
+        self.fields: list[Field] = []
+        self.allow_extra = schema.get("additionalProperties") is True
+
+
+class Generator:
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.defs = schema.get("$defs", {})
+        self.structs: dict[str, StructDef] = {}
+        # id(schema dict) -> struct name
+        self._names: dict[int, str] = {}
+        self._pending: list[StructDef] = []
+        # Union decoders: union annotation -> function name
+        self.unions: dict[str, str] = {}
+        self._union_code: list[str] = []
+        self._tables: list[str] = []
+
+    # =========================================================================
+    # Schema -> types
+    # =========================================================================
+
+    def resolve(self, node: dict) -> dict:
+        while "$ref" in node:
+            node = self.defs[node["$ref"].split("/")[-1]]
+        return node
+
+    def struct_name(self, node: dict) -> str:
+        if id(node) in self._names:
+            return self._names[id(node)]
+        # Same class names as datamodel-codegen's --use-title-as-name
+        base = "".join(
+            word[:1].upper() + word[1:]
+            for word in re.split(r"\W+", node.get("title") or "Model")
+        )
+        name = base
+        suffix = 1
+        while name in self.structs:
+            if self.structs[name].schema == node:
+                self._names[id(node)] = name
+                return name
+            name = f"{base}{suffix}"
+            suffix += 1
+        self._names[id(node)] = name
+        struct = StructDef(name, node)
+        self.structs[name] = struct
+        self._pending.append(struct)
+        return name
+
+    def type_of(self, node: dict) -> TypeRef:
+        node = self.resolve(node)
+        if "const" in node:
+            return TypeRef("const", [node["const"]])
+        if "enum" in node:
+            return TypeRef("enum", list(node["enum"]))
+        if "anyOf" in node:
+            members: list[TypeRef] = []
+            for option in node["anyOf"]:
+                member = self.type_of(option)
+                members.extend(member.items if member.kind == "union" else [member])
+            if all(member.kind == "const" for member in members):
+                return TypeRef("enum", [member.value[0] for member in members])
+            return TypeRef("union", items=members)
+        node_type = node.get("type")
+        if isinstance(node_type, list):
+            return TypeRef(
+                "union",
+                items=[self.type_of({**node, "type": option}) for option in node_type],
+            )
+        if node_type == "array":
+            return TypeRef("list", items=self.type_of(node.get("items", {})))
+        if node_type == "object":
+            if "properties" in node:
+                return TypeRef("class", self.struct_name(node))
+            values = node.get("patternProperties", {}).get("^(.*)$")
+            if values is None and isinstance(node.get("additionalProperties"), dict):
+                values = node["additionalProperties"]
+            return TypeRef("dict", items=self.type_of(values or {}))
+        if node_type in _PRIMITIVES:
+            return TypeRef("prim", _PRIMITIVES[node_type])
+        return TypeRef("any")
+
+    def build(self) -> None:
+        self.struct_name(self.schema)
+        while self._pending:
+            struct = self._pending.pop(0)
+            required = set(struct.schema.get("required", []))
+            for key, node in struct.schema["properties"].items():
+                type_ref = self.type_of(node)
+                node = self.resolve(node)
+                default = node.get("default")
+                if type_ref.kind == "const" and default is None:
+                    # Single-value literals default to their value
+                    default = type_ref.value[0]
+                # Nullable fields may be left out even when listed as
+                # required, as in the Pydantic models
+                is_required = (
+                    key in required and default is None and not type_ref.nullable
+                )
+                struct.fields.append(Field(key, type_ref, is_required, default))
+
+    # =========================================================================
+    # Code generation
+    # =========================================================================
+
+    def decoder(self, type_ref: TypeRef, expr: str, depth: int = 0) -> Optional[str]:
+        """Expression decoding `expr`, or None if it passes through as is."""
+        if not type_ref.has_structs():
+            return None
+        if type_ref.kind == "class":
+            return f"{type_ref.value}.from_dict({expr})"
+        if type_ref.kind == "list":
+            item = self.decoder(type_ref.items, f"v{depth}", depth + 1)
+            return f"[{item} for v{depth} in {expr}]"
+        if type_ref.kind == "dict":
+            item = self.decoder(type_ref.items, f"v{depth}", depth + 1)
+            return f"{{k{depth}: {item} for k{depth}, v{depth} in {expr}.items()}}"
+        return f"{self.union_decoder(type_ref)}({expr})"
+
+    def encoder(self, type_ref: TypeRef, expr: str, depth: int = 0) -> Optional[str]:
+        """Expression encoding `expr`, or None if it passes through as is."""
+        if not type_ref.has_structs():
+            return None
+        if type_ref.kind == "class":
+            return f"{expr}.to_dict()"
+        if type_ref.kind == "list":
+            item = self.encoder(type_ref.items, f"v{depth}", depth + 1)
+            return f"[{item} for v{depth} in {expr}]"
+        if type_ref.kind == "dict":
+            item = self.encoder(type_ref.items, f"v{depth}", depth + 1)
+            return f"{{k{depth}: {item} for k{depth}, v{depth} in {expr}.items()}}"
+        options = [m for m in type_ref.items if not m.nullable]
+        if all(m.kind == "class" for m in options):
+            if type_ref.nullable:
+                return f"None if {expr} is None else {expr}.to_dict()"
+            return f"{expr}.to_dict()"
+        return f"_encode({expr})"
+
+    def tag_fields(self, name: str, kind: str) -> dict[str, list[Any]]:
+        """Values accepted by each const (or enum) field of a struct."""
+        return {
+            field.key: field.type.value
+            for field in self.structs[name].fields
+            if field.type.kind == kind
+        }
+
+    def dispatch(self, members: list[str], name: str) -> str:
+        """Expression of a decoder choosing among struct members by tag."""
+        if len(members) == 1:
+            return f"{members[0]}.from_dict"
+        best_key, best_groups = None, None
+        # Prefer const tags such as 'kind'; enum fields only split members
+        # that accept different values, as Pydantic rejects the others
+        for kind in ("const", "enum"):
+            tags = [self.tag_fields(member, kind) for member in members]
+            for key in tags[0]:
+                if not all(key in fields for fields in tags):
+                    continue
+                groups: dict[Any, list[str]] = {}
+                for member, fields in zip(members, tags):
+                    for value in fields[key]:
+                        groups.setdefault(value, []).append(member)
+                if any(len(group) < len(members) for group in groups.values()) and (
+                    best_groups is None or len(groups) > len(best_groups)
+                ):
+                    best_key, best_groups = key, groups
+            if best_groups is not None:
+                break
+        fallback = ", ".join(f"{member}.from_dict" for member in members)
+        index = len(self._union_code)
+        function = f"_decode_{name}_{index}"
+        if best_groups is None:
+            self._union_code.append(
+                f"def {function}(value: dict) -> Struct:\n"
+                f"    return _decode_best(value, ({fallback},), {name!r})\n"
+            )
+            return function
+        self._union_code.append("")  # reserve the index
+        # Values every member accepts are left to the fallback
+        table = {
+            value: self.dispatch(group, name)
+            for value, group in best_groups.items()
+            if len(group) < len(members)
+        }
+        entries = "".join(
+            f"    {value!r}: {decoder},\n" for value, decoder in table.items()
+        )
+        self._union_code[index] = (
+            f"def {function}(value: dict) -> Struct:\n"
+            f"    decoder = {function.upper()}.get(value.get({best_key!r}))\n"
+            f"    if decoder is None:\n"
+            f"        return _decode_best(value, ({fallback},), {name!r})\n"
+            f"    return decoder(value)\n"
+        )
+        # Tables go after all functions, which they may reference
+        self._tables.append(
+            f"{function.upper()}: dict[Any, Callable[[dict], Struct]] = {{\n"
+            f"{entries}"
+            f"}}\n"
+        )
+        return function
+
+    def union_decoder(self, type_ref: TypeRef) -> str:
+        """Name of a function decoding a union-typed value."""
+        key = type_ref.annotation()
+        if key in self.unions:
+            return self.unions[key]
+        options = [m for m in type_ref.items if not m.nullable]
+        members = [m.value for m in options if m.kind == "class"]
+        others = [m for m in options if m.kind != "class"]
+        if not type_ref.nullable and not others:
+            # Only structs: the tag dispatcher decodes it directly
+            self.unions[key] = self.dispatch(members, "union")
+            return self.unions[key]
+        index = len(self._union_code)
+        self._union_code.append("")  # reserve the index
+        if len(options) == 1 and not members:
+            # e.g. list[Stock] | None
+            name = "optional"
+            returned = self.decoder(options[0], "value")
+        elif any(m.has_structs() for m in others):
+            raise ValueError(f"Unsupported union: {key}")
+        else:
+            name = "union" if len(members) > 1 else members[0].lower()
+            returned = f"{self.dispatch(members, name)}(value)"
+        function = f"_decode_{name}_{index}"
+        self.unions[key] = function
+        body = f"def {function}(value: Any) -> Any:\n"
+        if type_ref.nullable:
+            body += "    if value is None:\n        return None\n"
+        if others:
+            body += "    if not isinstance(value, dict):\n        return value\n"
+        body += f"    return {returned}\n"
+        self._union_code[index] = body
+        return function
+
+    def struct_code(self, struct: StructDef) -> str:
+        lines = [f"class {struct.name}(Struct):"]
+        slots = [field.name for field in struct.fields]
+        if struct.allow_extra:
+            slots.append("_extra")
+        lines.append(f"    __slots__ = ({''.join(repr(s) + ', ' for s in slots)})")
+        keys = "".join(repr(field.key) + ", " for field in struct.fields)
+        lines.append(f"    __json_fields__ = ({keys})")
+        lines.append("")
+
+        # __init__ (keyword-only, required fields first)
+        params = ["self", "*"]
+        for field in sorted(struct.fields, key=lambda f: not f.required):
+            annotation = field.type.annotation()
+            if field.required:
+                params.append(f"{field.name}: {annotation}")
+            else:
+                if field.default is None and "None" not in annotation.split(" | "):
+                    annotation += " | None"
+                params.append(f"{field.name}: {annotation} = {field.default!r}")
+        if struct.allow_extra:
+            params.append("**extra: Any")
+        lines.append(f"    def __init__({', '.join(params)}) -> None:")
+        for field in struct.fields:
+            lines.append(f"        self.{field.name} = {field.name}")
+        if struct.allow_extra:
+            lines.append("        self._extra = extra")
+        if not struct.fields and not struct.allow_extra:
+            lines.append("        pass")
+        lines.append("")
+
+        # from_dict
+        lines.append("    @classmethod")
+        lines.append(f"    def from_dict(cls, data: dict) -> {struct.name}:")
+        lines.append("        if not isinstance(data, dict):")
+        lines.append("            raise _not_object(cls, data)")
+        lines.append("        self = cls.__new__(cls)")
+        required = [field for field in struct.fields if field.required]
+        if required:
+            lines.append("        try:")
+            for field in required:
+                source = f"data[{field.key!r}]"
+                decoder = self.decoder(field.type, source)
+                if decoder and field.type.nullable:
+                    lines.append(f"            value = {source}")
+                    lines.append(
+                        f"            self.{field.name} = None if value is None "
+                        f"else {self.decoder(field.type, 'value')}"
+                    )
+                else:
+                    lines.append(f"            self.{field.name} = {decoder or source}")
+            lines.append("        except KeyError as error:")
+            lines.append("            raise _missing(cls, error) from None")
+        for field in struct.fields:
+            if field.required:
+                continue
+            source = (
+                f"data.get({field.key!r})"
+                if field.default is None
+                else f"data.get({field.key!r}, {field.default!r})"
+            )
+            if field.const is not None:
+                lines.append(f"        value = {source}")
+                lines.append(f"        if value != {field.const!r}:")
+                lines.append(
+                    f"            raise _mismatch(cls, {field.key!r}, "
+                    f"{field.const!r}, value)"
+                )
+                lines.append(f"        self.{field.name} = value")
+                continue
+            decoder = self.decoder(field.type, "value")
+            if decoder:
+                lines.append(f"        value = {source}")
+                lines.append(
+                    f"        self.{field.name} = None if value is None else {decoder}"
+                )
+            else:
+                lines.append(f"        self.{field.name} = {source}")
+        if struct.allow_extra:
+            lines.append(
+                "        self._extra = {key: value for key, value in data.items() "
+                "if key not in cls.__json_fields__}"
+            )
+        lines.append("        return self")
+        lines.append("")
+
+        # to_dict (field order and exclude_none as in model_dump)
+        lines.append("    def to_dict(self) -> dict:")
+        lines.append("        data: dict[str, Any] = {}")
+        for field in struct.fields:
+            encoder = self.encoder(field.type, "value")
+            if (field.required or field.const is not None) and not field.type.nullable:
+                value = self.encoder(field.type, f"self.{field.name}")
+                lines.append(
+                    f"        data[{field.key!r}] = {value or 'self.' + field.name}"
+                )
+            else:
+                lines.append(f"        value = self.{field.name}")
+                lines.append("        if value is not None:")
+                lines.append(f"            data[{field.key!r}] = {encoder or 'value'}")
+        if struct.allow_extra:
+            lines.append("        for key, value in self._extra.items():")
+            lines.append("            if value is not None:")
+            lines.append("                data[key] = _encode(value)")
+        lines.append("        return data")
+        return "\n".join(lines) + "\n"
+
+    def generate(self) -> str:
+        self.build()
+        # Struct classes in dependency-free order (names resolve at call time)
+        classes = [self.struct_code(struct) for struct in self.structs.values()]
+        parts = [HEADER.format(schema_id=self.schema.get("$id", ""))]
+        parts.extend(classes)
+        parts.append("# Union decoders: dispatch on tag fields such as 'kind'\n")
+        parts.extend(code for code in self._union_code if code)
+        parts.extend(self._tables)
+        return "\n\n".join(parts)
+
+
+def main() -> None:
+    with open(SCHEMA_PATH, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    code = Generator(schema).generate()
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write(code)
+    print(f"Wrote {OUTPUT_PATH}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Tests for the chunked, randomly accessible model log archive."""
+
+import json
+import random
+
+import pytest
+
+from deliberate_lab.archive import (
+    LogArchive,
+    LogArchiveWriter,
+    split_chunks,
+    write_log_archive,
+)
+
+INSTRUCTIONS = "".join(f"Rule {i}: be kind to participant {i}.\n" for i in range(200))
+
+
+def _entry(log_id: str, prompt, **fields) -> dict:
+    return {"id": log_id, "type": "chat", "prompt": prompt, **fields}
+
+
+ENTRIES = [
+    _entry("l0", INSTRUCTIONS + "Chat so far:\nAnn: hi\n", response={"text": "ok"}),
+    _entry("l1", INSTRUCTIONS + "Chat so far:\nAnn: hi\nBob: hey"),
+    # Prompt as the first and the last key
+    {"prompt": "first key\n", "id": "l2", "response": None},
+    {"id": "l3", "response": {"text": "x"}, "prompt": "last key"},
+    _entry("l4", ""),
+    _entry("l5", None),
+    {"id": "l6", "type": "chat", "response": {"text": "no prompt"}},
+    _entry("l7", [{"role": "user", "content": "Hi"}, {"role": "model"}]),
+    _entry("l8", {"text": "structured"}),
+    _entry("l9", 42),
+    _entry("l10", "Windows\r\nline\r\nendings\r\n\r\nand a lone\rcarriage return\r"),
+    _entry("l11", "Ünïcödé ✓ 日本語 🙂\nmixed separator\x85next line\n"),
+    _entry("l12", "\n\n\n"),
+    # Same ID as an earlier entry
+    _entry("l1", "again", response={"text": "é"}),
+]
+
+
+def _dumps(entry: dict) -> str:
+    # Compares key order too
+    return json.dumps(entry, ensure_ascii=False)
+
+
+@pytest.fixture
+def path(tmp_path) -> str:
+    return str(tmp_path / "logs.dla")
+
+
+def test_split_chunks_round_trip():
+    for text in (INSTRUCTIONS, "", "no newline", "a\r\nb\rc\n", "ü\n" * 5000):
+        chunks = split_chunks(text)
+        assert b"".join(chunks).decode("utf-8") == text
+    # Chunks follow content, not position: after the first boundary, a
+    # prefix does not change them
+    chunks = split_chunks(INSTRUCTIONS)
+    assert len(chunks) > 10
+    assert set(chunks[1:]) <= set(split_chunks("Prefix\n" + INSTRUCTIONS))
+
+
+def test_round_trip(path):
+    manifest = write_log_archive(iter(ENTRIES), path)
+    assert manifest["entries"] == len(ENTRIES)
+    # The shared instructions are stored once
+    assert manifest["chunkBytes"] < manifest["promptBytes"] - len(INSTRUCTIONS) // 2
+
+    with LogArchive(path) as archive:
+        assert len(archive) == len(ENTRIES)
+        assert archive.ids == [entry.get("id") for entry in ENTRIES]
+        for index, entry in enumerate(ENTRIES):
+            assert archive[index] == entry
+            assert _dumps(archive[index]) == _dumps(entry)
+            prompt = entry.get("prompt")
+            assert archive.prompt(index) == (
+                prompt if isinstance(prompt, str) else None
+            )
+        assert [_dumps(entry) for entry in archive] == [_dumps(e) for e in ENTRIES]
+        assert [entry.get("id") for entry in archive.entries_without_prompts()] == [
+            entry.get("id") for entry in ENTRIES
+        ]
+        assert archive.get("l10") == ENTRIES[10]
+        # The last entry with an ID wins
+        assert archive.get("l1")["prompt"] == "again"
+        with pytest.raises(KeyError):
+            archive.get("missing")
+        with pytest.raises(IndexError):
+            archive[len(ENTRIES)]
+
+
+def test_many_blocks(path):
+    rng = random.Random(0)
+    entries = [
+        _entry(
+            f"l{index}",
+            INSTRUCTIONS
+            + "".join(f"{rng.random()}\n" for _ in range(rng.randint(0, 300))),
+        )
+        for index in range(300)
+    ]
+    with LogArchiveWriter(path, level=1) as writer:
+        for entry in entries:
+            writer.add(entry)
+    # One cached block forces decompressing blocks again
+    with LogArchive(path, cache_blocks=1) as archive:
+        assert archive.stats()["blocks"] > 2
+        for index in [0, 299, 150, 1, 298]:
+            assert archive[index] == entries[index]
+        assert list(archive) == entries
+
+
+@pytest.mark.parametrize(
+    "cut",
+    [
+        lambda data: b"",
+        lambda data: data[:8],
+        lambda data: data[:30],
+        lambda data: data[: len(data) // 2],
+        lambda data: data[:-1],
+        # Middle missing, footer trailer intact
+        lambda data: data[:40] + data[-16:],
+        lambda data: data[:8] + data[-16:],
+        # Footer corrupted
+        lambda data: data[:-17] + bytes([data[-17] ^ 1]) + data[-16:],
+    ],
+)
+def test_truncated_archive_is_rejected(path, cut):
+    write_log_archive(ENTRIES, path)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(cut(data))
+    with pytest.raises(ValueError, match="Not a complete log archive"):
+        LogArchive(path)
+
+
+def test_unclosed_writer_is_rejected(path):
+    writer = LogArchiveWriter(path)
+    writer.add(ENTRIES[0])
+    writer._fp.flush()
+    with pytest.raises(ValueError):
+        LogArchive(path)
+    writer.close()
+    with LogArchive(path) as archive:
+        assert archive[0] == ENTRIES[0]
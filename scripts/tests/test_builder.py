@@ -0,0 +1,205 @@
+"""Tests for the template builder that validates once, at build() time."""
+
+import pytest
+
+from deliberate_lab import builder as builder_module
+from deliberate_lab import types
+from deliberate_lab.builder import (
+    TemplateBuilder,
+    TemplateValidationError,
+    stage_model,
+)
+
+DESCRIPTIONS = {"primaryText": "", "infoText": "", "helpText": ""}
+PROGRESS = {
+    "minParticipants": 0,
+    "waitForAllParticipants": False,
+    "showParticipantProgress": True,
+}
+
+
+def _stage(stage_id: str, kind: str, **fields) -> dict:
+    return {
+        "id": stage_id,
+        "kind": kind,
+        "name": stage_id,
+        "descriptions": DESCRIPTIONS,
+        "progress": PROGRESS,
+        **fields,
+    }
+
+
+def _info(stage_id: str, **fields) -> dict:
+    return _stage(stage_id, "info", **{"infoLines": ["Welcome"], **fields})
+
+
+def _tos(stage_id: str, **fields) -> dict:
+    return _stage(stage_id, "tos", **{"tosLines": ["Agree"], **fields})
+
+
+def _ranking(stage_id: str, ranking_type: str) -> dict:
+    stage = _stage(stage_id, "ranking", rankingType=ranking_type, strategy="condorcet")
+    if ranking_type == "items":
+        stage["rankingItems"] = [{"id": "a", "imageId": "", "text": "A"}]
+    else:
+        stage["enableSelfVoting"] = False
+    return stage
+
+
+@pytest.fixture
+def validations(monkeypatch) -> list:
+    """IDs of the parts validated by each in-process build()."""
+    calls = []
+    validate_chunk = builder_module._validate_chunk
+
+    def record(items):
+        calls.append([data.get("id") for _, data in items])
+        return validate_chunk(items)
+
+    monkeypatch.setattr(builder_module, "_validate_chunk", record)
+    return calls
+
+
+def test_build():
+    builder = TemplateBuilder(name="Study", template_id="t1")
+    builder.add_stages([_tos("tos"), _info("intro")])
+    builder.add_stage(types.InfoStageConfig.model_validate(_info("outro")))
+    template = builder.build()
+    assert isinstance(template, types.ExperimentTemplate)
+    assert template.id == "t1"
+    assert template.experiment.metadata.name == "Study"
+    assert template.experiment.stageIds == ["tos", "intro", "outro"]
+    assert [type(stage).__name__ for stage in template.stageConfigs] == [
+        "TOSStageConfig",
+        "InfoStageConfig",
+        "InfoStageConfig",
+    ]
+    with pytest.raises(ValueError):
+        builder.add_stage(_info("intro"))
+    with pytest.raises(ValueError):
+        builder.add_stage({"kind": "info"})
+
+
+def test_errors_are_located_by_part_and_field():
+    builder = TemplateBuilder()
+    builder.add_stage(_info("intro"))
+    stage = _tos("t")
+    del stage["tosLines"]
+    builder.add_stage(stage)
+    builder.add_stage(_info("bad", infoLines=[1]))
+    builder.add_stage({"id": "x", "kind": "nope"})
+    builder.add_agent_mediator({"persona": {"id": "mod"}})
+
+    with pytest.raises(TemplateValidationError) as info:
+        builder.build()
+    errors = info.value.errors
+    locations = [error["location"] for error in errors]
+    assert "stageConfigs[1] (tos 't').tosLines" in locations
+    assert "stageConfigs[2] (info 'bad').infoLines[0]" in locations
+    assert "stageConfigs[3]" in locations
+    assert any(
+        location.startswith("agentMediators[0] ('mod').") for location in locations
+    )
+    error = errors[locations.index("stageConfigs[1] (tos 't').tosLines")]
+    assert error["part"] == "stageConfigs[1]"
+    assert error["id"] == "t"
+    assert error["model"] == "TOSStageConfig"
+    assert error["field"] == "tosLines"
+    assert error["msg"] == "Field required"
+    unknown = errors[locations.index("stageConfigs[3]")]
+    assert (unknown["field"], unknown["type"]) == ("kind", "union_tag_invalid")
+    assert "stageConfigs[1] (tos 't').tosLines: Field required" in str(info.value)
+
+
+def test_parts_are_validated_once_across_copies(validations):
+    intro, chat = _info("intro"), _info("chat")
+    builder = TemplateBuilder().add_stages([intro, chat])
+    builder.build()
+    assert validations == [[builder.experiment["id"], "intro", "chat"]]
+
+    # Only the experiment (its ID differs) and the replaced stage are new
+    variant = builder.copy().replace_stage("chat", _info("chat", infoLines=["Hi"]))
+    template = variant.build()
+    assert validations[1] == [variant.experiment["id"], "chat"]
+    assert template.model_dump()["stageConfigs"][1]["infoLines"] == ["Hi"]
+    # The original is unchanged and fully cached
+    builder.build()
+    assert validations[2] == [builder.experiment["id"]]
+    assert builder.stage("chat") is chat
+
+
+def test_validated_models_are_not_validated_again(validations):
+    template = TemplateBuilder().add_stage(_info("intro")).build()
+    builder = TemplateBuilder.from_template(template)
+    builder.build()
+    assert validations[-1] == [template.experiment.id]
+
+
+def test_stage_ids_keep_stage_order():
+    builder = TemplateBuilder().add_stages(
+        [_info("a"), _info("b"), _info("c"), _info("d")]
+    )
+    builder.replace_stage("b", _info("e"))
+    assert builder.stage_ids == ["a", "e", "c", "d"]
+    builder.remove_stage("a")
+    assert builder.stage_ids == ["e", "c", "d"]
+    builder.replace_stage("c", _info("c", infoLines=["x"]))
+    assert builder.stage_ids == ["e", "c", "d"]
+    assert builder.stage("d")["id"] == "d"
+    builder.reorder_stages(["d", "e", "c"])
+    builder.remove_stage("e")
+    assert builder.stage_ids == ["d", "c"]
+    assert builder.build().experiment.stageIds == ["d", "c"]
+    assert builder.to_dict()["experiment"]["stageIds"] == ["d", "c"]
+
+    with pytest.raises(ValueError):
+        builder.replace_stage("d", _info("c"))
+    with pytest.raises(ValueError):
+        builder.replace_stage("d", {"kind": "info"})
+    assert builder.stage_ids == ["d", "c"]
+
+
+def test_ranking_kinds_are_told_apart():
+    items = _ranking("items", "items")
+    participants = _ranking("participants", "participants")
+    assert stage_model(items) is types.ItemRankingStageConfig
+    assert stage_model(participants) is types.ParticipantRankingStageConfig
+    template = TemplateBuilder().add_stages([participants, items]).build()
+    assert [type(stage) for stage in template.stageConfigs] == [
+        types.ParticipantRankingStageConfig,
+        types.ItemRankingStageConfig,
+    ]
+
+    # A mismatching literal is reported by validation
+    bad = {**items, "rankingType": "people"}
+    with pytest.raises(TemplateValidationError) as info:
+        TemplateBuilder().add_stage(bad).build()
+    assert [error["field"] for error in info.value.errors] == ["rankingType"]
+
+
+def test_build_with_workers(monkeypatch):
+    stages = [_info(f"s{index}") for index in range(150)]
+    stages[100] = _info("s100", infoLines=None)
+    builder = TemplateBuilder().add_stages(stages)
+    with pytest.raises(TemplateValidationError) as info:
+        builder.build(workers=2)
+    assert [error["location"] for error in info.value.errors] == [
+        "stageConfigs[100] (info 's100').infoLines"
+    ]
+
+    builder.replace_stage("s100", _info("s100"))
+    template = builder.build(workers=2)
+    assert template.experiment.stageIds == [f"s{index}" for index in range(150)]
+    assert template == TemplateBuilder.from_template(template).build()
+
+    # Results from worker processes are cached like in-process ones
+    validate_chunk = builder_module._validate_chunk
+    validated = []
+
+    def record(items):
+        validated.extend(data["id"] for _, data in items)
+        return validate_chunk(items)
+
+    monkeypatch.setattr(builder_module, "_validate_chunk", record)
+    assert builder.build(workers=2).stageConfigs == template.stageConfigs
+    assert validated == [template.experiment.id]
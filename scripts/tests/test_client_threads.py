@@ -0,0 +1,183 @@
+"""Tests for sharing one Client between threads."""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from deliberate_lab.client import APIError, Client, _RequestBudget
+
+POOL_SIZE = 4
+MAX_REQUESTS = 50
+WINDOW_SECONDS = 60.0
+# Large enough that the log stream outlasts one read of the client's decoder
+LOG_COUNT = 40000
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+    def do_GET(self):  # noqa: N802
+        server = self.server
+        assert isinstance(server, _Server)
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        time.sleep(0.002)
+        experiment_id = self.path.split("/")[3]
+        if self.path.endswith("/export/logs"):
+            status = 200
+            payload = [
+                {"index": i, "experimentId": experiment_id} for i in range(LOG_COUNT)
+            ]
+        elif experiment_id.startswith("missing"):
+            status, payload = 404, {"error": "Experiment not found"}
+        else:
+            status, payload = 200, {"experiment": {"id": experiment_id}}
+        body = json.dumps(payload).encode("utf-8")
+        with server.lock:
+            server.active -= 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class _FakeClock:
+    """Clock that only moves when a thread sleeps, to the sleeper's wake time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+        self._read = threading.local()
+
+    def time(self) -> float:
+        with self.lock:
+            self._read.now = self.now
+            return self.now
+
+    def sleep(self, seconds: float) -> None:
+        # Sleeps count from the time the sleeping thread last read, so
+        # threads waiting for the same slot wake at the same time
+        with self.lock:
+            self.now = max(self.now, getattr(self._read, "now", 0.0) + seconds)
+
+
+def _client(server: _Server, **kwargs) -> Client:
+    host, port = server.server_address[:2]
+    return Client(base_url=f"http://{host!s}:{port}/v1", api_key="key", **kwargs)
+
+
+def test_budget_waits_for_the_oldest_request(caplog):
+    clock = _FakeClock()
+    budget = _RequestBudget(2, 10, clock=clock.time, sleep=clock.sleep)
+    assert budget.acquire() == 0
+    clock.now = 4
+    assert budget.acquire() == 0
+    # Full until the first request leaves the window at t=10
+    assert budget.acquire() == 6
+    assert clock.now == 10
+    # Then until the second one leaves it at t=14
+    assert budget.acquire() == 4
+    assert clock.now == 14
+    assert budget.waited == 10
+    assert [record.levelname for record in caplog.records] == ["WARNING"] * 2
+
+
+def test_threads_share_pool_and_budget(server):
+    client = _client(server, pool_size=POOL_SIZE)
+    clock = _FakeClock()
+    client.budget = _RequestBudget(
+        MAX_REQUESTS, WINDOW_SECONDS, clock=clock.time, sleep=clock.sleep
+    )
+
+    def fetch(index: int) -> bool:
+        if index % 10 == 0:
+            with pytest.raises(APIError) as error:
+                client.get_experiment(f"missing{index}")
+            response = error.value.response
+            return response is not None and response.status_code == 404
+        if index % 25 == 1:
+            logs = list(client.iter_experiment_logs(f"e{index}"))
+            return len(logs) == LOG_COUNT and all(
+                log["experimentId"] == f"e{index}" for log in logs
+            )
+        return client.get_experiment(f"e{index}")["experiment"]["id"] == f"e{index}"
+
+    calls = 250
+    with ThreadPoolExecutor(32) as pool:
+        assert all(pool.map(fetch, range(calls)))
+
+    assert server.peak <= POOL_SIZE
+    # Time only passes while threads wait for the budget, so 250 requests
+    # at 50 per window end at the start of the fifth window
+    assert clock.now == (calls - 1) // MAX_REQUESTS * WINDOW_SECONDS
+
+    metrics = client.request_metrics()
+    assert sum(m.requests for m in metrics.values()) == calls
+    total = client.total_request_metrics()
+    assert total.requests == calls
+    assert total.errors == calls // 10
+    assert total.budget_wait > 0
+
+
+def test_closed_stream_releases_connection(server):
+    client = _client(server, pool_size=1, timeout=1)
+    with closing(client.iter_experiment_logs("e1")) as logs:
+        assert next(logs)["index"] == 0
+    assert client.get_experiment("e2")["experiment"]["id"] == "e2"
+
+
+def test_waiting_threads_get_the_connection_once_released(server):
+    client = _client(server, pool_size=1, timeout=0.2)
+    logs = client.iter_experiment_logs("e1")
+    assert next(logs)["index"] == 0
+    with ThreadPoolExecutor(1) as pool:
+        future = pool.submit(client.get_experiment, "e2")
+        # Waiting longer than the request timeout does not fail the request
+        time.sleep(0.5)
+        assert not future.done()
+        logs.close()
+        assert future.result()["experiment"]["id"] == "e2"
+
+
+def test_open_stream_times_out_waiting_threads(server):
+    client = _client(server, pool_size=1, timeout=5, pool_timeout=0.2)
+    logs = client.iter_experiment_logs("e1")
+    assert next(logs)["index"] == 0
+    start = time.monotonic()
+    with ThreadPoolExecutor(1) as pool:
+        with pytest.raises(requests.ConnectionError):
+            pool.submit(client.get_experiment, "e2").result()
+    assert time.monotonic() - start < 5
+    logs.close()
+    assert client.get_experiment("e3")["experiment"]["id"] == "e3"
@@ -0,0 +1,138 @@
+"""
+Tests for offline condition evaluation.
+
+Expected masks are evaluateCondition() results from utils/src/utils/condition.ts
+for the same answers, one digit per participant.
+"""
+
+import pytest
+
+from deliberate_lab.conditions import (
+    SYSTEM_VARIABLE_NAMESPACE,
+    AnswerTable,
+    compile_condition,
+    extract_condition_dependencies,
+)
+
+# One answer per participant for target "s::q"; the last has not answered
+VALUES = [5, "5", " 7 ", "abc", True, "0x10", 1e21, None]
+
+
+def _comparison(question_id: str, operator: str, value, stage_id: str = "s") -> dict:
+    return {
+        "type": "comparison",
+        "target": {"stageId": stage_id, "questionId": question_id},
+        "operator": operator,
+        "value": value,
+    }
+
+
+def _group(operator: str, *conditions: dict) -> dict:
+    return {"type": "group", "operator": operator, "conditions": list(conditions)}
+
+
+def _mask(condition: dict, table: AnswerTable) -> str:
+    return "".join(str(flag) for flag in compile_condition(condition).mask(table))
+
+
+@pytest.fixture
+def table() -> AnswerTable:
+    return AnswerTable.from_rows(
+        (f"p{index}", {} if value is None else {"s::q": value})
+        for index, value in enumerate(VALUES)
+    )
+
+
+@pytest.mark.parametrize(
+    "operator, value, expected",
+    [
+        ("equals", 5, "10000000"),
+        ("equals", "5", "01000000"),
+        ("equals", True, "00001000"),
+        ("not_equals", 5, "01111110"),
+        ("greater_than", 5, "00100110"),
+        ("greater_than", 0, "11101110"),
+        ("greater_than_or_equal", "5", "11100110"),
+        ("less_than", 10, "11101000"),
+        ("less_than_or_equal", "", "00000000"),
+        ("contains", "e+2", "00000010"),
+        ("contains", 1, "00000110"),
+        ("not_contains", "b", "11101110"),
+    ],
+)
+def test_operators_match_server(table, operator, value, expected):
+    assert _mask(_comparison("q", operator, value), table) == expected
+
+
+def test_missing_answers_never_match(table):
+    for operator in ("not_equals", "not_contains", "less_than"):
+        condition = _comparison("other", operator, "x")
+        assert _mask(condition, table) == "00000000"
+
+
+def test_nested_groups():
+    table = AnswerTable.from_rows(
+        [
+            ("p1", {"s::age": 30, "s::country": "US", "s::agree": True}),
+            ("p2", {"s::age": "17", "s::country": "US"}),
+            ("p3", {"s::age": "40", "s::country": "UK", "s::agree": False}),
+            ("p4", {"s::country": "UK", "s::agree": True}),
+            ("p5", {}),
+        ]
+    )
+    adult_us = _group(
+        "and",
+        _comparison("age", "greater_than_or_equal", 18),
+        _comparison("country", "equals", "US"),
+    )
+    agreeing = _group(
+        "and",
+        _comparison("agree", "equals", True),
+        _comparison("age", "not_equals", 30),
+        # An empty group is always true
+        _group("or"),
+    )
+    condition = _group("or", adult_us, agreeing)
+    assert _mask(condition, table) == "10000"
+    assert compile_condition(condition).matching_ids(table) == ["p1"]
+    assert _mask(_group("or"), table) == "11111"
+    assert compile_condition(None).count(table) == 5
+    assert extract_condition_dependencies(condition) == [
+        "s::age",
+        "s::country",
+        "s::agree",
+    ]
+
+
+def test_system_variable_targets():
+    def participant(variables: dict) -> dict:
+        return {"profile": {"variableMap": variables}, "answerMap": {}}
+
+    export = {
+        "participantMap": {
+            "p1": participant(
+                {"arm": "high", "info": '{"dose": 2, "tag": "a"}', "list": "[3, 4]"}
+            ),
+            "p2": participant({"arm": '"low"', "info": '{"dose": "1"}', "n": "5"}),
+            "p3": participant({}),
+        }
+    }
+    table = AnswerTable.from_export(export)
+
+    def mask(question_id: str, operator: str, value) -> str:
+        condition = _comparison(
+            question_id, operator, value, stage_id=SYSTEM_VARIABLE_NAMESPACE
+        )
+        return _mask(condition, table)
+
+    # Values that are not JSON are used as-is; JSON strings and numbers
+    # are not exposed at all
+    assert mask("arm", "equals", "high") == "100"
+    assert mask("arm", "contains", "low") == "000"
+    assert mask("n", "equals", 5) == "000"
+    # Objects and arrays are flattened one level
+    assert mask("info.dose", "greater_than", 1.5) == "100"
+    assert mask("info.dose", "equals", "1") == "010"
+    assert mask("info.tag", "equals", "a") == "100"
+    assert mask("list.1", "equals", 4) == "100"
+    assert AnswerTable.from_export(export, include_variables=False).columns == {}
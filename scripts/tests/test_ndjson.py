@@ -0,0 +1,71 @@
+"""Tests for the streaming JSON reader behind the NDJSON exports."""
+
+import io
+import json
+
+import pytest
+
+from deliberate_lab.ndjson import (
+    JsonStreamReader,
+    iter_experiment_records,
+    iter_experiment_records_from_stream,
+)
+
+NUMBERS = [1.5e3, -2, 0, 10, -0.25, 3e-7, 12345678901234567890, 1.0]
+
+EXPORT = {
+    "experiment": {"id": "exp", "version": 19, "ratio": -1.5e-3},
+    "stageMap": {"s1": {"id": "s1", "order": 1}, "s2": {"id": "s2", "order": 2}},
+    "participantMap": {"p1": {"profile": {"score": 12.75}, "answerMap": {}}},
+    "cohortMap": {
+        "c1": {
+            "cohort": {"id": "c1"},
+            "dataMap": {},
+            "chatMap": {"chat": [{"id": "m1", "timestamp": 1.7e12}]},
+        }
+    },
+    "alerts": {"p1": [{"id": "a1"}]},
+    "count": 42,
+}
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_array_of_numbers_across_chunk_boundaries(chunk_size):
+    text = json.dumps(NUMBERS)
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+    values = []
+    for _ in reader.iter_array():
+        values.append(reader.read_value())
+    assert values == NUMBERS
+    assert reader.peek() == ""
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_top_level_number_across_chunk_boundaries(chunk_size):
+    reader = JsonStreamReader(io.StringIO("  -12.5e+3 "), chunk_size=chunk_size)
+    assert reader.read_value() == -12.5e3
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 6, 7, 11, 64, 1 << 20])
+def test_experiment_records_match_in_memory_layout(chunk_size):
+    text = json.dumps(EXPORT, indent=1)
+    streamed = list(iter_experiment_records_from_stream(_Chunked(text, chunk_size)))
+    assert streamed == list(iter_experiment_records(json.loads(text)))
+
+
+def test_malformed_array_is_rejected():
+    reader = JsonStreamReader(io.StringIO("[1 2]"), chunk_size=1)
+    with pytest.raises(ValueError, match="Expected ',' or ']'"):
+        for _ in reader.iter_array():
+            reader.read_value()
+
+
+class _Chunked(io.StringIO):
+    """StringIO that ignores the requested size, as sockets may."""
+
+    def __init__(self, text: str, chunk_size: int):
+        super().__init__(text)
+        self._chunk_size = chunk_size
+
+    def read(self, size: int | None = -1) -> str:
+        return super().read(self._chunk_size)
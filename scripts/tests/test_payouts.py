@@ -0,0 +1,262 @@
+"""Tests for offline payout computation and Prolific bonus files."""
+
+import csv
+import io
+
+import pytest
+
+from deliberate_lab.payouts import (
+    ParticipantPayout,
+    compute_payouts,
+    write_prolific_bonus_csv,
+)
+
+
+def _item(item_id: str, kind: str, stage_id: str, base: float, **kwargs) -> dict:
+    return {
+        "id": item_id,
+        "type": kind,
+        "name": item_id,
+        "stageId": stage_id,
+        "baseCurrencyAmount": base,
+        "isActive": True,
+        **kwargs,
+    }
+
+
+def _mc(question_id: str, correct: str) -> dict:
+    return {
+        "id": question_id,
+        "kind": "mc",
+        "questionTitle": question_id,
+        "options": [{"id": "a", "text": "A"}, {"id": "b", "text": "B"}],
+        "correctAnswerId": correct,
+    }
+
+
+def _participant(
+    public_id: str,
+    prolific_id,
+    cohort_id: str,
+    completed: list,
+    selection: dict,
+    stages=("pay",),
+) -> dict:
+    return {
+        "profile": {
+            "publicId": public_id,
+            "prolificId": prolific_id,
+            "currentCohortId": cohort_id,
+            "timestamps": {
+                "completedStages": {stage_id: {"seconds": 0} for stage_id in completed}
+            },
+        },
+        "answerMap": {
+            stage_id: {"kind": "payout", "randomSelectionMap": selection}
+            for stage_id in stages
+        },
+    }
+
+
+def _answers(q1: str, q2: str) -> dict:
+    return {
+        "q1": {"id": "q1", "kind": "mc", "choiceId": q1},
+        "q2": {"id": "q2", "kind": "mc", "choiceId": q2},
+    }
+
+
+STAGES = {
+    "intro": {"id": "intro", "kind": "info"},
+    "chip": {
+        "id": "chip",
+        "kind": "chip",
+        "chips": [{"id": "red", "startingQuantity": 10}],
+    },
+    "quiz": {
+        "id": "quiz",
+        "kind": "survey",
+        "questions": [
+            _mc("q1", "a"),
+            _mc("q2", "b"),
+            {"id": "q3", "kind": "text", "questionTitle": "Why?"},
+        ],
+    },
+    "vote": {"id": "vote", "kind": "ranking"},
+    "pay": {
+        "id": "pay",
+        "kind": "payout",
+        "currency": "USD",
+        "averageAllPayoutItems": False,
+        "payoutItems": [
+            _item("default", "DEFAULT", "intro", 2),
+            _item("chips", "CHIP", "chip", 1),
+            _item("quiz", "SURVEY", "quiz", 0.5, questionMap={"q1": 1, "q2": 0.25}),
+            # Pays for the ranking winner's answers
+            _item(
+                "winner",
+                "SURVEY",
+                "quiz",
+                0,
+                questionMap={"q1": 3},
+                rankingStageId="vote",
+            ),
+            {**_item("inactive", "DEFAULT", "intro", 100), "isActive": False},
+            _item("r1", "DEFAULT", "intro", 1, randomSelectionId="pick"),
+            _item("r2", "DEFAULT", "intro", 0.25, randomSelectionId="pick"),
+        ],
+    },
+    "average": {
+        "id": "average",
+        "kind": "payout",
+        "currency": "USD",
+        "averageAllPayoutItems": True,
+        "payoutItems": [
+            _item("a1", "DEFAULT", "intro", 1),
+            _item("a2", "DEFAULT", "quiz", 2),
+        ],
+    },
+}
+
+EXPORT = {
+    "stageMap": STAGES,
+    "participantMap": {
+        "p1": _participant(
+            "p1",
+            "PA",
+            "c1",
+            ["intro", "chip", "quiz"],
+            {"pick": "r2"},
+            stages=("pay", "average"),
+        ),
+        "p2": _participant("p2", "PB", "c1", ["intro", "quiz"], {"pick": "r2"}),
+        "p3": _participant("p3", None, "c1", [], {"pick": "r1"}),
+        # No chip, survey or ranking data in this cohort
+        "p4": _participant("p4", "PD", "c2", ["intro"], {}),
+        "p5": _participant("p5", "PE", "c1", [], {}, stages=()),
+    },
+    "cohortMap": {
+        "c1": {
+            "dataMap": {
+                "chip": {
+                    "kind": "chip",
+                    "participantChipMap": {"p1": {"red": 12}},
+                    "participantChipValueMap": {"p1": {"red": 0.5}},
+                },
+                "quiz": {
+                    "kind": "survey",
+                    "participantAnswerMap": {
+                        "p1": _answers("a", "a"),
+                        "p2": _answers("b", "b"),
+                    },
+                },
+                "vote": {"kind": "ranking", "winnerId": "p1"},
+            }
+        },
+        "c2": {"dataMap": {}},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def payouts() -> dict:
+    return {
+        (payout.public_id, payout.stage_id): payout
+        for payout in compute_payouts(EXPORT)
+    }
+
+
+def test_participants_without_a_payout_answer_are_skipped(payouts):
+    assert sorted(payouts) == [
+        ("p1", "average"),
+        ("p1", "pay"),
+        ("p2", "pay"),
+        ("p3", "pay"),
+        ("p4", "pay"),
+    ]
+
+
+def test_item_breakdown(payouts):
+    items = {item.item_id: item for item in payouts["p1", "pay"].items}
+    # Inactive items and unselected random items are left out
+    assert list(items) == ["default", "chips", "quiz", "winner", "r2"]
+    assert items["default"].amount == 2
+    # 12 * 0.5 - 10 * 0.5 chips gained on top of the base amount
+    assert items["chips"].chip_amount == 1
+    assert items["chips"].amount == 2
+    assert items["quiz"].question_amounts == {"q1": 1, "q2": 0}
+    assert items["quiz"].amount == 1.5
+    assert items["winner"].ranking_winner == "p1"
+    assert items["winner"].question_amounts == {"q1": 3}
+    assert payouts["p1", "pay"].total == 8.75
+
+
+def test_base_amounts_require_completed_stages(payouts):
+    items = {item.item_id: item for item in payouts["p2", "pay"].items}
+    assert not items["chips"].completed_stage
+    assert items["chips"].amount == 0
+    assert items["quiz"].question_amounts == {"q1": 0, "q2": 0.25}
+    assert items["quiz"].amount == 0.75
+    # The winner's answers count, not the participant's own
+    assert items["winner"].question_amounts == {"q1": 3}
+    assert payouts["p2", "pay"].total == 6
+
+    items = {item.item_id: item for item in payouts["p3", "pay"].items}
+    assert items["r1"].amount == 0
+    assert payouts["p3", "pay"].total == 3
+
+
+def test_items_without_cohort_data_are_dropped(payouts):
+    payout = payouts["p4", "pay"]
+    # CHIP and ranking SURVEY items return null without chip / ranking data
+    assert [item.item_id for item in payout.items] == ["default", "quiz"]
+    assert payout.items[1].question_amounts == {"q1": 0, "q2": 0}
+    assert payout.total == 2
+
+
+def test_average_all_payout_items(payouts):
+    assert payouts["p1", "average"].total == 1.5
+
+
+def test_stage_ids_filter():
+    payouts = compute_payouts(EXPORT, stage_ids=["average"])
+    assert [(payout.public_id, payout.stage_id) for payout in payouts] == [
+        ("p1", "average")
+    ]
+
+
+def test_prolific_bonus_csv_round_trip(payouts):
+    dest = io.StringIO(newline="")
+    assert write_prolific_bonus_csv(payouts.values(), dest) == 3
+    # Stages are summed per participant; participants without a Prolific ID
+    # are skipped
+    assert list(csv.reader(io.StringIO(dest.getvalue()))) == [
+        ["PA", "10.25"],
+        ["PB", "6.00"],
+        ["PD", "2.00"],
+    ]
+
+
+def _payout(prolific_id: str, total: float, currency: str = "USD"):
+    return ParticipantPayout(
+        public_id=prolific_id,
+        prolific_id=prolific_id,
+        cohort_id="c1",
+        stage_id="pay",
+        currency=currency,
+        items=[],
+        total=total,
+    )
+
+
+def test_prolific_bonus_csv_zero_and_currency():
+    payouts = [_payout("PA", 0), _payout("PB", 1.5)]
+    dest = io.StringIO()
+    assert write_prolific_bonus_csv(payouts, dest) == 1
+    assert dest.getvalue() == "PB,1.50\n"
+
+    dest = io.StringIO()
+    assert write_prolific_bonus_csv(payouts, dest, include_zero=True) == 2
+    assert dest.getvalue() == "PA,0.00\nPB,1.50\n"
+
+    with pytest.raises(ValueError):
+        write_prolific_bonus_csv([_payout("PA", 1), _payout("PB", 1, "GBP")], dest)
@@ -0,0 +1,331 @@
+"""
+Golden tests for the offline prompt renderer.
+
+Expected strings follow processPromptItems() and the stage displays in
+functions/src/structured_prompt.utils.ts and utils/src/stages; shuffle orders
+are shuffleWithSeed() outputs from utils/src/utils/random.utils.ts.
+"""
+
+import pytest
+
+from deliberate_lab.prompts import PromptContext, PromptRenderer, mediator_profile
+
+PROFILE_INFO_SCAFFOLDING = (
+    "This is the display name that others will use to refer to you. It may be "
+    "a label such as an animal or object, but you are still a human using this "
+    "alias."
+)
+PROFILE_CONTEXT_SCAFFOLDING = (
+    "This information is private to you. Use it to guide your behavior in this "
+    "task. Other participants do not know these attributes unless you choose to "
+    "share it."
+)
+TRANSCRIPT_EXPLANATION = (
+    "Below is the transcript of your discussion. Messages are shown in "
+    "chronological order; new messages appear at the bottom. Each message / "
+    "turn follows the format: (HH:MM) Name: message."
+)
+
+SURVEY = {
+    "id": "survey",
+    "kind": "survey",
+    "name": "Opinions",
+    "descriptions": {"primaryText": "About {{topic}}", "infoText": "Be honest"},
+    "questions": [
+        {
+            "id": "q1",
+            "kind": "scale",
+            "questionTitle": "How worried are you about {{topic}}?",
+            "lowerValue": 1,
+            "upperValue": 5,
+            "lowerText": "Not",
+            "upperText": "Very",
+            "middleText": "",
+        },
+        {
+            "id": "q2",
+            "kind": "mc",
+            "questionTitle": "Pick one",
+            "options": [{"id": "a", "text": "Tax"}, {"id": "b", "text": "Trade"}],
+        },
+        {"id": "q3", "kind": "text", "questionTitle": "Why?"},
+    ],
+}
+CHAT = {
+    "id": "chat",
+    "kind": "chat",
+    "name": "Discussion",
+    "descriptions": {"primaryText": "Discuss {{topic}}", "infoText": ""},
+    "discussions": [],
+    "isTurnBased": False,
+}
+
+
+def _profile(public_id: str, name: str, avatar: str, **kwargs) -> dict:
+    return {
+        "publicId": public_id,
+        "privateId": f"private-{public_id}",
+        "type": "participant",
+        "name": name,
+        "avatar": avatar,
+        "pronouns": None,
+        "currentCohortId": "c1",
+        "currentStatus": "IN_PROGRESS",
+        "variableMap": {},
+        "anonymousProfiles": {},
+        **kwargs,
+    }
+
+
+def _message(message_id: str, name: str, text: str, minute: int) -> dict:
+    return {
+        "id": message_id,
+        "type": "participant",
+        "senderId": name,
+        "profile": {"name": name},
+        "message": text,
+        # 2025-01-01 13:MM UTC
+        "timestamp": {"seconds": 1735736400 + 60 * minute, "nanoseconds": 0},
+    }
+
+
+ANN = _profile(
+    "p1",
+    "Ann",
+    "🐱",
+    pronouns="she/her",
+    variableMap={"role": "skeptic"},
+    agentConfig={"agentId": "persona", "promptContext": "You care about oceans"},
+)
+BOB = _profile("p2", "Bob", "🐶")
+
+EXPORT = {
+    "experiment": {
+        "id": "exp-1",
+        "stageIds": ["survey", "chat"],
+        "variableConfigs": [
+            {"type": "static", "definition": {"name": n, "schema": {"type": t}}}
+            for n, t in [
+                ("topic", "string"),
+                ("role", "string"),
+                ("rounds", "integer"),
+                ("flag", "boolean"),
+                ("large", "number"),
+                ("small", "number"),
+            ]
+        ],
+        "variableMap": {
+            "rounds": "3",
+            "flag": "true",
+            "large": "1e21",
+            "small": "0.0000005",
+        },
+    },
+    "stageMap": {"survey": SURVEY, "chat": CHAT},
+    "participantMap": {
+        "p1": {
+            "profile": ANN,
+            "answerMap": {
+                "survey": {
+                    "kind": "survey",
+                    "answerMap": {
+                        "q1": {"id": "q1", "kind": "scale", "value": 4},
+                        "q2": {"id": "q2", "kind": "mc", "choiceId": "b"},
+                    },
+                }
+            },
+        },
+        "p2": {"profile": BOB, "answerMap": {}},
+    },
+    "cohortMap": {
+        "c1": {
+            "cohort": {"id": "c1", "variableMap": {"topic": "climate"}},
+            "dataMap": {},
+            "chatMap": {
+                "chat": [
+                    _message("m1", "Ann", "Hello", 5),
+                    _message("m2", "Bob", "Hi Ann", 6),
+                ]
+            },
+        }
+    },
+}
+
+MEDIATOR = mediator_profile(
+    {"id": "mod", "defaultProfile": {"name": "Mod", "avatar": "🤖"}}, "c1"
+)
+
+
+def _render(items: list, user: dict, scaffolding: bool) -> str:
+    config = {
+        "id": "chat",
+        "type": "chat",
+        "prompt": items,
+        "includeScaffoldingInPrompt": scaffolding,
+    }
+    return PromptRenderer(EXPORT).render(config, PromptContext("c1", "chat", user))
+
+
+def _stage_context(stage_id: str = "", answers: bool = True) -> dict:
+    return {
+        "type": "STAGE_CONTEXT",
+        "stageId": stage_id,
+        "includePrimaryText": True,
+        "includeInfoText": False,
+        "includeParticipantAnswers": answers,
+    }
+
+
+def _group(texts: list, shuffle: bool = True, seed: str = "cohort") -> dict:
+    return {
+        "type": "GROUP",
+        "title": "",
+        "items": [
+            text if isinstance(text, dict) else {"type": "TEXT", "text": text}
+            for text in texts
+        ],
+        "shuffleConfig": {"shuffle": shuffle, "seed": seed, "customSeed": ""},
+    }
+
+
+def test_text_resolves_variables_by_scope():
+    text = {
+        "type": "TEXT",
+        "text": "{{topic}}/{{role}}/{{rounds}}{{#flag}} flagged{{/flag}}[{{missing}}]",
+    }
+    # Agent participants use their own variables over the cohort's
+    assert _render([text], ANN, False) == "climate/skeptic/3 flagged[]"
+    # Mediators in a group chat only see experiment and cohort variables
+    assert _render([text], MEDIATOR, False) == "climate//3 flagged[]"
+
+
+def test_text_formats_numbers_like_javascript():
+    text = {"type": "TEXT", "text": "{{large}} {{small}}"}
+    assert _render([text], ANN, False) == "1e+21 5e-7"
+
+
+@pytest.mark.parametrize(
+    "user, scaffolding, expected",
+    [
+        (ANN, True, f"Alias: 🐱 Ann\n{PROFILE_INFO_SCAFFOLDING}"),
+        (ANN, False, "🐱 Ann"),
+        ({**ANN, "name": None}, True, "Profile not yet set"),
+        (MEDIATOR, True, "Alias: 🤖 Mod"),
+        (MEDIATOR, False, "🤖 Mod"),
+    ],
+)
+def test_profile_info(user, scaffolding, expected):
+    assert _render([{"type": "PROFILE_INFO"}], user, scaffolding) == expected
+
+
+@pytest.mark.parametrize(
+    "user, scaffolding, expected",
+    [
+        (
+            ANN,
+            True,
+            "before\nPrivate persona context: You care about oceans\n"
+            f"{PROFILE_CONTEXT_SCAFFOLDING}\nafter",
+        ),
+        (ANN, False, "before\nYou care about oceans\nafter"),
+        # Empty contexts are left out
+        (MEDIATOR, True, "before\nafter"),
+    ],
+)
+def test_profile_context(user, scaffolding, expected):
+    items = [
+        {"type": "TEXT", "text": "before"},
+        {"type": "PROFILE_CONTEXT"},
+        {"type": "TEXT", "text": "after"},
+    ]
+    assert _render(items, user, scaffolding) == expected
+
+
+def test_stage_context_labels_preceding_stages_for_participants():
+    expected = (
+        "\n--- Previously completed stages chronologically (read only) ---\n"
+        "[Stage: Opinions]\n"
+        "* Stage description: About climate\n"
+        "* Participant 🐱 Ann (she/her)'s answers:\n"
+        "  * How worried are you about climate?: 4 (Scale: 1 = Not, 5 = Very)\n"
+        "  * Pick one: Trade\n"
+        "  * Why?: (not answered yet)\n"
+        "\n--- Current stage ---\n"
+        "[Stage: Discussion]\n"
+        "* Stage description: Discuss climate\n"
+        "Participants in chat: 🐱 Ann (she/her), 🐶 Bob\n"
+        "\n\n--- Start of chat transcript ---\n"
+        f"{TRANSCRIPT_EXPLANATION}\n\n"
+        "(13:05) Ann: Hello\n"
+        "(13:06) Bob: Hi Ann\n"
+        "--- End of chat transcript ---\n"
+    )
+    assert _render([_stage_context()], ANN, True) == expected
+
+
+def test_stage_context_without_scaffolding():
+    expected = (
+        # Without scaffolding, a single participant's answers have no prefix
+        "* Stage description: About climate\n"
+        "  * How worried are you about climate?: 4 (Scale: 1 = Not, 5 = Very)\n"
+        "  * Pick one: Trade\n"
+        "  * Why?: (not answered yet)\n"
+        "* Stage description: Discuss climate\n"
+        "Participants in chat: 🐱 Ann (she/her), 🐶 Bob\n"
+        f"{TRANSCRIPT_EXPLANATION}\n\n"
+        "(13:05) Ann: Hello\n"
+        "(13:06) Bob: Hi Ann"
+    )
+    assert _render([_stage_context()], MEDIATOR, False) == expected
+
+
+def test_stage_context_for_mediators_is_not_labeled():
+    expected = (
+        "[Stage: Opinions]\n"
+        "* Stage description: About climate\n"
+        "* How worried are you about climate? (Scale: 1 = Not, 5 = Very)\n"
+        "* Pick one (Multiple choice: Tax (a), Trade (b))\n"
+        "* Why? (Text response)"
+    )
+    assert _render([_stage_context("survey", answers=False)], MEDIATOR, True) == (
+        expected
+    )
+
+
+def test_stage_context_chat_before_any_message():
+    context = PromptContext("c1", "chat", BOB, turn=0)
+    config = {
+        "id": "chat",
+        "type": "chat",
+        "prompt": [_stage_context("chat")],
+        "includeScaffoldingInPrompt": False,
+    }
+    assert PromptRenderer(EXPORT).render(config, context) == (
+        "* Stage description: Discuss climate\n"
+        "Participants in chat: 🐱 Ann (she/her), 🐶 Bob\n"
+        "No messages yet."
+    )
+
+
+def test_first_shuffled_group_keeps_the_bare_seed():
+    items = [
+        {"type": "TEXT", "text": "start"},
+        # First shuffled group: shuffleWithSeed(items, "c1")
+        _group(["A", "B", "C"]),
+        # Later group: seed "c1::chat::2"
+        _group(["D", "E", "F"]),
+        # Nested group: seed "c1::chat::3.0"
+        _group([_group(["X", "Y", "Z"])], shuffle=False),
+    ]
+    assert _render(items, ANN, False).split("\n") == [
+        "start",
+        *"BCA",
+        *"EDF",
+        *"ZYX",
+    ]
+
+
+def test_shuffled_group_after_the_first_uses_its_position():
+    # The same group in second place is seeded with "c1::chat::1"
+    items = [_group(["Q"]), _group(["A", "B", "C"])]
+    assert _render(items, ANN, False).split("\n") == ["Q", *"BAC"]
@@ -0,0 +1,154 @@
+"""
+Tests for ranking aggregation.
+
+Server winners are getCondorcetElectionWinner() results from
+utils/src/utils/algebraic.utils.ts for the same rankings.
+"""
+
+import pytest
+
+from deliberate_lab.rankings import _server_winner, tally_ranking_stage, tally_rankings
+
+
+@pytest.mark.parametrize(
+    "rankings, expected",
+    [
+        ({"v1": ["a", "b", "c"], "v2": ["a", "c", "b"], "v3": ["b", "a", "c"]}, "a"),
+        # Cycle: every candidate has one pairwise win
+        ({"v1": ["a", "b", "c"], "v2": ["b", "c", "a"], "v3": ["c", "a", "b"]}, "a"),
+        # Unranked candidates have index -1 and so beat ranked ones
+        ({"v1": ["a"], "v2": ["b", "a"], "v3": []}, "b"),
+        ({"v1": ["b", "a"], "v2": ["c"], "v3": ["a", "b", "a"]}, "c"),
+        # Ties go to the first key in JavaScript order, where numeric IDs
+        # come first
+        ({"v1": ["x", "10"], "v2": ["10", "x"]}, "10"),
+        ({"v1": ["a"]}, "a"),
+        ({}, ""),
+    ],
+)
+def test_server_winner_matches_server(rankings, expected):
+    candidates = list(dict.fromkeys(c for r in rankings.values() for c in r))
+    assert _server_winner(list(rankings.values()), candidates) == expected
+    assert tally_rankings(rankings).server_winner == expected
+
+
+def test_condorcet_winner():
+    tally = tally_rankings(
+        {"v1": ["a", "b", "c"], "v2": ["a", "c", "b"], "v3": ["b", "a", "c"]},
+        stored_winner="a",
+    )
+    assert tally.candidates == ["a", "b", "c"]
+    assert tally.pairwise == [[0, 2, 3], [1, 0, 2], [0, 1, 0]]
+    assert tally.borda == {"a": 5, "b": 3, "c": 1}
+    assert tally.plurality == {"a": 2, "b": 1, "c": 0}
+    assert tally.copeland == {"a": 2, "b": 1, "c": 0}
+    assert (
+        tally.condorcet_winner,
+        tally.borda_winner,
+        tally.plurality_winner,
+        tally.copeland_winner,
+        tally.server_winner,
+        tally.stored_winner,
+    ) == ("a", "a", "a", "a", "a", "a")
+
+
+def test_cycle_has_no_condorcet_winner():
+    tally = tally_rankings(
+        {"v1": ["a", "b", "c"], "v2": ["b", "c", "a"], "v3": ["c", "a", "b"]}
+    )
+    assert tally.condorcet_winner is None
+    # Every tally is tied; ties go to the first candidate
+    assert tally.borda == {"a": 3, "b": 3, "c": 3}
+    assert tally.copeland == {"a": 1, "b": 1, "c": 1}
+    assert (tally.borda_winner, tally.plurality_winner, tally.copeland_winner) == (
+        "a",
+        "a",
+        "a",
+    )
+
+
+def test_incomplete_rankings():
+    tally = tally_rankings(
+        {"v1": ["a"], "v2": ["b", "a"], "v3": []}, candidates=["a", "b", "c"]
+    )
+    assert tally.voters == ["v1", "v2", "v3"]
+    assert tally.candidates == ["a", "b", "c"]
+    # Ranked candidates are above unranked ones
+    assert tally.pairwise == [[0, 1, 2], [1, 0, 1], [0, 0, 0]]
+    assert tally.borda == {"a": 0, "b": 1, "c": 0}
+    assert tally.plurality == {"a": 1, "b": 1, "c": 0}
+    assert tally.copeland == {"a": 1, "b": 1, "c": 0}
+    assert tally.condorcet_winner is None
+    assert tally.borda_winner == "b"
+    assert tally.plurality_winner == "a"
+    assert tally.copeland_winner == "a"
+    # The server counts missing candidates as ranked above everyone
+    assert tally.server_winner == "b"
+
+
+def test_single_and_no_candidates():
+    tally = tally_rankings({"v1": ["a"]})
+    assert tally.condorcet_winner == "a"
+    tally = tally_rankings({}, candidates=["a", "b"])
+    assert tally.server_winner == ""
+    assert tally.borda == {"a": 0, "b": 0}
+    assert tally.borda_winner is None
+    assert tally.condorcet_winner is None
+
+
+def _cohort(rankings: dict, winner: str, wtl=None) -> dict:
+    data_map = {
+        "vote": {
+            "kind": "ranking",
+            "participantAnswerMap": rankings,
+            "winnerId": winner,
+        }
+    }
+    if wtl is not None:
+        data_map["wtl"] = {
+            "kind": "survey",
+            "participantAnswerMap": {
+                voter: {"wtl": {"id": "wtl", "kind": "scale", "value": value}}
+                for voter, value in wtl.items()
+            },
+        }
+    return {"cohort": {}, "dataMap": data_map, "chatMap": {}}
+
+
+def test_tally_ranking_stage():
+    export = {
+        "stageMap": {
+            "vote": {
+                "id": "vote",
+                "kind": "ranking",
+                "rankingItems": [{"id": "a"}, {"id": "b"}, {"id": "z"}],
+            },
+            "chat": {"id": "chat", "kind": "chat"},
+        },
+        "cohortMap": {
+            "c1": _cohort({"p1": ["a", "b"], "p2": ["b", "a"], "p3": ["a"]}, "a"),
+            # Only the two participants most willing to lead are candidates
+            "c2": _cohort(
+                {
+                    "p1": ["p3", "p1", "p2"],
+                    "p2": ["p3", "p2", "p1"],
+                    "p3": ["p2", "p3", "p1"],
+                },
+                "p2",
+                wtl={"p1": 3, "p2": 5, "p3": 1},
+            ),
+            "c3": {"cohort": {}, "dataMap": {}, "chatMap": {}},
+        },
+    }
+    tallies = tally_ranking_stage(export, "vote")
+    assert list(tallies) == ["c1", "c2"]
+    assert tallies["c1"].candidates == ["a", "b", "z"]
+    assert tallies["c1"].borda_winner == "a"
+    assert tallies["c1"].stored_winner == "a"
+    assert tallies["c2"].candidates == ["p1", "p2", "a", "b", "z"]
+    assert tallies["c2"].plurality == {"p1": 1, "p2": 2, "a": 0, "b": 0, "z": 0}
+    assert tallies["c2"].condorcet_winner == "p2"
+    assert tallies["c2"].server_winner == "p2"
+    assert list(tally_ranking_stage(export, "vote", cohort_ids=["c2"])) == ["c2"]
+    with pytest.raises(ValueError):
+        tally_ranking_stage(export, "chat")
@@ -0,0 +1,344 @@
+"""Tests for offline reference-integrity checks of templates."""
+
+import copy
+
+import pytest
+
+from deliberate_lab.conditions import SYSTEM_VARIABLE_NAMESPACE
+from deliberate_lab.references import (
+    TemplateReferenceError,
+    check_template_references,
+    find_reference_issues,
+)
+
+
+def _condition(stage_id: str, question_id: str) -> dict:
+    return {
+        "id": "c",
+        "type": "comparison",
+        "target": {"stageId": stage_id, "questionId": question_id},
+        "operator": "==",
+        "value": 1,
+    }
+
+
+TEMPLATE = {
+    "experiment": {
+        "stageIds": [
+            "intro",
+            "survey",
+            "stock",
+            "alloc",
+            "multi",
+            "vote",
+            "reveal",
+            "transfer",
+            "split",
+            "pay",
+        ],
+        "cohortDefinitions": [{"alias": "treatment"}, {"alias": "control"}],
+        "variableMap": {"topic": {}},
+        "variableConfigs": [
+            {
+                "id": "v",
+                "type": "random_permutation",
+                "definition": {"name": "arms"},
+            }
+        ],
+    },
+    "stageConfigs": [
+        {"id": "intro", "kind": "info"},
+        {
+            "id": "survey",
+            "kind": "survey",
+            "questions": [
+                {"id": "q1", "kind": "scale"},
+                {
+                    "id": "q2",
+                    "kind": "text",
+                    "condition": {
+                        "id": "g",
+                        "type": "group",
+                        "operator": "AND",
+                        "conditions": [
+                            _condition("survey", "q1"),
+                            _condition(SYSTEM_VARIABLE_NAMESPACE, "arms_2"),
+                            _condition(SYSTEM_VARIABLE_NAMESPACE, "topic.title"),
+                        ],
+                    },
+                },
+            ],
+        },
+        {"id": "stock", "kind": "stockinfo"},
+        {
+            "id": "alloc",
+            "kind": "assetAllocation",
+            "stockConfig": {"stockInfoStageId": "stock"},
+        },
+        {"id": "multi", "kind": "multiAssetAllocation", "stockInfoStageId": "stock"},
+        {"id": "vote", "kind": "ranking"},
+        {
+            "id": "reveal",
+            "kind": "reveal",
+            "items": [
+                {"id": "vote", "kind": "ranking"},
+                {"id": "survey", "kind": "survey"},
+            ],
+        },
+        {
+            "id": "transfer",
+            "kind": "transfer",
+            "autoTransferConfig": {
+                "type": "survey",
+                "surveyStageId": "survey",
+                "surveyQuestionId": "q1",
+            },
+        },
+        {
+            "id": "split",
+            "kind": "transfer",
+            "autoTransferConfig": {
+                "type": "condition",
+                "transferGroups": [
+                    {"targetCohortAlias": "treatment"},
+                    {"targetCohortAlias": "control"},
+                ],
+            },
+        },
+        {
+            "id": "pay",
+            "kind": "payout",
+            "payoutItems": [
+                {"type": "DEFAULT", "stageId": "intro"},
+                {
+                    "type": "SURVEY",
+                    "stageId": "survey",
+                    "rankingStageId": "vote",
+                    "questionMap": {"q1": 1},
+                },
+            ],
+        },
+    ],
+    "agentMediators": [
+        {
+            "persona": {"id": "mod"},
+            "promptMap": {
+                "survey": {
+                    "prompt": [
+                        {"type": "TEXT", "text": "Hi"},
+                        {"type": "STAGE_CONTEXT", "stageId": "survey"},
+                    ]
+                }
+            },
+        }
+    ],
+    "agentParticipants": [],
+}
+
+
+def _stage(template: dict, stage_id: str) -> dict:
+    return next(s for s in template["stageConfigs"] if s["id"] == stage_id)
+
+
+def _targets(template: dict) -> list:
+    return _stage(template, "survey")["questions"][1]["condition"]["conditions"]
+
+
+def _break_condition_question(template):
+    _targets(template)[0]["target"]["questionId"] = "q9"
+
+
+def _break_condition_stage(template):
+    _targets(template)[0]["target"]["stageId"] = "intro"
+
+
+def _break_condition_variable(template):
+    _targets(template)[1]["target"]["questionId"] = "topic_1"
+
+
+def _break_stage_context(template):
+    prompt = template["agentMediators"][0]["promptMap"]["survey"]["prompt"]
+    prompt[1]["stageId"] = "gone"
+
+
+def _break_payout_stage(template):
+    _stage(template, "pay")["payoutItems"][1]["stageId"] = "intro"
+
+
+def _break_payout_ranking(template):
+    _stage(template, "pay")["payoutItems"][1]["rankingStageId"] = "survey"
+
+
+def _break_payout_questions(template):
+    _stage(template, "pay")["payoutItems"][1]["questionMap"] = {"q1": 1, "q3": 2}
+
+
+def _break_reveal(template):
+    _stage(template, "reveal")["items"][0]["kind"] = "chip"
+
+
+def _break_transfer_alias(template):
+    groups = _stage(template, "split")["autoTransferConfig"]["transferGroups"]
+    groups[1]["targetCohortAlias"] = "placebo"
+
+
+def _break_transfer_question(template):
+    _stage(template, "transfer")["autoTransferConfig"]["surveyQuestionId"] = "q2x"
+
+
+def _break_transfer_survey(template):
+    _stage(template, "transfer")["autoTransferConfig"]["surveyStageId"] = "vote"
+
+
+def _break_stock_info(template):
+    _stage(template, "alloc")["stockConfig"]["stockInfoStageId"] = "intro"
+    _stage(template, "multi")["stockInfoStageId"] = "stocks"
+
+
+def _break_stage_order(template):
+    stage_ids = template["experiment"]["stageIds"]
+    stage_ids[0], stage_ids[1] = stage_ids[1], stage_ids[0]
+
+
+def _break_stage_ids_duplicate(template):
+    template["experiment"]["stageIds"].insert(3, "intro")
+
+
+def _break_stage_ids_unknown(template):
+    template["experiment"]["stageIds"].append("extra")
+
+
+def _break_stage_config_duplicate(template):
+    template["stageConfigs"].append({"id": "vote", "kind": "ranking"})
+
+
+@pytest.mark.parametrize(
+    "break_template, expected",
+    [
+        (
+            _break_condition_question,
+            "stageConfigs[1] (survey 'survey').questions[1].condition.conditions[0]"
+            ".target: question 'q9' is not in survey 'survey'",
+        ),
+        (
+            _break_condition_stage,
+            "stageConfigs[1] (survey 'survey').questions[1].condition.conditions[0]"
+            ".target: target stage 'intro' is a info stage, not a survey",
+        ),
+        (
+            _break_condition_variable,
+            "stageConfigs[1] (survey 'survey').questions[1].condition.conditions[1]"
+            ".target: variable 'topic_1' is not defined",
+        ),
+        (
+            _break_stage_context,
+            "agentMediators[0].promptMap.survey.prompt[1].stageId: "
+            "stage 'gone' is not a stage in stageConfigs",
+        ),
+        (
+            _break_payout_stage,
+            "stageConfigs[9] (payout 'pay').payoutItems[1].stageId: "
+            "stage 'intro' is a info stage, expected survey",
+        ),
+        (
+            _break_payout_ranking,
+            "stageConfigs[9] (payout 'pay').payoutItems[1].rankingStageId: "
+            "rankingStageId 'survey' is a survey stage, expected ranking",
+        ),
+        (
+            _break_payout_questions,
+            "stageConfigs[9] (payout 'pay').payoutItems[1].questionMap: "
+            "question 'q3' is not in survey 'survey'",
+        ),
+        (
+            _break_reveal,
+            "stageConfigs[6] (reveal 'reveal').items[0].id: "
+            "stage 'vote' is a ranking stage, expected chip",
+        ),
+        (
+            _break_transfer_alias,
+            "stageConfigs[8] (transfer 'split').autoTransferConfig.transferGroups[1]"
+            ".targetCohortAlias: cohort alias 'placebo' is not in "
+            "experiment.cohortDefinitions",
+        ),
+        (
+            _break_transfer_question,
+            "stageConfigs[7] (transfer 'transfer').autoTransferConfig"
+            ".surveyQuestionId: question 'q2x' is not in survey 'survey'",
+        ),
+        (
+            _break_transfer_survey,
+            "stageConfigs[7] (transfer 'transfer').autoTransferConfig"
+            ".surveyStageId: stage 'vote' is a ranking stage, expected survey",
+        ),
+        (
+            _break_stage_order,
+            "experiment.stageIds: order differs from stageConfigs",
+        ),
+        (
+            _break_stage_ids_duplicate,
+            "experiment.stageIds[3]: duplicate 'intro'",
+        ),
+        (
+            _break_stage_ids_unknown,
+            "experiment.stageIds[10]: 'extra' is not a stage in stageConfigs",
+        ),
+        (
+            _break_stage_config_duplicate,
+            "stageConfigs[10].id: duplicate stage ID 'vote'",
+        ),
+    ],
+)
+def test_broken_reference(break_template, expected):
+    template = copy.deepcopy(TEMPLATE)
+    break_template(template)
+    issues = find_reference_issues(template)
+    assert [str(issue) for issue in issues] == [expected]
+    assert issues[0].severity == "error"
+    with pytest.raises(TemplateReferenceError):
+        check_template_references(template)
+
+
+def test_valid_template():
+    assert find_reference_issues(TEMPLATE) == []
+    assert check_template_references(TEMPLATE) == []
+
+
+def test_stock_info_stage():
+    template = copy.deepcopy(TEMPLATE)
+    _break_stock_info(template)
+    assert [str(issue) for issue in find_reference_issues(template)] == [
+        "stageConfigs[3] (assetAllocation 'alloc').stockConfig.stockInfoStageId: "
+        "stockInfoStageId 'intro' is a info stage, expected stockinfo",
+        "stageConfigs[4] (multiAssetAllocation 'multi').stockInfoStageId: "
+        "stockInfoStageId 'stocks' is not a stage in stageConfigs",
+    ]
+
+
+def test_missing_stage_ids():
+    template = copy.deepcopy(TEMPLATE)
+    del template["experiment"]["stageIds"][2:4]
+    assert [str(issue) for issue in find_reference_issues(template)] == [
+        "experiment.stageIds: missing stages from stageConfigs: ['stock', 'alloc']"
+    ]
+
+
+def test_warnings():
+    template = copy.deepcopy(TEMPLATE)
+    # A condition on a later survey, and a prompt for a removed stage
+    _stage(template, "intro")["condition"] = _condition("survey", "q1")
+    template["agentMediators"][0]["promptMap"]["old"] = {}
+    issues = find_reference_issues(template)
+    assert [(str(issue), issue.severity) for issue in issues] == [
+        (
+            "stageConfigs[0] (info 'intro').condition.target: "
+            "targets survey 'survey', which comes after this stage",
+            "warning",
+        ),
+        (
+            "agentMediators[0].promptMap: prompt for 'old', which is not in "
+            "stageConfigs",
+            "warning",
+        ),
+    ]
+    assert check_template_references(template) == issues
@@ -0,0 +1,187 @@
+"""Tests for replaying recorded model calls against OllamaStub."""
+
+import math
+
+import pytest
+import requests
+
+from deliberate_lab.replay import (
+    OllamaStub,
+    ReplayCall,
+    StubLatency,
+    load_replay_calls,
+    replay,
+    replicate_calls,
+)
+
+START = 1735736400
+
+
+def _log(
+    log_id: str,
+    second: float,
+    prompt="Hello",
+    agent_id="mod",
+    stage_id="chat",
+    latency=None,
+) -> dict:
+    entry = {
+        "id": log_id,
+        "prompt": prompt,
+        "stageId": stage_id,
+        "cohortId": "c1",
+        "queryTimestamp": {
+            "seconds": START + int(second),
+            "nanoseconds": round(second % 1 * 1e9),
+        },
+        "userProfile": {
+            "agentConfig": {"agentId": agent_id, "modelSettings": {"modelName": "m"}}
+        },
+        "response": {"text": f"reply {log_id}"},
+    }
+    if latency is not None:
+        entry["responseTimestamp"] = (START + second + latency) * 1000
+    return entry
+
+
+AGENTS = {
+    "agentMediators": [
+        {
+            "persona": {"id": "mod"},
+            "promptMap": {
+                "chat": {
+                    "generationConfig": {
+                        "temperature": 0.5,
+                        "maxTokens": 100,
+                        "frequencyPenalty": 0,
+                        "providerOptions": {"ollama": {"numCtx": 4096}},
+                    },
+                    "structuredOutputConfig": {"enabled": True, "type": "JSON_FORMAT"},
+                }
+            },
+        }
+    ]
+}
+
+
+def test_load_replay_calls():
+    logs = [
+        _log("l3", 12.5, latency=2),
+        _log("l1", 10),
+        _log("l2", 11, prompt="Other", stage_id="vote"),
+        # Same query time as l1, logged later
+        _log("l1b", 10, agent_id="p1"),
+        {**_log("none", 9), "prompt": ""},
+        {**_log("untimed", 9), "queryTimestamp": None},
+    ]
+    calls = load_replay_calls(logs, agents=AGENTS)
+    assert [call.recorded_text for call in calls] == [
+        "reply l1",
+        "reply l1b",
+        "reply l2",
+        "reply l3",
+    ]
+    # Offsets from the first call kept, in seconds
+    assert [call.offset for call in calls] == [0, 0, 1, 2.5]
+    assert calls[3].recorded_latency == 2
+    assert math.isnan(calls[0].recorded_latency)
+    assert (calls[0].agent_id, calls[0].stage_id, calls[0].model) == (
+        "mod",
+        "chat",
+        "m",
+    )
+    assert calls[0].options == {"num_predict": 100, "temperature": 0.5, "num_ctx": 4096}
+    assert calls[0].format == "json"
+    # No prompt config for other agents or stages
+    assert (calls[1].options, calls[1].format) == ({}, None)
+    assert (calls[2].options, calls[2].format) == ({}, None)
+    assert calls[0].request_body()["format"] == "json"
+
+    # Offsets are relative to the first call in the window
+    window = load_replay_calls(
+        logs, start_ms=(START + 11) * 1000, end_ms=(START + 12.5) * 1000
+    )
+    assert [(call.recorded_text, call.offset) for call in window] == [("reply l2", 0)]
+    assert load_replay_calls([]) == []
+
+
+def test_replicate_calls():
+    calls = [ReplayCall(offset=0, prompt="a"), ReplayCall(offset=3, prompt="b")]
+    replicated = replicate_calls(calls, copies=3, stagger_seconds=2)
+    assert [(call.prompt, call.offset, call.cohort_id) for call in replicated] == [
+        ("a", 0, ""),
+        ("a", 2, "#1"),
+        ("b", 3, ""),
+        ("a", 4, "#2"),
+        ("b", 5, "#1"),
+        ("b", 7, "#2"),
+    ]
+
+
+def test_stub_answers_recorded_responses():
+    calls = [ReplayCall(offset=0, prompt="Hello", recorded_text="Hi there")]
+    with OllamaStub(calls, latency=StubLatency(base=0)) as stub:
+        chat = requests.post(
+            f"{stub.url}/chat",
+            json={"model": "m", "messages": [{"role": "user", "content": "Hello"}]},
+            timeout=10,
+        ).json()
+        assert chat["message"]["content"] == "Hi there"
+        generated = requests.post(
+            f"{stub.url}/generate",
+            json={"prompt": "Unknown", "format": "json"},
+            timeout=10,
+        ).json()
+        assert generated["response"] == "{}"
+        assert requests.get(f"{stub.url}/version", timeout=10).ok
+
+
+def test_replay_against_stub():
+    calls = [
+        ReplayCall(offset=index, prompt=f"prompt {index}", recorded_text="ok")
+        for index in range(12)
+    ]
+    latency = StubLatency(base=0.3)
+    with OllamaStub(calls, latency=latency, parallel=2, max_queue=3) as stub:
+        # All at once, beyond the server's queue
+        report = replay(calls, stub.url, time_scale=0, max_concurrency=12)
+        stats = stub.stats()
+    assert stats["requests"] == 12
+    assert stats["peakActive"] <= 2
+    assert stats["peakWaiting"] <= 3
+    # Every call arrives before the first finishes, so at most
+    # parallel + max_queue are served
+    assert stats["rejected"] >= 12 - 2 - 3
+    assert len(report.errors) == stats["rejected"]
+    assert {result.status_code for result in report.errors} == {503}
+    assert all(str(result.error).startswith("HTTP 503") for result in report.errors)
+    ok = [result for result in report.results if result.ok]
+    assert ok
+    assert all(result.server_seconds >= 0.3 for result in ok)
+    assert all(result.scheduled == 0 for result in report.results)
+    # Results are in call order
+    assert [result.call for result in report.results] == calls
+
+    summary = report.summary()
+    assert summary["calls"] == 12
+    assert summary["errors"] == stats["rejected"]
+    assert summary["timeScale"] == 0
+    assert summary["model"]["p50"] >= 0.3
+
+
+def test_replay_concurrency_limit():
+    calls = [
+        ReplayCall(offset=0, prompt=f"prompt {index}", agent_id=f"a{index % 2}")
+        for index in range(6)
+    ]
+    with OllamaStub(calls, latency=StubLatency(base=0.1), parallel=4) as stub:
+        report = replay(calls, stub.url, time_scale=0, max_concurrency=2)
+        stats = stub.stats()
+    assert not report.errors
+    assert stats["peakActive"] <= 2
+    assert report.summary()["peakInFlight"] <= 2
+    # Calls waited for the replay's slots, not the server's
+    assert max(result.client_queue for result in report.results) >= 0.1
+    assert set(report.latency_percentiles(by="agent")) == {"a0", "a1"}
+    with pytest.raises(ValueError):
+        report.latency_percentiles(by="persona")
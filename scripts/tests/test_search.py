@@ -0,0 +1,152 @@
+"""Tests for the full-text search index over chats, alerts and model logs."""
+
+import math
+
+import pytest
+
+from deliberate_lab.search import SearchIndex, parse_query
+
+
+def _message(message_id: str, sender: str, text: str, second: int) -> dict:
+    return {
+        "id": message_id,
+        "type": "participant",
+        "senderId": sender,
+        "message": text,
+        "timestamp": {"seconds": 1735736400 + second, "nanoseconds": 0},
+    }
+
+
+EXPORT = {
+    "experiment": {"id": "exp-1"},
+    "cohortMap": {
+        "c1": {
+            "chatMap": {
+                "chat": [
+                    _message("m1", "p1", "We are lost at sea on a raft", 0),
+                    _message("m2", "p2", "The raft is lost, see https://x.org", 1),
+                ]
+            }
+        },
+        "c2": {"chatMap": {"chat": [_message("m3", "p3", "Sea water is salty", 2)]}},
+    },
+    "alerts": {
+        "private-p1": [
+            {
+                "id": "a1",
+                "message": "I am stuck",
+                "responses": ["Try reloading"],
+                "cohortId": "c1",
+                "stageId": "chat",
+                "status": "answered",
+            }
+        ]
+    },
+}
+
+LOGS = [
+    {
+        "id": "l1",
+        "type": "chat",
+        "publicId": "mediator",
+        "cohortId": "c1",
+        "stageId": "chat",
+        "prompt": "Summarize the raft discussion",
+        "response": {"text": "Lost at sea", "errorMessage": None},
+    }
+]
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    index = SearchIndex()
+    assert index.add_export(EXPORT) == 4
+    assert index.add_logs(LOGS, "exp-1") == 1
+    return index
+
+
+def test_words_phrases_and_filters(index):
+    assert index.count("raft") == 3
+    assert [hit.doc_id for hit in index.search('"lost at sea"')] == ["m1", "l1"]
+    assert index.count('"at lost"') == 0
+    assert [hit.cohort_id for hit in index.search("sea kind:chat")] == ["c1", "c2"]
+    assert index.count("sea", cohort="c2", sender="p3") == 1
+    assert index.count('stage:chat kind:"alert" reloading') == 1
+    assert index.count("raft missing") == 0
+    assert index.count("kind:chat") == 3
+
+
+def test_phrases_do_not_match_across_text_parts(index):
+    # The log's prompt ends with "discussion" and its response starts with
+    # "Lost"; the alert's message and response are separate parts too
+    assert index.count('"discussion lost"') == 0
+    assert index.count('"stuck try"') == 0
+    assert index.count('"raft discussion"') == 1
+    assert index.count('"try reloading"') == 1
+
+
+def test_unknown_field_prefixes_are_text(index):
+    assert parse_query("https://x.org kind:chat") == (
+        [["https", "x", "org"]],
+        {"kind": "chat"},
+    )
+    assert [hit.doc_id for hit in index.search("https://x.org")] == ["m2"]
+    assert index.count("note:raft") == 0
+    with pytest.raises(ValueError):
+        index.count("raft", room="c1")
+
+
+def test_adding_the_same_documents_again_is_a_no_op(index):
+    assert index.add_export(EXPORT) == 0
+    assert index.add_logs(LOGS, "exp-1") == 0
+    # Same IDs in another experiment are new documents
+    assert index.add_logs(LOGS, "exp-2") == 1
+    assert len(index) == 6
+    assert index.count('"lost at sea"') == 3
+    assert index.values("experiment") == ["exp-1", "exp-2"]
+
+
+def test_hits(index):
+    hit = index.search("salty")[0]
+    assert (hit.kind, hit.experiment_id, hit.cohort_id, hit.sender_id) == (
+        "chat",
+        "exp-1",
+        "c2",
+        "p3",
+    )
+    assert hit.timestamp == 1735736402000
+    assert hit.text == "Sea water is salty"
+    assert index.search("reloading")[0].text == "I am stuck\nTry reloading"
+    # Log entries without a timestamp
+    assert math.isnan(index.search("summarize")[0].timestamp)
+
+
+def test_save_and_load(index, tmp_path):
+    path = str(tmp_path / "search.idx")
+    index.save(path)
+    loaded = SearchIndex.load(path)
+    assert len(loaded) == len(index)
+    for query in ("raft", '"lost at sea"', "sea kind:chat", "https://x.org"):
+        assert loaded.search_docs(query) == index.search_docs(query)
+    assert [hit.text for hit in loaded.search("raft")] == [
+        hit.text for hit in index.search("raft")
+    ]
+    # A loaded index keeps deduplicating and accepts new documents
+    assert loaded.add_export(EXPORT) == 0
+    assert loaded.add_logs(LOGS, "exp-2") == 1
+
+
+def test_without_texts():
+    index = SearchIndex(keep_text=False)
+    index.add_export(EXPORT)
+    assert index.search("salty")[0].text is None
+
+
+def test_rare_terms_are_probed_in_long_lists():
+    index = SearchIndex()
+    for number in range(200):
+        text = "common words here" + (" rare" if number in (7, 150) else "")
+        index.add_document("chat", "exp", f"m{number}", [text])
+    assert index.search_docs("common rare") == [7, 150]
+    assert index.search_docs('"words here" rare') == [7, 150]
+    assert index.search_docs("common", limit=3) == [0, 1, 2]
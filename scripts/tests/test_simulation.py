@@ -0,0 +1,271 @@
+"""
+Tests for the offline experiment simulators.
+
+Seeded draws are compared with outputs of shuffleWithSeed(), choices() and
+weightedChoice() from utils/src/utils/random.utils.ts for the same seeds.
+"""
+
+import pytest
+
+from deliberate_lab.simulation import (
+    _choices,
+    _SeededRandom,
+    _weighted_choice,
+    simulate_condition_transfer,
+    simulate_variable_assignment,
+)
+
+LETTERS = list("ABCDE")
+
+
+def test_seeded_random_matches_server():
+    rng = _SeededRandom("")
+    assert [rng.random() for _ in range(3)] == [
+        0.536110901273787,
+        0.23401072318665683,
+        0.9350802428089082,
+    ]
+
+
+@pytest.mark.parametrize(
+    "seed, shuffled, chosen",
+    [
+        ("", "CAEDB", "CA"),
+        ("c1", "CDEAB", "CD"),
+        ("exp-1", "EDCAB", "ED"),
+        ("cohort-0::2", "EDBCA", "ED"),
+        ("::2", "BCEDA", "BC"),
+    ],
+)
+def test_choices_match_server(seed, shuffled, chosen):
+    assert "".join(_choices(LETTERS, len(LETTERS), seed)) == shuffled
+    assert "".join(_choices(LETTERS, 2, seed)) == chosen
+
+
+@pytest.mark.parametrize(
+    "seed, weighted, uniform",
+    [
+        ("", "y", "y"),
+        ("c1", "x", "y"),
+        ("exp-1", "z", "z"),
+        ("p2-arm", "y", "z"),
+    ],
+)
+def test_weighted_choice_matches_server(seed, weighted, uniform):
+    values = ["x", "y", "z"]
+    assert _weighted_choice(values, [5, 3, 2], seed) == weighted
+    # Missing, mismatched and all-zero weights fall back to a uniform choice
+    assert _weighted_choice(values, None, seed) == uniform
+    assert _weighted_choice(values, [1, 2], seed) == uniform
+    assert _weighted_choice(values, [0, 0, 0], seed) == uniform
+
+
+def _permutation(name: str, scope: str, seed: str, shuffle: bool = True) -> dict:
+    return {
+        "type": "random_permutation",
+        "scope": scope,
+        "definition": {"name": name, "schema": {"type": "array"}},
+        "values": LETTERS,
+        "numToSelect": 2,
+        "shuffleConfig": {"shuffle": shuffle, "seed": seed, "customSeed": ""},
+    }
+
+
+def test_variable_seeds_by_scope_and_position():
+    configs = [
+        {
+            "type": "static",
+            "scope": "cohort",
+            "definition": {"name": "arm", "schema": {"type": "string"}},
+            "value": '"a"',
+            "cohortValues": {"cohort-1": '"b"'},
+        },
+        # First shuffled config in the cohort scope: seeded by the cohort ID
+        _permutation("first", "cohort", "cohort"),
+        # Later ones add their position in the scope: "<cohortId>::2"
+        _permutation("second", "cohort", "cohort"),
+        # Unshuffled configs keep the pool order and do not count as the
+        # first shuffled config
+        _permutation("fixed", "participant", "experiment", shuffle=False),
+        _permutation("pick", "participant", "experiment"),
+        # Custom seeds are mixed the same way: "" + "::2"
+        _permutation("custom", "participant", "custom"),
+        {
+            "type": "balanced_assignment",
+            "scope": "participant",
+            "definition": {"name": "group", "schema": {"type": "string"}},
+            "values": ["x", "y", "z"],
+            "weights": None,
+            "balanceStrategy": "round_robin",
+            "balanceAcross": "cohort",
+        },
+    ]
+    report = simulate_variable_assignment(
+        configs, num_participants=4, cohort_size=2, experiment_id="exp-1", seed=0
+    )
+    assert report.cohorts == 2
+    assert report.counts == {
+        "arm": {'"a"': 2, '"b"': 2},
+        "first": {'["C","B"]': 2, '["A","B"]': 2},
+        "second": {'["E","D"]': 2, '["A","E"]': 2},
+        "fixed": {'["A","B"]': 4},
+        "pick": {'["E","D"]': 4},
+        "custom": {'["B","C"]': 4},
+        "group": {"x": 2, "y": 2},
+    }
+    # Two participants per cohort leave "z" unassigned
+    assert report.cohort_deviation["group"] == pytest.approx([1 / 3, 1 / 3])
+
+
+def _entry(entry_id: str, team, min_count: int = 1, max_count: int = 1) -> dict:
+    # team=None accepts everyone; a list of teams accepts any of them
+    teams = [] if team is None else team if isinstance(team, list) else [team]
+    return {
+        "id": entry_id,
+        "condition": (
+            {
+                "type": "group",
+                "operator": "or",
+                "conditions": [
+                    {
+                        "type": "comparison",
+                        "target": {"stageId": "s", "questionId": "team"},
+                        "operator": "equals",
+                        "value": value,
+                    }
+                    for value in teams
+                ],
+            }
+            if teams
+            else {"type": "group", "operator": "and", "conditions": []}
+        ),
+        "minCount": min_count,
+        "maxCount": max_count,
+    }
+
+
+def _transfer_stage(*groups: dict, balancing: bool = False, **stage) -> dict:
+    return {
+        "id": "transfer",
+        "kind": "transfer",
+        "autoTransferConfig": {
+            "type": "condition",
+            "transferGroups": list(groups),
+            "enableGroupBalancing": balancing,
+        },
+        **stage,
+    }
+
+
+def _transfer_group(group_id: str, *entries: dict, alias=None) -> dict:
+    return {"id": group_id, "composition": list(entries), "targetCohortAlias": alias}
+
+
+def _simulate(stage: dict, teams: str, times=None, **kwargs):
+    """Arrivals answer "s::team" with one letter each, one second apart."""
+    rows = iter([{"s::team": team} for team in teams])
+    return simulate_condition_transfer(
+        stage,
+        lambda rng: next(rows),
+        num_arrivals=len(teams),
+        arrival_times=range(len(teams)) if times is None else times,
+        **kwargs,
+    )
+
+
+def test_transfer_uses_first_matching_entry():
+    # "a" matches both entries but only waits in the first one
+    stage = _transfer_stage(
+        _transfer_group("g", _entry("any", ["a", "b"]), _entry("a", "a"))
+    )
+    report = _simulate(stage, "aa")
+    assert (report.matched, report.waiting) == (0, 2)
+
+    stage = _transfer_stage(
+        _transfer_group("g", _entry("a", "a"), _entry("any", ["a", "b"]))
+    )
+    report = _simulate(stage, "ab")
+    assert report.matched == 2
+    assert report.composition_participants == {"g": {"a": 1, "any": 1}}
+
+
+def test_transfer_takes_oldest_up_to_max_count():
+    stage = _transfer_stage(
+        _transfer_group("g", _entry("a", "a", 2, 3), _entry("b", "b", 1, 1))
+    )
+    report = _simulate(stage, "aaaab")
+    assert report.cohorts == 1
+    assert report.cohort_sizes == {4: 1}
+    assert report.composition_participants == {"g": {"a": 3, "b": 1}}
+    # The three oldest "a" arrivals, then the arriving "b"
+    assert report.wait_times == [4, 3, 2, 0]
+    assert report.fill_times == [4]
+    assert report.waiting == 1
+
+
+def test_transfer_waits_for_min_counts():
+    stage = _transfer_stage(_transfer_group("g", _entry("a", "a", 3, 3)))
+    report = _simulate(stage, "aabaa")
+    assert report.cohort_sizes == {3: 1}
+    # Ready on the third "a"; the arriving participant is listed first
+    assert report.wait_times == [0, 3, 2]
+    assert report.waiting == 2
+
+
+@pytest.mark.parametrize(
+    "balancing, expected",
+    [
+        # Fewest participants first; ties go to the earlier group and groups
+        # without an alias are never preferred
+        (True, {"x": 2, "y": 2}),
+        (False, {"x": 4}),
+    ],
+)
+def test_transfer_group_balancing(balancing, expected):
+    stage = _transfer_stage(
+        _transfer_group("none", _entry("e", None)),
+        _transfer_group("x", _entry("e", None), alias="x"),
+        _transfer_group("y", _entry("e", None), alias="y"),
+        balancing=balancing,
+    )
+    report = _simulate(stage, "aaaa", initial_alias_sizes={"x": 1})
+    if balancing:
+        assert report.alias_participants == expected
+        assert report.group_cohorts == {"none": 0, "x": 2, "y": 2}
+    else:
+        assert report.alias_participants == {}
+        assert report.group_participants == {"none": 4, "x": 0, "y": 0}
+
+
+def test_transfer_alias_capacity_overflow():
+    stage = _transfer_stage(_transfer_group("g", _entry("e", None, 2, 2), alias="x"))
+    report = _simulate(stage, "aaaaaa", max_participants_per_cohort=3)
+    # The first cohort fills the alias; later transfers go to overflow cohorts
+    assert report.alias_participants == {"x": 6}
+    assert report.overflow_transfers == 2
+
+
+def test_transfer_timeout():
+    stage = _transfer_stage(
+        _transfer_group("g", _entry("a", "a"), _entry("b", "b")),
+        enableTimeout=True,
+        timeoutSeconds=10,
+    )
+    report = _simulate(stage, "acbab", times=[0, 1, 11, 12, 13])
+    # "a" and the unmatchable "c" leave before "b" arrives; the last "b"
+    # waits until the end
+    assert report.matched == 2
+    assert report.wait_times == [0, 1]
+    assert (report.timed_out, report.timed_out_unmatchable) == (3, 1)
+    assert report.waiting == 0
+    assert report.duration == 23
+
+
+def test_transfer_requires_one_arrival_process():
+    stage = _transfer_stage(_transfer_group("g", _entry("e", None)))
+    with pytest.raises(ValueError):
+        simulate_condition_transfer(stage, {}, num_arrivals=1)
+    with pytest.raises(ValueError):
+        simulate_condition_transfer(
+            stage, {}, num_arrivals=1, arrival_rate=1, arrival_times=[0]
+        )
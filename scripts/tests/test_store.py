@@ -0,0 +1,108 @@
+"""Tests for the indexed local export store."""
+
+import pytest
+
+from deliberate_lab.store import ExportStore
+
+
+def _message(message_id: str, text: str) -> dict:
+    return {"id": message_id, "senderId": "p1", "message": text}
+
+
+EXPORT = {
+    "experiment": {"id": "exp-1", "stageIds": ["survey", "chat"]},
+    "stageMap": {
+        "survey": {"id": "survey", "kind": "survey"},
+        "chat": {"id": "chat", "kind": "chat"},
+    },
+    "participantMap": {
+        "p1": {
+            "profile": {"publicId": "p1", "name": "Ann"},
+            "answerMap": {"survey": {"kind": "survey", "answerMap": {"q1": 1}}},
+        },
+        "p2": {"profile": {"publicId": "p2", "name": "Bob"}, "answerMap": {}},
+    },
+    "cohortMap": {
+        "c1": {
+            "cohort": {"id": "c1"},
+            "dataMap": {"survey": {"kind": "survey"}},
+            "chatMap": {
+                "chat": [_message("m1", "Hello"), _message("m2", "Hi ünïcode")]
+            },
+        },
+        "c2": {"cohort": {"id": "c2"}, "dataMap": {}, "chatMap": {}},
+    },
+    "agentMediatorMap": {"mod": {"persona": {"id": "mod"}}},
+    "alerts": {"private-p1": [{"id": "a1", "message": "Stuck"}]},
+}
+
+
+def _check_lookups(store: ExportStore) -> None:
+    assert store.experiment() == EXPORT["experiment"]
+    assert store.stage_ids() == ["survey", "chat"]
+    assert store.stage("chat") == EXPORT["stageMap"]["chat"]
+
+    assert store.participant_ids() == ["p1", "p2"]
+    assert store.participant("p2") == EXPORT["participantMap"]["p2"]
+    assert store.profile("p1")["name"] == "Ann"
+    assert store.answer("p1", "survey") == {"kind": "survey", "answerMap": {"q1": 1}}
+    assert store.answer("p2", "survey") is None
+    assert [public_id for public_id, _ in store.iter_participants()] == ["p1", "p2"]
+
+    assert store.cohort_ids() == ["c1", "c2"]
+    assert store.cohort("c1") == EXPORT["cohortMap"]["c1"]
+    assert store.cohort("c1", include_chats=False)["chatMap"] == {}
+    assert [m["id"] for m in store.chat("c1", "chat")] == ["m1", "m2"]
+    assert store.chat("c1", "chat")[1]["message"] == "Hi ünïcode"
+    assert store.chat("c2", "chat") == []
+    assert store.chat_map("c2") == {}
+
+    assert store.alert_participant_ids() == ["private-p1"]
+    assert store.alerts("private-p1") == EXPORT["alerts"]["private-p1"]
+    assert store.alerts("private-p2") == []
+
+    for lookup, key in [
+        (store.participant, "p3"),
+        (store.stage, "missing"),
+        (store.cohort, "c3"),
+        (store.chat_map, "c3"),
+    ]:
+        with pytest.raises(KeyError):
+            lookup(key)
+
+
+def test_written_store(tmp_path):
+    path = str(tmp_path / "exp.ndjson")
+    with ExportStore.write(path, EXPORT) as store:
+        _check_lookups(store)
+        assert store.counts["participant"] == 2
+        assert store.counts["chatMessage"] == 2
+    # Later sessions open the index written next to the export
+    with ExportStore(path) as store:
+        _check_lookups(store)
+
+
+def test_build_index_skips_blank_lines(tmp_path):
+    path = str(tmp_path / "exp.ndjson")
+    ExportStore.write(path, EXPORT).close()
+    with open(path, "rb") as f:
+        lines = f.read().splitlines(keepends=True)
+    # Blank lines between records, inside the chat range and at the end
+    with open(path, "wb") as f:
+        for line in lines:
+            f.write(b"\n" + line + b"  \r\n")
+        f.write(b"\n")
+
+    with ExportStore.build_index(path) as store:
+        _check_lookups(store)
+        assert store.counts == ExportStore(path).counts
+        assert sum(store.counts.values()) == len(lines)
+
+
+def test_index_version_is_checked(tmp_path):
+    path = str(tmp_path / "exp.ndjson")
+    ExportStore.write(path, EXPORT).close()
+    with open(ExportStore.index_path(path), "w", encoding="utf-8") as f:
+        f.write('{"version": 0}')
+    with pytest.raises(ValueError):
+        ExportStore(path)
@@ -0,0 +1,167 @@
+"""
+Parity tests for the generated structs against the Pydantic models.
+
+Random experiment templates are generated from docs/assets/api/schemas.json;
+each one the Pydantic models accept must decode to structs of the same
+types and encode back to the same dict.
+"""
+
+from enum import Enum
+from pathlib import Path
+import json
+import random
+from typing import Any
+
+from pydantic import BaseModel, RootModel
+import pytest
+
+from deliberate_lab import structs, types
+
+SCHEMA_PATH = (
+    Path(__file__).resolve().parents[2] / "docs" / "assets" / "api" / "schemas.json"
+)
+TEMPLATES_PER_SEED = 100
+
+
+@pytest.fixture(scope="module")
+def schema() -> dict:
+    if not SCHEMA_PATH.exists():
+        pytest.skip("schemas.json is not available outside the repository")
+    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+
+
+class _TemplateGenerator:
+    """Random JSON values for a JSON schema (valid or nearly so)."""
+
+    def __init__(self, schema: dict, seed: int):
+        self.defs = schema["$defs"]
+        self.rng = random.Random(seed)
+
+    def _resolve(self, node: dict) -> dict:
+        while "$ref" in node:
+            node = self.defs[node["$ref"].split("/")[-1]]
+        return node
+
+    def generate(self, node: dict, depth: int = 0) -> Any:
+        rng = self.rng
+        node = self._resolve(node)
+        if "const" in node:
+            return node["const"]
+        if "enum" in node:
+            return rng.choice(node["enum"])
+        if "anyOf" in node:
+            return self.generate(rng.choice(node["anyOf"]), depth + 1)
+        kind = node.get("type")
+        if isinstance(kind, list):
+            kind = rng.choice(kind)
+        if kind == "null":
+            return None
+        if kind == "string":
+            return f"s{rng.randint(0, 99)}"
+        if kind == "number":
+            return rng.choice([1, 2.5, 1000])
+        if kind == "integer":
+            return rng.randint(1, 5)
+        if kind == "boolean":
+            return rng.random() < 0.5
+        if kind == "array":
+            size = rng.randint(0, 3) if depth < 6 else 0
+            return [
+                self.generate(node.get("items", {}), depth + 1) for _ in range(size)
+            ]
+        if kind == "object":
+            if "properties" in node:
+                required = set(node.get("required", []))
+                data = {
+                    key: self.generate(value, depth + 1)
+                    for key, value in node["properties"].items()
+                    if key in required or (rng.random() < 0.5 and depth < 8)
+                }
+                if node.get("additionalProperties") is True and rng.random() < 0.3:
+                    data["extraKey"] = rng.choice([1, None, "x"])
+                return data
+            values = node.get("patternProperties", {}).get("^(.*)$", {})
+            return {
+                f"k{i}": self.generate(values, depth + 1)
+                for i in range(rng.randint(0, 2))
+            }
+        return rng.choice([1, "x", None])
+
+
+def _normalize_numbers(value: Any) -> Any:
+    # Pydantic dumps integral values of float fields as floats
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {key: _normalize_numbers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize_numbers(item) for item in value]
+    return value
+
+
+def _assert_same_types(model: Any, struct: Any, path: str = "$") -> None:
+    """Check that every nested model decoded to the struct of the same name."""
+    if isinstance(model, RootModel):
+        _assert_same_types(model.root, struct, path)
+    elif isinstance(model, BaseModel):
+        # Reused models are aliases in types.py (AgentParticipantTemplate)
+        assert getattr(types, type(struct).__name__) is type(model), path
+        for name, info in type(model).model_fields.items():
+            key = info.alias or name
+            _assert_same_types(
+                getattr(model, name), getattr(struct, key), f"{path}.{key}"
+            )
+    elif isinstance(model, list):
+        assert len(struct) == len(model), path
+        for index, (item, struct_item) in enumerate(zip(model, struct)):
+            _assert_same_types(item, struct_item, f"{path}[{index}]")
+    elif isinstance(model, dict):
+        assert list(struct) == list(model), path
+        for key, item in model.items():
+            _assert_same_types(item, struct[key], f"{path}.{key}")
+    elif not isinstance(model, Enum):
+        assert not isinstance(struct, structs.Struct), path
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_structs_match_pydantic_models(schema, seed):
+    generator = _TemplateGenerator(schema, seed)
+    root = schema["properties"]["experimentCreation"]["properties"][
+        "experimentTemplate"
+    ]
+    checked = 0
+    for _ in range(TEMPLATES_PER_SEED):
+        data = generator.generate(root)
+        try:
+            model = types.ExperimentTemplate.model_validate(data)
+        except ValueError:
+            continue
+        struct = structs.ExperimentTemplate.from_dict(data)
+        _assert_same_types(model, struct)
+        expected = model.model_dump(mode="json", by_alias=True, exclude_none=True)
+        # Compare as JSON so that key order counts too
+        assert json.dumps(_normalize_numbers(struct.to_dict())) == json.dumps(
+            _normalize_numbers(expected)
+        )
+        encoded = structs.ExperimentTemplate.from_model(model).to_dict()
+        assert _normalize_numbers(encoded) == _normalize_numbers(expected)
+        checked += 1
+    assert checked > TEMPLATES_PER_SEED // 2
+
+
+def test_union_tag_mismatch_is_rejected():
+    data = {
+        "id": "s1",
+        "kind": "survey",
+        "name": "Survey",
+        "descriptions": {"primaryText": "", "infoText": "", "helpText": ""},
+        "progress": {
+            "minParticipants": 0,
+            "waitForAllParticipants": False,
+            "showParticipantProgress": True,
+        },
+        "infoLines": [],
+    }
+    with pytest.raises(structs.DecodeError):
+        structs.InfoStageConfig.from_dict(data)
+    assert structs.InfoStageConfig.from_dict({**data, "kind": "info"}).kind == "info"
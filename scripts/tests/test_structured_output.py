@@ -0,0 +1,228 @@
+"""Tests for structured output schema checks of logged model responses."""
+
+import random
+from typing import Any
+
+import pytest
+
+from deliberate_lab.structured_output import (
+    CompiledSchema,
+    _generate_is_valid,
+    check_log_conformance,
+    parse_response,
+)
+
+
+def _prop(name: str, schema: dict) -> dict:
+    return {"name": name, "schema": schema}
+
+
+SCHEMA = {
+    "type": "OBJECT",
+    "properties": [
+        _prop("shouldRespond", {"type": "BOOLEAN"}),
+        _prop("response", {"type": "STRING"}),
+        _prop(
+            "votes",
+            {
+                "type": "ARRAY",
+                "arrayItems": {
+                    "type": "OBJECT",
+                    "properties": [
+                        _prop("choice", {"type": "ENUM", "enumItems": ["a", "b"]}),
+                        _prop("score", {"type": "NUMBER"}),
+                        _prop(
+                            "tags",
+                            {"type": "ARRAY", "arrayItems": {"type": "STRING"}},
+                        ),
+                    ],
+                },
+            },
+        ),
+        _prop(
+            "meta",
+            {
+                "type": "OBJECT",
+                "properties": [
+                    _prop("rank", {"type": "INTEGER"}),
+                    _prop("extra", {"type": "ARRAY"}),
+                ],
+            },
+        ),
+    ],
+}
+
+VALID = {
+    "shouldRespond": True,
+    "response": "Hi",
+    "votes": [
+        {"choice": "a", "score": 1, "tags": []},
+        {"choice": "b", "score": 0.5, "tags": ["x", "y"], "note": "other keys"},
+    ],
+    "meta": {"rank": 2.0, "extra": [1, "x", None]},
+}
+
+
+# Marks a value to remove in _with()
+_REMOVE = object()
+
+
+def _with(path: list, value) -> Any:
+    """A copy of VALID with the value at a path replaced (or removed)."""
+
+    def replace(node, keys):
+        if not keys:
+            return value
+        node = list(node) if isinstance(node, list) else dict(node)
+        if len(keys) == 1 and value is _REMOVE:
+            del node[keys[0]]
+        else:
+            node[keys[0]] = replace(node[keys[0]], keys[1:])
+        return node
+
+    return replace(VALID, path)
+
+
+@pytest.fixture(scope="module")
+def compiled() -> CompiledSchema:
+    return CompiledSchema(SCHEMA)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (VALID, None),
+        (_with(["votes"], []), None),
+        (_with(["meta", "rank"], 3), None),
+        (None, "$: expected object, got null"),
+        ([VALID], "$: expected object, got array"),
+        (_with(["response"], _REMOVE), "$: missing property 'response'"),
+        (_with(["shouldRespond"], 1), "$.shouldRespond: expected boolean, got integer"),
+        (_with(["response"], None), "$.response: expected string, got null"),
+        (_with(["votes"], {}), "$.votes: expected array, got object"),
+        (_with(["votes", 1], "b"), "$.votes[1]: expected object, got string"),
+        (
+            _with(["votes", 1, "choice"], "c"),
+            "$.votes[1].choice: 'c' is not one of ['a', 'b']",
+        ),
+        (
+            _with(["votes", 0, "choice"], 1),
+            "$.votes[0].choice: expected string, got integer",
+        ),
+        (
+            _with(["votes", 1, "score"], True),
+            "$.votes[1].score: expected number, got boolean",
+        ),
+        (
+            _with(["votes", 1, "tags", 1], 2),
+            "$.votes[1].tags[1]: expected string, got integer",
+        ),
+        (
+            _with(["votes", 0, "tags"], _REMOVE),
+            "$.votes[0]: missing property 'tags'",
+        ),
+        (_with(["meta", "rank"], 2.5), "$.meta.rank: expected integer, got number"),
+        (_with(["meta", "rank"], False), "$.meta.rank: expected integer, got boolean"),
+        (_with(["meta", "extra"], "x"), "$.meta.extra: expected array, got string"),
+    ],
+)
+def test_validate(compiled, value, expected):
+    assert compiled.validate(value) == expected
+    assert compiled.is_valid(value) == (expected is None)
+
+
+def _mutate(rng: random.Random, value):
+    """A copy of a value with one random nested value replaced."""
+    if isinstance(value, dict) and value and rng.random() < 0.8:
+        key = rng.choice(list(value))
+        if rng.random() < 0.1:
+            return {k: v for k, v in value.items() if k != key}
+        return {**value, key: _mutate(rng, value[key])}
+    if isinstance(value, list) and value and rng.random() < 0.8:
+        index = rng.randrange(len(value))
+        return [*value[:index], _mutate(rng, value[index]), *value[index + 1 :]]
+    return rng.choice([None, True, 0, 1.0, 1.5, "a", "c", [], {}, ["x"]])
+
+
+def test_generated_function_matches_checkers(compiled):
+    rng = random.Random(0)
+    valid = 0
+    for _ in range(2000):
+        value = _mutate(rng, VALID)
+        error = compiled.validate(value)
+        assert compiled.is_valid(value) == (error is None), (value, error)
+        valid += error is None
+    # Some mutations keep the value valid (e.g. "a" for a choice)
+    assert 0 < valid < 2000
+
+
+@pytest.mark.parametrize(
+    "schema, valid, invalid",
+    [
+        ({"type": "ARRAY"}, [[], [1]], [None, {}]),
+        (
+            {
+                "type": "ARRAY",
+                "arrayItems": {"type": "ARRAY", "arrayItems": {"type": "INTEGER"}},
+            },
+            [[], [[]], [[1, 2.0], [3]]],
+            [[1], [[1.5]], [[True]]],
+        ),
+        ({"type": "OBJECT", "properties": []}, [{}, {"a": 1}], [[], None]),
+        ({"type": "ENUM"}, ["anything"], [1]),
+        (
+            {
+                "type": "OBJECT",
+                "properties": [_prop("not an identifier", {"type": "NUMBER"})],
+            },
+            [{"not an identifier": 1}],
+            [{"not an identifier": "1"}, {}],
+        ),
+    ],
+)
+def test_schema_shapes(schema, valid, invalid):
+    is_valid = _generate_is_valid(schema)
+    compiled = CompiledSchema(schema)
+    for value in valid:
+        assert is_valid(value) and compiled.validate(value) is None
+    for value in invalid:
+        assert not is_valid(value) and compiled.validate(value) is not None
+
+
+def test_unknown_type():
+    with pytest.raises(ValueError):
+        CompiledSchema({"type": "OBJECT", "properties": [_prop("x", {"type": "DATE"})]})
+
+
+def test_parse_response():
+    assert parse_response({"parsedResponse": {"a": 1}, "text": "x"}) == ({"a": 1}, None)
+    assert parse_response({"text": '```json\n{"a": 1}\n```'}) == ({"a": 1}, None)
+    assert parse_response({"text": ""}) == (None, "no response text")
+    value, error = parse_response({"text": "{"})
+    assert value is None and error is not None and error.startswith("invalid JSON")
+
+
+def _log(log_id: str, agent_id: str, stage_id: str, text: str, status="ok") -> dict:
+    return {
+        "id": log_id,
+        "stageId": stage_id,
+        "userProfile": {"agentConfig": {"agentId": agent_id}},
+        "response": {"status": status, "text": text},
+    }
+
+
+def test_check_log_conformance():
+    schema = {"type": "OBJECT", "properties": [_prop("ok", {"type": "BOOLEAN"})]}
+    logs = [
+        _log("l1", "mod", "chat", '{"ok": true}'),
+        _log("l2", "mod", "chat", '{"ok": 1}'),
+        _log("l3", "mod", "chat", "not json"),
+        _log("l4", "mod", "chat", "", status="provider_error"),
+        _log("l5", "mod", "other", '{"ok": true}'),
+    ]
+    report = check_log_conformance(logs, {("mod", "chat"): schema})
+    agent = report.agents["mod"]
+    assert (agent.checked, agent.conforming) == (3, 1)
+    assert (agent.parse_errors, agent.schema_errors) == (1, 1)
+    assert agent.samples[0] == ("l2", "chat", "$.ok: expected boolean, got integer")
+    assert (report.unmatched, report.no_output) == (1, 1)
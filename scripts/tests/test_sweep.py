@@ -0,0 +1,192 @@
+"""Tests for factorial sweeps, submitted to a stub API client."""
+
+import threading
+
+import pytest
+import requests
+
+from deliberate_lab import sweep as sweep_module
+from deliberate_lab.builder import TemplateBuilder
+from deliberate_lab.client import APIError
+from deliberate_lab.sweep import (
+    Axis,
+    ExperimentSweep,
+    read_sweep_manifest,
+    stage_order_axis,
+)
+
+
+def _info(stage_id: str, lines: list) -> dict:
+    return {
+        "id": stage_id,
+        "kind": "info",
+        "name": stage_id,
+        "descriptions": {"primaryText": "", "infoText": "", "helpText": ""},
+        "progress": {
+            "minParticipants": 0,
+            "waitForAllParticipants": False,
+            "showParticipantProgress": True,
+        },
+        "infoLines": lines,
+    }
+
+
+def _lines(lines: list):
+    return lambda builder: builder.replace_stage("intro", _info("intro", lines))
+
+
+def _error(status: int, headers=None) -> APIError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return APIError(response, "error")
+
+
+class _StubClient:
+    """Creates experiments, raising queued errors by intro text first."""
+
+    budget = None
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.created: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def create_experiment(self, template: dict) -> dict:
+        stages = {stage["id"]: stage for stage in template["stageConfigs"]}
+        text = stages["intro"]["infoLines"][0]
+        with self._lock:
+            queued = self.errors.get(text)
+            if queued:
+                raise queued.pop(0)
+            experiment_id = f"exp-{len(self.created)}"
+            self.created.append((text, template["experiment"]["metadata"]["name"]))
+        return {"experiment": {"id": experiment_id}}
+
+
+@pytest.fixture
+def sweep() -> ExperimentSweep:
+    builder = TemplateBuilder(name="Base")
+    builder.add_stages([_info("intro", ["base"]), _info("outro", ["Bye"])])
+    text = Axis(
+        "text",
+        {
+            "a": _lines(["A"]),
+            "b": _lines(["B"]),
+            # Same content as "a"
+            "a2": _lines(["A"]),
+            "bad": _lines([1]),
+            # Same content as "bad", which fails validation
+            "bad2": _lines([1]),
+        },
+    )
+    order = stage_order_axis(
+        "order", {"intro-first": ["intro", "outro"], "outro-first": ["outro", "intro"]}
+    )
+    return ExperimentSweep(builder, [order, text])
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch) -> list:
+    sleeps = []
+    monkeypatch.setattr(sweep_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_variants_and_duplicates(sweep):
+    variants = list(sweep.variants())
+    assert len(sweep) == len(variants) == 10
+    assert variants[0].condition == "order=intro-first, text=a"
+    assert variants[0].builder.experiment["metadata"]["name"] == (
+        "Base [order=intro-first, text=a]"
+    )
+    duplicates = {
+        variant.condition: variant.duplicate_of
+        for variant in variants
+        if variant.duplicate_of is not None
+    }
+    assert duplicates == {
+        "order=intro-first, text=a2": "order=intro-first, text=a",
+        "order=intro-first, text=bad2": "order=intro-first, text=bad",
+        "order=outro-first, text=a2": "order=outro-first, text=a",
+        "order=outro-first, text=bad2": "order=outro-first, text=bad",
+    }
+
+
+def test_submit_and_resume(sweep, tmp_path):
+    path = str(tmp_path / "sweep.ndjson")
+    # "B" fails for good the first time (500 is not retried)
+    client = _StubClient({"B": [_error(500), _error(500)]})
+    records = []
+    report = sweep.submit(client, path, max_workers=2, on_record=records.append)
+    assert (report.conditions, report.created, report.duplicates) == (10, 2, 2)
+    assert report.failed == 6
+    assert sorted(text for text, _ in client.created) == ["A", "A"]
+    assert len(records) == 10
+
+    manifest = read_sweep_manifest(path)
+    assert len(manifest) == 10
+    a = manifest["order=intro-first, text=a"]
+    a2 = manifest["order=intro-first, text=a2"]
+    assert a2["experimentId"] == a["experimentId"]
+    assert a2["duplicateOf"] == "order=intro-first, text=a"
+    assert a2["hash"] == a["hash"]
+    assert "infoLines" in manifest["order=intro-first, text=bad"]["error"]
+    assert manifest["order=intro-first, text=bad2"]["error"] == (
+        "Duplicate of failed condition order=intro-first, text=bad"
+    )
+    assert "500" in report.errors["order=outro-first, text=b"]
+
+    # Resuming only retries the failed conditions
+    report = sweep.submit(client, path, max_workers=2)
+    assert (report.resumed, report.created, report.failed) == (4, 2, 4)
+    assert sorted(text for text, _ in client.created) == ["A", "A", "B", "B"]
+    assert "Base [order=outro-first, text=b]" in [name for _, name in client.created]
+    manifest = read_sweep_manifest(path)
+    assert "experimentId" in manifest["order=intro-first, text=b"]
+
+    # Nothing left to create; a cut-off last line is ignored
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"condition": "order=intro')
+    report = sweep.submit(client, path)
+    assert (report.resumed, report.created, report.duplicates) == (6, 0, 0)
+    assert len(client.created) == 4
+
+
+def test_duplicates_of_resumed_conditions(sweep, tmp_path):
+    path = str(tmp_path / "sweep.ndjson")
+    client = _StubClient()
+    sweep.submit(client, path)
+    manifest = read_sweep_manifest(path)
+    # Drop a duplicate's record, as if the run stopped before writing it
+    with open(path, encoding="utf-8") as f:
+        lines = [line for line in f if '"order=outro-first, text=a2"' not in line]
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+
+    report = sweep.submit(client, path)
+    assert (report.created, report.duplicates) == (0, 1)
+    record = read_sweep_manifest(path)["order=outro-first, text=a2"]
+    assert record == manifest["order=outro-first, text=a2"]
+    assert len(client.created) == 4
+
+
+def test_rate_limited_requests_are_retried(sweep, tmp_path, no_sleep):
+    path = str(tmp_path / "sweep.ndjson")
+    limited = [_error(429, {"RateLimit-Reset": "30"}), _error(429)]
+    client = _StubClient({"A": limited})
+    report = sweep.submit(client, path, max_workers=1)
+    assert report.failed == 4
+    assert report.created == 4
+    # RateLimit-Reset, then the default without headers
+    assert no_sleep == [30.0, 60.0]
+    assert report.rate_limit_wait == 90.0
+
+    # Requests still limited after every retry fail
+    path = str(tmp_path / "limited.ndjson")
+    retries = sweep_module._MAX_RATE_LIMIT_RETRIES
+    client = _StubClient({"B": [_error(429, {"Retry-After": "0"})] * (retries + 1)})
+    report = sweep.submit(client, path, max_workers=1)
+    assert "429" in report.errors["order=intro-first, text=b"]
+    assert "order=outro-first, text=b" not in report.errors
+    assert no_sleep[2:] == [1.0] * retries
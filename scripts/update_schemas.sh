@@ -52,12 +52,16 @@ uv run datamodel-codegen \
 # pytype: disable=invalid-function-definition
 # pylint: disable=missing-module-docstring,missing-class-docstring,invalid-name,too-few-public-methods'
 
-# Step 5: Format the generated Python code.
+# Step 5: Generate the lightweight struct backend from the same schemas.
+echo "==> Generating Python structs..."
+uv run python generate_structs.py
+
+# Step 6: Format the generated Python code.
 echo "==> Formatting Python code..."
 uv run black deliberate_lab/
 
-# Step 6: Typecheck the generated Python code.
+# Step 7: Typecheck the generated Python code.
 echo "==> Typechecking Python code..."
 uv run pyright deliberate_lab/
 
-echo "==> Done. schemas.json and types.py are up to date."
+echo "==> Done. schemas.json, types.py and structs.py are up to date."
@@ -0,0 +1,42 @@
+import {
+  getExperimentDownloadSelection,
+  isExperimentDownloadSection,
+} from './data';
+
+describe('getExperimentDownloadSelection', () => {
+  it('selects everything when no sections are given', () => {
+    const selection = getExperimentDownloadSelection();
+    expect(Object.values(selection).every((value) => value)).toBe(true);
+  });
+
+  it('selects only the requested top-level sections', () => {
+    const selection = getExperimentDownloadSelection(['stageMap', 'alerts']);
+    expect(selection.stageMap).toBe(true);
+    expect(selection.alerts).toBe(true);
+    expect(selection.participantProfiles).toBe(false);
+    expect(selection.cohorts).toBe(false);
+    expect(selection.agentMediatorMap).toBe(false);
+  });
+
+  it('selects participant profiles without answers', () => {
+    const selection = getExperimentDownloadSelection([
+      'participantMap.profile',
+    ]);
+    expect(selection.participantProfiles).toBe(true);
+    expect(selection.participantAnswers).toBe(false);
+  });
+
+  it('includes cohort configs when only chats are requested', () => {
+    const selection = getExperimentDownloadSelection(['cohortMap.chatMap']);
+    expect(selection.cohorts).toBe(true);
+    expect(selection.cohortChats).toBe(true);
+    expect(selection.cohortData).toBe(false);
+  });
+});
+
+describe('isExperimentDownloadSection', () => {
+  it('validates section names', () => {
+    expect(isExperimentDownloadSection('participantMap.answerMap')).toBe(true);
+    expect(isExperimentDownloadSection('participants')).toBe(false);
+  });
+});
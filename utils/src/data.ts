@@ -28,6 +28,27 @@ import {
 /** Default page size when fetching experiment logs in batches. */
 export const DEFAULT_LOGS_PAGE_SIZE = 500;
 
+/**
+ * Sections of ExperimentDownload that can be requested individually.
+ * `experiment` is always included. Dotted sections select part of each
+ * participant/cohort download: e.g., `participantMap.profile` returns
+ * profiles without answers, `cohortMap.chatMap` returns cohort configs
+ * with chat transcripts but no public stage data.
+ */
+export const EXPERIMENT_DOWNLOAD_SECTIONS = [
+  'stageMap',
+  'participantMap',
+  'participantMap.profile',
+  'participantMap.answerMap',
+  'cohortMap',
+  'cohortMap.cohort',
+  'cohortMap.dataMap',
+  'cohortMap.chatMap',
+  'agentMediatorMap',
+  'agentParticipantMap',
+  'alerts',
+] as const;
+
 // ************************************************************************* //
 // TYPES                                                                     //
 // ************************************************************************* //
@@ -50,6 +71,22 @@ export interface ExperimentDownload {
   alerts: Record<string, AlertMessage[]>;
 }
 
+export type ExperimentDownloadSection =
+  (typeof EXPERIMENT_DOWNLOAD_SECTIONS)[number];
+
+/** Resolved flags for which parts of ExperimentDownload to build. */
+export interface ExperimentDownloadSelection {
+  stageMap: boolean;
+  participantProfiles: boolean;
+  participantAnswers: boolean;
+  cohorts: boolean;
+  cohortData: boolean;
+  cohortChats: boolean;
+  agentMediatorMap: boolean;
+  agentParticipantMap: boolean;
+  alerts: boolean;
+}
+
 export interface ParticipantDownload {
   profile: ParticipantProfileExtended;
   // Maps from stage ID to participant's stage answer
@@ -97,3 +134,53 @@ export function createCohortDownload(cohort: CohortConfig): CohortDownload {
     chatMap: {},
   };
 }
+
+/** Returns true if the given string is a valid ExperimentDownloadSection. */
+export function isExperimentDownloadSection(
+  section: string,
+): section is ExperimentDownloadSection {
+  return (EXPERIMENT_DOWNLOAD_SECTIONS as readonly string[]).includes(section);
+}
+
+/**
+ * Resolve requested sections into flags for building ExperimentDownload.
+ * If no sections are given, everything is selected.
+ *
+ * Selecting part of a participant/cohort download also selects the
+ * profile/cohort config it belongs to, so each entry stays identifiable.
+ */
+export function getExperimentDownloadSelection(
+  sections?: ExperimentDownloadSection[],
+): ExperimentDownloadSelection {
+  if (!sections) {
+    return {
+      stageMap: true,
+      participantProfiles: true,
+      participantAnswers: true,
+      cohorts: true,
+      cohortData: true,
+      cohortChats: true,
+      agentMediatorMap: true,
+      agentParticipantMap: true,
+      alerts: true,
+    };
+  }
+
+  const has = (...options: ExperimentDownloadSection[]) =>
+    options.some((option) => sections.includes(option));
+  const participantAnswers = has('participantMap', 'participantMap.answerMap');
+  const cohortData = has('cohortMap', 'cohortMap.dataMap');
+  const cohortChats = has('cohortMap', 'cohortMap.chatMap');
+
+  return {
+    stageMap: has('stageMap'),
+    participantProfiles: participantAnswers || has('participantMap.profile'),
+    participantAnswers,
+    cohorts: cohortData || cohortChats || has('cohortMap.cohort'),
+    cohortData,
+    cohortChats,
+    agentMediatorMap: has('agentMediatorMap'),
+    agentParticipantMap: has('agentParticipantMap'),
+    alerts: has('alerts'),
+  };
+}